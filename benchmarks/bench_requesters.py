@@ -0,0 +1,278 @@
+"""Requester benchmark suite against a local mock Binance server.
+
+Starts a `MockBinanceServer` serving pre-encoded Binance-shaped payloads
+(large exchangeInfo, 1000-row klines pages, deep order book, ping) and
+measures, for every backend x endpoint x concurrency level:
+
+- throughput (requests/s),
+- p50 / p99 / max latency (ms),
+- Python allocations per request (tracemalloc, measured in a separate,
+  sequential pass so tracing overhead does not skew timings).
+
+Backends: `requests`, `httpx-sync`, `httpx-async`, and `client+requests`
+(`BinanceClient` over `RequestsRequester`, to show the client's overhead).
+
+Results are written as JSON. Pass `--baseline` to compare against a
+previous run and exit non-zero when throughput or p99 regress by more
+than `--threshold`. Pass `--recording` to serve payloads captured with
+`RecordingRequester` instead of the synthetic ones.
+
+Usage:
+    uv run python benchmarks/bench_requesters.py --requests 200
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import typer
+
+from binance_trader.clients.binance import BinanceClient
+from binance_trader.clients.requester import HttpxRequester, RequestsRequester
+from binance_trader.clients.requester.recording import recorded_routes
+from binance_trader.testing import MockBinanceServer, payloads
+
+ENDPOINTS: Dict[str, str] = {
+    "ping": "/api/v3/ping",
+    "klines": "/api/v3/klines",
+    "depth": "/api/v3/depth",
+    "exchangeInfo": "/api/v3/exchangeInfo",
+}
+
+BACKENDS = ("requests", "httpx-sync", "httpx-async", "client+requests")
+
+app = typer.Typer(add_completion=False)
+
+
+def _routes(recording: Optional[Path] = None) -> Dict[str, bytes]:
+    routes = {
+        "/api/v3/ping": b"{}",
+        "/api/v3/klines": json.dumps(payloads.klines(1000)).encode(),
+        "/api/v3/depth": json.dumps(payloads.depth(5000)).encode(),
+        "/api/v3/exchangeInfo": json.dumps(payloads.exchange_info(2000)).encode(),
+    }
+    if recording is not None:
+        routes.update(recorded_routes(recording))
+    return routes
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _summarize(latencies: List[float], wall: float) -> Dict[str, float]:
+    lat = sorted(latencies)
+    return {
+        "requests": len(lat),
+        "throughput_rps": len(lat) / wall if wall else 0.0,
+        "p50_ms": _percentile(lat, 0.50) * 1000,
+        "p99_ms": _percentile(lat, 0.99) * 1000,
+        "max_ms": lat[-1] * 1000 if lat else 0.0,
+        "mean_ms": statistics.fmean(lat) * 1000 if lat else 0.0,
+    }
+
+
+def _run_sync(call: Callable[[], Any], n: int, concurrency: int) -> Dict[str, float]:
+    def timed(_: int) -> float:
+        start = time.perf_counter()
+        call()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    if concurrency == 1:
+        latencies = [timed(i) for i in range(n)]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            latencies = list(pool.map(timed, range(n)))
+    return _summarize(latencies, time.perf_counter() - start)
+
+
+def _run_async(url: str, n: int, concurrency: int) -> Dict[str, float]:
+    async def runner() -> Dict[str, float]:
+        # AsyncClient connections are bound to their loop: one client per run.
+        requester = HttpxRequester()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def timed() -> float:
+            async with semaphore:
+                start = time.perf_counter()
+                await requester.aget(url)
+                return time.perf_counter() - start
+
+        await requester.aget(url)  # warm the connection pool
+        start = time.perf_counter()
+        latencies = await asyncio.gather(*(timed() for _ in range(n)))
+        wall = time.perf_counter() - start
+        await requester.aclose()
+        return _summarize(list(latencies), wall)
+
+    return asyncio.run(runner())
+
+
+def _allocations(call: Callable[[], Any], n: int = 10) -> Dict[str, float]:
+    call()  # warm connection pools and caches
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    for _ in range(n):
+        call()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "alloc_peak_kib": (peak - base) / 1024,
+        "alloc_retained_kib_per_req": (current - base) / 1024 / n,
+    }
+
+
+def _make_sync_call(backend: str, base_url: str, path: str) -> Callable[[], Any]:
+    """Return a blocking call of `path` through `backend`."""
+    url = base_url + path
+    if backend == "requests":
+        req = RequestsRequester()
+        return lambda: req.get(url)
+    if backend == "httpx-sync":
+        hreq = HttpxRequester()
+        return lambda: hreq.get(url)
+    if backend == "client+requests":
+        client = BinanceClient(RequestsRequester(), base_url=base_url)
+        if path == ENDPOINTS["klines"]:
+            return lambda: client.klines("BTCUSDT", "1m", limit=1000)
+        if path == ENDPOINTS["depth"]:
+            return lambda: client.depth("BTCUSDT", limit=5000)
+        if path == ENDPOINTS["exchangeInfo"]:
+            return client.exchange_info
+        return client.ping
+    raise ValueError(f"Unknown backend {backend}")
+
+
+def run_suite(
+    backends: List[str],
+    endpoints: List[str],
+    concurrency_levels: List[int],
+    n: int,
+    recording: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    results = []
+    with MockBinanceServer(_routes(recording)) as server:
+        for endpoint in endpoints:
+            path = ENDPOINTS[endpoint]
+            for backend in backends:
+                is_async = backend == "httpx-async"
+                allocs: Dict[str, float] = {}
+                if not is_async:
+                    call = _make_sync_call(backend, server.url, path)
+                    allocs = _allocations(call)
+                for concurrency in concurrency_levels:
+                    if is_async:
+                        stats = _run_async(server.url + path, n, concurrency)
+                    else:
+                        stats = _run_sync(call, n, concurrency)
+                    row = {
+                        "backend": backend,
+                        "endpoint": endpoint,
+                        "concurrency": concurrency,
+                        **stats,
+                        **allocs,
+                    }
+                    results.append(row)
+                    typer.echo(
+                        f"{endpoint:>12} {backend:>16} c={concurrency:<3}"
+                        f" {row['throughput_rps']:9.1f} req/s"
+                        f"  p50={row['p50_ms']:7.2f}ms  p99={row['p99_ms']:7.2f}ms",
+                        err=True,
+                    )
+    return results
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float
+) -> List[str]:
+    """Return human-readable regressions of `results` versus `baseline`."""
+
+    def key(row: Dict[str, Any]) -> tuple:
+        return row["backend"], row["endpoint"], row["concurrency"]
+
+    previous = {key(row): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = previous.get(key(row))
+        if old is None:
+            continue
+        if row["throughput_rps"] < old["throughput_rps"] * (1 - threshold):
+            regressions.append(
+                f"{key(row)} throughput {old['throughput_rps']:.1f}"
+                f" -> {row['throughput_rps']:.1f} req/s"
+            )
+        if row["p99_ms"] > old["p99_ms"] * (1 + threshold):
+            regressions.append(
+                f"{key(row)} p99 {old['p99_ms']:.2f} -> {row['p99_ms']:.2f} ms"
+            )
+    return regressions
+
+
+def _split(value: str) -> List[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+@app.command()
+def main(
+    requests_per_case: int = typer.Option(
+        200, "--requests", help="Requests per backend/endpoint/concurrency case"
+    ),
+    backends: str = typer.Option(",".join(BACKENDS), help="Comma-separated backends"),
+    endpoints: str = typer.Option(
+        ",".join(ENDPOINTS), help="Comma-separated endpoints"
+    ),
+    concurrency: str = typer.Option("1,8,32", help="Comma-separated levels"),
+    output: Path = typer.Option(Path("bench_output.json"), help="Results file"),
+    baseline: Optional[Path] = typer.Option(None, help="Previous results to compare"),
+    threshold: float = typer.Option(0.2, help="Allowed relative regression"),
+    recording: Optional[Path] = typer.Option(
+        None, help="RecordingRequester log whose payloads replace the synthetic ones"
+    ),
+) -> None:
+    """Benchmark the requester backends against a local mock server."""
+    results = run_suite(
+        _split(backends),
+        _split(endpoints),
+        [int(c) for c in _split(concurrency)],
+        requests_per_case,
+        recording,
+    )
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "requests_per_case": requests_per_case,
+        },
+        "results": results,
+    }
+    output.write_text(json.dumps(report, indent=2))
+    typer.echo(f"Wrote {len(results)} results to {output}", err=True)
+
+    if baseline is not None:
+        regressions = compare(
+            results, json.loads(baseline.read_text())["results"], threshold
+        )
+        for line in regressions:
+            typer.echo(f"REGRESSION {line}", err=True)
+        if regressions:
+            raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    app()
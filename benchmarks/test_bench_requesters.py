@@ -0,0 +1,29 @@
+"""Smoke tests for the requester benchmark suite."""
+
+from __future__ import annotations
+
+import bench_requesters as bench
+
+
+def test_percentile_picks_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert bench._percentile(values, 0.5) == 51.0
+    assert bench._percentile(values, 0.99) == 99.0
+    assert bench._percentile(values, 1.0) == 100.0
+    assert bench._percentile([], 0.5) == 0.0
+
+
+def test_compare_flags_regressions_of_a_tiny_run():
+    results = bench.run_suite(["requests"], ["ping"], [1], n=3)
+    (row,) = results
+    assert row["requests"] == 3 and row["throughput_rps"] > 0
+    assert bench.compare(results, results, threshold=0.2) == []
+
+    faster = dict(
+        row, throughput_rps=row["throughput_rps"] * 2, p99_ms=row["p99_ms"] / 2
+    )
+    regressions = bench.compare(results, [faster], threshold=0.2)
+    assert len(regressions) == 2
+    assert "throughput" in regressions[0] and "p99" in regressions[1]
+    other = dict(faster, concurrency=8)
+    assert bench.compare(results, [other], threshold=0.2) == []
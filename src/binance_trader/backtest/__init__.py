@@ -0,0 +1,17 @@
+"""Vectorized backtesting over candle columns."""
+
+from .engine import BacktestResult, candles_from_klines, run, simulate
+from .signals import moving_average, sma_crossover
+from .sweep import SharedCandles, parameter_grid, sweep
+
+__all__ = [
+    "BacktestResult",
+    "simulate",
+    "run",
+    "candles_from_klines",
+    "sweep",
+    "parameter_grid",
+    "SharedCandles",
+    "sma_crossover",
+    "moving_average",
+]
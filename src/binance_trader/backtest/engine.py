@@ -0,0 +1,210 @@
+"""Vectorized single-run backtest over OHLCV columns.
+
+A strategy is a signal function `signal(candles, **params)` returning one
+target position per bar: the fraction of the starting capital to hold
+(0 flat, 1 fully long; negative values short when `allow_short=True`). It
+sees whole columns at once, so it should be written with NumPy operations
+instead of a loop over bars.
+
+`simulate` turns targets into fills without a per-bar Python loop:
+
+- The target computed at bar `i` (from its close) is traded at the open of
+  bar `i + 1`, so a signal never trades on data it could not have seen.
+- Position sizes are a fraction of the *starting* capital (no
+  compounding), which keeps every bar independent of the previous equity
+  and therefore vectorizable.
+- With `SymbolFilters` (see `clients.binance.orders`), quantities are
+  rounded down to the lot step, clipped to `max_qty`, and trades below
+  `min_qty` or the minimum notional are not executed, as the exchange
+  would reject them.
+- Each fill pays `slippage` (fraction of the price, against the trade) and
+  a `fee` on its notional.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from ..clients.binance.orders import SymbolFilters
+from ..store.candles import Candles, klines_to_columns
+
+SignalFn = Callable[..., np.ndarray]
+
+_YEAR_MS = 365 * 24 * 3600 * 1000
+
+
+def candles_from_klines(rows: Sequence[Sequence[Any]]) -> Candles:
+    """`Candles` from raw `/api/v3/klines` rows (e.g. `BinanceClient.klines`)."""
+    return Candles(**klines_to_columns(rows))
+
+
+@dataclass(frozen=True)
+class BacktestResult:
+    """Per-bar series and summary statistics of one run.
+
+    `quantity` is the base-asset amount held during each bar and `equity`
+    the account value at each bar's close.
+    """
+
+    equity: np.ndarray
+    quantity: np.ndarray
+    trades: int
+    fees: float
+    capital: float
+    bar_ms: float
+
+    @property
+    def total_return(self) -> float:
+        return float(self.equity[-1] / self.capital - 1) if len(self.equity) else 0.0
+
+    @property
+    def max_drawdown(self) -> float:
+        if not len(self.equity):
+            return 0.0
+        peak = np.maximum.accumulate(self.equity)
+        return float(np.max(1 - self.equity / peak))
+
+    @property
+    def sharpe(self) -> float:
+        """Annualized Sharpe ratio of per-bar returns (risk-free rate 0)."""
+        if len(self.equity) < 2 or not self.bar_ms:
+            return 0.0
+        returns = np.diff(self.equity) / self.equity[:-1]
+        std = returns.std()
+        if std == 0:
+            return 0.0
+        return float(returns.mean() / std * math.sqrt(_YEAR_MS / self.bar_ms))
+
+    @property
+    def exposure(self) -> float:
+        """Fraction of bars with an open position."""
+        return float(np.count_nonzero(self.quantity) / max(1, len(self.quantity)))
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "total_return": self.total_return,
+            "max_drawdown": self.max_drawdown,
+            "sharpe": self.sharpe,
+            "trades": self.trades,
+            "fees": self.fees,
+            "exposure": self.exposure,
+        }
+
+
+def _quantize(qty: np.ndarray, filters: Optional[SymbolFilters]) -> np.ndarray:
+    """Apply lot-size rules to the order quantities of `qty`."""
+    if filters is None:
+        return qty
+    size = np.abs(qty)
+    if filters.step > 0:
+        size = np.floor(size / filters.step + 1e-9) * filters.step
+    if filters.max_qty > 0:
+        size = np.minimum(size, filters.max_qty)
+    size[size < filters.min_qty] = 0.0
+    return np.copysign(size, qty)
+
+
+def _drop_small_trades(
+    qty: np.ndarray, price: np.ndarray, min_notional: float
+) -> np.ndarray:
+    """Keep the previous holding where the trade would be below `min_notional`.
+
+    Skipping a trade changes the next one's size, so repeat until stable
+    (typically one or two passes).
+    """
+    qty = qty.copy()
+    while True:
+        prev = np.concatenate(([0.0], qty[:-1]))
+        delta = qty - prev
+        small = (delta != 0) & (np.abs(delta) * price < min_notional)
+        if not small.any():
+            return qty
+        qty[small] = prev[small]
+
+
+def simulate(
+    candles: Candles,
+    target: np.ndarray,
+    capital: float = 10_000.0,
+    fee: float = 0.001,
+    slippage: float = 0.0,
+    filters: Optional[Union[SymbolFilters, Mapping[str, Any]]] = None,
+    allow_short: bool = False,
+) -> BacktestResult:
+    """Simulate trading towards `target` positions; see the module docstring.
+
+    Args:
+        candles: OHLCV columns, e.g. `CandleFile.range(...)` or
+            `candles_from_klines(rows)`.
+        target: Target position per bar as a fraction of `capital`; NaN
+            means flat.
+        capital: Starting capital in quote asset.
+        fee: Fee rate per fill (0.001 is Binance's 0.1% base rate).
+        slippage: Price penalty per fill as a fraction of the price.
+        filters: `SymbolFilters`, or the raw exchange info symbol entry.
+        allow_short: Allow negative targets; otherwise they are clipped
+            to 0 as on a spot account.
+    """
+    if filters is not None and not isinstance(filters, SymbolFilters):
+        filters = SymbolFilters(filters)
+    open_ = np.asarray(candles.open, dtype=np.float64)
+    close = np.asarray(candles.close, dtype=np.float64)
+    n = len(close)
+    target = np.asarray(target, dtype=np.float64)
+    if target.shape != (n,):
+        raise ValueError(f"target has shape {target.shape}, expected ({n},)")
+    target = np.clip(np.nan_to_num(target), -1.0 if allow_short else 0.0, 1.0)
+    open_time = np.asarray(candles.open_time)
+    bar_ms = float(np.median(np.diff(open_time))) if n > 1 else 0.0
+    if n == 0:
+        return BacktestResult(np.empty(0), np.empty(0), 0, 0.0, capital, bar_ms)
+
+    # Target decided at bar i's close is traded at bar i+1's open.
+    desired = np.empty(n)
+    desired[0] = 0.0
+    desired[1:] = target[:-1]
+    changes = np.flatnonzero(np.diff(desired, prepend=0.0))
+    price = open_[changes]
+    qty = _quantize(desired[changes] * capital / price, filters)
+    if filters is not None and filters.min_notional > 0:
+        qty = _drop_small_trades(qty, price, filters.min_notional)
+    delta = np.diff(qty, prepend=0.0)
+    filled = delta != 0
+    changes, price, qty, delta = (
+        changes[filled],
+        price[filled],
+        qty[filled],
+        delta[filled],
+    )
+
+    fill_price = price * (1 + slippage * np.sign(delta))
+    notional = np.abs(delta) * fill_price
+    fees = notional * fee
+    cash_after = capital - np.cumsum(delta * fill_price + fees)
+
+    if not len(changes):
+        flat = np.full(n, capital)
+        return BacktestResult(flat, np.zeros(n), 0, 0.0, capital, bar_ms)
+    # Forward-fill holdings and cash from the fills to every bar.
+    last_fill = np.searchsorted(changes, np.arange(n), side="right") - 1
+    has_fill = last_fill >= 0
+    quantity = np.where(has_fill, qty[last_fill], 0.0)
+    cash = np.where(has_fill, cash_after[last_fill], capital)
+    equity = cash + quantity * close
+    return BacktestResult(
+        equity, quantity, int(len(changes)), float(fees.sum()), capital, bar_ms
+    )
+
+
+def run(
+    candles: Candles,
+    signal: SignalFn,
+    params: Optional[Mapping[str, Any]] = None,
+    **options: Any,
+) -> BacktestResult:
+    """Compute `signal(candles, **params)` and `simulate` it with `options`."""
+    return simulate(candles, signal(candles, **(params or {})), **options)
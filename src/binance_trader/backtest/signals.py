@@ -0,0 +1,29 @@
+"""Reference signal functions for `run` and `sweep`."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ..store.candles import Candles
+
+
+def moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average; NaN for the first `window - 1` bars."""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if window <= 0 or window > len(values):
+        return out
+    csum = np.cumsum(values)
+    out[window - 1] = csum[window - 1]
+    out[window:] = csum[window:] - csum[:-window]
+    out[window - 1 :] /= window
+    return out
+
+
+def sma_crossover(candles: Candles, fast: int = 10, slow: int = 50) -> np.ndarray:
+    """Long while the `fast` SMA of the close is above the `slow` one."""
+    close = candles.close
+    fast_ma = moving_average(close, fast)
+    slow_ma = moving_average(close, slow)
+    with np.errstate(invalid="ignore"):
+        return (fast_ma > slow_ma).astype(np.float64)
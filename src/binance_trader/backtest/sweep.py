@@ -0,0 +1,135 @@
+"""Parallel parameter sweeps over shared-memory candles.
+
+`sweep` evaluates a signal function for every combination of a parameter
+grid. The candle columns are copied once into a single
+`multiprocessing.shared_memory` block; worker processes attach to it at
+start-up and build zero-copy NumPy views, so neither the data nor its
+pickled form is sent per task. Tasks carry only the parameter dict and
+return only the summary statistics.
+
+The signal function must be picklable, i.e. defined at module level.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..store.candles import Candles
+from .engine import SignalFn, run
+
+# (shared memory name, rows, [(column, dtype, byte offset)])
+_Layout = Tuple[str, int, List[Tuple[str, str, int]]]
+
+
+def parameter_grid(grid: Mapping[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Every combination of `grid` values, last key varying fastest."""
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*grid.values())]
+
+
+class SharedCandles:
+    """`Candles` copied into one shared memory block; use as a context manager.
+
+    The creating process owns the block and unlinks it on exit; workers
+    call `attach` with `layout`.
+    """
+
+    def __init__(self, candles: Candles) -> None:
+        columns = {
+            f.name: np.ascontiguousarray(getattr(candles, f.name))
+            for f in fields(Candles)
+        }
+        size = sum(a.nbytes for a in columns.values())
+        self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        entries = []
+        offset = 0
+        for name, array in columns.items():
+            view = np.ndarray(array.shape, array.dtype, self._shm.buf, offset)
+            view[:] = array
+            entries.append((name, array.dtype.str, offset))
+            offset += array.nbytes
+        self.layout: _Layout = (self._shm.name, len(candles), entries)
+
+    def __enter__(self) -> SharedCandles:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    @staticmethod
+    def attach(layout: _Layout) -> Tuple[shared_memory.SharedMemory, Candles]:
+        """Open the block described by `layout` and build read-only views.
+
+        Keep the returned `SharedMemory` alive as long as the views are used.
+        """
+        name, rows, entries = layout
+        # Only the creator unlinks; do not let a worker's tracker do it too.
+        shm = shared_memory.SharedMemory(name=name, track=False)
+        columns = {}
+        for column, dtype, offset in entries:
+            view = np.ndarray((rows,), np.dtype(dtype), shm.buf, offset)
+            view.flags.writeable = False
+            columns[column] = view
+        return shm, Candles(**columns)
+
+
+# Per-worker state set by `_init_worker`.
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(layout: _Layout, signal: SignalFn, options: Dict[str, Any]) -> None:
+    shm, candles = SharedCandles.attach(layout)
+    _worker.update(shm=shm, candles=candles, signal=signal, options=options)
+
+
+def _evaluate(params: Dict[str, Any]) -> Dict[str, Any]:
+    result = run(_worker["candles"], _worker["signal"], params, **_worker["options"])
+    return {**params, **result.summary()}
+
+
+def sweep(
+    candles: Candles,
+    signal: SignalFn,
+    grid: Mapping[str, Sequence[Any]],
+    processes: Optional[int] = None,
+    **options: Any,
+) -> List[Dict[str, Any]]:
+    """Backtest `signal` for every combination in `grid`.
+
+    Returns one dict per combination, in grid order, holding the
+    parameters and `BacktestResult.summary()`. `options` are passed to
+    `simulate` (capital, fee, filters, ...). `processes` defaults to the
+    number of CPUs; 1 runs in the calling process.
+
+    Example:
+        results = sweep(candles, sma_crossover, {"fast": [5, 10], "slow": [50, 100]})
+        best = max(results, key=lambda r: r["sharpe"])
+    """
+    combos = parameter_grid(grid)
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(combos) <= 1:
+        _worker.update(candles=candles, signal=signal, options=options)
+        try:
+            return [_evaluate(params) for params in combos]
+        finally:
+            _worker.clear()
+    processes = min(processes, len(combos))
+    chunksize = max(1, len(combos) // (processes * 4))
+    with SharedCandles(candles) as shared:
+        with ProcessPoolExecutor(
+            processes,
+            initializer=_init_worker,
+            initargs=(shared.layout, signal, options),
+        ) as pool:
+            return list(pool.map(_evaluate, combos, chunksize=chunksize))
@@ -0,0 +1,86 @@
+"""Tests for the vectorized backtest engine."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from binance_trader.backtest import candles_from_klines, run, simulate, sma_crossover
+from binance_trader.backtest.signals import moving_average
+from binance_trader.store.candles import Candles
+
+MINUTE = 60_000
+
+
+def make_candles(closes) -> Candles:
+    closes = np.asarray(closes, dtype=float)
+    opens = np.concatenate(([closes[0]], closes[:-1]))
+    n = len(closes)
+    return Candles(
+        open_time=np.arange(n, dtype=np.int64) * MINUTE,
+        open=opens,
+        high=np.maximum(opens, closes),
+        low=np.minimum(opens, closes),
+        close=closes,
+        volume=np.ones(n),
+    )
+
+
+def test_trades_at_next_open_with_fees():
+    candles = make_candles([100, 100, 110, 120, 120])
+    # Go long after bar 0, flat after bar 2: fills at the opens of bars 1 and 3.
+    result = simulate(candles, [1, 1, 0, 0, 0], capital=1000, fee=0.001)
+    np.testing.assert_allclose(result.quantity, [0, 10, 10, 0, 0])
+    assert result.trades == 2
+    # Bought 10 @ 100, sold 10 @ 110 (bar 3 opens at bar 2's close).
+    assert result.fees == pytest.approx(1.0 + 1.1)
+    assert result.equity[-1] == pytest.approx(1000 + 100 - 2.1)
+    assert result.total_return == pytest.approx(0.0979)
+
+
+def test_symbol_filters_quantize_and_skip_small_trades():
+    raw = {
+        "symbol": "XUSDT",
+        "filters": [
+            {
+                "filterType": "LOT_SIZE",
+                "minQty": "1",
+                "maxQty": "1000",
+                "stepSize": "1",
+            },
+            {"filterType": "NOTIONAL", "minNotional": "50"},
+        ],
+    }
+    candles = make_candles([30.0] * 6)
+    # 0.5 * 100 / 30 = 1.67 -> 1 unit (30 notional, below 50: skipped);
+    # 1.0 * 100 / 30 = 3.33 -> 3 units (90 notional: filled).
+    result = simulate(candles, [0.5, 0.5, 1, 1, 1, 1], capital=100, fee=0, filters=raw)
+    np.testing.assert_allclose(result.quantity, [0, 0, 0, 3, 3, 3])
+    assert result.trades == 1
+
+
+def test_long_only_clips_shorts_and_nan_is_flat():
+    candles = make_candles([10, 11, 12, 13])
+    result = simulate(candles, [-1, np.nan, -1, 0], fee=0)
+    assert result.trades == 0 and result.equity[-1] == 10_000
+    short = simulate(candles, [-1, -1, 0, 0], capital=100, fee=0, allow_short=True)
+    # Short 10 @ 10 (bar 1 open), covered @ 12 (bar 3 open).
+    assert short.equity[-1] == pytest.approx(80.0)
+
+
+def test_run_sma_crossover_on_klines_rows():
+    closes = np.concatenate([np.linspace(100, 50, 200), np.linspace(50, 150, 200)])
+    rows = [
+        [i * MINUTE, str(c), str(c), str(c), str(c), "1", i * MINUTE + MINUTE - 1]
+        for i, c in enumerate(closes)
+    ]
+    result = run(candles_from_klines(rows), sma_crossover, {"fast": 5, "slow": 20})
+    assert result.total_return > 0.5
+    assert 0 < result.exposure < 1 and result.sharpe > 0
+    summary = result.summary()
+    assert set(summary) >= {"total_return", "max_drawdown", "sharpe", "trades"}
+
+
+def test_moving_average():
+    np.testing.assert_allclose(moving_average([1, 2, 3, 4], 2), [np.nan, 1.5, 2.5, 3.5])
+    assert np.isnan(moving_average([1.0], 3)).all()
@@ -0,0 +1,46 @@
+"""Tests for parallel parameter sweeps."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from binance_trader.backtest import SharedCandles, parameter_grid, sma_crossover, sweep
+from binance_trader.backtest.test_engine import make_candles
+
+
+def _candles():
+    rng = np.random.default_rng(1)
+    return make_candles(100 * np.exp(np.cumsum(rng.normal(0, 0.01, 5000))))
+
+
+def test_parameter_grid_order():
+    assert parameter_grid({"a": [1, 2], "b": ["x", "y"]}) == [
+        {"a": 1, "b": "x"},
+        {"a": 1, "b": "y"},
+        {"a": 2, "b": "x"},
+        {"a": 2, "b": "y"},
+    ]
+
+
+def test_shared_candles_round_trip():
+    candles = _candles()
+    with SharedCandles(candles) as shared:
+        shm, view = SharedCandles.attach(shared.layout)
+        np.testing.assert_array_equal(view.close, candles.close)
+        np.testing.assert_array_equal(view.open_time, candles.open_time)
+        assert not view.close.flags.writeable
+        del view
+        shm.close()
+
+
+def test_parallel_sweep_matches_serial():
+    candles = _candles()
+    grid = {"fast": [3, 5, 8], "slow": [20, 40]}
+    serial = sweep(candles, sma_crossover, grid, processes=1, fee=0.0005)
+    parallel = sweep(candles, sma_crossover, grid, processes=2, fee=0.0005)
+    assert len(parallel) == 6
+    assert [(r["fast"], r["slow"]) for r in parallel] == [
+        (p["fast"], p["slow"]) for p in parameter_grid(grid)
+    ]
+    for a, b in zip(serial, parallel):
+        assert a == b
@@ -1,26 +1,131 @@
 """CLI for quick Binance API interactions.
 
 Uses `typer` for nicer help, automatic validation, and easy completion support.
+
+Commands that print API responses take `--format json|ndjson|table` and
+`--fields` (see `output`); `exchange-info` streams its symbol list from
+the socket to stdout when records are asked for.
+
+The HTTP backends are imported only when a command builds its requester.
+`binance-trader daemon` keeps requesters, clients and their caches warm in
+a long-lived process; see `daemon` for how invocations are forwarded to it.
 """
 
 from __future__ import annotations
 
 import json
-from typing import Optional
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import typer
 
 from .clients.binance.client import BinanceClient
-from .clients.requester.httpx_requester import HttpxRequester
-from .clients.requester.requests_requester import RequestsRequester
+from .clients.requester.base import Requester
+from .clients.requester.instrumentation import RequestEvent, RequestHook, StatsCollector
+from .clients.requester.rate_limit import RateLimiter
+from .output import FORMATS, parse_fields, write_records, write_result
 
 app = typer.Typer(help="Interact with the Binance public REST API")
 
+# Set by `--stats`; every requester built for the command reports into it.
+_stats: Optional[StatsCollector] = None
+
+# Requesters and clients reused across invocations, or None outside daemon mode.
+_warm: Optional[Dict[Tuple[Any, ...], Any]] = None
+
+
+class _ActiveStats(RequestHook):
+    """Forwards to the current `--stats` collector; used by warm requesters."""
+
+    def on_response(self, event: RequestEvent) -> None:
+        if _stats is not None:
+            _stats.on_response(event)
+
+
+@app.callback()
+def _main(
+    ctx: typer.Context,
+    stats: bool = typer.Option(
+        False, "--stats", help="Print per-endpoint request stats to stderr"
+    ),
+    stats_format: str = typer.Option(
+        "table", help="Format of --stats output: table|json|prometheus"
+    ),
+):
+    global _stats
+    _stats = StatsCollector() if stats else None
+    if _stats is not None:
+        collector = _stats
+        ctx.call_on_close(lambda: _print_stats(collector, stats_format))
+
 
-def _build_requester(name: str):
+def _print_stats(collector: StatsCollector, fmt: str) -> None:
+    if fmt == "json":
+        text = json.dumps(collector.snapshot(), indent=2)
+    elif fmt == "prometheus":
+        text = collector.to_prometheus()
+    else:
+        text = collector.format_table()
+    typer.echo(text, err=True)
+
+
+def _build_requester(
+    name: str, rate_limiter: Optional[RateLimiter] = None
+) -> Requester:
+    if _warm is not None and rate_limiter is None:
+        key = ("requester", name)
+        if key not in _warm:
+            _warm[key] = _new_requester(name, None, (_ActiveStats(),))
+        return _warm[key]
+    hooks = (_stats,) if _stats is not None else ()
+    return _new_requester(name, rate_limiter, hooks)
+
+
+def _new_requester(
+    name: str, rate_limiter: Optional[RateLimiter], hooks: Tuple[RequestHook, ...]
+) -> Requester:
     if name == "httpx":
-        return HttpxRequester()
-    return RequestsRequester()
+        from .clients.requester.httpx_requester import HttpxRequester
+
+        return HttpxRequester(rate_limiter=rate_limiter, hooks=hooks)
+    from .clients.requester.requests_requester import RequestsRequester
+
+    return RequestsRequester(rate_limiter=rate_limiter, hooks=hooks)
+
+
+def _build_client(
+    requester: str, base_url: str, timeout: Optional[float], **kwargs: Any
+) -> BinanceClient:
+    """A `BinanceClient`; in daemon mode the same one is reused per config."""
+    if _warm is None:
+        return BinanceClient(
+            _build_requester(requester), base_url=base_url, timeout=timeout, **kwargs
+        )
+    key = ("client", requester, base_url, timeout, *sorted(kwargs.items()))
+    if key not in _warm:
+        _warm[key] = BinanceClient(
+            _build_requester(requester), base_url=base_url, timeout=timeout, **kwargs
+        )
+    return _warm[key]
+
+
+def _output_options(fmt: str, fields: Optional[str]) -> Optional[List[str]]:
+    if fmt not in FORMATS:
+        raise typer.BadParameter(
+            f"expected one of {'|'.join(FORMATS)}", param_hint="--format"
+        )
+    return parse_fields(fields)
+
+
+def _parse_time(value: str) -> int:
+    """Parse epoch milliseconds or an ISO date/datetime (UTC if naive)."""
+    if value.isdigit():
+        return int(value)
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
 
 
 @app.command()
@@ -28,12 +133,15 @@ def ping(
     base_url: str = typer.Option("https://api.binance.com", help="Binance base URL"),
     requester: str = typer.Option("requests", help="Requester backend: requests|httpx"),
     timeout: Optional[float] = typer.Option(None, help="Request timeout in seconds"),
+    fmt: str = typer.Option("json", "--format", help="Output: json|ndjson|table"),
+    fields: Optional[str] = typer.Option(
+        None, help="Comma-separated fields to keep (dotted for nested)"
+    ),
 ):
     """Test connectivity to the REST API."""
-    req = _build_requester(requester)
-    client = BinanceClient(req, base_url=base_url, timeout=timeout)
-    res = client.ping()
-    typer.echo(json.dumps(res, indent=2, ensure_ascii=False))
+    keys = _output_options(fmt, fields)
+    client = _build_client(requester, base_url, timeout)
+    write_result(client.ping(), fmt, keys)
 
 
 @app.command()
@@ -41,12 +149,15 @@ def time(
     base_url: str = typer.Option("https://api.binance.com", help="Binance base URL"),
     requester: str = typer.Option("requests", help="Requester backend: requests|httpx"),
     timeout: Optional[float] = typer.Option(None, help="Request timeout in seconds"),
+    fmt: str = typer.Option("json", "--format", help="Output: json|ndjson|table"),
+    fields: Optional[str] = typer.Option(
+        None, help="Comma-separated fields to keep (dotted for nested)"
+    ),
 ):
     """Get server time."""
-    req = _build_requester(requester)
-    client = BinanceClient(req, base_url=base_url, timeout=timeout)
-    res = client.time()
-    typer.echo(json.dumps(res, indent=2, ensure_ascii=False))
+    keys = _output_options(fmt, fields)
+    client = _build_client(requester, base_url, timeout)
+    write_result(client.time(), fmt, keys)
 
 
 @app.command("exchange-info")
@@ -55,12 +166,270 @@ def exchange_info(
     base_url: str = typer.Option("https://api.binance.com", help="Binance base URL"),
     requester: str = typer.Option("requests", help="Requester backend: requests|httpx"),
     timeout: Optional[float] = typer.Option(None, help="Request timeout in seconds"),
+    cache_file: Optional[Path] = typer.Option(
+        None, help="JSON snapshot file used to cache exchange info between runs"
+    ),
+    cache_ttl: float = typer.Option(300.0, help="Seconds before the cache is stale"),
+    fmt: str = typer.Option("json", "--format", help="Output: json|ndjson|table"),
+    fields: Optional[str] = typer.Option(
+        None, help="Comma-separated fields to keep (dotted for nested)"
+    ),
 ):
-    """Get exchange information."""
-    req = _build_requester(requester)
-    client = BinanceClient(req, base_url=base_url, timeout=timeout)
+    """Get exchange information.
+
+    With `--format ndjson|table` or `--fields`, prints one record per symbol.
+    """
+    keys = _output_options(fmt, fields)
+    # The daemon keeps the document in memory even without a snapshot file.
+    cached = cache_file is not None or _warm is not None
+    if (fmt != "json" or keys) and symbol is None and not cached:
+        # Records only: stream the symbol list instead of decoding it whole.
+        from .clients.requester.decoders import iter_json_array
+
+        client = _build_client(requester, base_url, timeout)
+        with client.stream("/api/v3/exchangeInfo") as chunks:
+            write_records(iter_json_array(chunks, ("symbols",)), fmt, keys)
+        return
+    client = _build_client(
+        requester,
+        base_url,
+        timeout,
+        exchange_info_ttl=cache_ttl if cached else None,
+        exchange_info_path=cache_file,
+    )
     res = client.exchange_info(symbol=symbol)
-    typer.echo(json.dumps(res, indent=2, ensure_ascii=False))
+    write_result(res, fmt, keys, records_key="symbols")
+    if client.exchange_info_cache is not None and _warm is None:
+        # Let a stale-triggered refresh land in the snapshot before exiting.
+        client.exchange_info_cache.wait_for_refresh()
+
+
+_TICKER_KINDS = {"price": "ticker_price", "book": "book_ticker", "24hr": "ticker_24hr"}
+
+
+@app.command()
+def tickers(
+    symbols: Optional[List[str]] = typer.Argument(
+        None, help="Symbols (default: the whole market)"
+    ),
+    kind: str = typer.Option("book", help="Ticker endpoint: price|book|24hr"),
+    fields: Optional[str] = typer.Option(
+        None, help="Comma-separated API fields to keep (e.g. bidPrice,askPrice)"
+    ),
+    fmt: str = typer.Option("json", "--format", help="Output: json|ndjson|table"),
+    base_url: str = typer.Option("https://api.binance.com", help="Binance base URL"),
+    requester: str = typer.Option("requests", help="Requester backend: requests|httpx"),
+    timeout: Optional[float] = typer.Option(None, help="Request timeout in seconds"),
+):
+    """Snapshot tickers for many symbols in batched requests."""
+    from .market.tickers import TickerSnapshot
+
+    if kind not in _TICKER_KINDS:
+        raise typer.BadParameter(f"expected one of {', '.join(_TICKER_KINDS)}")
+    keys = _output_options(fmt, fields)
+    client = _build_client(requester, base_url, timeout)
+    rows = getattr(client, _TICKER_KINDS[kind])(symbols or None)
+    snapshot = TickerSnapshot.from_rows(rows, fields=keys)
+    write_records(snapshot.records(), fmt)
+
+
+@app.command("download-klines")
+def download_klines(
+    symbols: List[str] = typer.Argument(..., help="Symbols to download"),
+    interval: str = typer.Option("1m", help="Kline interval (e.g. 1m, 1h, 1d)"),
+    start: str = typer.Option(..., help="Start (epoch ms or ISO date, UTC)"),
+    end: Optional[str] = typer.Option(
+        None, help="End, exclusive (default: now, or the interrupted run's end)"
+    ),
+    out_dir: Path = typer.Option(Path("klines"), help="Output directory"),
+    workers: int = typer.Option(4, help="Chunks downloaded concurrently"),
+    weight_limit: int = typer.Option(
+        5000, help="Request weight per minute to stay under"
+    ),
+    base_url: str = typer.Option("https://api.binance.com", help="Binance base URL"),
+    requester: str = typer.Option("requests", help="Requester backend: requests|httpx"),
+    timeout: Optional[float] = typer.Option(None, help="Request timeout in seconds"),
+):
+    """Download historical klines to NDJSON files, resuming interrupted runs."""
+    from .clients.binance.klines import KlinesDownloader
+
+    req = _build_requester(requester, rate_limiter=RateLimiter(weight_limit))
+    client = BinanceClient(req, base_url=base_url, timeout=timeout)
+    # Without --end, a resumed download keeps the end it was started with.
+    end_ms = _parse_time(end) if end else None
+    downloader = KlinesDownloader(client, out_dir, max_workers=workers)
+    paths = downloader.download_many(symbols, interval, _parse_time(start), end_ms)
+    for symbol, path in paths.items():
+        typer.echo(f"{symbol}: {path}")
+
+
+@app.command("archive-trades")
+def archive_trades(
+    symbols: List[str] = typer.Argument(..., help="Symbols to archive"),
+    start: Optional[str] = typer.Option(
+        None, help="Start of a new archive (epoch ms or ISO date, UTC)"
+    ),
+    end: Optional[str] = typer.Option(
+        None, help="End, exclusive (default: the latest trade)"
+    ),
+    kind: str = typer.Option("aggTrades", help="Trades to archive: aggTrades|trades"),
+    out_dir: Path = typer.Option(Path("trades"), help="Archive directory"),
+    processes: Optional[int] = typer.Option(
+        None, help="Worker processes (default: number of CPUs)"
+    ),
+    weight_limit: int = typer.Option(
+        5000, help="Request weight per minute to stay under, over all workers"
+    ),
+    fmt: str = typer.Option("table", "--format", help="Output: json|ndjson|table"),
+    base_url: str = typer.Option("https://api.binance.com", help="Binance base URL"),
+):
+    """Archive tick-level trades to compressed per-day files, resuming runs."""
+    from .clients.binance.trades import TRADE_KINDS, TradesArchiver
+
+    if kind not in TRADE_KINDS:
+        raise typer.BadParameter(f"expected one of {', '.join(TRADE_KINDS)}")
+    _output_options(fmt, None)
+    archiver = TradesArchiver(
+        out_dir,
+        kind=kind,
+        processes=processes,
+        base_url=base_url,
+        weight_limit=weight_limit,
+    )
+    stats = archiver.archive(
+        symbols,
+        _parse_time(start) if start else None,
+        _parse_time(end) if end else None,
+    )
+    write_records((worker.report() for worker in stats), fmt)
+
+
+def _parse_job(spec: str) -> Any:
+    """`PATH[?QUERY]@SECONDS[!PRIORITY]` -> `Job` named after its spec."""
+    from urllib.parse import parse_qsl
+
+    from .scheduler import Job
+
+    target, sep, timing = spec.rpartition("@")
+    if not sep or not target:
+        raise typer.BadParameter(
+            f"{spec!r}: expected PATH[?QUERY]@SECONDS[!PRIORITY]", param_hint="--job"
+        )
+    freshness, _, priority = timing.partition("!")
+    path, _, query = target.partition("?")
+    try:
+        return Job(
+            spec,
+            path if path.startswith("/") else f"/api/v3/{path}",
+            params=dict(parse_qsl(query)) or None,
+            freshness=float(freshness),
+            priority=int(priority or 0),
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(f"{spec!r}: {exc}", param_hint="--job") from exc
+
+
+@app.command()
+def watch(
+    jobs: List[str] = typer.Option(
+        ...,
+        "--job",
+        help="Endpoint to poll as PATH[?QUERY]@SECONDS[!PRIORITY], e.g. "
+        "ticker/bookTicker?symbol=BTCUSDT@2!10 (repeatable)",
+    ),
+    budget: float = typer.Option(1200, help="Request weight per minute to use"),
+    duration: Optional[float] = typer.Option(
+        None, help="Stop after this many seconds (default: run until interrupted)"
+    ),
+    status_interval: Optional[float] = typer.Option(
+        None, help="Print job staleness and budget to stderr every N seconds"
+    ),
+    fields: Optional[str] = typer.Option(
+        None, help="Comma-separated fields to keep from each result record"
+    ),
+    base_url: str = typer.Option("https://api.binance.com", help="Binance base URL"),
+    timeout: Optional[float] = typer.Option(None, help="Request timeout in seconds"),
+):
+    """Poll endpoints within a weight budget, printing results as NDJSON."""
+    import asyncio
+    import sys
+    import time as time_mod
+
+    from .clients.binance.async_client import AsyncBinanceClient
+    from .clients.requester.httpx_requester import HttpxRequester
+    from .output import project
+    from .scheduler import PollingScheduler
+
+    keys = parse_fields(fields)
+    parsed = [_parse_job(spec) for spec in jobs]
+
+    def emit(job: Any, data: Any) -> None:
+        if keys:
+            data = (
+                [project(r, keys) for r in data]
+                if isinstance(data, list)
+                else project(data, keys)
+            )
+        record = {"job": job.name, "time": time_mod.time(), "data": data}
+        sys.stdout.write(json.dumps(record, separators=(",", ":")) + "\n")
+        sys.stdout.flush()
+
+    async def report(scheduler: PollingScheduler) -> None:
+        assert status_interval is not None
+        while True:
+            await asyncio.sleep(status_interval)
+            state = {"budget": scheduler.budget_report(), "jobs": scheduler.status()}
+            typer.echo(json.dumps(state), err=True)
+
+    async def run() -> None:
+        hooks = (_stats,) if _stats is not None else ()
+        requester = HttpxRequester(rate_limiter=RateLimiter(), hooks=hooks)
+        async with AsyncBinanceClient(
+            requester, base_url=base_url, timeout=timeout
+        ) as client:
+            scheduler = PollingScheduler(client, budget=budget)
+            for job in parsed:
+                scheduler.add(job)
+            scheduler.subscribe(emit)
+            reporter = (
+                asyncio.ensure_future(report(scheduler)) if status_interval else None
+            )
+            try:
+                await scheduler.run(duration)
+            finally:
+                if reporter is not None:
+                    reporter.cancel()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+@app.command()
+def daemon(
+    socket_path: Optional[Path] = typer.Option(
+        None, "--socket", help="Unix socket to listen on (default: per-user path)"
+    ),
+):
+    """Serve CLI invocations from a warm process over a Unix socket."""
+    from . import daemon as daemon_mod
+
+    global _warm
+    _warm = {}
+    path = socket_path or daemon_mod.default_socket_path()
+    typer.echo(f"Listening on {path}", err=True)
+    daemon_mod.serve(path, _run_in_daemon)
+
+
+def _run_in_daemon(argv: List[str]) -> int:
+    """Run one forwarded invocation; output goes to the current sys.stdout/err."""
+    try:
+        app(prog_name="binance-trader", args=argv)
+    except SystemExit as exc:
+        code = exc.code
+        return code if isinstance(code, int) else (0 if code is None else 1)
+    return 0
 
 
 def main(argv: Optional[list[str]] = None) -> int:  # pragma: no cover - CLI
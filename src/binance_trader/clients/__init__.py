@@ -1,6 +1,7 @@
 """Clients package for binance_trader.
 
-This package groups API clients and the pluggable HTTP requester implementations.
+This package groups API clients, the pluggable HTTP requester implementations
+and the WebSocket streaming client.
 """
 
-__all__ = ["binance", "requester"]
+__all__ = ["binance", "requester", "stream"]
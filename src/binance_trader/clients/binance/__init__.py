@@ -1,5 +1,59 @@
 """Binance client subpackage."""
 
+from .async_client import AsyncBinanceClient
 from .client import BinanceClient
+from .exchange_info import ExchangeInfoCache, ExchangeInfoIndex
+from .klines import KlinesDownloader, iter_klines
+from .models import (
+    BookTicker,
+    DepthSnapshot,
+    ExchangeInfo,
+    Kline,
+    Klines,
+    SymbolInfo,
+    TickerPrice,
+)
+from .orders import (
+    AsyncOrders,
+    ClientOrderIds,
+    FilterTable,
+    OrderRejected,
+    Orders,
+    PreparedOrder,
+    SymbolFilters,
+)
+from .routing import BINANCE_HOSTS, EndpointRouter
+from .signing import ClockOffset, Ed25519Signer, HmacSigner, QueryTemplate
+from .trades import TradeArchive, TradesArchiver, WorkerStats
 
-__all__ = ["BinanceClient"]
+__all__ = [
+    "BinanceClient",
+    "AsyncBinanceClient",
+    "ExchangeInfoCache",
+    "ExchangeInfoIndex",
+    "KlinesDownloader",
+    "iter_klines",
+    "TradesArchiver",
+    "TradeArchive",
+    "WorkerStats",
+    "ExchangeInfo",
+    "SymbolInfo",
+    "TickerPrice",
+    "BookTicker",
+    "Kline",
+    "Klines",
+    "DepthSnapshot",
+    "EndpointRouter",
+    "BINANCE_HOSTS",
+    "HmacSigner",
+    "Ed25519Signer",
+    "ClockOffset",
+    "QueryTemplate",
+    "Orders",
+    "AsyncOrders",
+    "FilterTable",
+    "SymbolFilters",
+    "PreparedOrder",
+    "ClientOrderIds",
+    "OrderRejected",
+]
@@ -0,0 +1,301 @@
+"""Asyncio Binance API client using a pluggable `AsyncRequester`.
+
+`AsyncBinanceClient` mirrors `BinanceClient` with `async def` methods and
+adds fan-out helpers that poll many symbols concurrently, bounded by a
+semaphore so hundreds of symbols don't open hundreds of sockets at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from ..requester import AsyncRequester, RateLimiter
+from .client import Symbols, _BinanceClientBase
+from .models import BookTicker, DepthSnapshot, ExchangeInfo, Klines, TickerPrice
+from .orders import AsyncOrders
+from .signing import ClockOffset, Signer
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBinanceClient(_BinanceClientBase):
+    """Minimal asyncio Binance REST API client.
+
+    Example:
+        from binance_trader.clients.requester import HttpxRequester
+        from binance_trader.clients.binance import AsyncBinanceClient
+
+        async with AsyncBinanceClient(HttpxRequester()) as client:
+            prices = await client.gather_tickers(["BTCUSDT", "ETHUSDT"])
+
+    SIGNED endpoints work as on `BinanceClient` when `api_key` and `signer`
+    are given; the clock offset is measured on the first signed request
+    and refreshed in a background task once stale.
+    """
+
+    def __init__(
+        self,
+        requester: AsyncRequester,
+        base_url: str = "https://api.binance.com",
+        timeout: float | None = None,
+        concurrency: int = 50,
+        api_key: Optional[str] = None,
+        signer: Optional[Signer] = None,
+        recv_window: Optional[int] = 5000,
+    ) -> None:
+        self._requester = requester
+        self.base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self.concurrency = concurrency
+        self.signer = signer
+        self.recv_window = recv_window
+        self._auth_headers = {"X-MBX-APIKEY": api_key} if api_key else None
+        self.clock_offset: Optional[ClockOffset] = None
+        if signer is not None:
+            self.clock_offset = ClockOffset()
+        self._clock_task: Optional[asyncio.Task] = None
+        self.orders = AsyncOrders(self)
+
+    async def __aenter__(self) -> AsyncBinanceClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the requester if it owns closable resources."""
+        aclose = getattr(self._requester, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """The requester's rate limiter, if client-side limiting is enabled."""
+        return self._requester.rate_limiter
+
+    def remaining_weight(self) -> Optional[int]:
+        """Request weight that can be spent now, or None without a limiter."""
+        limiter = self.rate_limiter
+        return limiter.remaining if limiter is not None else None
+
+    async def warmup(self, connections: int = 1) -> int:
+        """Open pooled connections on this loop; see `BinanceClient.warmup`."""
+        return await self._requester.awarmup(self._url("/api/v3/ping"), connections)
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return await self._requester.aget(
+            self._url(path), params=params, timeout=self._timeout
+        )
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET any public endpoint, e.g. `get("/api/v3/avgPrice", {...})`."""
+        return await self._get(path, params=params)
+
+    async def sync_clock(self) -> float:
+        """Measure the server clock offset now and return it in ms."""
+        offset = self.clock_offset
+        if offset is None:
+            raise ValueError("Signed endpoints need api_key and signer")
+        samples = []
+        for _ in range(max(1, offset.samples)):
+            before = time.time() * 1000
+            server = float((await self.time())["serverTime"])
+            samples.append((before, server, time.time() * 1000))
+        offset_ms, rtt_ms = ClockOffset.best_sample(samples)
+        offset.set(offset_ms, rtt_ms)
+        return offset_ms
+
+    async def _background_sync_clock(self) -> None:
+        try:
+            await self.sync_clock()
+        except Exception:  # keep the previous estimate
+            logger.exception("Clock offset refresh failed")
+
+    async def _timestamp(self) -> int:
+        offset = self.clock_offset
+        if offset is None:
+            raise ValueError("Signed endpoints need api_key and signer")
+        if offset.offset_ms is None:
+            await self.sync_clock()
+        elif offset.stale and (self._clock_task is None or self._clock_task.done()):
+            self._clock_task = asyncio.ensure_future(self._background_sync_clock())
+        return offset.now_ms()
+
+    async def signed_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        query: Optional[str] = None,
+    ) -> Any:
+        """Send a SIGNED request; see `BinanceClient.signed_request`."""
+        url = self._signed_url(
+            self.base_url, path, params, query, await self._timestamp()
+        )
+        headers, timeout = self._auth_headers, self._timeout
+        if method == "GET":
+            return await self._requester.aget(url, headers=headers, timeout=timeout)
+        if method == "POST":
+            return await self._requester.apost(url, headers=headers, timeout=timeout)
+        if method == "DELETE":
+            return await self._requester.adelete(url, headers=headers, timeout=timeout)
+        raise ValueError(f"Unsupported method for signed request: {method}")
+
+    async def account(self) -> Any:
+        """Account information and balances (SIGNED)."""
+        return await self.signed_request("GET", "/api/v3/account")
+
+    async def open_orders(self, symbol: Optional[str] = None) -> Any:
+        """Open orders, for one `symbol` or all symbols (SIGNED)."""
+        return await self.signed_request(
+            "GET", "/api/v3/openOrders", {"symbol": symbol}
+        )
+
+    async def ping(self) -> Any:
+        """Test connectivity to the REST API."""
+        return await self._get("/api/v3/ping")
+
+    async def time(self) -> Any:
+        """Get server time."""
+        return await self._get("/api/v3/time")
+
+    async def exchange_info(
+        self, symbol: Optional[str] = None, typed: bool = False
+    ) -> Any:
+        """Get exchange information. Pass `symbol` to filter for a single symbol.
+
+        `typed=True` returns an `ExchangeInfo` instead of the raw dict.
+        """
+        params: Optional[Dict[str, Any]] = {"symbol": symbol} if symbol else None
+        info = await self._get("/api/v3/exchangeInfo", params=params)
+        return ExchangeInfo(info) if typed else info
+
+    async def klines(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: Optional[int] = None,
+        typed: bool = False,
+    ) -> Any:
+        """Get candlesticks for `symbol`. Times are epoch milliseconds.
+
+        `typed=True` returns the rows as column arrays (`Klines`).
+        """
+        params = self._klines_params(symbol, interval, start_time, end_time, limit)
+        rows = await self._get("/api/v3/klines", params=params)
+        return Klines(rows) if typed else rows
+
+    async def agg_trades(
+        self,
+        symbol: str,
+        from_id: Optional[int] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Any:
+        """Get aggregate trades, from trade ID `from_id` or within a time range."""
+        params = self._trades_params(symbol, from_id, start_time, end_time, limit)
+        return await self._get("/api/v3/aggTrades", params=params)
+
+    async def historical_trades(
+        self, symbol: str, from_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Any:
+        """Get individual trades from trade ID `from_id` (default: the latest)."""
+        params = self._trades_params(symbol, from_id, None, None, limit)
+        return await self._get("/api/v3/historicalTrades", params=params)
+
+    async def _ticker(
+        self, path: str, symbols: Symbols, extra: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        batches, wanted = self._ticker_batches(path, symbols, extra)
+        if isinstance(symbols, str):
+            return await self._get(path, params=batches[0])
+        results = await asyncio.gather(
+            *(self._get(path, params=params) for params in batches)
+        )
+        return self._keep([row for rows in results for row in rows], wanted)
+
+    async def ticker_price(self, symbols: Symbols = None, typed: bool = False) -> Any:
+        """Latest prices; see `BinanceClient.ticker_price`.
+
+        Batches of a long symbol list are requested concurrently.
+        """
+        raw = await self._ticker("/api/v3/ticker/price", symbols)
+        return TickerPrice.parse_many(raw) if typed else raw
+
+    async def book_ticker(self, symbols: Symbols = None, typed: bool = False) -> Any:
+        """Best bid/ask price and quantity; see `ticker_price`."""
+        raw = await self._ticker("/api/v3/ticker/bookTicker", symbols)
+        return BookTicker.parse_many(raw) if typed else raw
+
+    async def ticker_24hr(
+        self, symbols: Symbols = None, type: Optional[str] = None
+    ) -> Any:
+        """Rolling 24h statistics; see `BinanceClient.ticker_24hr`."""
+        extra = {"type": type} if type else None
+        return await self._ticker("/api/v3/ticker/24hr", symbols, extra)
+
+    async def depth(self, symbol: str, limit: int = 100, typed: bool = False) -> Any:
+        """Get an order book snapshot for `symbol`.
+
+        `typed=True` returns a `DepthSnapshot` of price/quantity arrays.
+        """
+        raw = await self._get(
+            "/api/v3/depth", params={"symbol": symbol, "limit": limit}
+        )
+        return DepthSnapshot(raw) if typed else raw
+
+    async def _gather(
+        self,
+        symbols: Iterable[str],
+        fetch: Callable[[str], Awaitable[Any]],
+        concurrency: Optional[int],
+        return_exceptions: bool,
+    ) -> Dict[str, Any]:
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def bounded(symbol: str) -> Any:
+            async with semaphore:
+                return await fetch(symbol)
+
+        symbols = list(symbols)
+        results = await asyncio.gather(
+            *(bounded(s) for s in symbols), return_exceptions=return_exceptions
+        )
+        return dict(zip(symbols, results))
+
+    async def gather_tickers(
+        self,
+        symbols: Iterable[str],
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> Dict[str, Any]:
+        """Fetch `ticker_price` for every symbol concurrently.
+
+        One request per symbol; `ticker_price(symbols)` gets the same data
+        in batched requests. Returns a dict keyed by symbol. With
+        `return_exceptions=True` failed symbols map to their exception
+        instead of aborting the whole batch.
+        """
+        return await self._gather(
+            symbols, self.ticker_price, concurrency, return_exceptions
+        )
+
+    async def gather_depths(
+        self,
+        symbols: Iterable[str],
+        limit: int = 100,
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> Dict[str, Any]:
+        """Fetch `depth` for every symbol concurrently; see `gather_tickers`."""
+
+        async def fetch(symbol: str) -> Any:
+            return await self.depth(symbol, limit=limit)
+
+        return await self._gather(symbols, fetch, concurrency, return_exceptions)
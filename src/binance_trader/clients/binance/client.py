@@ -6,12 +6,143 @@ an object implementing `Requester` so the HTTP backend can be swapped easily.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import inspect
+import json
+import os
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Awaitable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
-from ..requester import Requester
+from ..requester import RateLimiter, Requester, request_weight
+from ..requester.resilience import is_host_failure
+from .exchange_info import ExchangeInfoCache
+from .models import BookTicker, DepthSnapshot, ExchangeInfo, Klines, TickerPrice
+from .orders import Orders
+from .routing import EndpointRouter
+from .signing import ClockOffset, Signer, encode_params, sign_query
 
+#: One symbol, a list of symbols, or None for the whole market.
+Symbols = Union[str, Sequence[str], None]
 
-class BinanceClient:
+TickerBatches = Tuple[List[Optional[Dict[str, Any]]], Optional[Set[str]]]
+
+
+class _BinanceClientBase:
+    """URL handling and signing shared by the sync and async clients."""
+
+    base_url: str
+    signer: Optional[Signer]
+    recv_window: Optional[int]
+    _auth_headers: Optional[Dict[str, str]]
+
+    #: Symbols per `symbols=[...]` ticker request; longer lists are split.
+    ticker_batch_size = 100
+
+    def _url(self, path: str) -> str:
+        if path.startswith("/"):
+            return f"{self.base_url}{path}"
+        return f"{self.base_url}/{path}"
+
+    def _signed_url(
+        self,
+        base_url: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        query: Optional[str],
+        timestamp: int,
+    ) -> str:
+        if self.signer is None or self._auth_headers is None:
+            raise ValueError("Signed endpoints need api_key and signer")
+        encoded = encode_params(params)
+        if query:
+            encoded = f"{query}&{encoded}" if encoded else query
+        signed = sign_query(encoded, self.signer, timestamp, self.recv_window)
+        return f"{base_url}{path}?{signed}"
+
+    def _ticker_batches(
+        self, path: str, symbols: Symbols, extra: Optional[Dict[str, Any]] = None
+    ) -> TickerBatches:
+        """Params of the requests covering `symbols` on a ticker endpoint.
+
+        Lists are sent as `symbols=[...]` batches of `ticker_batch_size`,
+        unless the batches together weigh more than one whole-market
+        request; then that request is used and the second value is the set
+        of symbols to keep from its response.
+        """
+        extra = extra or {}
+        if isinstance(symbols, str):
+            return [{"symbol": symbols, **extra}], None
+        if symbols is None:
+            return [dict(extra) or None], None
+        unique = list(dict.fromkeys(symbols))
+        size = self.ticker_batch_size
+        batches: List[Optional[Dict[str, Any]]] = [
+            {
+                "symbols": json.dumps(unique[i : i + size], separators=(",", ":")),
+                **extra,
+            }
+            for i in range(0, len(unique), size)
+        ]
+        if len(batches) > 1:
+            batched = sum(request_weight(path, params) for params in batches)
+            if request_weight(path, extra) <= batched:
+                return [dict(extra) or None], set(unique)
+        return batches, None
+
+    @staticmethod
+    def _keep(rows: List[Any], wanted: Optional[Set[str]]) -> List[Any]:
+        if wanted is None:
+            return rows
+        return [row for row in rows if row["symbol"] in wanted]
+
+    @staticmethod
+    def _klines_params(
+        symbol: str,
+        interval: str,
+        start_time: Optional[int],
+        end_time: Optional[int],
+        limit: Optional[int],
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"symbol": symbol, "interval": interval}
+        if start_time is not None:
+            params["startTime"] = start_time
+        if end_time is not None:
+            params["endTime"] = end_time
+        if limit is not None:
+            params["limit"] = limit
+        return params
+
+    @staticmethod
+    def _trades_params(
+        symbol: str,
+        from_id: Optional[int],
+        start_time: Optional[int],
+        end_time: Optional[int],
+        limit: Optional[int],
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"symbol": symbol}
+        for key, value in (
+            ("fromId", from_id),
+            ("startTime", start_time),
+            ("endTime", end_time),
+            ("limit", limit),
+        ):
+            if value is not None:
+                params[key] = value
+        return params
+
+
+class BinanceClient(_BinanceClientBase):
     """Minimal Binance REST API client.
 
     Example:
@@ -21,6 +152,20 @@ class BinanceClient:
         req = RequestsRequester()
         client = BinanceClient(req)
         client.ping()
+
+    Pass `exchange_info_ttl` (and optionally `exchange_info_path`) to serve
+    `exchange_info()` from an indexed TTL cache instead of downloading the
+    full document on every call.
+
+    Pass `base_urls` (e.g. `routing.BINANCE_HOSTS`) to spread over several
+    equivalent hosts: requests go to the fastest healthy one, as measured
+    by periodic pings, and fail over to the next on 5xx or transport errors.
+
+    Pass `api_key` and a `signer` (`signing.HmacSigner` or
+    `signing.Ed25519Signer`) to call SIGNED endpoints. Timestamps come from
+    a `ClockOffset` estimate (`clock_offset`) instead of a `time()` call per
+    request, and `recv_window` is sent with every signed request. Order
+    endpoints live on `orders` (see `orders.Orders`).
     """
 
     def __init__(
@@ -28,27 +173,305 @@ class BinanceClient:
         requester: Requester,
         base_url: str = "https://api.binance.com",
         timeout: float | None = None,
+        exchange_info_ttl: float | None = None,
+        exchange_info_path: str | os.PathLike[str] | None = None,
+        base_urls: Optional[Sequence[str]] = None,
+        probe_interval: float = 30.0,
+        api_key: Optional[str] = None,
+        signer: Optional[Signer] = None,
+        recv_window: Optional[int] = 5000,
     ) -> None:
         self._requester = requester
-        self.base_url = base_url.rstrip("/")
+        self.base_url = (base_urls[0] if base_urls else base_url).rstrip("/")
         self._timeout = timeout
+        self.router: Optional[EndpointRouter] = None
+        if base_urls:
+            self.router = EndpointRouter(
+                base_urls, self._probe, probe_interval=probe_interval
+            )
+        self.signer = signer
+        self.recv_window = recv_window
+        self._auth_headers = {"X-MBX-APIKEY": api_key} if api_key else None
+        self.clock_offset: Optional[ClockOffset] = None
+        if signer is not None:
+            self.clock_offset = ClockOffset(lambda: self.time()["serverTime"])
+        self.orders = Orders(self)
+        self.exchange_info_cache: Optional[ExchangeInfoCache] = None
+        if exchange_info_ttl is not None or exchange_info_path is not None:
+            self.exchange_info_cache = ExchangeInfoCache(
+                self._fetch_exchange_info,
+                ttl=exchange_info_ttl if exchange_info_ttl is not None else 300.0,
+                path=exchange_info_path,
+            )
 
-    def _url(self, path: str) -> str:
-        if path.startswith("/"):
-            return f"{self.base_url}{path}"
-        return f"{self.base_url}/{path}"
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """The requester's rate limiter, if client-side limiting is enabled."""
+        return self._requester.rate_limiter
+
+    def remaining_weight(self) -> Optional[int]:
+        """Request weight that can be spent now, or None without a limiter."""
+        limiter = self.rate_limiter
+        return limiter.remaining if limiter is not None else None
+
+    def _probe(self, base_url: str) -> Any:
+        return self._requester.get(f"{base_url}/api/v3/ping", timeout=self._timeout)
+
+    def warmup(self, connections: int = 1) -> int:
+        """Open `connections` pooled connections to the API host.
+
+        Call before the first latency-critical request so it does not pay
+        for DNS, TCP and TLS setup. Costs one `ping` (weight 1) per
+        connection; returns how many were opened.
+        """
+        base_url = self.router.best() if self.router is not None else self.base_url
+        return self._requester.warmup(f"{base_url}/api/v3/ping", connections)
+
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET `path`, routed and failed over when several hosts are set.
+
+        Routed requests only update host health; RTTs come from the ping
+        probes, since request times include throttling and body downloads.
+        When the requester answers with an awaitable (an async requester
+        inside an event loop), the preferred host is used without failover.
+        """
+        router = self.router
+        if router is None:
+            return self._requester.get(
+                self._url(path), params=params, timeout=self._timeout
+            )
+        error: Optional[Exception] = None
+        for base_url in router.candidates():
+            try:
+                value = self._requester.get(
+                    f"{base_url}{path}", params=params, timeout=self._timeout
+                )
+            except Exception as exc:
+                if not is_host_failure(exc):
+                    raise
+                router.record_failure(base_url)
+                error = exc
+                continue
+            if inspect.isawaitable(value):
+                return self._await_routed(router, base_url, value)
+            router.record_success(base_url)
+            return value
+        assert error is not None
+        raise error
+
+    @staticmethod
+    async def _await_routed(
+        router: EndpointRouter, base_url: str, pending: Awaitable[Any]
+    ) -> Any:
+        try:
+            value = await pending
+        except Exception as exc:
+            if is_host_failure(exc):
+                router.record_failure(base_url)
+            raise
+        router.record_success(base_url)
+        return value
+
+    @contextmanager
+    def stream(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Iterator[bytes]]:
+        """GET `path` as raw body chunks; see `Requester.stream`.
+
+        Parse with `decoders.iter_json_array`. Goes to the preferred host
+        without failover, since a partly consumed body cannot be retried.
+        """
+        base_url = self.router.best() if self.router is not None else self.base_url
+        with self._requester.stream(
+            f"{base_url}{path}", params=params, timeout=self._timeout
+        ) as chunks:
+            yield chunks
+
+    def signed_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        query: Optional[str] = None,
+    ) -> Any:
+        """Send a SIGNED request.
+
+        `query` is an already encoded query string (see
+        `signing.QueryTemplate`); `params` are encoded after it. Signed
+        requests go to the preferred host without failover, since a failed
+        order request may still have been executed.
+        """
+        if self.clock_offset is None:
+            raise ValueError("Signed endpoints need api_key and signer")
+        base_url = self.router.best() if self.router is not None else self.base_url
+        url = self._signed_url(
+            base_url, path, params, query, self.clock_offset.now_ms()
+        )
+        headers, timeout = self._auth_headers, self._timeout
+        if method == "GET":
+            return self._requester.get(url, headers=headers, timeout=timeout)
+        if method == "POST":
+            return self._requester.post(url, headers=headers, timeout=timeout)
+        if method == "DELETE":
+            return self._requester.delete(url, headers=headers, timeout=timeout)
+        raise ValueError(f"Unsupported method for signed request: {method}")
+
+    def account(self) -> Any:
+        """Account information and balances (SIGNED)."""
+        return self.signed_request("GET", "/api/v3/account")
+
+    def open_orders(self, symbol: Optional[str] = None) -> Any:
+        """Open orders, for one `symbol` or all symbols (SIGNED)."""
+        return self.signed_request("GET", "/api/v3/openOrders", {"symbol": symbol})
 
     def ping(self) -> Any:
         """Test connectivity to the REST API."""
-        return self._requester.get(self._url("/api/v3/ping"), timeout=self._timeout)
+        return self._get("/api/v3/ping")
 
     def time(self) -> Any:
         """Get server time."""
-        return self._requester.get(self._url("/api/v3/time"), timeout=self._timeout)
+        return self._get("/api/v3/time")
 
-    def exchange_info(self, symbol: Optional[str] = None) -> Any:
-        """Get exchange information. Pass `symbol` to filter for a single symbol."""
+    def _fetch_exchange_info(self, symbol: Optional[str] = None) -> Any:
         params: Optional[Dict[str, Any]] = {"symbol": symbol} if symbol else None
-        return self._requester.get(
-            self._url("/api/v3/exchangeInfo"), params=params, timeout=self._timeout
-        )
+        return self._get("/api/v3/exchangeInfo", params=params)
+
+    def exchange_info(self, symbol: Optional[str] = None, typed: bool = False) -> Any:
+        """Get exchange information. Pass `symbol` to filter for a single symbol.
+
+        With a cache configured, symbol lookups are answered from the index;
+        symbols missing from the index fall through to a direct request.
+        `typed=True` returns an `ExchangeInfo` instead of the raw dict.
+        """
+        info = self._exchange_info(symbol)
+        return ExchangeInfo(info) if typed else info
+
+    def _exchange_info(self, symbol: Optional[str]) -> Any:
+        if self.exchange_info_cache is None:
+            return self._fetch_exchange_info(symbol)
+        index = self.exchange_info_cache.get()
+        if symbol is None:
+            return index.document
+        filtered = index.filtered(symbol)
+        if filtered is None:
+            return self._fetch_exchange_info(symbol)
+        return filtered
+
+    def symbol_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Return the exchange info entry for `symbol`, or None if unknown.
+
+        Uses the exchange info cache when configured.
+        """
+        if self.exchange_info_cache is not None:
+            return self.exchange_info_cache.get().symbol(symbol)
+        symbols = self.exchange_info(symbol=symbol).get("symbols", [])
+        return symbols[0] if symbols else None
+
+    def symbols_for_asset(
+        self, base_asset: Optional[str] = None, quote_asset: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Return symbols trading `base_asset` and/or `quote_asset`."""
+        if self.exchange_info_cache is not None:
+            index = self.exchange_info_cache.get()
+            if base_asset is not None and quote_asset is None:
+                return list(index.by_base_asset.get(base_asset.upper(), ()))
+            if quote_asset is not None and base_asset is None:
+                return list(index.by_quote_asset.get(quote_asset.upper(), ()))
+            symbols = index.document.get("symbols", [])
+        else:
+            symbols = self.exchange_info().get("symbols", [])
+        return [
+            s
+            for s in symbols
+            if (base_asset is None or s.get("baseAsset") == base_asset.upper())
+            and (quote_asset is None or s.get("quoteAsset") == quote_asset.upper())
+        ]
+
+    def klines(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: Optional[int] = None,
+        typed: bool = False,
+    ) -> Any:
+        """Get candlesticks for `symbol`. Times are epoch milliseconds.
+
+        Binance returns at most `limit` (max 1000) rows per call; use
+        `KlinesDownloader` to walk long ranges. `typed=True` returns the
+        rows as column arrays (`Klines`).
+        """
+        params = self._klines_params(symbol, interval, start_time, end_time, limit)
+        rows = self._get("/api/v3/klines", params=params)
+        return Klines(rows) if typed else rows
+
+    def depth(self, symbol: str, limit: int = 100, typed: bool = False) -> Any:
+        """Get an order book snapshot (`lastUpdateId`, `bids`, `asks`).
+
+        `typed=True` returns a `DepthSnapshot` of price/quantity arrays.
+        """
+        raw = self._get("/api/v3/depth", params={"symbol": symbol, "limit": limit})
+        return DepthSnapshot(raw) if typed else raw
+
+    def agg_trades(
+        self,
+        symbol: str,
+        from_id: Optional[int] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Any:
+        """Get aggregate trades, from trade ID `from_id` or within a time range.
+
+        Binance allows at most one hour between `start_time` and `end_time`;
+        use `TradesArchiver` to walk long ranges.
+        """
+        params = self._trades_params(symbol, from_id, start_time, end_time, limit)
+        return self._get("/api/v3/aggTrades", params=params)
+
+    def historical_trades(
+        self, symbol: str, from_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Any:
+        """Get individual trades from trade ID `from_id` (default: the latest)."""
+        params = self._trades_params(symbol, from_id, None, None, limit)
+        return self._get("/api/v3/historicalTrades", params=params)
+
+    def _ticker(
+        self, path: str, symbols: Symbols, extra: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        batches, wanted = self._ticker_batches(path, symbols, extra)
+        if isinstance(symbols, str):
+            return self._get(path, params=batches[0])
+        rows: List[Any] = []
+        for params in batches:
+            rows.extend(self._get(path, params=params))
+        return self._keep(rows, wanted)
+
+    def ticker_price(self, symbols: Symbols = None, typed: bool = False) -> Any:
+        """Latest prices.
+
+        A single symbol returns one `{"symbol", "price"}` dict; a list of
+        symbols, or None for the whole market, returns a list. Lists are
+        batched (see `ticker_batch_size`); wrap the result in
+        `market.TickerSnapshot` for columnar access. `typed=True` always
+        returns a list of `TickerPrice`.
+        """
+        raw = self._ticker("/api/v3/ticker/price", symbols)
+        return TickerPrice.parse_many(raw) if typed else raw
+
+    def book_ticker(self, symbols: Symbols = None, typed: bool = False) -> Any:
+        """Best bid/ask price and quantity; see `ticker_price`.
+
+        `typed=True` always returns a list of `BookTicker`.
+        """
+        raw = self._ticker("/api/v3/ticker/bookTicker", symbols)
+        return BookTicker.parse_many(raw) if typed else raw
+
+    def ticker_24hr(self, symbols: Symbols = None, type: Optional[str] = None) -> Any:
+        """Rolling 24h statistics; see `ticker_price`.
+
+        `type="MINI"` omits the bid/ask and change fields from each entry.
+        """
+        extra = {"type": type} if type else None
+        return self._ticker("/api/v3/ticker/24hr", symbols, extra)
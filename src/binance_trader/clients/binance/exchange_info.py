@@ -0,0 +1,176 @@
+"""TTL cache and symbol index for the `/api/v3/exchangeInfo` document.
+
+The full exchange info document is several megabytes and costs request
+weight every time it is downloaded. `ExchangeInfoCache` keeps the parsed
+document in memory (optionally mirrored to a JSON snapshot on disk) and
+wraps it in an `ExchangeInfoIndex` so per-symbol lookups are dict hits
+instead of scans over the `symbols` list.
+
+Stale entries are served immediately while a background thread refreshes
+them, so callers never block on the network once the cache is warm.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ExchangeInfoIndex:
+    """Immutable view over an exchange info document with O(1) lookups."""
+
+    __slots__ = (
+        "document",
+        "fetched_at",
+        "by_symbol",
+        "by_base_asset",
+        "by_quote_asset",
+    )
+
+    def __init__(self, document: Dict[str, Any], fetched_at: float) -> None:
+        self.document = document
+        self.fetched_at = fetched_at
+        self.by_symbol: Dict[str, Dict[str, Any]] = {}
+        self.by_base_asset: Dict[str, List[Dict[str, Any]]] = {}
+        self.by_quote_asset: Dict[str, List[Dict[str, Any]]] = {}
+        for info in document.get("symbols", ()):
+            self.by_symbol[info["symbol"]] = info
+            if "baseAsset" in info:
+                self.by_base_asset.setdefault(info["baseAsset"], []).append(info)
+            if "quoteAsset" in info:
+                self.by_quote_asset.setdefault(info["quoteAsset"], []).append(info)
+
+    def symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Return the raw info dict for `symbol`, or None if it is unknown."""
+        return self.by_symbol.get(symbol.upper())
+
+    def filtered(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Return a document shaped like `exchangeInfo?symbol=...`.
+
+        Returns None when the symbol is not in the index.
+        """
+        info = self.symbol(symbol)
+        if info is None:
+            return None
+        doc = {k: v for k, v in self.document.items() if k != "symbols"}
+        doc["symbols"] = [info]
+        return doc
+
+
+class ExchangeInfoCache:
+    """In-memory TTL cache for exchange info, with an optional disk snapshot.
+
+    Args:
+        fetch: Zero-argument callable returning the full exchange info document.
+        ttl: Seconds after which an entry is considered stale.
+        path: Optional JSON file used to persist the document between runs.
+        clock: Wall-clock function, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Any],
+        ttl: float = 300.0,
+        path: str | os.PathLike[str] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._fetch = fetch
+        self.ttl = ttl
+        self.path = Path(path) if path is not None else None
+        self._clock = clock
+        self._entry: Optional[ExchangeInfoIndex] = None
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def is_stale(self, entry: ExchangeInfoIndex) -> bool:
+        return self._clock() - entry.fetched_at >= self.ttl
+
+    def get(self) -> ExchangeInfoIndex:
+        """Return the cached index, fetching synchronously only on a cold cache.
+
+        A stale entry is returned as-is and a background refresh is started.
+        """
+        entry = self._entry
+        if entry is None:
+            with self._lock:
+                entry = self._entry
+                if entry is None:
+                    entry = self._load_snapshot()
+                    if entry is None:
+                        entry = self._fetch_and_store()
+                    else:
+                        self._entry = entry
+        if self.is_stale(entry):
+            self._refresh_in_background()
+        return entry
+
+    def refresh(self) -> ExchangeInfoIndex:
+        """Fetch a fresh document synchronously and replace the cached entry."""
+        with self._lock:
+            return self._fetch_and_store()
+
+    def invalidate(self) -> None:
+        """Drop the in-memory entry; the next `get()` reloads it."""
+        with self._lock:
+            self._entry = None
+
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> None:
+        """Block until a pending background refresh (if any) has finished."""
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            thread = self._refresh_thread
+            if thread is not None and thread.is_alive():
+                return
+            thread = threading.Thread(
+                target=self._background_refresh,
+                name="exchange-info-refresh",
+                daemon=True,
+            )
+            self._refresh_thread = thread
+        thread.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception:  # keep serving the stale entry
+            logger.exception("Background exchange info refresh failed")
+
+    def _fetch_and_store(self) -> ExchangeInfoIndex:
+        document = self._fetch()
+        entry = ExchangeInfoIndex(document, self._clock())
+        self._entry = entry
+        self._save_snapshot(entry)
+        return entry
+
+    def _load_snapshot(self) -> Optional[ExchangeInfoIndex]:
+        if self.path is None or not self.path.exists():
+            return None
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                raw = json.load(f)
+            return ExchangeInfoIndex(raw["document"], float(raw["fetched_at"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning(
+                "Ignoring unreadable exchange info snapshot at %s", self.path
+            )
+            return None
+
+    def _save_snapshot(self, entry: ExchangeInfoIndex) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"fetched_at": entry.fetched_at, "document": entry.document}, f)
+        os.replace(tmp, self.path)
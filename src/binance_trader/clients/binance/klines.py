@@ -0,0 +1,268 @@
+"""Parallel, resumable historical klines downloader.
+
+`/api/v3/klines` returns at most 1000 candles per call, so a multi-year 1m
+backfill is millions of pages' worth of requests. `KlinesDownloader` splits
+each symbol's range into fixed-size chunks that are walked concurrently on
+a thread pool; request weight is budgeted by the requester's `RateLimiter`
+(if any).
+
+Pages are appended to one NDJSON part file per chunk as soon as they
+arrive, and a JSON checkpoint records each chunk's next start time and the
+byte offset of its part file. After an interruption, `download()` truncates
+every part file back to its checkpointed offset and carries on from there.
+When all chunks are complete the parts are concatenated, in order, into
+`<out_dir>/<SYMBOL>-<interval>.ndjson` (one JSON array per candle).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Protocol
+
+#: Approximate interval lengths in milliseconds, used for range splitting.
+INTERVAL_MS: Dict[str, int] = {
+    "1s": 1_000,
+    "1m": 60_000,
+    "3m": 3 * 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 3_600_000,
+    "2h": 2 * 3_600_000,
+    "4h": 4 * 3_600_000,
+    "6h": 6 * 3_600_000,
+    "8h": 8 * 3_600_000,
+    "12h": 12 * 3_600_000,
+    "1d": 86_400_000,
+    "3d": 3 * 86_400_000,
+    "1w": 7 * 86_400_000,
+    "1M": 31 * 86_400_000,
+}
+
+MAX_LIMIT = 1000
+
+
+class KlinesSource(Protocol):
+    """Anything with a `BinanceClient.klines`-compatible method."""
+
+    def klines(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Any: ...
+
+
+@dataclass
+class _Chunk:
+    symbol: str
+    interval: str
+    start: int
+    end: int  # exclusive
+    part: Path
+
+
+class KlinesDownloader:
+    """Download klines for long time ranges concurrently and resumably.
+
+    Args:
+        client: A `BinanceClient` (or anything exposing `klines`).
+        out_dir: Directory for outputs, part files and checkpoints.
+        max_workers: Number of chunks fetched concurrently.
+        pages_per_chunk: Chunk size, in pages of `limit` candles.
+        limit: Candles per request (Binance maximum: 1000).
+    """
+
+    def __init__(
+        self,
+        client: KlinesSource,
+        out_dir: str | os.PathLike[str],
+        max_workers: int = 4,
+        pages_per_chunk: int = 10,
+        limit: int = MAX_LIMIT,
+    ) -> None:
+        self.client = client
+        self.out_dir = Path(out_dir)
+        self.max_workers = max_workers
+        self.pages_per_chunk = pages_per_chunk
+        self.limit = limit
+        self._lock = threading.Lock()
+
+    def output_path(self, symbol: str, interval: str) -> Path:
+        return self.out_dir / f"{symbol}-{interval}.ndjson"
+
+    def checkpoint_path(self, symbol: str, interval: str) -> Path:
+        return self.out_dir / f"{symbol}-{interval}.checkpoint.json"
+
+    def _parts_dir(self, symbol: str, interval: str) -> Path:
+        return self.out_dir / f"{symbol}-{interval}.parts"
+
+    def download(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: int,
+        end_time: Optional[int] = None,
+    ) -> Path:
+        """Download `[start_time, end_time)` for one symbol; see `download_many`."""
+        return self.download_many([symbol], interval, start_time, end_time)[symbol]
+
+    def download_many(
+        self,
+        symbols: Iterable[str],
+        interval: str,
+        start_time: int,
+        end_time: Optional[int] = None,
+    ) -> Dict[str, Path]:
+        """Download `[start_time, end_time)` (epoch ms) for every symbol.
+
+        Chunks of all symbols share one worker pool. Returns the merged
+        NDJSON file per symbol. Without `end_time`, an interrupted download
+        resumes up to the end it was started with; a new one ends now.
+        """
+        step = INTERVAL_MS[interval]
+        chunk_ms = step * self.limit * self.pages_per_chunk
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+
+        checkpoints: Dict[str, Dict[str, Any]] = {}
+        chunks: List[_Chunk] = []
+        for symbol in symbols:
+            checkpoint = self._load_checkpoint(
+                symbol, interval, start_time, end_time, chunk_ms
+            )
+            checkpoints[symbol] = checkpoint
+            parts = self._parts_dir(symbol, interval)
+            parts.mkdir(exist_ok=True)
+            for key, state in checkpoint["chunks"].items():
+                chunk_start = int(key)
+                if state["next"] is None:
+                    continue
+                chunks.append(
+                    _Chunk(
+                        symbol,
+                        interval,
+                        chunk_start,
+                        min(chunk_start + chunk_ms, checkpoint["end"]),
+                        parts / f"{chunk_start}.ndjson",
+                    )
+                )
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="klines"
+        ) as executor:
+            futures = [
+                executor.submit(self._download_chunk, chunk, checkpoints[chunk.symbol])
+                for chunk in chunks
+            ]
+            for future in futures:
+                future.result()
+
+        return {
+            symbol: self._merge(symbol, interval, checkpoint)
+            for symbol, checkpoint in checkpoints.items()
+        }
+
+    def _load_checkpoint(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: int,
+        end_time: Optional[int],
+        chunk_ms: int,
+    ) -> Dict[str, Any]:
+        path = self.checkpoint_path(symbol, interval)
+        meta = {"start": start_time, "end": end_time, "chunk_ms": chunk_ms}
+        if path.exists():
+            with path.open("r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+            if end_time is None:
+                meta["end"] = checkpoint.get("end")
+            if all(checkpoint.get(k) == v for k, v in meta.items()):
+                return checkpoint
+            raise ValueError(
+                f"Checkpoint {path} was written for a different range; "
+                "delete it to start over."
+            )
+        if end_time is None:
+            end_time = meta["end"] = int(time.time() * 1000)
+        chunks = {
+            str(t): {"next": t, "offset": 0}
+            for t in range(start_time, end_time, chunk_ms)
+        }
+        checkpoint = {**meta, "symbol": symbol, "interval": interval, "chunks": chunks}
+        self._save_checkpoint(symbol, interval, checkpoint)
+        return checkpoint
+
+    def _save_checkpoint(
+        self, symbol: str, interval: str, checkpoint: Dict[str, Any]
+    ) -> None:
+        path = self.checkpoint_path(symbol, interval)
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp, path)
+
+    def _download_chunk(self, chunk: _Chunk, checkpoint: Dict[str, Any]) -> None:
+        state = checkpoint["chunks"][str(chunk.start)]
+        with self._lock:
+            next_start, offset = state["next"], state["offset"]
+
+        mode = "r+b" if chunk.part.exists() else "wb"
+        with chunk.part.open(mode) as f:
+            # Drop anything written after the last checkpoint.
+            f.truncate(offset)
+            f.seek(offset)
+            while next_start is not None:
+                rows = self.client.klines(
+                    chunk.symbol,
+                    chunk.interval,
+                    start_time=next_start,
+                    end_time=chunk.end - 1,
+                    limit=self.limit,
+                )
+                for row in rows:
+                    f.write(json.dumps(row, separators=(",", ":")).encode())
+                    f.write(b"\n")
+                f.flush()
+                if not rows or len(rows) < self.limit:
+                    next_start = None
+                else:
+                    # Close time + 1ms is the next candle's open time.
+                    next_start = int(rows[-1][6]) + 1
+                    if next_start >= chunk.end:
+                        next_start = None
+                with self._lock:
+                    state["next"], state["offset"] = next_start, f.tell()
+                    self._save_checkpoint(chunk.symbol, chunk.interval, checkpoint)
+
+    def _merge(self, symbol: str, interval: str, checkpoint: Dict[str, Any]) -> Path:
+        out = self.output_path(symbol, interval)
+        parts = self._parts_dir(symbol, interval)
+        tmp = out.with_name(out.name + ".tmp")
+        with tmp.open("wb") as dst:
+            for key in sorted(checkpoint["chunks"], key=int):
+                part = parts / f"{key}.ndjson"
+                if part.exists():
+                    with part.open("rb") as src:
+                        shutil.copyfileobj(src, dst)
+        os.replace(tmp, out)
+        shutil.rmtree(parts)
+        self.checkpoint_path(symbol, interval).unlink()
+        return out
+
+
+def iter_klines(path: str | os.PathLike[str]) -> Iterator[List[Any]]:
+    """Stream candles back from a file written by `KlinesDownloader`."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
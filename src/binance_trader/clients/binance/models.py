@@ -0,0 +1,223 @@
+"""Compact typed models for the hot Binance REST responses.
+
+The raw responses keep every number as a string, so downstream code ends
+up converting the same price over and over. These models convert once, at
+parse time, and store the result compactly:
+
+- `SymbolInfo`, `TickerPrice`, `BookTicker`: `__slots__` records.
+- `Klines` and `DepthSnapshot`: column arrays (`array.array`) with row
+  accessors, a fraction of the memory of nested lists of strings.
+
+Numbers become `float` by default; pass `number=Decimal` to the record
+parsers when exact decimal arithmetic matters. The client builds them when
+called with `typed=True` (`klines`, `depth`, `ticker_price`, `book_ticker`,
+`exchange_info`).
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence
+
+Number = Callable[[str], Any]
+
+
+class SymbolInfo:
+    """Trading rules for one symbol, with the common filters pre-parsed."""
+
+    __slots__ = (
+        "symbol",
+        "status",
+        "base_asset",
+        "quote_asset",
+        "tick_size",
+        "min_price",
+        "max_price",
+        "step_size",
+        "min_qty",
+        "max_qty",
+        "min_notional",
+        "filters",
+    )
+
+    def __init__(self, raw: Mapping[str, Any], number: Number = float) -> None:
+        self.symbol: str = raw["symbol"]
+        self.status: str = raw.get("status", "")
+        self.base_asset: str = raw.get("baseAsset", "")
+        self.quote_asset: str = raw.get("quoteAsset", "")
+        self.filters: Dict[str, Mapping[str, Any]] = {
+            f["filterType"]: f for f in raw.get("filters", ())
+        }
+        price = self.filters.get("PRICE_FILTER", {})
+        lot = self.filters.get("LOT_SIZE", {})
+        notional = self.filters.get("NOTIONAL") or self.filters.get("MIN_NOTIONAL", {})
+        self.tick_size = number(price.get("tickSize", "0"))
+        self.min_price = number(price.get("minPrice", "0"))
+        self.max_price = number(price.get("maxPrice", "0"))
+        self.step_size = number(lot.get("stepSize", "0"))
+        self.min_qty = number(lot.get("minQty", "0"))
+        self.max_qty = number(lot.get("maxQty", "0"))
+        self.min_notional = number(notional.get("minNotional", "0"))
+
+    def __repr__(self) -> str:
+        return f"SymbolInfo({self.symbol!r}, status={self.status!r})"
+
+
+class ExchangeInfo:
+    """Parsed `/api/v3/exchangeInfo`: `SymbolInfo` records keyed by symbol."""
+
+    __slots__ = ("server_time", "timezone", "rate_limits", "symbols")
+
+    def __init__(self, raw: Mapping[str, Any], number: Number = float) -> None:
+        self.server_time: Optional[int] = raw.get("serverTime")
+        self.timezone: Optional[str] = raw.get("timezone")
+        self.rate_limits: List[Mapping[str, Any]] = list(raw.get("rateLimits", ()))
+        self.symbols: Dict[str, SymbolInfo] = {
+            s["symbol"]: SymbolInfo(s, number) for s in raw.get("symbols", ())
+        }
+
+    def __getitem__(self, symbol: str) -> SymbolInfo:
+        return self.symbols[symbol]
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+
+class TickerPrice:
+    """`/api/v3/ticker/price` entry."""
+
+    __slots__ = ("symbol", "price")
+
+    def __init__(self, raw: Mapping[str, Any], number: Number = float) -> None:
+        self.symbol: str = raw["symbol"]
+        self.price = number(raw["price"])
+
+    def __repr__(self) -> str:
+        return f"TickerPrice({self.symbol!r}, {self.price!r})"
+
+    @classmethod
+    def parse_many(
+        cls,
+        raw: Sequence[Mapping[str, Any]] | Mapping[str, Any],
+        number: Number = float,
+    ) -> List[TickerPrice]:
+        """Parse a single ticker or a list of them into a list."""
+        items = [raw] if isinstance(raw, Mapping) else raw
+        return [cls(item, number) for item in items]
+
+
+class BookTicker:
+    """`/api/v3/ticker/bookTicker` entry."""
+
+    __slots__ = ("symbol", "bid_price", "bid_qty", "ask_price", "ask_qty")
+
+    def __init__(self, raw: Mapping[str, Any], number: Number = float) -> None:
+        self.symbol: str = raw["symbol"]
+        self.bid_price = number(raw["bidPrice"])
+        self.bid_qty = number(raw["bidQty"])
+        self.ask_price = number(raw["askPrice"])
+        self.ask_qty = number(raw["askQty"])
+
+    def __repr__(self) -> str:
+        return (
+            f"BookTicker({self.symbol!r},"
+            f" bid={self.bid_price!r}, ask={self.ask_price!r})"
+        )
+
+    @classmethod
+    def parse_many(
+        cls,
+        raw: Sequence[Mapping[str, Any]] | Mapping[str, Any],
+        number: Number = float,
+    ) -> List[BookTicker]:
+        """Parse a single book ticker or a list of them into a list."""
+        items = [raw] if isinstance(raw, Mapping) else raw
+        return [cls(item, number) for item in items]
+
+
+class Kline:
+    """One candle, as returned by indexing `Klines`."""
+
+    __slots__ = ("open_time", "open", "high", "low", "close", "volume", "close_time")
+
+    def __init__(
+        self,
+        open_time: int,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        close_time: int,
+    ) -> None:
+        self.open_time = open_time
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.close_time = close_time
+
+    def __repr__(self) -> str:
+        return f"Kline(open_time={self.open_time}, close={self.close})"
+
+
+class Klines:
+    """Column-oriented `/api/v3/klines` result.
+
+    Columns are `array.array` ("q" for times, "d" for prices and volumes).
+    """
+
+    __slots__ = ("open_time", "open", "high", "low", "close", "volume", "close_time")
+
+    def __init__(self, rows: Sequence[Sequence[Any]] = ()) -> None:
+        self.open_time = array("q", [int(r[0]) for r in rows])
+        self.open = array("d", [float(r[1]) for r in rows])
+        self.high = array("d", [float(r[2]) for r in rows])
+        self.low = array("d", [float(r[3]) for r in rows])
+        self.close = array("d", [float(r[4]) for r in rows])
+        self.volume = array("d", [float(r[5]) for r in rows])
+        self.close_time = array("q", [int(r[6]) for r in rows])
+
+    def __len__(self) -> int:
+        return len(self.open_time)
+
+    def __getitem__(self, i: int) -> Kline:
+        return Kline(
+            self.open_time[i],
+            self.open[i],
+            self.high[i],
+            self.low[i],
+            self.close[i],
+            self.volume[i],
+            self.close_time[i],
+        )
+
+    def __iter__(self) -> Iterator[Kline]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def extend(self, rows: Sequence[Sequence[Any]]) -> None:
+        """Append more raw rows (e.g. the next page)."""
+        other = Klines(rows)
+        for name in self.__slots__:
+            getattr(self, name).extend(getattr(other, name))
+
+
+class DepthSnapshot:
+    """`/api/v3/depth` with each side stored as price/quantity arrays."""
+
+    __slots__ = ("last_update_id", "bid_prices", "bid_qtys", "ask_prices", "ask_qtys")
+
+    def __init__(self, raw: Mapping[str, Any]) -> None:
+        self.last_update_id = int(raw["lastUpdateId"])
+        self.bid_prices = array("d", [float(p) for p, _ in raw["bids"]])
+        self.bid_qtys = array("d", [float(q) for _, q in raw["bids"]])
+        self.ask_prices = array("d", [float(p) for p, _ in raw["asks"]])
+        self.ask_qtys = array("d", [float(q) for _, q in raw["asks"]])
+
+    def __repr__(self) -> str:
+        return (
+            f"DepthSnapshot(last_update_id={self.last_update_id},"
+            f" bids={len(self.bid_prices)}, asks={len(self.ask_prices)})"
+        )
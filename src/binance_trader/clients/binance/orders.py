@@ -0,0 +1,661 @@
+"""Order placement with symbol filters compiled ahead of time.
+
+Binance rejects orders whose price or quantity do not sit on the symbol's
+tick/step grid or fall outside its limits, after a full round-trip. To
+catch that locally without walking the raw `filters` list on every order,
+`FilterTable` compiles the exchange info once into one `SymbolFilters`
+record per symbol holding exactly what is needed to round and check:
+tick and step sizes with their decimal places, min/max price and quantity
+(separately for MARKET orders) and the notional bounds.
+
+`Orders` (sync, `BinanceClient.orders`) and `AsyncOrders`
+(`AsyncBinanceClient.orders`) then split an order in two steps:
+
+- `prepare` quantizes, validates and encodes the order into a
+  `PreparedOrder` (a few microseconds, no I/O);
+- `submit` only adds timestamp and signature and sends it.
+
+`place` does both. Every prepared order carries a `newClientOrderId`, but
+that does not make re-submitting safe: Binance rejects a duplicate id only
+while the original order is still open, so a filled MARKET or IOC order sent
+again places a second order. After a timeout, call `lookup(order)` (a
+`GET /api/v3/order?origClientOrderId=...`) and re-submit only if it returns
+None, i.e. the exchange never received the order.
+
+Filters that depend on market data or account state (`PERCENT_PRICE*`,
+`MAX_NUM_ORDERS`, ...) are left to the exchange.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Mapping, Optional
+from urllib.parse import quote
+
+from .signing import encode_params
+
+if TYPE_CHECKING:
+    from .async_client import AsyncBinanceClient
+    from .client import BinanceClient
+
+# Slack for float division landing just below a grid point (0.3 / 0.1).
+_EPS = 1e-9
+
+MARKET_TYPES = frozenset({"MARKET"})
+
+
+#: Binance error code for "Order does not exist."
+ORDER_DOES_NOT_EXIST = -2013
+
+
+def order_missing(exc: BaseException) -> bool:
+    """True if `exc` is the exchange's "Order does not exist." error."""
+    response = getattr(exc, "response", None)
+    try:
+        return response.json().get("code") == ORDER_DOES_NOT_EXIST  # type: ignore[union-attr]
+    except Exception:
+        return False
+
+
+class OrderRejected(ValueError):
+    """An order failed local validation; `filter` names the failed rule."""
+
+    def __init__(self, symbol: str, filter: str, message: str) -> None:
+        super().__init__(f"{symbol}: {message} ({filter})")
+        self.symbol = symbol
+        self.filter = filter
+
+
+def _decimals(value: str) -> int:
+    """Decimal places of a step string: "0.00100000" -> 3, "1.00" -> 0."""
+    _, _, fraction = value.partition(".")
+    return len(fraction.rstrip("0"))
+
+
+def _format(value: float, decimals: int) -> str:
+    return f"{value:.{decimals}f}"
+
+
+class SymbolFilters:
+    """Compiled price/quantity rules of one symbol.
+
+    Sizes and limits are floats; a size of 0 means the rule is disabled,
+    as in the exchange info. `*_decimals` are the decimal places used to
+    print quantized values.
+    """
+
+    __slots__ = (
+        "symbol",
+        "status",
+        "order_types",
+        "tick",
+        "price_decimals",
+        "min_price",
+        "max_price",
+        "step",
+        "qty_decimals",
+        "min_qty",
+        "max_qty",
+        "market_step",
+        "market_qty_decimals",
+        "market_min_qty",
+        "market_max_qty",
+        "min_notional",
+        "max_notional",
+        "min_notional_market",
+        "max_notional_market",
+    )
+
+    def __init__(self, raw: Mapping[str, Any]) -> None:
+        filters = {f["filterType"]: f for f in raw.get("filters", ())}
+        price = filters.get("PRICE_FILTER", {})
+        lot = filters.get("LOT_SIZE", {})
+        market = filters.get("MARKET_LOT_SIZE", {})
+        self.symbol: str = raw["symbol"]
+        self.status: str = raw.get("status", "TRADING")
+        self.order_types = frozenset(raw.get("orderTypes", ()))
+        tick = price.get("tickSize", "0")
+        self.tick = float(tick)
+        self.price_decimals = _decimals(tick)
+        self.min_price = float(price.get("minPrice", "0"))
+        self.max_price = float(price.get("maxPrice", "0"))
+        step = lot.get("stepSize", "0")
+        self.step = float(step)
+        self.qty_decimals = _decimals(step)
+        self.min_qty = float(lot.get("minQty", "0"))
+        self.max_qty = float(lot.get("maxQty", "0"))
+        # MARKET_LOT_SIZE with zero step falls back to LOT_SIZE rounding.
+        market_step = market.get("stepSize", "0")
+        if float(market_step) > 0:
+            self.market_step = float(market_step)
+            self.market_qty_decimals = _decimals(market_step)
+        else:
+            self.market_step = self.step
+            self.market_qty_decimals = self.qty_decimals
+        self.market_min_qty = max(float(market.get("minQty", "0")), self.min_qty)
+        market_max = float(market.get("maxQty", "0"))
+        self.market_max_qty = market_max if market_max > 0 else self.max_qty
+        self.min_notional = self.max_notional = 0.0
+        self.min_notional_market = self.max_notional_market = False
+        if "NOTIONAL" in filters:
+            notional = filters["NOTIONAL"]
+            self.min_notional = float(notional.get("minNotional", "0"))
+            self.max_notional = float(notional.get("maxNotional", "0"))
+            self.min_notional_market = bool(notional.get("applyMinToMarket"))
+            self.max_notional_market = bool(notional.get("applyMaxToMarket"))
+        elif "MIN_NOTIONAL" in filters:
+            notional = filters["MIN_NOTIONAL"]
+            self.min_notional = float(notional.get("minNotional", "0"))
+            self.min_notional_market = bool(notional.get("applyToMarket"))
+
+    def __repr__(self) -> str:
+        return f"SymbolFilters({self.symbol!r}, tick={self.tick}, step={self.step})"
+
+    def price_units(self, price: float, side: Optional[str] = None) -> float:
+        """`price` on the tick grid: down for BUY, up for SELL, else nearest.
+
+        Rounding towards the passive side never makes a limit order pay
+        more (or receive less) than asked.
+        """
+        tick = self.tick
+        if tick <= 0:
+            return price
+        units = price / tick
+        if side == "BUY":
+            return math.floor(units + _EPS) * tick
+        if side == "SELL":
+            return math.ceil(units - _EPS) * tick
+        return round(units) * tick
+
+    def quantize_price(self, price: float, side: Optional[str] = None) -> str:
+        """`price_units` formatted with the tick's decimal places."""
+        if self.tick <= 0:
+            return _format(price, 8).rstrip("0").rstrip(".") or "0"
+        return _format(self.price_units(price, side), self.price_decimals)
+
+    def quantity_units(self, quantity: float, market: bool = False) -> float:
+        """`quantity` rounded down to the (market) lot step."""
+        step = self.market_step if market else self.step
+        if step <= 0:
+            return quantity
+        return math.floor(quantity / step + _EPS) * step
+
+    def quantize_quantity(self, quantity: float, market: bool = False) -> str:
+        decimals = self.market_qty_decimals if market else self.qty_decimals
+        if (self.market_step if market else self.step) <= 0:
+            return _format(quantity, 8).rstrip("0").rstrip(".") or "0"
+        return _format(self.quantity_units(quantity, market), decimals)
+
+    def check(
+        self,
+        order_type: str,
+        quantity: Optional[float] = None,
+        price: Optional[float] = None,
+    ) -> None:
+        """Raise `OrderRejected` if already-quantized values break a rule.
+
+        `price` is the limit price, or for MARKET orders an optional
+        reference price used for the notional check.
+        """
+        symbol = self.symbol
+        if self.status != "TRADING":
+            raise OrderRejected(symbol, "STATUS", f"symbol is {self.status}")
+        if self.order_types and order_type not in self.order_types:
+            raise OrderRejected(symbol, "ORDER_TYPE", f"{order_type} not allowed")
+        market = order_type in MARKET_TYPES
+        if price is not None and not market:
+            if price <= 0 or price < self.min_price:
+                raise OrderRejected(symbol, "PRICE_FILTER", f"price {price} too low")
+            if self.max_price > 0 and price > self.max_price:
+                raise OrderRejected(symbol, "PRICE_FILTER", f"price {price} too high")
+        if quantity is None:
+            return
+        min_qty = self.market_min_qty if market else self.min_qty
+        max_qty = self.market_max_qty if market else self.max_qty
+        lot = "MARKET_LOT_SIZE" if market else "LOT_SIZE"
+        if quantity <= 0 or quantity < min_qty - _EPS * min_qty:
+            raise OrderRejected(symbol, lot, f"quantity {quantity} below {min_qty}")
+        if max_qty > 0 and quantity > max_qty:
+            raise OrderRejected(symbol, lot, f"quantity {quantity} above {max_qty}")
+        if price is None:
+            return
+        notional = price * quantity
+        if (not market or self.min_notional_market) and notional < self.min_notional:
+            raise OrderRejected(
+                symbol, "NOTIONAL", f"notional {notional:g} below {self.min_notional:g}"
+            )
+        if (
+            self.max_notional > 0
+            and (not market or self.max_notional_market)
+            and notional > self.max_notional
+        ):
+            raise OrderRejected(
+                symbol, "NOTIONAL", f"notional {notional:g} above {self.max_notional:g}"
+            )
+
+
+class FilterTable:
+    """`SymbolFilters` for every symbol of an exchange info document."""
+
+    __slots__ = ("symbols", "source")
+
+    def __init__(self, symbols: Iterable[Mapping[str, Any]] = ()) -> None:
+        self.symbols: Dict[str, SymbolFilters] = {
+            s["symbol"]: SymbolFilters(s) for s in symbols
+        }
+        self.source: Optional[Mapping[str, Any]] = None
+
+    @classmethod
+    def from_exchange_info(cls, document: Mapping[str, Any]) -> FilterTable:
+        table = cls(document.get("symbols", ()))
+        table.source = document
+        return table
+
+    def __getitem__(self, symbol: str) -> SymbolFilters:
+        try:
+            return self.symbols[symbol]
+        except KeyError:
+            raise OrderRejected(symbol, "SYMBOL", "unknown symbol") from None
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self.symbols
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+
+class ClientOrderIds:
+    """Generator of unique `newClientOrderId`s.
+
+    Ids are `<prefix><session>-<counter>`: the session part (start time
+    and process id in base 36) keeps ids from different runs apart and the
+    counter makes them unique within a run. Binance allows up to 36
+    characters matching `^[.A-Z:/a-z0-9_-]{1,36}$`.
+    """
+
+    def __init__(self, prefix: str = "bt") -> None:
+        session = f"{_base36(int(time.time() * 1000))}{_base36(os.getpid())}"
+        self.prefix = f"{prefix}{session}-"
+        if len(self.prefix) > 28:
+            raise ValueError("Client order id prefix too long")
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def next(self) -> str:
+        with self._lock:
+            n = next(self._counter)
+        return f"{self.prefix}{_base36(n)}"
+
+
+def _base36(n: int) -> str:
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    out = ""
+    while True:
+        n, r = divmod(n, 36)
+        out = digits[r] + out
+        if not n:
+            return out
+
+
+class PreparedOrder:
+    """A validated, encoded order ready to be signed and sent.
+
+    `query` holds every order parameter except `recvWindow`, `timestamp`
+    and `signature`. Submitting the same instance twice reuses its
+    `client_order_id`, which does not prevent a second order once the
+    first is filled; check with `Orders.lookup` before re-submitting.
+    """
+
+    __slots__ = (
+        "symbol",
+        "side",
+        "type",
+        "quantity",
+        "price",
+        "client_order_id",
+        "query",
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        side: str,
+        type: str,
+        quantity: Optional[str],
+        price: Optional[str],
+        client_order_id: str,
+        query: str,
+    ) -> None:
+        self.symbol = symbol
+        self.side = side
+        self.type = type
+        self.quantity = quantity
+        self.price = price
+        self.client_order_id = client_order_id
+        self.query = query
+
+    def __repr__(self) -> str:
+        return f"PreparedOrder({self.query!r})"
+
+
+class _OrderBuilder:
+    """Validation and encoding shared by `Orders` and `AsyncOrders`."""
+
+    ORDER_PATH = "/api/v3/order"
+    TEST_PATH = "/api/v3/order/test"
+    CANCEL_REPLACE_PATH = "/api/v3/order/cancelReplace"
+
+    def __init__(
+        self,
+        filters: Optional[FilterTable] = None,
+        ids: Optional[ClientOrderIds] = None,
+        validate: bool = True,
+    ) -> None:
+        self._filters = filters
+        self.ids = ids or ClientOrderIds()
+        self.validate = validate
+
+    @property
+    def filters(self) -> FilterTable:
+        if self._filters is None:
+            raise RuntimeError("Symbol filters are not loaded")
+        return self._filters
+
+    @filters.setter
+    def filters(self, table: FilterTable) -> None:
+        self._filters = table
+
+    def prepare(
+        self,
+        symbol: str,
+        side: str,
+        type: str = "LIMIT",
+        quantity: Optional[float] = None,
+        price: Optional[float] = None,
+        time_in_force: Optional[str] = None,
+        quote_quantity: Optional[float] = None,
+        stop_price: Optional[float] = None,
+        client_order_id: Optional[str] = None,
+        **extra: Any,
+    ) -> PreparedOrder:
+        """Quantize, validate and encode an order (no I/O).
+
+        Quantities are rounded down to the lot step and prices to the tick
+        (see `SymbolFilters.price_units`). For MARKET orders `price` is only
+        a reference for the notional check and is not sent. LIMIT orders
+        default to GTC.
+        `extra` params (e.g. `newOrderRespType="RESULT"`) are sent as is.
+        """
+        side = side.upper()
+        type = type.upper()
+        market = type in MARKET_TYPES
+        rules = self.filters[symbol] if self.validate else None
+        qty_str = price_str = None
+        qty_value = price_value = None
+        if quantity is not None:
+            if rules is not None:
+                qty_value = rules.quantity_units(quantity, market)
+                qty_str = rules.quantize_quantity(quantity, market)
+            else:
+                qty_value, qty_str = quantity, str(quantity)
+        if price is not None:
+            if rules is not None:
+                price_value = rules.price_units(price, side)
+                price_str = rules.quantize_price(price, side)
+            else:
+                price_value, price_str = price, str(price)
+        if rules is not None:
+            rules.check(type, qty_value, price_value)
+        if type == "LIMIT" and time_in_force is None:
+            time_in_force = "GTC"
+        client_order_id = client_order_id or self.ids.next()
+        parts = [f"symbol={symbol}", f"side={side}", f"type={type}"]
+        if time_in_force is not None:
+            parts.append(f"timeInForce={time_in_force}")
+        if qty_str is not None:
+            parts.append(f"quantity={qty_str}")
+        if quote_quantity is not None:
+            parts.append(f"quoteOrderQty={quote_quantity}")
+        if price_str is not None and not market:
+            parts.append(f"price={price_str}")
+        if stop_price is not None:
+            stop = rules.quantize_price(stop_price) if rules else stop_price
+            parts.append(f"stopPrice={stop}")
+        parts.append(f"newClientOrderId={quote(client_order_id, safe='')}")
+        if extra:
+            parts.append(encode_params(extra))
+        return PreparedOrder(
+            symbol, side, type, qty_str, price_str, client_order_id, "&".join(parts)
+        )
+
+    @staticmethod
+    def _order_params(
+        symbol: str, order_id: Optional[int], client_order_id: Optional[str]
+    ) -> Dict[str, Any]:
+        if order_id is None and client_order_id is None:
+            raise ValueError("Pass order_id or client_order_id")
+        return {
+            "symbol": symbol,
+            "orderId": order_id,
+            "origClientOrderId": client_order_id,
+        }
+
+    @staticmethod
+    def _cancel_replace_query(
+        order: PreparedOrder,
+        cancel_order_id: Optional[int],
+        cancel_client_order_id: Optional[str],
+        mode: str,
+    ) -> str:
+        if cancel_order_id is None and cancel_client_order_id is None:
+            raise ValueError("Pass cancel_order_id or cancel_client_order_id")
+        cancel = encode_params(
+            {
+                "cancelReplaceMode": mode,
+                "cancelOrderId": cancel_order_id,
+                "cancelOrigClientOrderId": cancel_client_order_id,
+            }
+        )
+        return f"{order.query}&{cancel}"
+
+
+class Orders(_OrderBuilder):
+    """Order endpoints of a `BinanceClient` (SIGNED).
+
+    Filters are compiled from `client.exchange_info()` on first use and
+    recompiled whenever the client's exchange info cache refreshes;
+    without a cache call `load_filters()` to pick up changes.
+
+    Example:
+        order = client.orders.prepare("BTCUSDT", "BUY", quantity=0.0012345, price=30000.123)
+        client.orders.submit(order)
+    """
+
+    def __init__(
+        self,
+        client: BinanceClient,
+        filters: Optional[FilterTable] = None,
+        ids: Optional[ClientOrderIds] = None,
+        validate: bool = True,
+    ) -> None:
+        super().__init__(filters, ids, validate)
+        self._client = client
+        self._lock = threading.Lock()
+
+    @property
+    def filters(self) -> FilterTable:
+        table = self._filters
+        cache = self._client.exchange_info_cache
+        if table is None or (
+            cache is not None and cache.get().document is not table.source
+        ):
+            table = self.load_filters()
+        return table
+
+    @filters.setter
+    def filters(self, table: FilterTable) -> None:
+        self._filters = table
+
+    def load_filters(self) -> FilterTable:
+        """(Re)compile the filter table from the client's exchange info."""
+        with self._lock:
+            document = self._client.exchange_info()
+            table = self._filters
+            if table is None or table.source is not document:
+                table = self._filters = FilterTable.from_exchange_info(document)
+            return table
+
+    def submit(self, order: PreparedOrder, test: bool = False) -> Any:
+        """Send a prepared order; `test=True` uses the test endpoint.
+
+        If the call times out, the order may still have been placed: check
+        `lookup(order)` before sending it again.
+        """
+        path = self.TEST_PATH if test else self.ORDER_PATH
+        return self._client.signed_request("POST", path, query=order.query)
+
+    def place(self, symbol: str, side: str, **kwargs: Any) -> Any:
+        """`prepare` and `submit` an order; see `prepare` for arguments."""
+        return self.submit(self.prepare(symbol, side, **kwargs))
+
+    def test(self, symbol: str, side: str, **kwargs: Any) -> Any:
+        """Validate an order on the exchange without placing it."""
+        return self.submit(self.prepare(symbol, side, **kwargs), test=True)
+
+    def query(
+        self,
+        symbol: str,
+        order_id: Optional[int] = None,
+        client_order_id: Optional[str] = None,
+    ) -> Any:
+        """Status of an order, by exchange or client order id."""
+        params = self._order_params(symbol, order_id, client_order_id)
+        return self._client.signed_request("GET", self.ORDER_PATH, params)
+
+    def lookup(self, order: PreparedOrder) -> Optional[Any]:
+        """The exchange's record of `order`, or None if it never arrived.
+
+        Use after a submit timed out: re-submit only on None.
+        """
+        try:
+            return self.query(order.symbol, client_order_id=order.client_order_id)
+        except Exception as exc:
+            if order_missing(exc):
+                return None
+            raise
+
+    def cancel(
+        self,
+        symbol: str,
+        order_id: Optional[int] = None,
+        client_order_id: Optional[str] = None,
+    ) -> Any:
+        params = self._order_params(symbol, order_id, client_order_id)
+        return self._client.signed_request("DELETE", self.ORDER_PATH, params)
+
+    def cancel_replace(
+        self,
+        symbol: str,
+        side: str,
+        cancel_order_id: Optional[int] = None,
+        cancel_client_order_id: Optional[str] = None,
+        mode: str = "STOP_ON_FAILURE",
+        **kwargs: Any,
+    ) -> Any:
+        """Cancel an order and place a new one in a single request."""
+        order = self.prepare(symbol, side, **kwargs)
+        query = self._cancel_replace_query(
+            order, cancel_order_id, cancel_client_order_id, mode
+        )
+        return self._client.signed_request(
+            "POST", self.CANCEL_REPLACE_PATH, query=query
+        )
+
+
+class AsyncOrders(_OrderBuilder):
+    """Order endpoints of an `AsyncBinanceClient` (SIGNED).
+
+    `prepare` is synchronous and needs the filters loaded; the async
+    methods load them on first use, or call `await load_filters()` ahead
+    of time.
+    """
+
+    def __init__(
+        self,
+        client: AsyncBinanceClient,
+        filters: Optional[FilterTable] = None,
+        ids: Optional[ClientOrderIds] = None,
+        validate: bool = True,
+    ) -> None:
+        super().__init__(filters, ids, validate)
+        self._client = client
+
+    async def load_filters(self) -> FilterTable:
+        document = await self._client.exchange_info()
+        self._filters = FilterTable.from_exchange_info(document)
+        return self._filters
+
+    async def _ensure_filters(self) -> None:
+        if self.validate and self._filters is None:
+            await self.load_filters()
+
+    async def submit(self, order: PreparedOrder, test: bool = False) -> Any:
+        path = self.TEST_PATH if test else self.ORDER_PATH
+        return await self._client.signed_request("POST", path, query=order.query)
+
+    async def place(self, symbol: str, side: str, **kwargs: Any) -> Any:
+        await self._ensure_filters()
+        return await self.submit(self.prepare(symbol, side, **kwargs))
+
+    async def test(self, symbol: str, side: str, **kwargs: Any) -> Any:
+        await self._ensure_filters()
+        return await self.submit(self.prepare(symbol, side, **kwargs), test=True)
+
+    async def query(
+        self,
+        symbol: str,
+        order_id: Optional[int] = None,
+        client_order_id: Optional[str] = None,
+    ) -> Any:
+        params = self._order_params(symbol, order_id, client_order_id)
+        return await self._client.signed_request("GET", self.ORDER_PATH, params)
+
+    async def lookup(self, order: PreparedOrder) -> Optional[Any]:
+        """See `Orders.lookup`."""
+        try:
+            return await self.query(order.symbol, client_order_id=order.client_order_id)
+        except Exception as exc:
+            if order_missing(exc):
+                return None
+            raise
+
+    async def cancel(
+        self,
+        symbol: str,
+        order_id: Optional[int] = None,
+        client_order_id: Optional[str] = None,
+    ) -> Any:
+        params = self._order_params(symbol, order_id, client_order_id)
+        return await self._client.signed_request("DELETE", self.ORDER_PATH, params)
+
+    async def cancel_replace(
+        self,
+        symbol: str,
+        side: str,
+        cancel_order_id: Optional[int] = None,
+        cancel_client_order_id: Optional[str] = None,
+        mode: str = "STOP_ON_FAILURE",
+        **kwargs: Any,
+    ) -> Any:
+        await self._ensure_filters()
+        order = self.prepare(symbol, side, **kwargs)
+        query = self._cancel_replace_query(
+            order, cancel_order_id, cancel_client_order_id, mode
+        )
+        return await self._client.signed_request(
+            "POST", self.CANCEL_REPLACE_PATH, query=query
+        )
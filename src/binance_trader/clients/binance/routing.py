@@ -0,0 +1,165 @@
+"""Latency-based selection among equivalent Binance REST hosts.
+
+Binance serves the same API from several hosts (`api.binance.com`,
+`api1`..`api4.binance.com`, `api-gcp.binance.com`) whose latency differs
+from one location to another. `EndpointRouter` keeps an exponentially
+weighted round-trip time per host, measured with `/api/v3/ping`, and orders
+hosts fastest-first. Hosts that fail are skipped for `cooldown` seconds.
+
+Probing follows the same stale-while-revalidate approach as
+`ExchangeInfoCache`: once measurements are older than `probe_interval`, the
+next lookup starts a background probe and keeps using the current ranking.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+BINANCE_HOSTS = (
+    "https://api.binance.com",
+    "https://api1.binance.com",
+    "https://api2.binance.com",
+    "https://api3.binance.com",
+    "https://api4.binance.com",
+    "https://api-gcp.binance.com",
+)
+
+
+@dataclass
+class HostStats:
+    """Routing state of one base URL."""
+
+    rtt: Optional[float] = None
+    down_until: float = 0.0
+    failures: int = 0
+
+
+class EndpointRouter:
+    """Ranks base URLs by measured RTT and health.
+
+    Args:
+        base_urls: Equivalent base URLs, in order of preference before any
+            measurement is available.
+        probe: Callable sending a ping to a base URL; raises on failure.
+        probe_interval: Seconds between background probes.
+        cooldown: Seconds a failed host is skipped.
+        alpha: Weight of a new RTT sample in the moving average.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        base_urls: Sequence[str],
+        probe: Callable[[str], object],
+        probe_interval: float = 30.0,
+        cooldown: float = 30.0,
+        alpha: float = 0.3,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not base_urls:
+            raise ValueError("EndpointRouter needs at least one base URL")
+        self.base_urls = [url.rstrip("/") for url in base_urls]
+        self._probe = probe
+        self.probe_interval = probe_interval
+        self.cooldown = cooldown
+        self.alpha = alpha
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hosts: Dict[str, HostStats] = {url: HostStats() for url in self.base_urls}
+        self._probed_at: Optional[float] = None
+        self._probe_thread: Optional[threading.Thread] = None
+
+    def record_rtt(self, base_url: str, rtt: float) -> None:
+        with self._lock:
+            stats = self.hosts[base_url]
+            if stats.rtt is None:
+                stats.rtt = rtt
+            else:
+                stats.rtt = self.alpha * rtt + (1 - self.alpha) * stats.rtt
+
+    def record_success(self, base_url: str) -> None:
+        with self._lock:
+            stats = self.hosts[base_url]
+            stats.failures = 0
+            stats.down_until = 0.0
+
+    def record_failure(self, base_url: str) -> None:
+        """Take `base_url` out of rotation for `cooldown` seconds."""
+        with self._lock:
+            stats = self.hosts[base_url]
+            stats.failures += 1
+            stats.down_until = self._clock() + self.cooldown
+
+    def healthy(self, base_url: str) -> bool:
+        with self._lock:
+            return self.hosts[base_url].down_until <= self._clock()
+
+    def candidates(self) -> List[str]:
+        """Base URLs to try in order: healthy fastest-first, then the rest."""
+        self._maybe_probe()
+        now = self._clock()
+        with self._lock:
+            order = {url: i for i, url in enumerate(self.base_urls)}
+
+            def rank(url: str) -> tuple:
+                stats = self.hosts[url]
+                down = stats.down_until > now
+                rtt = stats.rtt if stats.rtt is not None else math.inf
+                # Down hosts last, soonest-recovering first.
+                return (down, stats.down_until if down else rtt, order[url])
+
+            return sorted(self.base_urls, key=rank)
+
+    def best(self) -> str:
+        return self.candidates()[0]
+
+    def probe(self) -> None:
+        """Ping every host concurrently and update RTTs and health."""
+        with ThreadPoolExecutor(max_workers=len(self.base_urls)) as pool:
+            list(pool.map(self._probe_one, self.base_urls))
+        with self._lock:
+            self._probed_at = self._clock()
+
+    def _probe_one(self, base_url: str) -> None:
+        start = time.perf_counter()
+        try:
+            self._probe(base_url)
+        except Exception:
+            logger.info("Probe of %s failed", base_url, exc_info=True)
+            self.record_failure(base_url)
+            return
+        self.record_rtt(base_url, time.perf_counter() - start)
+        self.record_success(base_url)
+
+    def wait_for_probe(self, timeout: Optional[float] = None) -> None:
+        """Block until a pending background probe (if any) has finished."""
+        thread = self._probe_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _maybe_probe(self) -> None:
+        with self._lock:
+            probed_at = self._probed_at
+            if (
+                probed_at is not None
+                and self._clock() - probed_at < self.probe_interval
+            ):
+                return
+            thread = self._probe_thread
+            if thread is not None and thread.is_alive():
+                return
+            # Claim this round so concurrent lookups do not start another.
+            self._probed_at = self._clock()
+            thread = threading.Thread(
+                target=self.probe, name="endpoint-probe", daemon=True
+            )
+            self._probe_thread = thread
+        thread.start()
@@ -0,0 +1,250 @@
+"""Request signing and server clock tracking for SIGNED endpoints.
+
+Binance authenticates SIGNED (TRADE, USER_DATA) requests with an
+`X-MBX-APIKEY` header and a `signature` over the exact query string sent,
+which must include a `timestamp` within `recvWindow` ms of server time.
+
+Everything that does not change between requests is prepared once:
+
+- `HmacSigner` keys an HMAC-SHA256 state at construction and only copies it
+  per request; `Ed25519Signer` loads the private key once.
+- `ClockOffset` estimates the server-minus-local clock offset from a few
+  `/api/v3/time` samples, keeping the lowest-RTT one, and re-samples in the
+  background, so timestamps need no round-trip on the request path.
+- `QueryTemplate` pre-encodes the fixed part of a query (e.g. symbol, side,
+  type); per request only the changing values, `timestamp`, `recvWindow`
+  and the signature are appended.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Iterable, Mapping, Optional, Protocol, Tuple, Union
+from urllib.parse import quote, urlencode
+
+logger = logging.getLogger(__name__)
+
+KeyMaterial = Union[str, bytes]
+
+
+class Signer(Protocol):
+    """Signs a query string; returns the value of the `signature` param."""
+
+    def sign(self, payload: bytes) -> str: ...
+
+
+class HmacSigner:
+    """HMAC-SHA256 signer for classic API keys."""
+
+    __slots__ = ("_base",)
+
+    def __init__(self, secret: KeyMaterial) -> None:
+        key = secret.encode() if isinstance(secret, str) else secret
+        self._base = hmac.new(key, digestmod=hashlib.sha256)
+
+    def sign(self, payload: bytes) -> str:
+        mac = self._base.copy()
+        mac.update(payload)
+        return mac.hexdigest()
+
+
+class Ed25519Signer:
+    """Ed25519 signer for Ed25519 API keys (needs `cryptography`).
+
+    Args:
+        private_key: PEM-encoded PKCS#8 private key (bytes or str), or a path
+            to a PEM file.
+        password: Password of an encrypted PEM.
+    """
+
+    __slots__ = ("_key",)
+
+    def __init__(
+        self,
+        private_key: Union[KeyMaterial, "os.PathLike[str]"],
+        password: Optional[bytes] = None,
+    ) -> None:
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+            Ed25519PrivateKey,
+        )
+        from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+        if isinstance(private_key, os.PathLike) or (
+            isinstance(private_key, str) and "-----BEGIN" not in private_key
+        ):
+            with open(private_key, "rb") as f:
+                pem = f.read()
+        elif isinstance(private_key, str):
+            pem = private_key.encode()
+        else:
+            pem = private_key
+        key = load_pem_private_key(pem, password=password)
+        if not isinstance(key, Ed25519PrivateKey):
+            raise ValueError("Ed25519Signer needs an Ed25519 private key")
+        self._key = key
+
+    def sign(self, payload: bytes) -> str:
+        return base64.b64encode(self._key.sign(payload)).decode()
+
+
+def encode_params(params: Optional[Mapping[str, Any]]) -> str:
+    """URL-encode `params` in insertion order, dropping None values.
+
+    Booleans become `true`/`false` as Binance expects.
+    """
+    if not params:
+        return ""
+    items = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        items.append((key, value))
+    return urlencode(items)
+
+
+class QueryTemplate:
+    """A query string with a pre-encoded fixed prefix.
+
+    Example:
+        template = QueryTemplate({"symbol": "BTCUSDT", "side": "BUY", "type": "LIMIT"})
+        template.render({"quantity": "0.001", "price": "30000"})
+    """
+
+    __slots__ = ("prefix",)
+
+    def __init__(self, fixed: Optional[Mapping[str, Any]] = None) -> None:
+        self.prefix = encode_params(fixed)
+
+    def render(self, params: Optional[Mapping[str, Any]] = None) -> str:
+        rest = encode_params(params)
+        if not self.prefix:
+            return rest
+        return f"{self.prefix}&{rest}" if rest else self.prefix
+
+
+def sign_query(
+    query: str,
+    signer: Signer,
+    timestamp: int,
+    recv_window: Optional[int] = None,
+) -> str:
+    """Append `recvWindow`, `timestamp` and `signature` to an encoded query."""
+    parts = [query] if query else []
+    if recv_window is not None:
+        parts.append(f"recvWindow={recv_window}")
+    parts.append(f"timestamp={timestamp}")
+    payload = "&".join(parts)
+    signature = quote(signer.sign(payload.encode()), safe="")
+    return f"{payload}&signature={signature}"
+
+
+class ClockOffset:
+    """Server clock estimate maintained from `/api/v3/time` samples.
+
+    Each sample measures local time before and after the request and
+    assumes the server stamped its reply mid-way; of `samples` samples the
+    one with the smallest round-trip (least uncertainty) wins.
+
+    Args:
+        fetch_server_time: Callable returning the server time in ms, e.g.
+            `lambda: client.time()["serverTime"]`. None for an estimate fed
+            externally through `set` (as the async client does); it is then
+            never refreshed automatically.
+        interval: Seconds after which the estimate is refreshed in the
+            background.
+        samples: Requests per estimate.
+        clock: Local wall clock in seconds, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        fetch_server_time: Optional[Callable[[], int]] = None,
+        interval: float = 300.0,
+        samples: int = 3,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._fetch = fetch_server_time
+        self.interval = interval
+        self.samples = samples
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.offset_ms: Optional[float] = None
+        self.rtt_ms: Optional[float] = None
+        self._measured_at: Optional[float] = None
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def best_sample(
+        samples: Iterable[Tuple[float, float, float]],
+    ) -> Tuple[float, float]:
+        """(offset_ms, rtt_ms) of the lowest-RTT `(before, server, after)` sample."""
+        before, server, after = min(samples, key=lambda s: s[2] - s[0])
+        return server - (before + after) / 2, after - before
+
+    def set(self, offset_ms: float, rtt_ms: float) -> None:
+        with self._lock:
+            self.offset_ms, self.rtt_ms = offset_ms, rtt_ms
+            self._measured_at = self._clock()
+
+    @property
+    def stale(self) -> bool:
+        return (
+            self._measured_at is None
+            or self._clock() - self._measured_at >= self.interval
+        )
+
+    def sync(self) -> float:
+        """Measure the offset now (blocking) and return it in ms."""
+        if self._fetch is None:
+            raise RuntimeError("ClockOffset has no fetch_server_time to sync with")
+        samples = []
+        for _ in range(max(1, self.samples)):
+            before = self._clock() * 1000
+            server = float(self._fetch())
+            samples.append((before, server, self._clock() * 1000))
+        offset, rtt = self.best_sample(samples)
+        self.set(offset, rtt)
+        return offset
+
+    def now_ms(self) -> int:
+        """Current server time estimate in ms.
+
+        Only the first call blocks (to measure); afterwards a stale estimate
+        is used while a background refresh runs.
+        """
+        offset = self.offset_ms
+        if offset is None:
+            offset = self.sync()
+        elif self._fetch is not None and self.stale:
+            self._refresh_in_background()
+        return int(self._clock() * 1000 + offset)
+
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> None:
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            thread = self._refresh_thread
+            if thread is not None and thread.is_alive():
+                return
+            thread = threading.Thread(
+                target=self._background_sync, name="clock-offset", daemon=True
+            )
+            self._refresh_thread = thread
+        thread.start()
+
+    def _background_sync(self) -> None:
+        try:
+            self.sync()
+        except Exception:  # keep the previous estimate
+            logger.exception("Clock offset refresh failed")
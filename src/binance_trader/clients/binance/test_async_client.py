@@ -0,0 +1,78 @@
+"""Unit tests for AsyncBinanceClient."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from binance_trader.clients.binance import AsyncBinanceClient
+from binance_trader.clients.requester import HttpxRequester
+
+
+class SlowRequester:
+    """AsyncRequester stand-in that records peak concurrency."""
+
+    rate_limiter = None
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def aget(self, url, params=None, headers=None, timeout=None):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        if params["symbol"] == "BAD":
+            raise RuntimeError("boom")
+        return {"symbol": params["symbol"], "url": url}
+
+
+def test_methods_await_requester():
+    requester = HttpxRequester()
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"serverTime": 1}
+    mock_response.raise_for_status.return_value = None
+
+    async def runner():
+        async_mock = AsyncMock(return_value=mock_response)
+        with patch.object(requester._async_client, "request", async_mock):
+            client = AsyncBinanceClient(requester)
+            result = await client.time()
+        async_mock.assert_awaited_once_with(
+            "GET",
+            "https://api.binance.com/api/v3/time",
+            params=None,
+            headers=None,
+            timeout=None,
+        )
+        return result
+
+    assert asyncio.run(runner()) == {"serverTime": 1}
+
+
+def test_gather_tickers_is_bounded():
+    requester = SlowRequester()
+    client = AsyncBinanceClient(requester, concurrency=5)
+    symbols = [f"SYM{i}" for i in range(40)]
+
+    result = asyncio.run(client.gather_tickers(symbols))
+
+    assert list(result) == symbols
+    assert result["SYM3"]["url"].endswith("/api/v3/ticker/price")
+    assert requester.peak == 5
+
+
+def test_gather_depths_return_exceptions():
+    client = AsyncBinanceClient(SlowRequester())
+
+    result = asyncio.run(
+        client.gather_depths(["BTCUSDT", "BAD"], limit=5, return_exceptions=True)
+    )
+
+    assert result["BTCUSDT"]["url"].endswith("/api/v3/depth")
+    assert isinstance(result["BAD"], RuntimeError)
+    with pytest.raises(RuntimeError):
+        asyncio.run(client.gather_depths(["BAD"]))
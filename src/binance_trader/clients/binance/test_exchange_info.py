@@ -0,0 +1,117 @@
+"""Unit tests for the exchange info cache and BinanceClient integration."""
+
+from __future__ import annotations
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+from binance_trader.clients.binance import BinanceClient
+from binance_trader.clients.binance.exchange_info import (
+    ExchangeInfoCache,
+    ExchangeInfoIndex,
+)
+from binance_trader.testing import FakeClock
+
+DOCUMENT = {
+    "timezone": "UTC",
+    "serverTime": 1,
+    "rateLimits": [],
+    "symbols": [
+        {"symbol": "BTCUSDT", "baseAsset": "BTC", "quoteAsset": "USDT"},
+        {"symbol": "ETHUSDT", "baseAsset": "ETH", "quoteAsset": "USDT"},
+        {"symbol": "ETHBTC", "baseAsset": "ETH", "quoteAsset": "BTC"},
+    ],
+}
+
+
+def test_index_lookups():
+    index = ExchangeInfoIndex(DOCUMENT, fetched_at=0.0)
+    assert index.symbol("btcusdt")["baseAsset"] == "BTC"
+    assert index.symbol("NOPE") is None
+    assert [s["symbol"] for s in index.by_base_asset["ETH"]] == ["ETHUSDT", "ETHBTC"]
+    assert [s["symbol"] for s in index.by_quote_asset["USDT"]] == ["BTCUSDT", "ETHUSDT"]
+
+    filtered = index.filtered("ETHBTC")
+    assert filtered["timezone"] == "UTC"
+    assert filtered["symbols"] == [DOCUMENT["symbols"][2]]
+
+
+def test_cache_fetches_once_while_fresh():
+    fetch = MagicMock(return_value=DOCUMENT)
+    clock = FakeClock(1000.0)
+    cache = ExchangeInfoCache(fetch, ttl=60, clock=clock)
+
+    assert cache.get().document is DOCUMENT
+    clock.now += 30
+    cache.get()
+    fetch.assert_called_once()
+
+
+def test_stale_entry_is_served_while_refreshing_in_background():
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        if len(calls) > 1:
+            release.wait(5)
+            return {**DOCUMENT, "serverTime": 2}
+        return DOCUMENT
+
+    clock = FakeClock(1000.0)
+    cache = ExchangeInfoCache(fetch, ttl=60, clock=clock)
+    first = cache.get()
+    clock.now += 61
+
+    stale = cache.get()
+    assert stale is first
+    release.set()
+    cache.wait_for_refresh(5)
+    assert cache.get().document["serverTime"] == 2
+    assert len(calls) == 2
+
+
+def test_disk_snapshot_round_trip(tmp_path):
+    path = tmp_path / "exchange_info.json"
+    clock = FakeClock(1000.0)
+    ExchangeInfoCache(lambda: DOCUMENT, ttl=60, path=path, clock=clock).get()
+    assert json.loads(path.read_text())["document"] == DOCUMENT
+
+    fetch = MagicMock(return_value=DOCUMENT)
+    cache = ExchangeInfoCache(fetch, ttl=60, path=path, clock=clock)
+    assert cache.get().symbol("BTCUSDT") is not None
+    fetch.assert_not_called()
+
+
+def test_client_serves_symbol_from_index():
+    requester = MagicMock()
+    requester.get.return_value = DOCUMENT
+    client = BinanceClient(requester, exchange_info_ttl=60)
+
+    res = client.exchange_info(symbol="BTCUSDT")
+    client.exchange_info(symbol="ETHUSDT")
+
+    assert res["symbols"][0]["symbol"] == "BTCUSDT"
+    requester.get.assert_called_once_with(
+        "https://api.binance.com/api/v3/exchangeInfo", params=None, timeout=None
+    )
+    assert [s["symbol"] for s in client.symbols_for_asset(quote_asset="btc")] == [
+        "ETHBTC"
+    ]
+
+
+def test_client_without_cache_requests_every_time():
+    requester = MagicMock()
+    requester.get.return_value = DOCUMENT
+    client = BinanceClient(requester)
+
+    client.exchange_info(symbol="BTCUSDT")
+    client.exchange_info(symbol="BTCUSDT")
+
+    assert requester.get.call_count == 2
+    requester.get.assert_called_with(
+        "https://api.binance.com/api/v3/exchangeInfo",
+        params={"symbol": "BTCUSDT"},
+        timeout=None,
+    )
@@ -0,0 +1,117 @@
+"""Unit tests for BinanceClient.klines and KlinesDownloader."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from typer.testing import CliRunner
+
+from binance_trader import cli
+from binance_trader.clients.binance import BinanceClient, KlinesDownloader, iter_klines
+from binance_trader.testing import MockBinanceServer
+
+MINUTE = 60_000
+
+
+class FakeKlinesClient:
+    """Serves synthetic 1m candles; optionally fails after `fail_after` pages."""
+
+    def __init__(self, fail_after: int | None = None) -> None:
+        self.calls = 0
+        self.fail_after = fail_after
+        self._lock = threading.Lock()
+
+    def klines(self, symbol, interval, start_time=None, end_time=None, limit=None):
+        with self._lock:
+            if self.fail_after is not None and self.calls >= self.fail_after:
+                raise ConnectionError("interrupted")
+            self.calls += 1
+        first = -(-start_time // MINUTE) * MINUTE
+        rows = []
+        t = first
+        while t <= end_time and len(rows) < limit:
+            rows.append([t, "1.0", "2.0", "0.5", "1.5", "10.0", t + MINUTE - 1])
+            t += MINUTE
+        return rows
+
+
+def test_client_klines_params():
+    requester = MagicMock()
+    client = BinanceClient(requester)
+    client.klines("BTCUSDT", "1m", start_time=1, limit=500)
+    requester.get.assert_called_once_with(
+        "https://api.binance.com/api/v3/klines",
+        params={"symbol": "BTCUSDT", "interval": "1m", "startTime": 1, "limit": 500},
+        timeout=None,
+    )
+
+
+def test_download_walks_all_pages_in_order(tmp_path):
+    client = FakeKlinesClient()
+    downloader = KlinesDownloader(
+        client, tmp_path, max_workers=3, pages_per_chunk=2, limit=10
+    )
+    end = 95 * MINUTE
+
+    path = downloader.download("BTCUSDT", "1m", 0, end)
+
+    open_times = [row[0] for row in iter_klines(path)]
+    assert open_times == list(range(0, end, MINUTE))
+    assert not downloader.checkpoint_path("BTCUSDT", "1m").exists()
+
+
+def test_download_resumes_from_checkpoint(tmp_path):
+    end = 95 * MINUTE
+    flaky = FakeKlinesClient(fail_after=4)
+    with pytest.raises(ConnectionError):
+        KlinesDownloader(
+            flaky, tmp_path, max_workers=1, pages_per_chunk=2, limit=10
+        ).download("BTCUSDT", "1m", 0, end)
+    assert (tmp_path / "BTCUSDT-1m.checkpoint.json").exists()
+
+    client = FakeKlinesClient()
+    path = KlinesDownloader(
+        client, tmp_path, max_workers=2, pages_per_chunk=2, limit=10
+    ).download("BTCUSDT", "1m", 0, end)
+
+    open_times = [row[0] for row in iter_klines(path)]
+    assert open_times == list(range(0, end, MINUTE))
+    # 10 pages are needed in total; 4 were already on disk.
+    assert client.calls == 6
+
+
+def test_cli_resumes_without_end(tmp_path):
+    calls = []
+
+    def route(params):
+        calls.append(params)
+        if len(calls) == 1:
+            return 500, {"code": -1000, "msg": "interrupted"}
+        client = FakeKlinesClient()
+        return client.klines(
+            params["symbol"],
+            params["interval"],
+            int(params["startTime"]),
+            int(params["endTime"]),
+            int(params["limit"]),
+        )
+
+    start = (int(time.time() * 1000) // MINUTE - 30) * MINUTE
+    args = ["download-klines", "BTCUSDT", "--start", str(start), "--workers", "1"]
+    args += ["--out-dir", str(tmp_path)]
+    with MockBinanceServer({"/api/v3/klines": route}) as srv:
+        args += ["--base-url", srv.url]
+        first = CliRunner().invoke(cli.app, args)
+        assert first.exit_code != 0
+        checkpoint = json.loads((tmp_path / "BTCUSDT-1m.checkpoint.json").read_text())
+        time.sleep(0.01)
+        result = CliRunner().invoke(cli.app, args)
+    assert result.exit_code == 0, result.output
+    # The resumed run kept the interrupted run's end.
+    assert int(calls[1]["endTime"]) == checkpoint["end"] - 1
+    open_times = [row[0] for row in iter_klines(tmp_path / "BTCUSDT-1m.ndjson")]
+    assert open_times[0] == start and open_times[-1] < checkpoint["end"]
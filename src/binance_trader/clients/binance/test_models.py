@@ -0,0 +1,132 @@
+"""Unit tests for the typed response models."""
+
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+
+from binance_trader.clients.binance import (
+    AsyncBinanceClient,
+    BinanceClient,
+    BookTicker,
+    DepthSnapshot,
+    ExchangeInfo,
+    Klines,
+    TickerPrice,
+)
+from binance_trader.clients.requester import HttpxRequester, RequestsRequester
+from binance_trader.testing import MockBinanceServer, payloads
+
+SYMBOL = {
+    "symbol": "BTCUSDT",
+    "status": "TRADING",
+    "baseAsset": "BTC",
+    "quoteAsset": "USDT",
+    "filters": [
+        {
+            "filterType": "PRICE_FILTER",
+            "minPrice": "0.01",
+            "maxPrice": "1000000.00",
+            "tickSize": "0.01",
+        },
+        {
+            "filterType": "LOT_SIZE",
+            "minQty": "0.00001",
+            "maxQty": "9000.0",
+            "stepSize": "0.00001",
+        },
+        {"filterType": "NOTIONAL", "minNotional": "5.0"},
+    ],
+}
+
+
+def test_exchange_info_parses_filters_once():
+    info = ExchangeInfo({"serverTime": 1, "symbols": [SYMBOL]})
+    btc = info["BTCUSDT"]
+    assert (btc.tick_size, btc.step_size, btc.min_notional) == (0.01, 0.00001, 5.0)
+    assert not hasattr(btc, "__dict__")
+
+    exact = ExchangeInfo({"symbols": [SYMBOL]}, number=Decimal)["BTCUSDT"]
+    assert exact.tick_size == Decimal("0.01")
+
+
+def test_tickers():
+    (ticker,) = TickerPrice.parse_many({"symbol": "BTCUSDT", "price": "42.5"})
+    assert ticker.price == 42.5
+    books = BookTicker.parse_many(
+        [
+            {
+                "symbol": "A",
+                "bidPrice": "1",
+                "bidQty": "2",
+                "askPrice": "3",
+                "askQty": "4",
+            }
+        ]
+    )
+    assert (books[0].bid_price, books[0].ask_qty) == (1.0, 4.0)
+
+
+def test_klines_are_column_backed():
+    rows = [
+        [t, "1", "2", "0.5", "1.5", "10", t + 59_999, "0", 1, "0", "0", "0"]
+        for t in (0, 60_000)
+    ]
+    klines = Klines(rows)
+    assert len(klines) == 2
+    assert klines.close.typecode == "d"
+    assert klines[1].open_time == 60_000
+    klines.extend(rows[:1])
+    assert [k.open_time for k in klines] == [0, 60_000, 0]
+
+
+def test_depth_snapshot():
+    depth = DepthSnapshot(
+        {"lastUpdateId": 5, "bids": [["1.0", "2"]], "asks": [["1.1", "3"]]}
+    )
+    assert depth.last_update_id == 5
+    assert list(depth.ask_prices) == [1.1]
+
+
+def _routes():
+    return {
+        "/api/v3/exchangeInfo": {"serverTime": 1, "symbols": [SYMBOL]},
+        "/api/v3/klines": payloads.klines(5),
+        "/api/v3/depth": payloads.depth(3),
+        "/api/v3/ticker/price": {"symbol": "BTCUSDT", "price": "30000.5"},
+        "/api/v3/ticker/bookTicker": payloads.book_tickers(4),
+    }
+
+
+def test_client_returns_models_when_typed():
+    with MockBinanceServer(_routes()) as srv:
+        client = BinanceClient(RequestsRequester(), base_url=srv.url)
+        assert client.exchange_info(typed=True)["BTCUSDT"].tick_size == 0.01
+        klines = client.klines("BTCUSDT", "1m", typed=True)
+        assert isinstance(klines, Klines) and len(klines) == 5
+        assert len(client.depth("BTCUSDT", typed=True).bid_prices) == 3
+        [price] = client.ticker_price("BTCUSDT", typed=True)
+        assert price.price == 30000.5
+        books = client.book_ticker(typed=True)
+        assert len(books) == 4 and isinstance(books[0], BookTicker)
+        assert isinstance(client.klines("BTCUSDT", "1m"), list)
+
+
+def test_async_client_returns_models_when_typed():
+    async def run(url):
+        async with AsyncBinanceClient(HttpxRequester(), base_url=url) as client:
+            return (
+                await client.exchange_info(typed=True),
+                await client.klines("BTCUSDT", "1m", typed=True),
+                await client.depth("BTCUSDT", typed=True),
+                await client.ticker_price("BTCUSDT", typed=True),
+                await client.book_ticker(typed=True),
+            )
+
+    with MockBinanceServer(_routes()) as srv:
+        info, klines, depth, prices, books = asyncio.run(run(srv.url))
+    assert isinstance(info, ExchangeInfo) and len(info) == 1
+    assert isinstance(klines, Klines) and len(klines) == 5
+    assert isinstance(depth, DepthSnapshot)
+    assert [p.symbol for p in prices] == ["BTCUSDT"]
+    assert len(books) == 4
@@ -0,0 +1,209 @@
+"""Tests for compiled symbol filters and the order endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from binance_trader.clients.binance import (
+    AsyncBinanceClient,
+    BinanceClient,
+    ClientOrderIds,
+    FilterTable,
+    HmacSigner,
+    OrderRejected,
+    SymbolFilters,
+)
+from binance_trader.clients.requester import HttpxRequester, RequestsRequester
+from binance_trader.testing import MockBinanceServer, payloads
+
+RAW = {
+    "symbol": "BTCUSDT",
+    "status": "TRADING",
+    "orderTypes": ["LIMIT", "MARKET", "LIMIT_MAKER"],
+    "filters": [
+        {
+            "filterType": "PRICE_FILTER",
+            "minPrice": "0.01000000",
+            "maxPrice": "1000000.00000000",
+            "tickSize": "0.01000000",
+        },
+        {
+            "filterType": "LOT_SIZE",
+            "minQty": "0.00001000",
+            "maxQty": "9000.00000000",
+            "stepSize": "0.00001000",
+        },
+        {
+            "filterType": "MARKET_LOT_SIZE",
+            "minQty": "0.00000000",
+            "maxQty": "100.00000000",
+            "stepSize": "0.00000000",
+        },
+        {
+            "filterType": "NOTIONAL",
+            "minNotional": "5.00000000",
+            "applyMinToMarket": True,
+            "maxNotional": "9000000.00000000",
+            "applyMaxToMarket": False,
+        },
+    ],
+}
+EXCHANGE_INFO = {"symbols": [RAW]}
+
+
+def test_symbol_filters_quantize_to_grid():
+    rules = SymbolFilters(RAW)
+    assert rules.quantize_quantity(0.123456789) == "0.12345"
+    assert rules.quantize_quantity(0.3) == "0.30000"  # 0.3 / 1e-5 lands below
+    assert rules.quantize_price(30000.126, "BUY") == "30000.12"
+    assert rules.quantize_price(30000.121, "SELL") == "30000.13"
+    assert rules.quantize_price(30000.126) == "30000.13"
+    assert rules.quantize_price(0.3, "SELL") == "0.30"
+    # MARKET_LOT_SIZE without a step rounds like LOT_SIZE but has its own max.
+    assert rules.quantize_quantity(0.123456, market=True) == "0.12345"
+    assert rules.market_max_qty == 100.0
+
+
+@pytest.mark.parametrize(
+    "order_type, qty, price, failed",
+    [
+        ("LIMIT", 0.000001, 30000.0, "LOT_SIZE"),
+        ("LIMIT", 10000.0, 30000.0, "LOT_SIZE"),
+        ("MARKET", 200.0, None, "MARKET_LOT_SIZE"),
+        ("LIMIT", 0.0001, 30000.0, "NOTIONAL"),
+        ("MARKET", 0.0001, 30000.0, "NOTIONAL"),
+        ("LIMIT", 1.0, 0.0, "PRICE_FILTER"),
+        ("STOP_LOSS", 1.0, None, "ORDER_TYPE"),
+    ],
+)
+def test_symbol_filters_check_rejects(order_type, qty, price, failed):
+    with pytest.raises(OrderRejected) as info:
+        SymbolFilters(RAW).check(order_type, qty, price)
+    assert info.value.filter == failed
+
+
+def test_filter_table_compiles_full_exchange_info_quickly():
+    document = payloads.exchange_info(2000)
+    start = time.perf_counter()
+    table = FilterTable.from_exchange_info(document)
+    assert time.perf_counter() - start < 1.0
+    assert len(table) == 2000
+    with pytest.raises(OrderRejected):
+        table["NOPE"]
+
+
+def test_client_order_ids_are_unique_and_valid():
+    ids = ClientOrderIds()
+    values = {ids.next() for _ in range(1000)}
+    assert len(values) == 1000
+    assert all(len(v) <= 36 and v.replace("-", "").isalnum() for v in values)
+    assert ClientOrderIds().prefix != ClientOrderIds(prefix="x").prefix
+
+
+def _routes():
+    return {
+        "/api/v3/time": {"serverTime": int(time.time() * 1000)},
+        "/api/v3/exchangeInfo": EXCHANGE_INFO,
+        "/api/v3/order": lambda params: {"orderId": 1, **params},
+        "/api/v3/order/test": {},
+        "/api/v3/order/cancelReplace": lambda params: params,
+    }
+
+
+def _signed_client(url: str) -> BinanceClient:
+    return BinanceClient(
+        RequestsRequester(), base_url=url, api_key="key", signer=HmacSigner("s")
+    )
+
+
+def test_place_prepares_once_and_resubmit_reuses_client_order_id():
+    with MockBinanceServer(_routes()) as srv:
+        client = _signed_client(srv.url)
+        order = client.orders.prepare(
+            "BTCUSDT", "buy", quantity=0.0012345, price=30000.129
+        )
+        assert order.query.startswith(
+            "symbol=BTCUSDT&side=BUY&type=LIMIT&timeInForce=GTC"
+            "&quantity=0.00123&price=30000.12&newClientOrderId="
+        )
+        first = client.orders.submit(order)
+        second = client.orders.submit(order)
+        client.orders.test("BTCUSDT", "SELL", type="MARKET", quantity=0.5)
+    assert first["newClientOrderId"] == second["newClientOrderId"]
+    assert first["timestamp"] and "signature" in first
+    method, path, params = srv.requests[-1]
+    assert (method, path) == ("POST", "/api/v3/order/test")
+    assert params["type"] == "MARKET" and "price" not in params
+    # Exchange info fetched once for all three orders.
+    assert [r[1] for r in srv.requests].count("/api/v3/exchangeInfo") == 1
+
+
+def test_lookup_tells_whether_a_timed_out_order_arrived():
+    placed = {}
+
+    def order(params):
+        if "newClientOrderId" in params:
+            placed[params["newClientOrderId"]] = {"status": "FILLED", **params}
+            return placed[params["newClientOrderId"]]
+        found = placed.get(params.get("origClientOrderId"))
+        if found is None:
+            return 400, {"code": -2013, "msg": "Order does not exist."}
+        return found
+
+    routes = {**_routes(), "/api/v3/order": order}
+    with MockBinanceServer(routes) as srv:
+        client = _signed_client(srv.url)
+        sent = client.orders.prepare("BTCUSDT", "BUY", type="MARKET", quantity=0.01)
+        unsent = client.orders.prepare("BTCUSDT", "BUY", type="MARKET", quantity=0.01)
+        client.orders.submit(sent)
+        assert client.orders.lookup(sent)["status"] == "FILLED"
+        assert client.orders.lookup(unsent) is None
+        with pytest.raises(ValueError):
+            client.orders.query("BTCUSDT")
+    method, path, params = srv.requests[-1]
+    assert (method, path) == ("GET", "/api/v3/order")
+    assert params["origClientOrderId"] == unsent.client_order_id
+
+
+def test_invalid_order_is_rejected_without_a_request():
+    with MockBinanceServer(_routes()) as srv:
+        client = _signed_client(srv.url)
+        with pytest.raises(OrderRejected):
+            client.orders.place("BTCUSDT", "BUY", quantity=0.0001, price=100.0)
+    assert not any(r[1].startswith("/api/v3/order") for r in srv.requests)
+
+
+def test_cancel_and_cancel_replace():
+    with MockBinanceServer(_routes()) as srv:
+        client = _signed_client(srv.url)
+        client.orders.cancel("BTCUSDT", client_order_id="abc")
+        replaced = client.orders.cancel_replace(
+            "BTCUSDT", "BUY", cancel_order_id=7, quantity=0.01, price=30000.0
+        )
+        with pytest.raises(ValueError):
+            client.orders.cancel("BTCUSDT")
+    cancel = [r for r in srv.requests if r[0] == "DELETE"]
+    assert cancel[0][2]["origClientOrderId"] == "abc"
+    assert replaced["cancelReplaceMode"] == "STOP_ON_FAILURE"
+    assert replaced["cancelOrderId"] == "7" and replaced["price"] == "30000.00"
+
+
+def test_async_orders():
+    async def main(url):
+        async with AsyncBinanceClient(
+            HttpxRequester(), base_url=url, api_key="key", signer=HmacSigner("s")
+        ) as client:
+            placed = await client.orders.place(
+                "BTCUSDT", "BUY", quantity=0.01, price=30000.0
+            )
+            await client.orders.cancel("BTCUSDT", order_id=1)
+            return placed, client.clock_offset.offset_ms
+
+    with MockBinanceServer(_routes()) as srv:
+        placed, offset = asyncio.run(main(srv.url))
+    assert placed["quantity"] == "0.01000" and "signature" in placed
+    assert offset is not None
+    assert srv.requests[-1][0] == "DELETE"
@@ -0,0 +1,114 @@
+"""Tests for latency-based endpoint routing and failover."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import ExitStack
+
+import httpx
+import pytest
+import requests
+
+from binance_trader.clients.binance import BinanceClient, EndpointRouter
+from binance_trader.clients.requester import HttpxRequester, RequestsRequester
+from binance_trader.testing import FakeClock, MockBinanceServer
+
+
+@pytest.fixture
+def servers():
+    routes = {"/api/v3/ping": {}, "/api/v3/time": {"serverTime": 1}}
+    with ExitStack() as stack:
+        yield [
+            stack.enter_context(MockBinanceServer(routes, delay=delay))
+            for delay in (0.15, 0.0, 0.05)
+        ]
+
+
+def test_router_ranks_by_rtt_and_health():
+    clock = FakeClock()
+    router = EndpointRouter(["a", "b", "c"], probe=lambda url: None, clock=clock)
+    router._probed_at = 0.0  # no background probes in this test
+    assert router.candidates() == ["a", "b", "c"]
+    router.record_rtt("a", 0.3)
+    router.record_rtt("b", 0.1)
+    router.record_rtt("c", 0.2)
+    assert router.candidates() == ["b", "c", "a"]
+    router.record_failure("b")
+    assert router.candidates() == ["c", "a", "b"]
+    clock.now = router.cooldown
+    assert router.best() == "b"
+    router.record_rtt("b", 1.1)  # moving average: 0.3 * 1.1 + 0.7 * 0.1
+    assert router.hosts["b"].rtt == pytest.approx(0.4)
+    assert router.best() == "c"
+
+
+def test_router_probe_marks_failures():
+    def probe(url):
+        if url == "down":
+            raise ConnectionError(url)
+
+    router = EndpointRouter(["down", "up"], probe=probe)
+    router.probe()
+    assert not router.healthy("down")
+    assert router.hosts["up"].rtt is not None
+    assert router.best() == "up"
+
+
+def test_client_routes_to_fastest_host(servers):
+    client = BinanceClient(RequestsRequester(), base_urls=[s.url for s in servers])
+    client.router.probe()
+    assert client.router.best() == servers[1].url
+    assert client.time() == {"serverTime": 1}
+    assert [r[1] for r in servers[1].requests].count("/api/v3/time") == 1
+    assert all("/api/v3/time" not in [r[1] for r in s.requests] for s in servers[::2])
+
+
+def test_client_fails_over_on_errors(servers):
+    fastest = servers[1]
+    fastest.routes["/api/v3/time"] = lambda params: (503, {"code": -1})
+    client = BinanceClient(RequestsRequester(), base_urls=[s.url for s in servers])
+    client.router.probe()
+    assert client.time() == {"serverTime": 1}
+    assert not client.router.healthy(fastest.url)
+    # Next fastest healthy host was used.
+    assert "/api/v3/time" in [r[1] for r in servers[2].requests]
+
+
+def test_client_requests_update_health_but_not_rtt(servers):
+    slow = servers[0].url
+    client = BinanceClient(RequestsRequester(), base_urls=[slow, servers[1].url])
+    router = client.router
+    router._probed_at = router._clock()  # no background probe in this test
+    router.record_failure(slow)
+    router.hosts[slow].down_until = 0.0  # cooldown over, failure count kept
+    assert client.time() == {"serverTime": 1}
+    stats = router.hosts[slow]
+    # Request times include server work and downloads; only pings set RTTs.
+    assert stats.failures == 0 and stats.rtt is None
+
+
+def test_client_records_health_of_awaited_requests(servers):
+    fastest, other = servers[1], servers[2]
+    fastest.routes["/api/v3/time"] = lambda params: (503, {"code": -1})
+    client = BinanceClient(HttpxRequester(), base_urls=[fastest.url, other.url])
+    router = client.router
+    router._probed_at = router._clock()
+
+    async def main():
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.time()
+        assert not router.healthy(fastest.url)
+        assert await client.time() == {"serverTime": 1}
+        assert router.hosts[other.url].failures == 0
+
+    asyncio.run(main())
+
+
+def test_client_errors_from_the_request_itself_are_not_failed_over(servers):
+    for server in servers:
+        server.routes["/api/v3/time"] = lambda params: (400, {"code": -1100})
+    client = BinanceClient(RequestsRequester(), base_urls=[s.url for s in servers])
+    client.router.probe()
+    with pytest.raises(requests.HTTPError):
+        client.time()
+    assert all(client.router.healthy(s.url) for s in servers)
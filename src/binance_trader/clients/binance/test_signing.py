@@ -0,0 +1,129 @@
+"""Tests for request signing, query templates and the clock offset."""
+
+from __future__ import annotations
+
+import base64
+from urllib.parse import urlencode
+
+import pytest
+
+from binance_trader.clients.binance import (
+    BinanceClient,
+    ClockOffset,
+    Ed25519Signer,
+    HmacSigner,
+    QueryTemplate,
+)
+from binance_trader.clients.binance.signing import encode_params, sign_query
+from binance_trader.clients.requester import RequestsRequester
+from binance_trader.testing import MockBinanceServer
+
+# Example from the Binance spot API documentation.
+DOC_SECRET = "NhqPtmdSJYdKjVHjA7PZj4Mge3R5YNiP1e3UZjInClVN65XAbvqqM6A7H5fATj0j"
+DOC_QUERY = (
+    "symbol=LTCBTC&side=BUY&type=LIMIT&timeInForce=GTC&quantity=1&price=0.1"
+    "&recvWindow=5000&timestamp=1499827319559"
+)
+DOC_SIGNATURE = "c8db56825ae71d6d79447849e617115f4a920fa2acdcab2b053c4b2838bd6b71"
+
+
+def test_hmac_signer_matches_documented_example():
+    signer = HmacSigner(DOC_SECRET)
+    assert signer.sign(DOC_QUERY.encode()) == DOC_SIGNATURE
+    # The keyed state is reused, not consumed.
+    assert signer.sign(DOC_QUERY.encode()) == DOC_SIGNATURE
+
+
+def test_sign_query_appends_window_timestamp_and_signature():
+    template = QueryTemplate(
+        {"symbol": "LTCBTC", "side": "BUY", "type": "LIMIT", "timeInForce": "GTC"}
+    )
+    query = template.render({"quantity": 1, "price": "0.1"})
+    signed = sign_query(query, HmacSigner(DOC_SECRET), 1499827319559, 5000)
+    assert signed == f"{DOC_QUERY}&signature={DOC_SIGNATURE}"
+
+
+def test_encode_params_drops_none_and_formats_bools():
+    assert encode_params({"a": None, "b": True, "c": "x y"}) == "b=true&c=x+y"
+    assert QueryTemplate().render() == ""
+    assert QueryTemplate({"a": 1}).render() == "a=1"
+
+
+def test_ed25519_signer_produces_verifiable_signature():
+    serialization = pytest.importorskip("cryptography.hazmat.primitives.serialization")
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+    key = Ed25519PrivateKey.generate()
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    signature = Ed25519Signer(pem).sign(b"symbol=BTCUSDT&timestamp=1")
+    key.public_key().verify(base64.b64decode(signature), b"symbol=BTCUSDT&timestamp=1")
+
+
+class SteppingClock:
+    """Local clock advancing by `step` seconds on every read."""
+
+    def __init__(self, start: float, step: float) -> None:
+        self.now = start
+        self.step = step
+
+    def __call__(self) -> float:
+        value = self.now
+        self.now += self.step
+        return value
+
+
+def test_clock_offset_uses_midpoint_of_lowest_rtt_sample():
+    clock = SteppingClock(1000.0, 0.010)
+    server_times = iter([1_000_510.0, 1_000_530.0])
+    offset = ClockOffset(lambda: next(server_times), samples=2, clock=clock)
+    # Sample 1: local 1000.000..1000.010, midpoint 1_000_005 ms -> +505 ms.
+    assert offset.sync() == pytest.approx(505.0)
+    assert offset.rtt_ms == pytest.approx(10.0)
+
+
+def test_clock_offset_refreshes_in_background_when_stale():
+    now = {"t": 0.0}
+    calls = []
+
+    def fetch():
+        calls.append(now["t"])
+        return now["t"] * 1000 + 250
+
+    offset = ClockOffset(fetch, interval=60, samples=1, clock=lambda: now["t"])
+    assert offset.now_ms() == 250
+    now["t"] = 61.0
+    offset.now_ms()  # stale: served, refresh started
+    offset.wait_for_refresh(5)
+    assert calls == [0.0, 61.0]
+
+
+def test_client_signed_request():
+    routes = {
+        "/api/v3/time": {"serverTime": 1_700_000_000_000},
+        "/api/v3/openOrders": [],
+    }
+    with MockBinanceServer(routes) as srv:
+        client = BinanceClient(
+            RequestsRequester(),
+            base_url=srv.url,
+            api_key="key",
+            signer=HmacSigner("secret"),
+        )
+        assert client.open_orders("BTCUSDT") == []
+        assert client.open_orders("BTCUSDT") == []
+    method, path, params = srv.requests[-1]
+    assert (method, path) == ("GET", "/api/v3/openOrders")
+    assert params["symbol"] == "BTCUSDT" and params["recvWindow"] == "5000"
+    signature = params.pop("signature")
+    assert HmacSigner("secret").sign(urlencode(params).encode()) == signature
+    # One clock sync (of `samples` requests), no per-request time() call.
+    assert [r[1] for r in srv.requests].count("/api/v3/time") == 3
+
+
+def test_unsigned_client_rejects_signed_endpoints():
+    with pytest.raises(ValueError):
+        BinanceClient(RequestsRequester()).account()
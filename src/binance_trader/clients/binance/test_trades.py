@@ -0,0 +1,257 @@
+"""Tests for the trade endpoints, TradesArchiver and TradeArchive."""
+
+from __future__ import annotations
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from typer.testing import CliRunner
+
+from binance_trader import cli
+from binance_trader.clients.binance import (
+    BinanceClient,
+    TradeArchive,
+    TradesArchiver,
+    trades,
+)
+from binance_trader.clients.binance.trades import DAY_MS
+from binance_trader.testing import MockBinanceServer, payloads
+
+MINUTE = 60_000
+HOUR = 3_600_000
+
+
+class FakeTradesClient:
+    """Serves synthetic aggTrades (and matching individual trades).
+
+    Pages overlap their predecessor by one trade, as the archiver must cope
+    with duplicates on page boundaries. Fails after `fail_after` calls.
+    """
+
+    def __init__(self, rows, fail_after=None):
+        self.rows = rows
+        self.calls = 0
+        self.fail_after = fail_after
+        self._lock = threading.Lock()
+
+    def _count(self):
+        with self._lock:
+            if self.fail_after is not None and self.calls >= self.fail_after:
+                raise ConnectionError("interrupted")
+            self.calls += 1
+
+    def agg_trades(
+        self, symbol, from_id=None, start_time=None, end_time=None, limit=None
+    ):
+        self._count()
+        if from_id is not None:
+            start = max(0, from_id - self.rows[0]["a"] - 1)
+            return self.rows[start : start + limit]
+        rows = [
+            r
+            for r in self.rows
+            if start_time <= r["T"] and (end_time is None or r["T"] <= end_time)
+        ]
+        return rows[:limit]
+
+    def historical_trades(self, symbol, from_id=None, limit=None):
+        self._count()
+        trades = [
+            {"id": i, "price": r["p"], "time": r["T"]}
+            for r in self.rows
+            for i in range(r["f"], r["l"] + 1)
+        ]
+        start = next(i for i, t in enumerate(trades) if t["id"] >= from_id)
+        return trades[start : start + limit]
+
+
+def _archiver(tmp_path, client, **kwargs):
+    options = dict(processes=1, limit=50, block_trades=120)
+    options.update(kwargs)
+    return TradesArchiver(tmp_path, client_factory=lambda: client, **options)
+
+
+def test_client_trade_params():
+    requester = MagicMock()
+    client = BinanceClient(requester)
+    client.agg_trades("BTCUSDT", start_time=1, end_time=2, limit=5)
+    requester.get.assert_called_with(
+        "https://api.binance.com/api/v3/aggTrades",
+        params={"symbol": "BTCUSDT", "startTime": 1, "endTime": 2, "limit": 5},
+        timeout=None,
+    )
+    client.historical_trades("BTCUSDT", from_id=7)
+    requester.get.assert_called_with(
+        "https://api.binance.com/api/v3/historicalTrades",
+        params={"symbol": "BTCUSDT", "fromId": 7},
+        timeout=None,
+    )
+
+
+def test_archive_dedups_pages_and_splits_days(tmp_path):
+    # 1000 trades a minute apart, crossing midnight, from 30 minutes in.
+    start = DAY_MS - 500 * MINUTE
+    rows = payloads.agg_trades(1000, start_time=start, first_id=100, spacing_ms=MINUTE)
+    client = FakeTradesClient(rows)
+    stats = _archiver(tmp_path, client).archive(
+        ["BTCUSDT"], start_time=start + 30 * MINUTE, end_time=start + 900 * MINUTE
+    )
+    archive = TradeArchive(tmp_path)
+    assert archive.symbols() == ["BTCUSDT"]
+    got = list(archive.iter_trades("BTCUSDT"))
+    assert got == rows[30:900]
+    days = archive.segments("BTCUSDT")
+    assert [d["day"] for d in days] == ["1970-01-01", "1970-01-02"]
+    assert [d["count"] for d in days] == [470, 400]
+    assert stats[0].trades == 870 and stats[0].requests == client.calls
+    assert stats[0].bytes_written == sum(d["size"] for d in days)
+
+    # Time-range reads seek to the covering block.
+    lo, hi = rows[640]["T"], rows[655]["T"]
+    assert list(archive.iter_trades("BTCUSDT", lo, hi)) == rows[640:655]
+    assert list(archive.iter_trades("BTCUSDT", hi, hi)) == []
+
+
+def test_archive_resumes_without_gaps_or_duplicates(tmp_path):
+    rows = payloads.agg_trades(600, start_time=0, spacing_ms=1000)
+    with pytest.raises(ConnectionError):
+        _archiver(tmp_path, FakeTradesClient(rows, fail_after=9)).archive(
+            ["ETHUSDT"], start_time=0
+        )
+    archive = TradeArchive(tmp_path)
+    (segment,) = archive.segments("ETHUSDT")
+    partial_count = segment["count"]
+    assert 0 < partial_count < 600
+    # Simulate a block cut short by the crash.
+    with segment["path"].open("ab") as f:
+        f.write(b"\x1f\x8b partial")
+
+    client = FakeTradesClient(rows)
+    (stats,) = _archiver(tmp_path, client).archive(["ETHUSDT"])
+    assert list(archive.iter_trades("ETHUSDT")) == rows
+    assert stats.trades == 600 - partial_count
+    # Up to date: one more request, nothing appended.
+    (stats,) = _archiver(tmp_path, FakeTradesClient(rows)).archive(["ETHUSDT"])
+    assert stats.trades == 0 and stats.requests == 1
+
+
+def test_archive_historical_trades_from_agg_trade_lookup(tmp_path):
+    rows = payloads.agg_trades(200, start_time=HOUR * 3, spacing_ms=100)
+    client = FakeTradesClient(rows)
+    _archiver(tmp_path, client, kind="trades").archive(["BNBUSDT"], start_time=0)
+    trades = list(TradeArchive(tmp_path, "trades").iter_trades("BNBUSDT"))
+    assert [t["id"] for t in trades] == list(range(rows[0]["f"], rows[-1]["l"] + 1))
+    with pytest.raises(ValueError):
+        _archiver(tmp_path, client).archive(["NEWUSDT"])
+
+
+class WindowOnlyClient(FakeTradesClient):
+    """Rejects `startTime` without `endTime`, like a strict proxy might."""
+
+    def agg_trades(
+        self, symbol, from_id=None, start_time=None, end_time=None, limit=None
+    ):
+        if from_id is None and end_time is None:
+            self._count()
+            response = requests.Response()
+            response.status_code = 400
+            raise requests.HTTPError("400 Client Error", response=response)
+        return super().agg_trades(symbol, from_id, start_time, end_time, limit)
+
+
+def test_first_trade_found_in_one_request_from_a_distant_start(tmp_path):
+    rows = payloads.agg_trades(100, start_time=DAY_MS * 3650, spacing_ms=1000)
+    client = FakeTradesClient(rows)
+    (stats,) = _archiver(tmp_path, client, limit=1000).archive(
+        ["BTCUSDT"], start_time=0, end_time=rows[-1]["T"] + 1
+    )
+    assert stats.trades == 100
+    # One lookup and one (short) page.
+    assert client.calls == 2
+
+
+def test_first_trade_falls_back_to_hourly_windows(tmp_path):
+    rows = payloads.agg_trades(100, start_time=5 * HOUR + 10, spacing_ms=1000)
+    client = WindowOnlyClient(rows)
+    (stats,) = _archiver(tmp_path, client, limit=1000).archive(
+        ["BTCUSDT"], start_time=0
+    )
+    assert list(TradeArchive(tmp_path).iter_trades("BTCUSDT")) == rows
+    # The rejected lookup, six hourly windows, then one page.
+    assert client.calls == 1 + 6 + 1 and stats.trades == 100
+
+
+def _route(tables):
+    def handler(params):
+        rows = tables[params["symbol"]]
+        limit = int(params.get("limit", 500))
+        if "fromId" in params:
+            from_id = int(params["fromId"])
+            return [r for r in rows if r["a"] >= from_id][:limit]
+        lo = int(params["startTime"])
+        hi = int(params.get("endTime", rows[-1]["T"] if rows else lo))
+        return [r for r in rows if lo <= r["T"] <= hi][:limit]
+
+    return handler
+
+
+def test_archive_shards_symbols_over_processes(tmp_path):
+    tables = {
+        symbol: payloads.agg_trades(300 + 100 * i, seed=i)
+        for i, symbol in enumerate(["AAAUSDT", "BBBUSDT", "CCCUSDT"])
+    }
+    with MockBinanceServer({"/api/v3/aggTrades": _route(tables)}) as srv:
+        archiver = TradesArchiver(
+            tmp_path, processes=2, base_url=srv.url, limit=100, block_trades=150
+        )
+        stats = archiver.archive(tables, start_time=0)
+    assert 1 <= len(stats) <= 2
+    assert sorted(s for w in stats for s in w.symbols) == sorted(tables)
+    assert sum(w.trades for w in stats) == 1200
+    assert all(w.report()["trades_per_second"] > 0 for w in stats)
+    archive = TradeArchive(tmp_path)
+    for symbol, rows in tables.items():
+        assert list(archive.iter_trades(symbol)) == rows
+
+
+def test_weight_limit_is_split_between_started_workers(tmp_path, monkeypatch):
+    limits = []
+    rows = payloads.agg_trades(10)
+
+    def fake_default_client(base_url, weight_limit):
+        limits.append(weight_limit)
+        return FakeTradesClient(rows)
+
+    monkeypatch.setattr(trades, "default_client", fake_default_client)
+    archiver = TradesArchiver(tmp_path, processes=16, weight_limit=5000)
+    archiver.archive(["BTCUSDT"], start_time=0)
+    assert limits == [5000]
+
+
+def test_archive_trades_command(tmp_path):
+    tables = {"BTCUSDT": payloads.agg_trades(250)}
+    with MockBinanceServer({"/api/v3/aggTrades": _route(tables)}) as srv:
+        result = CliRunner().invoke(
+            cli.app,
+            [
+                "archive-trades",
+                "BTCUSDT",
+                "--start",
+                "0",
+                "--out-dir",
+                str(tmp_path),
+                "--processes",
+                "1",
+                "--format",
+                "ndjson",
+                "--base-url",
+                srv.url,
+            ],
+        )
+    assert result.exit_code == 0, result.output
+    (report,) = [json.loads(line) for line in result.output.splitlines()]
+    assert report["trades"] == 250 and report["symbols"] == 1
+    assert len(list(TradeArchive(tmp_path).iter_trades("BTCUSDT"))) == 250
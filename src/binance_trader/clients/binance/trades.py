@@ -0,0 +1,471 @@
+"""Sharded, resumable archiving of tick-level trades.
+
+Decoding trade pages and compressing them costs more CPU than fetching
+them, so `TradesArchiver` spreads symbols over a process pool. Each worker
+keeps its own `BinanceClient` (and a share of the weight budget) and
+archives one symbol at a time:
+
+- The first trade ID at or after `start_time` is found with one
+  `/api/v3/aggTrades` query by `startTime` (falling back to hourly time
+  windows); from there pages are walked by `fromId`.
+- Trades whose ID is not above the last archived one are dropped, so page
+  boundaries and resumed runs never store a trade twice.
+- Trades are appended to one gzip file per UTC day. Every block of about
+  `block_trades` trades is a separate gzip member, and a JSON index next to
+  each day file records the blocks' offsets, first times and first IDs.
+
+Layout::
+
+    <out_dir>/<kind>/<SYMBOL>/<YYYY-MM-DD>.ndjson.gz
+    <out_dir>/<kind>/<SYMBOL>/<YYYY-MM-DD>.index.json
+
+The index is written after its block, so it only ever describes complete
+data; after an interruption anything past the indexed size is cut off and
+archiving resumes after the last indexed trade ID. Archives only grow
+forward: a later run continues from the end of the archive, whatever its
+`start_time`.
+
+`TradeArchive` reads an archive back, seeking to the block that covers a
+time range instead of decompressing whole days.
+"""
+
+from __future__ import annotations
+
+import bisect
+import gzip
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
+
+from ..requester.resilience import _status
+
+logger = logging.getLogger(__name__)
+
+DAY_MS = 86_400_000
+HOUR_MS = 3_600_000
+MAX_LIMIT = 1000
+
+
+@dataclass(frozen=True)
+class TradeKind:
+    """How to page through one trades endpoint."""
+
+    method: str  # `BinanceClient` method taking `symbol, from_id, limit`
+    id_key: str
+    time_key: str
+
+
+TRADE_KINDS: Dict[str, TradeKind] = {
+    "aggTrades": TradeKind("agg_trades", "a", "T"),
+    "trades": TradeKind("historical_trades", "id", "time"),
+}
+
+
+class TradesSource(Protocol):
+    """Anything with `BinanceClient`-compatible trade methods."""
+
+    def agg_trades(
+        self,
+        symbol: str,
+        from_id: Optional[int] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Any: ...
+
+    def historical_trades(
+        self, symbol: str, from_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Any: ...
+
+
+def _day_name(day: int) -> str:
+    return datetime.fromtimestamp(day * 86_400, timezone.utc).strftime("%Y-%m-%d")
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _write_json(path: Path, value: Dict[str, Any]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(value, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def _index_path(segment: Path) -> Path:
+    return segment.with_name(segment.name.replace(".ndjson.gz", ".index.json"))
+
+
+class _SymbolWriter:
+    """Appends deduplicated trades of one symbol to its day segments."""
+
+    def __init__(
+        self, directory: Path, kind: TradeKind, block_trades: int, compresslevel: int
+    ) -> None:
+        self.directory = directory
+        self.kind = kind
+        self.block_trades = block_trades
+        self.compresslevel = compresslevel
+        self.trades = 0
+        self.bytes_written = 0
+        self._pending: List[Dict[str, Any]] = []
+        directory.mkdir(parents=True, exist_ok=True)
+        self.last_id = self._recover()
+
+    def _recover(self) -> Optional[int]:
+        """Cut segments back to their indexed size; the last indexed ID."""
+        for segment in self.directory.glob("*.ndjson.gz"):
+            index = _read_json(_index_path(segment))
+            size = index["size"] if index else 0
+            if segment.stat().st_size > size:
+                with segment.open("r+b") as f:
+                    f.truncate(size)
+        indexes = sorted(self.directory.glob("*.index.json"))
+        if not indexes:
+            return None
+        last = _read_json(indexes[-1])
+        return None if last is None else last["last_id"]
+
+    def add(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Queue trades newer than the last one seen; returns how many."""
+        id_key, last, added = self.kind.id_key, self.last_id, 0
+        for row in rows:
+            trade_id = row[id_key]
+            if last is not None and trade_id <= last:
+                continue
+            self._pending.append(row)
+            last = trade_id
+            added += 1
+        self.last_id = last
+        if len(self._pending) >= self.block_trades:
+            self.flush()
+        return added
+
+    def flush(self) -> None:
+        rows, self._pending = self._pending, []
+        time_key = self.kind.time_key
+        start = 0
+        while start < len(rows):
+            day = rows[start][time_key] // DAY_MS
+            stop = start
+            while stop < len(rows) and rows[stop][time_key] // DAY_MS == day:
+                stop += 1
+            self._append_block(day, rows[start:stop])
+            start = stop
+
+    def _append_block(self, day: int, rows: List[Dict[str, Any]]) -> None:
+        segment = self.directory / f"{_day_name(day)}.ndjson.gz"
+        index_path = _index_path(segment)
+        index = _read_json(index_path) or {
+            "size": 0,
+            "count": 0,
+            "first_id": None,
+            "first_time": None,
+            "blocks": [],
+        }
+        id_key, time_key = self.kind.id_key, self.kind.time_key
+        data = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in rows)
+        blob = gzip.compress(data.encode(), self.compresslevel, mtime=0)
+        with segment.open("ab") as f:
+            offset = f.tell()
+            f.write(blob)
+        first, last = rows[0], rows[-1]
+        if index["first_id"] is None:
+            index["first_id"], index["first_time"] = first[id_key], first[time_key]
+        index["last_id"], index["last_time"] = last[id_key], last[time_key]
+        index["size"] = offset + len(blob)
+        index["count"] += len(rows)
+        index["blocks"].append([offset, first[time_key], first[id_key]])
+        _write_json(index_path, index)
+        self.trades += len(rows)
+        self.bytes_written += len(blob)
+
+
+@dataclass
+class WorkerStats:
+    """Throughput of one archiver process."""
+
+    worker: int
+    symbols: List[str] = field(default_factory=list)
+    trades: int = 0
+    requests: int = 0
+    bytes_written: int = 0
+    seconds: float = 0.0
+
+    @property
+    def trades_per_second(self) -> float:
+        return self.trades / self.seconds if self.seconds > 0 else 0.0
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "worker": self.worker,
+            "symbols": len(self.symbols),
+            "trades": self.trades,
+            "requests": self.requests,
+            "bytes": self.bytes_written,
+            "seconds": round(self.seconds, 3),
+            "trades_per_second": round(self.trades_per_second, 1),
+        }
+
+
+def default_client(base_url: str, weight_limit: int) -> Any:
+    """A `BinanceClient` on a rate-limited `RequestsRequester`."""
+    from ..requester import RateLimiter, RequestsRequester
+    from .client import BinanceClient
+
+    requester = RequestsRequester(rate_limiter=RateLimiter(weight_limit))
+    return BinanceClient(requester, base_url=base_url)
+
+
+# Per-worker state set by `_init_worker`.
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(factory: Callable[[], TradesSource], options: Dict[str, Any]) -> None:
+    _worker.update(client=factory(), options=options)
+
+
+def _first_id(
+    client: TradesSource, kind: str, symbol: str, start: int, stop: int
+) -> Tuple[Optional[int], int]:
+    """First trade ID at or after `start` (before `stop`), and requests made.
+
+    A `startTime` query without `endTime` returns the first aggregate trade
+    at or after `start` in one request, however far back `start` is. Sources
+    that reject it (HTTP 400) or answer with a trade before `start` are
+    walked in one-hour windows instead.
+    """
+    # An aggregate trade's `f` is its first individual trade ID.
+    id_key = "a" if kind == "aggTrades" else "f"
+    try:
+        rows = client.agg_trades(symbol, start_time=start, limit=1)
+    except Exception as exc:
+        if _status(exc) != 400:
+            raise
+        rows = None
+    if rows is not None and (not rows or rows[0]["T"] >= start):
+        if rows and rows[0]["T"] < stop:
+            return rows[0][id_key], 1
+        return None, 1
+    requests = 1
+    t = start
+    while t < stop:
+        rows = client.agg_trades(
+            symbol, start_time=t, end_time=min(t + HOUR_MS, stop) - 1, limit=1
+        )
+        requests += 1
+        if rows:
+            return rows[0][id_key], requests
+        t += HOUR_MS
+    return None, requests
+
+
+def _archive_symbol(
+    symbol: str, start_time: Optional[int], end_time: Optional[int]
+) -> Dict[str, Any]:
+    client, options = _worker["client"], _worker["options"]
+    kind = TRADE_KINDS[options["kind"]]
+    limit = options["limit"]
+    started = time.perf_counter()
+    writer = _SymbolWriter(
+        Path(options["out_dir"]) / options["kind"] / symbol,
+        kind,
+        options["block_trades"],
+        options["compresslevel"],
+    )
+    requests = 0
+    if writer.last_id is not None:
+        from_id: Optional[int] = writer.last_id + 1
+    elif start_time is None:
+        raise ValueError(f"{symbol}: start_time is needed for a new archive")
+    else:
+        stop = end_time if end_time is not None else int(time.time() * 1000)
+        from_id, requests = _first_id(client, options["kind"], symbol, start_time, stop)
+    if from_id is not None:
+        writer.last_id = from_id - 1
+    fetch = getattr(client, kind.method)
+    while from_id is not None:
+        rows = fetch(symbol, from_id=from_id, limit=limit)
+        requests += 1
+        done = len(rows) < limit
+        if end_time is not None:
+            kept = [r for r in rows if r[kind.time_key] < end_time]
+            done = done or len(kept) < len(rows)
+            rows = kept
+        writer.add(rows)
+        from_id = None if done or not rows else rows[-1][kind.id_key] + 1
+    writer.flush()
+    logger.info("%s: archived %d trades", symbol, writer.trades)
+    return {
+        "worker": os.getpid(),
+        "symbol": symbol,
+        "trades": writer.trades,
+        "requests": requests,
+        "bytes": writer.bytes_written,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+class TradesArchiver:
+    """Archive trades of many symbols on a process pool.
+
+    Args:
+        out_dir: Archive root directory.
+        kind: "aggTrades" or "trades" (`/api/v3/historicalTrades`).
+        processes: Worker processes (default: number of CPUs; 1 runs in
+            the calling process).
+        client_factory: Builds each worker's client; must be picklable
+            when `processes` > 1. Defaults to `default_client` on
+            `base_url`, with `weight_limit` split between the workers a
+            run actually starts.
+        limit: Trades per request (Binance maximum: 1000).
+        block_trades: Trades per compressed block (the index granularity).
+        compresslevel: gzip level, 1 (fast) to 9 (small).
+    """
+
+    def __init__(
+        self,
+        out_dir: str | os.PathLike[str],
+        kind: str = "aggTrades",
+        processes: Optional[int] = None,
+        client_factory: Optional[Callable[[], TradesSource]] = None,
+        base_url: str = "https://api.binance.com",
+        weight_limit: int = 6000,
+        limit: int = MAX_LIMIT,
+        block_trades: int = 10_000,
+        compresslevel: int = 6,
+    ) -> None:
+        if kind not in TRADE_KINDS:
+            raise ValueError(f"Unknown trade kind {kind!r}")
+        self.out_dir = Path(out_dir)
+        self.kind = kind
+        self.processes = processes or os.cpu_count() or 1
+        self.client_factory = client_factory
+        self.base_url = base_url
+        self.weight_limit = weight_limit
+        self.options = {
+            "out_dir": str(self.out_dir),
+            "kind": kind,
+            "limit": limit,
+            "block_trades": block_trades,
+            "compresslevel": compresslevel,
+        }
+
+    def archive(
+        self,
+        symbols: Iterable[str],
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> List[WorkerStats]:
+        """Archive `[start_time, end_time)` (epoch ms) for every symbol.
+
+        Symbols are handed to workers one at a time, so a few busy symbols
+        do not hold up a whole shard. Without `end_time` each symbol is
+        archived up to its latest trade. Returns per-worker throughput.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        task = partial(_archive_symbol, start_time=start_time, end_time=end_time)
+        workers = max(1, min(self.processes, len(symbols)))
+        factory = self.client_factory or partial(
+            default_client, self.base_url, max(1, self.weight_limit // workers)
+        )
+        if workers == 1:
+            _init_worker(factory, self.options)
+            try:
+                results = [task(symbol) for symbol in symbols]
+            finally:
+                _worker.clear()
+        else:
+            with ProcessPoolExecutor(
+                workers, initializer=_init_worker, initargs=(factory, self.options)
+            ) as pool:
+                results = list(pool.map(task, symbols))
+        stats: Dict[int, WorkerStats] = {}
+        for result in results:
+            worker = stats.setdefault(result["worker"], WorkerStats(result["worker"]))
+            worker.symbols.append(result["symbol"])
+            worker.trades += result["trades"]
+            worker.requests += result["requests"]
+            worker.bytes_written += result["bytes"]
+            worker.seconds += result["seconds"]
+        return list(stats.values())
+
+
+class TradeArchive:
+    """Read access to an archive written by `TradesArchiver`."""
+
+    def __init__(self, out_dir: str | os.PathLike[str], kind: str = "aggTrades"):
+        self.root = Path(out_dir) / kind
+        self.kind = TRADE_KINDS[kind]
+
+    def symbols(self) -> List[str]:
+        if not self.root.is_dir():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+    def segments(self, symbol: str) -> List[Dict[str, Any]]:
+        """Index of each day segment, oldest first, with its `day` and `path`."""
+        out = []
+        for path in sorted((self.root / symbol).glob("*.index.json")):
+            index = _read_json(path)
+            if index is not None:
+                day = path.name[: -len(".index.json")]
+                segment = path.with_name(f"{day}.ndjson.gz")
+                out.append({**index, "day": day, "path": segment})
+        return out
+
+    def iter_trades(
+        self,
+        symbol: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Trades of `symbol` with `start_time <= time < end_time`, in order."""
+        time_key = self.kind.time_key
+        for segment in self.segments(symbol):
+            if start_time is not None and segment["last_time"] < start_time:
+                continue
+            if end_time is not None and segment["first_time"] >= end_time:
+                return
+            blocks = segment["blocks"]
+            first = 0
+            if start_time is not None:
+                times = [block[1] for block in blocks]
+                first = max(0, bisect.bisect_right(times, start_time) - 1)
+            with segment["path"].open("rb") as f:
+                for i in range(first, len(blocks)):
+                    offset = blocks[i][0]
+                    size = (
+                        blocks[i + 1][0] if i + 1 < len(blocks) else segment["size"]
+                    ) - offset
+                    f.seek(offset)
+                    for line in gzip.decompress(f.read(size)).splitlines():
+                        row = json.loads(line)
+                        t = row[time_key]
+                        if start_time is not None and t < start_time:
+                            continue
+                        if end_time is not None and t >= end_time:
+                            return
+                        yield row
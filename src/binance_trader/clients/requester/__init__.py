@@ -1,7 +1,68 @@
-"""Requester subpackage: abstracts HTTP client implementation."""
+"""Requester subpackage: abstracts HTTP client implementation.
 
-from .base import Requester
-from .httpx_requester import HttpxRequester
-from .requests_requester import RequestsRequester
+The backend implementations (`RequestsRequester`, `HttpxRequester`) are
+imported on first access so that using one backend never pays the import
+cost of the other HTTP library.
+"""
 
-__all__ = ["Requester", "RequestsRequester", "HttpxRequester"]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .base import AsyncRequester, BatchResult, Requester, RequestSpec
+from .coalesce import CoalescingRequester
+from .decoders import get_decoder
+from .instrumentation import RequestEvent, RequestHook, StatsCollector
+from .rate_limit import RateLimiter, request_weight
+from .recording import RecordingRequester, ReplayMissError, ReplayRequester
+from .resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilientRequester,
+    RetryPolicy,
+)
+from .transport import TransportConfig
+
+if TYPE_CHECKING:
+    from .httpx_requester import HttpxRequester
+    from .requests_requester import RequestsRequester
+
+_LAZY = {
+    "HttpxRequester": ".httpx_requester",
+    "RequestsRequester": ".requests_requester",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "Requester",
+    "AsyncRequester",
+    "RequestSpec",
+    "BatchResult",
+    "RequestsRequester",
+    "HttpxRequester",
+    "RateLimiter",
+    "request_weight",
+    "get_decoder",
+    "RequestEvent",
+    "RequestHook",
+    "StatsCollector",
+    "CoalescingRequester",
+    "ResilientRequester",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RecordingRequester",
+    "ReplayRequester",
+    "ReplayMissError",
+    "TransportConfig",
+]
@@ -1,7 +1,49 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .decoders import Decoder
+    from .instrumentation import RequestHook
+    from .rate_limit import RateLimiter
+
+
+@dataclass(frozen=True)
+class RequestSpec:
+    """One request of a batch passed to `Requester.request_many`."""
+
+    url: str
+    method: str = "GET"
+    params: Optional[Dict[str, Any]] = None
+    headers: Optional[Dict[str, str]] = None
+    data: Optional[Any] = None
+    json: Optional[Any] = None
+    timeout: Optional[float] = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one `RequestSpec`; `index` is its position in the batch."""
+
+    index: int
+    request: RequestSpec
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> Any:
+        """Return the value, re-raising the request's exception if it failed."""
+        if self.error is not None:
+            raise self.error
+        return self.value
 
 
 class Requester(ABC):
@@ -9,8 +51,86 @@ class Requester(ABC):
 
     Implementations must raise on transport-level errors (e.g. non-2xx responses)
     and return either parsed JSON or raw text where appropriate.
+
+    Implementations that support client-side rate limiting expose their
+    `RateLimiter` as `rate_limiter` (None when disabled). Likewise `decoder`
+    is the body parser in use, or None for the HTTP library's default.
+    `hooks` are the `RequestHook`s notified around every request (see
+    `instrumentation`); `add_hook` installs another one.
+
+    `request_many`/`get_many` run a batch of requests and yield a
+    `BatchResult` per request in completion order. The default implementation
+    is sequential; backends override it to overlap network round-trips.
     """
 
+    rate_limiter: Optional["RateLimiter"] = None
+    decoder: Optional["Decoder"] = None
+    hooks: Tuple["RequestHook", ...] = ()
+
+    def add_hook(self, hook: "RequestHook") -> None:
+        self.hooks = (*self.hooks, hook)
+
+    def _call(self, spec: RequestSpec) -> Any:
+        if spec.method == "GET":
+            return self.get(
+                spec.url, params=spec.params, headers=spec.headers, timeout=spec.timeout
+            )
+        if spec.method == "POST":
+            return self.post(
+                spec.url,
+                data=spec.data,
+                json=spec.json,
+                headers=spec.headers,
+                timeout=spec.timeout,
+            )
+        if spec.method == "DELETE":
+            return self.delete(
+                spec.url, params=spec.params, headers=spec.headers, timeout=spec.timeout
+            )
+        raise ValueError(f"Unsupported batch method: {spec.method}")
+
+    def _call_captured(self, index: int, spec: RequestSpec) -> BatchResult:
+        try:
+            return BatchResult(index, spec, value=self._call(spec))
+        except Exception as exc:
+            return BatchResult(index, spec, error=exc)
+
+    def request_many(
+        self, specs: Iterable[RequestSpec], max_concurrency: int = 10
+    ) -> Iterator[BatchResult]:
+        """Run `specs` and yield their results as they complete.
+
+        Failures are reported through `BatchResult.error` rather than raised,
+        so one bad request does not abort the batch.
+        """
+        for index, spec in enumerate(specs):
+            yield self._call_captured(index, spec)
+
+    def get_many(
+        self,
+        urls: Iterable[str],
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_concurrency: int = 10,
+    ) -> Iterator[BatchResult]:
+        """GET every URL in `urls` with shared params; see `request_many`."""
+        specs = (
+            RequestSpec(url, params=params, headers=headers, timeout=timeout)
+            for url in urls
+        )
+        return self.request_many(specs, max_concurrency=max_concurrency)
+
+    def warmup(self, url: str, connections: int = 1) -> int:
+        """Open pooled connections ahead of the first latency-critical call.
+
+        Sends `connections` concurrent GETs to `url` (pick a cheap endpoint
+        such as `/api/v3/ping`) so later requests to that host skip the DNS
+        lookup and TCP/TLS handshakes. Returns how many succeeded.
+        """
+        results = self.get_many([url] * connections, max_concurrency=connections)
+        return sum(result.ok for result in results)
+
     @abstractmethod
     def get(
         self,
@@ -21,6 +141,25 @@ class Requester(ABC):
     ) -> Any:  # pragma: no cover - interface
         raise NotImplementedError
 
+    @contextmanager
+    def stream(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Iterator[bytes]]:
+        """GET `url` and yield an iterator over the raw body chunks.
+
+        For bodies too large to decode at once (see
+        `decoders.iter_json_array`). Backends read the chunks from the
+        socket as they are consumed; this default fetches the whole
+        response through `get` and yields it re-encoded as one chunk.
+        """
+        value = self.get(url, params=params, headers=headers, timeout=timeout)
+        body = value if isinstance(value, str) else json.dumps(value)
+        yield iter((body.encode(),))
+
     @abstractmethod
     def post(
         self,
@@ -31,3 +170,64 @@ class Requester(ABC):
         timeout: Optional[float] = None,
     ) -> Any:  # pragma: no cover - interface
         raise NotImplementedError
+
+    def delete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Send a DELETE (e.g. order cancellation); optional for backends."""
+        raise NotImplementedError(f"{type(self).__name__} does not support DELETE")
+
+
+class AsyncRequester(ABC):
+    """Abstract coroutine-based requester interface used by async API clients.
+
+    Same contract as `Requester`, but `aget`/`apost` are always coroutines.
+    """
+
+    rate_limiter: Optional["RateLimiter"] = None
+    hooks: Tuple["RequestHook", ...] = ()
+
+    def add_hook(self, hook: "RequestHook") -> None:
+        self.hooks = (*self.hooks, hook)
+
+    async def awarmup(self, url: str, connections: int = 1) -> int:
+        """Open pooled connections on the running loop; see `Requester.warmup`."""
+        results = await asyncio.gather(
+            *(self.aget(url) for _ in range(connections)), return_exceptions=True
+        )
+        return sum(not isinstance(r, BaseException) for r in results)
+
+    @abstractmethod
+    async def aget(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    @abstractmethod
+    async def apost(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    async def adelete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Send a DELETE; optional for backends."""
+        raise NotImplementedError(f"{type(self).__name__} does not support DELETE")
@@ -0,0 +1,333 @@
+"""Single-flight coalescing of identical GET requests.
+
+`CoalescingRequester` wraps another requester. Concurrent GETs for the same
+URL, params and headers share one in-flight request: the first caller sends
+it and every caller that arrives before it completes receives the same
+result (or exception). This works for threads (`get`) and coroutines
+(`aget`) alike; requests from different event loops are never merged.
+
+With `cache_ttl > 0` successful results are also kept for that many
+seconds, so a burst of identical requests arriving just after one another
+costs a single round-trip and a single request weight.
+
+Results are shared between callers, so treat them as read-only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from .base import AsyncRequester, BatchResult, Requester, RequestSpec
+
+Key = Tuple[Hashable, ...]
+
+
+def request_key(
+    url: str,
+    params: Optional[Mapping[str, Any]] = None,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Key:
+    """Identity of a GET: URL plus params and headers in a canonical order."""
+    norm_params = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    norm_headers = tuple(
+        sorted((str(k).lower(), str(v)) for k, v in (headers or {}).items())
+    )
+    return url, norm_params, norm_headers
+
+
+class _Flight:
+    """A sync in-flight request that other threads can wait on."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def _consume_result(task: asyncio.Future) -> None:
+    # If every waiter was cancelled, nobody retrieves a failure; do it here
+    # so asyncio does not log "exception was never retrieved".
+    if not task.cancelled():
+        task.exception()
+
+
+class CoalescingRequester(Requester, AsyncRequester):
+    """Requester wrapper merging identical concurrent GETs.
+
+    Args:
+        inner: The requester that actually performs requests. Async calls
+            need it to implement `AsyncRequester` (e.g. `HttpxRequester`).
+        cache_ttl: Seconds to keep successful GET results; 0 disables the
+            micro-cache and only in-flight requests are shared.
+        max_cache_entries: Bound on the number of cached results.
+        clock: Monotonic clock, injectable for tests.
+
+    `coalesced` and `cache_hits` count the requests that were served
+    without reaching `inner`.
+    """
+
+    def __init__(
+        self,
+        inner: Requester,
+        cache_ttl: float = 0.0,
+        max_cache_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.inner = inner
+        self.cache_ttl = cache_ttl
+        self.max_cache_entries = max_cache_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._inflight: Dict[Key, _Flight] = {}
+        self._async_inflight: Dict[Key, asyncio.Future] = {}
+        self._cache: Dict[Key, Tuple[float, Any]] = {}
+        self.coalesced = 0
+        self.cache_hits = 0
+
+    # The wrapper is transparent: limits, decoding and hooks live on `inner`.
+    @property
+    def rate_limiter(self):  # type: ignore[override]
+        return self.inner.rate_limiter
+
+    @property
+    def decoder(self):  # type: ignore[override]
+        return self.inner.decoder
+
+    @property
+    def hooks(self):  # type: ignore[override]
+        return self.inner.hooks
+
+    @hooks.setter
+    def hooks(self, value) -> None:
+        self.inner.hooks = value
+
+    def _cached(self, key: Key) -> Tuple[bool, Any]:
+        """Return (hit, value); caller holds the lock."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return False, None
+        expires, value = entry
+        if expires <= self._clock():
+            del self._cache[key]
+            return False, None
+        self.cache_hits += 1
+        return True, value
+
+    def _store(self, key: Key, value: Any) -> None:
+        """Cache a successful result; caller holds the lock."""
+        if self.cache_ttl <= 0:
+            return
+        now = self._clock()
+        if len(self._cache) >= self.max_cache_entries:
+            for stale in [k for k, (exp, _) in self._cache.items() if exp <= now]:
+                del self._cache[stale]
+            while len(self._cache) >= self.max_cache_entries:
+                del self._cache[next(iter(self._cache))]
+        self._cache[key] = (now + self.cache_ttl, value)
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _sync_get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[float],
+    ) -> Any:
+        key = request_key(url, params, headers)
+        with self._lock:
+            hit, value = self._cached(key)
+            if hit:
+                return value
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                self.coalesced += 1
+        assert flight is not None
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        try:
+            flight.value = self.inner.get(
+                url, params=params, headers=headers, timeout=timeout
+            )
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                if flight.error is None:
+                    self._store(key, flight.value)
+            flight.done.set()
+        return flight.value
+
+    async def _fetch_async(self, key: Key, url: str, **kwargs: Any) -> Any:
+        inner = self.inner
+        if not isinstance(inner, AsyncRequester):
+            raise TypeError(f"{type(inner).__name__} does not support async requests")
+        try:
+            value = await inner.aget(url, **kwargs)
+        finally:
+            with self._lock:
+                self._async_inflight.pop(key, None)
+        with self._lock:
+            self._store(key[1:], value)  # cached without the loop id
+        return value
+
+    async def aget(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        key = (id(loop), *request_key(url, params, headers))
+        with self._lock:
+            hit, value = self._cached(key[1:])
+            if hit:
+                return value
+            task = self._async_inflight.get(key)
+            if task is None:
+                task = loop.create_task(
+                    self._fetch_async(
+                        key, url, params=params, headers=headers, timeout=timeout
+                    )
+                )
+                task.add_done_callback(_consume_result)
+                self._async_inflight[key] = task
+            else:
+                self.coalesced += 1
+        # Shielded: one caller being cancelled must not cancel the others'.
+        return await asyncio.shield(task)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Blocking GET; returns a coroutine inside an event loop when `inner`
+        is async-capable, mirroring `HttpxRequester.get`."""
+        if isinstance(self.inner, AsyncRequester):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                return self.aget(url, params=params, headers=headers, timeout=timeout)
+        return self._sync_get(url, params, headers, timeout)
+
+    def post(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return self.inner.post(
+            url, data=data, json=json, headers=headers, timeout=timeout
+        )
+
+    async def apost(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        inner = self.inner
+        if not isinstance(inner, AsyncRequester):
+            raise TypeError(f"{type(inner).__name__} does not support async requests")
+        return await inner.apost(
+            url, data=data, json=json, headers=headers, timeout=timeout
+        )
+
+    def delete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return self.inner.delete(url, params=params, headers=headers, timeout=timeout)
+
+    async def adelete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        inner = self.inner
+        if not isinstance(inner, AsyncRequester):
+            raise TypeError(f"{type(inner).__name__} does not support async requests")
+        return await inner.adelete(url, params=params, headers=headers, timeout=timeout)
+
+    def request_many(
+        self, specs: Iterable[RequestSpec], max_concurrency: int = 10
+    ) -> Iterator[BatchResult]:
+        """Send each distinct GET of the batch once through `inner`."""
+        specs = list(specs)
+        groups: Dict[Key, List[int]] = {}
+        unique: List[RequestSpec] = []
+        for index, spec in enumerate(specs):
+            if spec.method == "GET":
+                key = request_key(spec.url, spec.params, spec.headers)
+                if key in groups:
+                    groups[key].append(index)
+                    self.coalesced += 1
+                    continue
+                groups[key] = [index]
+            else:
+                groups[("#", index)] = [index]
+            unique.append(spec)
+        owners = list(groups.values())
+        for result in self.inner.request_many(unique, max_concurrency=max_concurrency):
+            for index in owners[result.index]:
+                yield BatchResult(index, specs[index], result.value, result.error)
+
+    def warmup(self, url: str, connections: int = 1) -> int:
+        return self.inner.warmup(url, connections)
+
+    async def awarmup(self, url: str, connections: int = 1) -> int:
+        inner = self.inner
+        if not isinstance(inner, AsyncRequester):
+            raise TypeError(f"{type(inner).__name__} does not support async requests")
+        return await inner.awarmup(url, connections)
+
+    def close(self) -> None:
+        close = getattr(self.inner, "close", None)
+        if close is not None:
+            close()
+
+    async def aclose(self) -> None:
+        aclose = getattr(self.inner, "aclose", None)
+        if aclose is not None:
+            await aclose()
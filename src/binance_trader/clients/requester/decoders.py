@@ -0,0 +1,187 @@
+"""Pluggable JSON decoders for requester responses.
+
+By default the requesters call the HTTP library's `response.json()`. Pass a
+`decoder` (a callable taking the raw body bytes, or one of the names below)
+to parse with a faster library instead:
+
+- "orjson": `orjson.loads` (if installed)
+- "msgspec": `msgspec.json.decode` (if installed)
+- "json": the standard library
+- "auto": the fastest of the above that is importable
+
+`iter_json_array` parses incrementally instead: it yields the elements of
+a JSON array as the body chunks arrive (see `Requester.stream`), so a large
+list response is never held in memory as a whole.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Union
+
+Decoder = Callable[[bytes], Any]
+DecoderSpec = Union[Decoder, str, None]
+
+
+def _orjson_decoder() -> Decoder:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec_decoder() -> Decoder:
+    import msgspec  # type: ignore[import-not-found]
+
+    decoder = msgspec.json.Decoder()
+
+    def decode(content: bytes) -> Any:
+        try:
+            return decoder.decode(content)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+    return decode
+
+
+def _stdlib_decoder() -> Decoder:
+    return json.loads
+
+
+_FACTORIES = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "json": _stdlib_decoder,
+}
+
+
+def get_decoder(name: str = "auto") -> Decoder:
+    """Return the decoder called `name`; "auto" picks the fastest available.
+
+    Raises ImportError if a named optional library is not installed.
+    """
+    if name != "auto":
+        try:
+            factory = _FACTORIES[name]
+        except KeyError:
+            raise ValueError(f"Unknown decoder: {name!r}") from None
+        return factory()
+    for factory in (_orjson_decoder, _msgspec_decoder):
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return _stdlib_decoder()
+
+
+def resolve_decoder(spec: DecoderSpec) -> Optional[Decoder]:
+    """Turn a requester's `decoder` argument into a callable (or None)."""
+    if spec is None or callable(spec):
+        return spec
+    return get_decoder(spec)
+
+
+def decode_response(resp: Any, decoder: Optional[Decoder]) -> Any:
+    """Parse a requests/httpx response body, falling back to its text."""
+    try:
+        if decoder is None:
+            return resp.json()
+        return decoder(resp.content)
+    except ValueError:
+        return resp.text
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_json_decoder = json.JSONDecoder()
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+class _ChunkReader:
+    """Text buffer over UTF-8 byte chunks, refilled on demand."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+
+    def more(self) -> bool:
+        """Append the next chunk, dropping consumed text; False at the end."""
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                self.buf = self.buf[self.pos :] + text
+                self.pos = 0
+                return True
+        return False
+
+    def peek(self) -> str:
+        """The next non-whitespace character, left unconsumed."""
+        while True:
+            match = _WHITESPACE.match(self.buf, self.pos)
+            assert match is not None  # the pattern also matches ""
+            self.pos = match.end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.more():
+                raise ValueError("Truncated JSON document")
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON document, found {found!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _json_decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.more():
+                    raise
+                continue
+            # A number may continue in the next chunk ("12" + "34", "2." + "5").
+            if (
+                isinstance(value, (int, float))
+                and (end == len(self.buf) or self.buf[end] in _NUMBER_CHARS)
+                and self.more()
+            ):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(chunks: Iterable[bytes], path: Sequence[str] = ()) -> Iterator[Any]:
+    """Yield the elements of a JSON array from raw body `chunks`.
+
+    `path` names the object keys leading to the array, e.g. `("symbols",)`
+    for the symbol list of `/api/v3/exchangeInfo`; values before it are
+    parsed and discarded, values after it are not read. Only one element
+    (plus one chunk) is held in memory at a time.
+    """
+    reader = _ChunkReader(chunks)
+    for key in path:
+        reader.expect("{")
+        while True:
+            if reader.peek() == "}":
+                raise KeyError(key)
+            name = reader.value()
+            reader.expect(":")
+            if name == key:
+                break
+            reader.value()
+            if reader.peek() == ",":
+                reader.pos += 1
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' in JSON array, found {separator!r}")
@@ -6,49 +6,181 @@ The public methods (`get`, `post`) are dual-mode:
 - If called from within an active asyncio event loop they return an awaitable
   coroutine which the caller should `await`.
 
-This keeps a persistent `httpx.Client` and `httpx.AsyncClient` for efficiency.
+This keeps a persistent `httpx.Client` and `httpx.AsyncClient` for efficiency,
+each created on first use and configured from a `TransportConfig` (pool
+limits, keepalive, HTTP/2, connect/read timeouts, one shared TLS context).
+It also implements `AsyncRequester` (`aget`, `apost`) for callers that want
+an unconditionally awaitable API.
+
+`request_many` serves synchronous callers too: the batch runs concurrently
+on a private event loop in a background thread and results stream back to
+the calling thread as they complete.
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, Optional
+import concurrent.futures
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
 
 import httpx
 
-from .base import Requester
+from .base import AsyncRequester, BatchResult, Requester, RequestSpec
+from .decoders import DecoderSpec, decode_response, resolve_decoder
+from .instrumentation import RequestHook, finish_event, mark_sent, start_event
+from .rate_limit import RateLimiter, request_weight
+from .transport import TransportConfig
+
+# httpx's default for every timeout phase.
+_DEFAULT_TIMEOUT = 5.0
+
 
+def _or_default(value: Optional[float]) -> float:
+    return _DEFAULT_TIMEOUT if value is None else value
 
-class HttpxRequester(Requester):
+
+class HttpxRequester(Requester, AsyncRequester):
     """Adapter around `httpx.Client` / `httpx.AsyncClient`.
 
     Use the same method names for sync and async: in async contexts the
     methods return a coroutine; in sync contexts they return the final
     result.
+
+    With a `RateLimiter`, sync calls block and async calls are suspended
+    until the request weight is available. `decoder` swaps `response.json()`
+    for a faster parser (see `decoders`). `hooks` observe every request,
+    sync, async and batched alike (see `instrumentation`).
+
+    `transport` tunes the clients this requester creates (see
+    `transport.TransportConfig`); clients passed in are used as they are.
+    Each client is only created when first needed, and `warmup` opens
+    pooled connections before the first latency-critical request.
     """
 
     def __init__(
         self,
         client: Optional[httpx.Client] = None,
         async_client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        decoder: DecoderSpec = None,
+        hooks: Sequence[RequestHook] = (),
+        transport: Optional[TransportConfig] = None,
     ) -> None:
-        self._client = client or httpx.Client()
-        self._async_client = async_client or httpx.AsyncClient()
+        self.transport = transport or TransportConfig()
+        self._lazy_client = client
+        self._lazy_async_client = async_client
+        self._clients_lock = threading.Lock()
+        self._default_timeout: Optional[httpx.Timeout] = None
+        if self.transport.has_timeouts:
+            t = self.transport
+            self._default_timeout = httpx.Timeout(
+                _DEFAULT_TIMEOUT,
+                connect=_or_default(t.connect_timeout),
+                read=_or_default(t.read_timeout),
+                pool=_or_default(t.pool_timeout),
+            )
+        self.rate_limiter = rate_limiter
+        self.decoder = resolve_decoder(decoder)
+        self.hooks = tuple(hooks)
+        self._batch_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._batch_client: Optional[httpx.AsyncClient] = None
+        self._batch_lock = threading.Lock()
+
+    def _client_options(self) -> Dict[str, Any]:
+        t = self.transport
+        options: Dict[str, Any] = {
+            "http2": t.http2,
+            "limits": httpx.Limits(
+                max_connections=t.max_connections,
+                max_keepalive_connections=t.max_keepalive_connections,
+                keepalive_expiry=t.keepalive_expiry,
+            ),
+            "verify": t.ssl_context,
+        }
+        if self._default_timeout is not None:
+            options["timeout"] = self._default_timeout
+        return options
+
+    @property
+    def _client(self) -> httpx.Client:
+        client = self._lazy_client
+        if client is None:
+            with self._clients_lock:
+                if self._lazy_client is None:
+                    self._lazy_client = httpx.Client(**self._client_options())
+                client = self._lazy_client
+        return client
+
+    @_client.setter
+    def _client(self, client: httpx.Client) -> None:
+        self._lazy_client = client
+
+    @property
+    def _async_client(self) -> httpx.AsyncClient:
+        client = self._lazy_async_client
+        if client is None:
+            with self._clients_lock:
+                if self._lazy_async_client is None:
+                    self._lazy_async_client = httpx.AsyncClient(
+                        **self._client_options()
+                    )
+                client = self._lazy_async_client
+        return client
+
+    @_async_client.setter
+    def _async_client(self, client: httpx.AsyncClient) -> None:
+        self._lazy_async_client = client
+
+    def _with_timeout(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # An explicit timeout=None would disable the configured timeouts.
+        if kwargs.get("timeout") is None and self._default_timeout is not None:
+            kwargs["timeout"] = self._default_timeout
+        return kwargs
 
     def _handle_response(self, resp: httpx.Response) -> Any:
+        if self.rate_limiter is not None:
+            self.rate_limiter.update_from_headers(resp.headers, resp.status_code)
         resp.raise_for_status()
-        try:
-            return resp.json()
-        except ValueError:
-            return resp.text
+        return decode_response(resp, self.decoder)
 
     def _sync_request(self, method: str, url: str, **kwargs) -> Any:
-        resp = self._client.request(method, url, **kwargs)
-        return self._handle_response(resp)
+        event = start_event(self.hooks, method, url, kwargs.get("params"))
+        resp = None
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(request_weight(url, kwargs.get("params")))
+            mark_sent(event)
+            resp = self._client.request(method, url, **self._with_timeout(kwargs))
+            result = self._handle_response(resp)
+        except BaseException as exc:
+            finish_event(self.hooks, event, resp, exc)
+            raise
+        finish_event(self.hooks, event, resp)
+        return result
 
     async def _async_request(self, method: str, url: str, **kwargs) -> Any:
-        resp = await self._async_client.request(method, url, **kwargs)
-        return self._handle_response(resp)
+        return await self._async_send(self._async_client, method, url, **kwargs)
+
+    async def _async_send(
+        self, client: httpx.AsyncClient, method: str, url: str, **kwargs
+    ) -> Any:
+        event = start_event(self.hooks, method, url, kwargs.get("params"))
+        resp = None
+        try:
+            if self.rate_limiter is not None:
+                weight = request_weight(url, kwargs.get("params"))
+                await self.rate_limiter.acquire_async(weight)
+            mark_sent(event)
+            resp = await client.request(method, url, **self._with_timeout(kwargs))
+            result = self._handle_response(resp)
+        except BaseException as exc:
+            finish_event(self.hooks, event, resp, exc)
+            raise
+        finish_event(self.hooks, event, resp)
+        return result
 
     def _maybe_async_request(self, method: str, url: str, **kwargs) -> Any:
         """Return a coroutine in async context, otherwise perform sync request."""
@@ -85,3 +217,213 @@ class HttpxRequester(Requester):
             headers=headers,
             timeout=timeout,
         )
+
+    def delete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return self._maybe_async_request(
+            "DELETE", url, params=params, headers=headers, timeout=timeout
+        )
+
+    async def aget(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return await self._async_request(
+            "GET", url, params=params, headers=headers, timeout=timeout
+        )
+
+    async def apost(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return await self._async_request(
+            "POST",
+            url,
+            data=data,
+            json=json,
+            headers=headers,
+            timeout=timeout,
+        )
+
+    async def adelete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return await self._async_request(
+            "DELETE", url, params=params, headers=headers, timeout=timeout
+        )
+
+    @contextmanager
+    def stream(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Iterator[bytes]]:
+        """GET `url` with the sync client and yield the body chunks as they
+        arrive; see `Requester.stream`."""
+        event = start_event(self.hooks, "GET", url, params)
+        resp = None
+        received = 0
+        kwargs = self._with_timeout(
+            {"params": params, "headers": headers, "timeout": timeout}
+        )
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(request_weight(url, params))
+            mark_sent(event)
+            with self._client.stream("GET", url, **kwargs) as resp:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update_from_headers(
+                        resp.headers, resp.status_code
+                    )
+                resp.raise_for_status()
+
+                def chunks() -> Iterator[bytes]:
+                    nonlocal received
+                    for chunk in resp.iter_bytes():
+                        received += len(chunk)
+                        yield chunk
+
+                yield chunks()
+        except BaseException as exc:
+            finish_event(self.hooks, event, resp, exc, received)
+            raise
+        finish_event(self.hooks, event, resp, bytes_received=received)
+
+    def _warm_connections(self, connections: int) -> int:
+        # One HTTP/2 connection carries every request to a host.
+        return 1 if self.transport.http2 else max(1, connections)
+
+    def _warmed(self, resp: httpx.Response) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.update_from_headers(resp.headers, resp.status_code)
+
+    def warmup(self, url: str, connections: int = 1) -> Any:
+        """Open pooled connections to `url`'s host; see `Requester.warmup`.
+
+        Dual-mode like `get`: inside a running event loop this returns a
+        coroutine warming the async client (connections belong to the loop
+        that opened them), otherwise it warms the sync client. Responses
+        are discarded and transport errors only lower the returned count.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            return self.awarmup(url, connections)
+        client = self._client
+
+        def open_one(_: int) -> bool:
+            try:
+                self._warmed(client.get(url))
+            except httpx.TransportError:
+                return False
+            return True
+
+        n = self._warm_connections(connections)
+        if n == 1:
+            return int(open_one(0))
+        with ThreadPoolExecutor(n, thread_name_prefix="httpx-warmup") as pool:
+            return sum(pool.map(open_one, range(n)))
+
+    async def awarmup(self, url: str, connections: int = 1) -> int:
+        client = self._async_client
+
+        async def open_one() -> bool:
+            try:
+                self._warmed(await client.get(url))
+            except httpx.TransportError:
+                return False
+            return True
+
+        n = self._warm_connections(connections)
+        return sum(await asyncio.gather(*(open_one() for _ in range(n))))
+
+    async def aclose(self) -> None:
+        """Close the underlying async client, if it was created."""
+        if self._lazy_async_client is not None:
+            await self._lazy_async_client.aclose()
+
+    def _ensure_batch_loop(
+        self,
+    ) -> tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]:
+        # Connections of an AsyncClient are bound to the loop that opened them,
+        # so the background loop gets its own client rather than sharing
+        # `_async_client` with the caller's loop.
+        with self._batch_lock:
+            if self._batch_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="httpx-batch-loop", daemon=True
+                )
+                thread.start()
+                self._batch_loop = loop
+                self._batch_client = httpx.AsyncClient(**self._client_options())
+            assert self._batch_client is not None
+            return self._batch_loop, self._batch_client
+
+    async def _batch_call(
+        self,
+        client: httpx.AsyncClient,
+        index: int,
+        spec: RequestSpec,
+        semaphore: asyncio.Semaphore,
+    ) -> BatchResult:
+        kwargs: Dict[str, Any] = {"headers": spec.headers, "timeout": spec.timeout}
+        if spec.method in ("GET", "DELETE"):
+            kwargs["params"] = spec.params
+        else:
+            kwargs.update(data=spec.data, json=spec.json)
+        async with semaphore:
+            try:
+                value = await self._async_send(client, spec.method, spec.url, **kwargs)
+            except Exception as exc:
+                return BatchResult(index, spec, error=exc)
+        return BatchResult(index, spec, value=value)
+
+    def request_many(
+        self, specs: Iterable[RequestSpec], max_concurrency: int = 10
+    ) -> Iterator[BatchResult]:
+        loop, client = self._ensure_batch_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        futures = [
+            asyncio.run_coroutine_threadsafe(
+                self._batch_call(client, index, spec, semaphore), loop
+            )
+            for index, spec in enumerate(specs)
+        ]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def close(self) -> None:
+        """Close the sync client and stop the background batch loop, if any."""
+        if self._lazy_client is not None:
+            self._lazy_client.close()
+        with self._batch_lock:
+            loop, client = self._batch_loop, self._batch_client
+            self._batch_loop = self._batch_client = None
+        if loop is not None and client is not None:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
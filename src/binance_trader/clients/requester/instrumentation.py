@@ -0,0 +1,393 @@
+"""Request instrumentation hooks and a per-endpoint stats collector.
+
+Every requester accepts `hooks`: objects implementing `RequestHook`. For
+each request a `RequestEvent` is created and passed to `on_request` before
+anything is sent, then filled in (queueing delay, latency, status, bytes,
+used weight, error) and passed to `on_response` once the request finished,
+successfully or not. With no hooks installed no event is created at all.
+
+`StatsCollector` is the built-in hook. It keeps, per endpoint:
+
+- a log-linear latency histogram (`LatencyHistogram`, HDR-style: fixed
+  relative precision, constant-time recording, no sample buffer),
+- request, error, retry and per-status counts,
+- bytes received, request weight spent and the last `X-MBX-USED-WEIGHT`,
+- time spent queued in the client-side rate limiter, so local throttling
+  can be told apart from slow responses.
+
+Snapshots export as JSON (`snapshot`), Prometheus text (`to_prometheus`)
+or a plain table (`format_table`).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from .rate_limit import request_weight
+
+
+@dataclass
+class RequestEvent:
+    """What is known about one request; filled in as it progresses.
+
+    Times are `time.perf_counter()` seconds. `queued` is the time spent
+    waiting for the rate limiter, `elapsed` the total time including it.
+    """
+
+    method: str
+    url: str
+    endpoint: str
+    weight: int
+    started: float
+    queued: float = 0.0
+    elapsed: float = 0.0
+    status_code: Optional[int] = None
+    bytes_received: int = 0
+    used_weight: Optional[int] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class RequestHook:
+    """Base class for request hooks; override either callback."""
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Called before the request is queued or sent."""
+
+    def on_response(self, event: RequestEvent) -> None:
+        """Called once the request completed or failed."""
+
+    def on_retry(
+        self, method: str, url: str, attempt: int, error: BaseException, delay: float
+    ) -> None:
+        """Called by retrying wrappers before retry number `attempt`."""
+
+
+def start_event(
+    hooks: Sequence[RequestHook],
+    method: str,
+    url: str,
+    params: Optional[Mapping[str, Any]] = None,
+) -> Optional[RequestEvent]:
+    """Create the event for a request and notify `hooks` (None if no hooks)."""
+    if not hooks:
+        return None
+    event = RequestEvent(
+        method=method,
+        url=url,
+        endpoint=urlsplit(url).path,
+        weight=request_weight(url, params),
+        started=time.perf_counter(),
+    )
+    for hook in hooks:
+        hook.on_request(event)
+    return event
+
+
+def mark_sent(event: Optional[RequestEvent]) -> None:
+    """Record that the request left the rate limiter queue."""
+    if event is not None:
+        event.queued = time.perf_counter() - event.started
+
+
+def finish_event(
+    hooks: Sequence[RequestHook],
+    event: Optional[RequestEvent],
+    response: Any = None,
+    error: Optional[BaseException] = None,
+    bytes_received: Optional[int] = None,
+) -> None:
+    """Complete `event` from a requests/httpx `response` and notify `hooks`.
+
+    Pass `bytes_received` for streamed responses, whose body is consumed.
+    Otherwise the `Content-Length` header is used when present, so the body
+    is not touched; its length is the fallback.
+    """
+    if event is None:
+        return
+    event.elapsed = time.perf_counter() - event.started
+    event.error = error
+    if response is not None:
+        event.status_code = response.status_code
+        event.bytes_received = (
+            _content_length(response) if bytes_received is None else bytes_received
+        )
+        event.used_weight = _used_weight(response.headers)
+    for hook in hooks:
+        hook.on_response(event)
+
+
+def _content_length(response: Any) -> int:
+    length = response.headers.get("content-length")
+    if length is not None:
+        try:
+            return int(length)
+        except ValueError:
+            pass
+    return len(response.content)
+
+
+def _used_weight(headers: Mapping[str, str]) -> Optional[int]:
+    for name, value in headers.items():
+        if name.lower().startswith("x-mbx-used-weight"):
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+class LatencyHistogram:
+    """Log-linear histogram of durations with bounded relative error.
+
+    Values are recorded in microseconds. The first `2**precision` buckets
+    are exact; above that every power-of-two range is split into
+    `2**(precision - 1)` buckets, so any recorded value is reported within
+    `2**-(precision - 1)` of its true value (~1.6% for the default).
+    """
+
+    __slots__ = ("precision", "counts", "count", "total", "min", "max")
+
+    def __init__(self, precision: int = 7) -> None:
+        self.precision = precision
+        self.counts: List[int] = []
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def _index(self, micros: int) -> int:
+        shift = micros.bit_length() - self.precision
+        if shift <= 0:
+            return micros
+        half = 1 << (self.precision - 1)
+        return shift * half + (micros >> shift)
+
+    def _value(self, index: int) -> float:
+        """Midpoint, in microseconds, of the bucket at `index`."""
+        half = 1 << (self.precision - 1)
+        if index < 2 * half:
+            return float(index)
+        shift = index // half - 1
+        mantissa = index - shift * half
+        return (mantissa << shift) + (1 << shift) / 2
+
+    def record(self, seconds: float) -> None:
+        index = self._index(max(0, int(seconds * 1_000_000)))
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Duration in seconds at quantile `q` (0..1); 0.0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                value = self._value(index) / 1_000_000
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: LatencyHistogram) -> None:
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge histograms of different precision")
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, n in enumerate(other.counts):
+            self.counts[index] += n
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+
+@dataclass
+class EndpointStats:
+    """Aggregates for one (method, endpoint) pair."""
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    queued: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+    bytes_received: int = 0
+    weight: int = 0
+    used_weight: Optional[int] = None
+
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+class StatsCollector(RequestHook):
+    """Thread-safe `RequestHook` aggregating `EndpointStats` per endpoint."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], EndpointStats] = {}
+
+    def on_response(self, event: RequestEvent) -> None:
+        with self._lock:
+            stats = self._get(event.method, event.endpoint)
+            stats.latency.record(event.elapsed)
+            stats.queued += event.queued
+            stats.requests += 1
+            stats.weight += event.weight
+            stats.bytes_received += event.bytes_received
+            if event.error is not None:
+                stats.errors += 1
+            if event.status_code is not None:
+                stats.statuses[event.status_code] = (
+                    stats.statuses.get(event.status_code, 0) + 1
+                )
+            if event.used_weight is not None:
+                stats.used_weight = event.used_weight
+
+    def on_retry(
+        self, method: str, url: str, attempt: int, error: BaseException, delay: float
+    ) -> None:
+        with self._lock:
+            stats = self._get(method, urlsplit(url).path)
+            stats.retries += 1
+
+    def _get(self, method: str, endpoint: str) -> EndpointStats:
+        """Stats for an endpoint, created on first use; caller holds the lock."""
+        stats = self._stats.get((method, endpoint))
+        if stats is None:
+            stats = self._stats[(method, endpoint)] = EndpointStats()
+        return stats
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def endpoints(self) -> Dict[Tuple[str, str], EndpointStats]:
+        """Copy of the per-(method, endpoint) stats."""
+        with self._lock:
+            return dict(self._stats)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serialisable summary; latencies in milliseconds."""
+        endpoints = []
+        for (method, endpoint), stats in sorted(self.endpoints().items()):
+            latency = stats.latency
+            endpoints.append(
+                {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "retries": stats.retries,
+                    "statuses": {str(k): v for k, v in sorted(stats.statuses.items())},
+                    "bytes_received": stats.bytes_received,
+                    "weight": stats.weight,
+                    "used_weight": stats.used_weight,
+                    "queued_ms": stats.queued * 1000,
+                    "latency_ms": {
+                        "mean": latency.mean * 1000,
+                        "min": latency.min * 1000 if latency.count else 0.0,
+                        "max": latency.max * 1000,
+                        **{
+                            f"p{q * 100:g}": latency.percentile(q) * 1000
+                            for q in QUANTILES
+                        },
+                    },
+                }
+            )
+        return {"endpoints": endpoints}
+
+    def to_prometheus(self, prefix: str = "binance_requester") -> str:
+        """Render the stats in the Prometheus text exposition format."""
+        items = sorted(self.endpoints().items())
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str) -> str:
+            full = f"{prefix}_{name}"
+            lines.append(f"# HELP {full} {help_text}")
+            lines.append(f"# TYPE {full} {kind}")
+            return full
+
+        def labels(method: str, endpoint: str, **extra: str) -> str:
+            pairs = {"method": method, "endpoint": endpoint, **extra}
+            return ",".join(f'{k}="{_escape(v)}"' for k, v in pairs.items())
+
+        name = metric("request_duration_seconds", "summary", "Request latency.")
+        for (method, endpoint), stats in items:
+            for q in QUANTILES:
+                lbl = labels(method, endpoint, quantile=f"{q:g}")
+                lines.append(f"{name}{{{lbl}}} {stats.latency.percentile(q):.6f}")
+            lbl = labels(method, endpoint)
+            lines.append(f"{name}_sum{{{lbl}}} {stats.latency.total:.6f}")
+            lines.append(f"{name}_count{{{lbl}}} {stats.latency.count}")
+
+        counters: Iterable[Tuple[str, str, str]] = (
+            ("requests_total", "requests", "Requests sent."),
+            ("errors_total", "errors", "Requests that raised."),
+            ("retries_total", "retries", "Requests retried by a wrapper."),
+            ("received_bytes_total", "bytes_received", "Response body bytes."),
+            ("weight_total", "weight", "Request weight spent."),
+            ("queued_seconds_total", "queued", "Time queued by the rate limiter."),
+        )
+        for suffix, attr, help_text in counters:
+            name = metric(suffix, "counter", help_text)
+            for (method, endpoint), stats in items:
+                value = getattr(stats, attr)
+                lines.append(f"{name}{{{labels(method, endpoint)}}} {value:g}")
+
+        name = metric("responses_total", "counter", "Responses by status code.")
+        for (method, endpoint), stats in items:
+            for status, count in sorted(stats.statuses.items()):
+                lbl = labels(method, endpoint, status=str(status))
+                lines.append(f"{name}{{{lbl}}} {count}")
+
+        name = metric("used_weight", "gauge", "Last X-MBX-USED-WEIGHT reported.")
+        for (method, endpoint), stats in items:
+            if stats.used_weight is not None:
+                lines.append(
+                    f"{name}{{{labels(method, endpoint)}}} {stats.used_weight}"
+                )
+        return "\n".join(lines) + "\n"
+
+    def format_table(self) -> str:
+        """Human-readable per-endpoint breakdown."""
+        header = (
+            f"{'endpoint':<32} {'reqs':>5} {'err':>4} {'retry':>5} {'p50 ms':>8} {'p99 ms':>8}"
+            f" {'max ms':>8} {'queued ms':>10} {'KiB':>9} {'weight':>7}"
+        )
+        rows = [header]
+        for (method, endpoint), stats in sorted(self.endpoints().items()):
+            latency = stats.latency
+            rows.append(
+                f"{method + ' ' + endpoint:<32} {stats.requests:>5} {stats.errors:>4}"
+                f" {stats.retries:>5}"
+                f" {latency.percentile(0.5) * 1000:>8.2f}"
+                f" {latency.percentile(0.99) * 1000:>8.2f}"
+                f" {latency.max * 1000:>8.2f} {stats.queued * 1000:>10.2f}"
+                f" {stats.bytes_received / 1024:>9.1f} {stats.weight:>7}"
+            )
+        return "\n".join(rows)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,254 @@
+"""Client-side request weight limiting for the Binance REST API.
+
+Binance charges every REST call a *weight* and bans IPs that exceed the
+per-minute budget (HTTP 429, then 418). This module keeps a local estimate
+of the budget so requests can be delayed *before* they are sent:
+
+- `request_weight` looks up the weight of a call in `ENDPOINT_WEIGHTS`.
+- `TokenBucket` refills continuously and is corrected from the
+  `X-MBX-USED-WEIGHT-*` headers the server reports on each response.
+- `RateLimiter` schedules callers in FIFO order by reserving weight up
+  front and telling each caller how long to wait. It works for threads
+  (`acquire`) and coroutines (`acquire_async`) alike.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+from urllib.parse import parse_qsl, urlsplit
+
+Params = Optional[Mapping[str, Any]]
+
+
+def _symbols_count(params: Params) -> Optional[int]:
+    if not params:
+        return None
+    symbols = params.get("symbols")
+    if symbols is None:
+        return None
+    if isinstance(symbols, str):
+        try:
+            symbols = json.loads(symbols)
+        except ValueError:
+            return 1
+    return len(symbols)
+
+
+def _depth_weight(params: Params) -> int:
+    limit = int((params or {}).get("limit", 100))
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 25
+    if limit <= 1000:
+        return 50
+    return 250
+
+
+def _ticker_24hr_weight(params: Params) -> int:
+    if params and params.get("symbol"):
+        return 2
+    count = _symbols_count(params)
+    if count is None:
+        return 80
+    if count <= 20:
+        return 2
+    if count <= 100:
+        return 40
+    return 80
+
+
+def _ticker_light_weight(params: Params) -> int:
+    # /ticker/price and /ticker/bookTicker: 2 for one symbol, 4 otherwise.
+    return 2 if params and params.get("symbol") else 4
+
+
+def _open_orders_weight(params: Params) -> int:
+    return 6 if params and params.get("symbol") else 80
+
+
+WeightRule = Union[int, Callable[[Params], int]]
+
+#: Request weight per REST path (spot API). Unknown paths cost `DEFAULT_WEIGHT`.
+ENDPOINT_WEIGHTS: Dict[str, WeightRule] = {
+    "/api/v3/ping": 1,
+    "/api/v3/time": 1,
+    "/api/v3/exchangeInfo": 20,
+    "/api/v3/depth": _depth_weight,
+    "/api/v3/trades": 25,
+    "/api/v3/historicalTrades": 25,
+    "/api/v3/aggTrades": 4,
+    "/api/v3/klines": 2,
+    "/api/v3/uiKlines": 2,
+    "/api/v3/avgPrice": 2,
+    "/api/v3/ticker/24hr": _ticker_24hr_weight,
+    "/api/v3/ticker/price": _ticker_light_weight,
+    "/api/v3/ticker/bookTicker": _ticker_light_weight,
+    "/api/v3/order": 1,
+    "/api/v3/order/test": 1,
+    "/api/v3/order/cancelReplace": 1,
+    "/api/v3/openOrders": _open_orders_weight,
+    "/api/v3/account": 20,
+    "/api/v3/myTrades": 20,
+}
+
+DEFAULT_WEIGHT = 1
+
+
+def request_weight(url: str, params: Params = None) -> int:
+    """Return the request weight Binance charges for `url` with `params`.
+
+    Params already encoded into the URL's query string (as signed requests
+    do) are used when `params` is not given.
+    """
+    parts = urlsplit(url)
+    rule = ENDPOINT_WEIGHTS.get(parts.path.rstrip("/"), DEFAULT_WEIGHT)
+    if callable(rule):
+        if params is None and parts.query:
+            params = dict(parse_qsl(parts.query))
+        return rule(params)
+    return rule
+
+
+class TokenBucket:
+    """Continuously refilling token bucket.
+
+    `capacity` tokens are replenished over `interval` seconds. Tokens may go
+    negative: that is how reservations queue up behind each other.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = float(capacity)
+        self.interval = float(interval)
+        self.rate = self.capacity / self.interval
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def take(self, amount: float) -> float:
+        """Consume `amount` tokens and return the seconds until they are covered."""
+        self._refill()
+        self._tokens -= amount
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+    def correct(self, used: float) -> None:
+        """Clamp the bucket to what the server says is left in the window."""
+        self._refill()
+        self._tokens = min(self._tokens, self.capacity - used)
+
+
+_USED_WEIGHT_RE = re.compile(r"^x-mbx-used-weight-(\d+[smhd])$", re.IGNORECASE)
+_ORDER_COUNT_RE = re.compile(r"^x-mbx-order-count-(\d+[smhd])$", re.IGNORECASE)
+
+
+class RateLimiter:
+    """Weight-aware scheduler shared by sync and async requesters.
+
+    Args:
+        weight_limit: Request weight allowed per `interval` (Binance: 6000/min).
+        interval: Length of the weight window in seconds.
+        interval_header: Suffix of the `X-MBX-USED-WEIGHT-*` header that
+            matches `interval`; its value corrects the token bucket.
+        clock: Monotonic clock, injectable for tests.
+        sleep: Blocking sleep used by `acquire`, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        weight_limit: int = 6000,
+        interval: float = 60.0,
+        interval_header: str = "1m",
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.weight_limit = weight_limit
+        self.interval_header = interval_header.lower()
+        self._clock = clock
+        self._sleep = sleep
+        self._bucket = TokenBucket(weight_limit, interval, clock=clock)
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+        self.used_weight: Dict[str, int] = {}
+        self.order_count: Dict[str, int] = {}
+
+    @property
+    def remaining(self) -> int:
+        """Weight that can be spent right now without waiting."""
+        with self._lock:
+            if self._clock() < self._blocked_until:
+                return 0
+            return max(0, int(self._bucket.tokens))
+
+    def reserve(self, weight: int) -> float:
+        """Reserve `weight` and return how many seconds the caller must wait."""
+        with self._lock:
+            delay = self._bucket.take(weight)
+            return max(delay, self._blocked_until - self._clock())
+
+    def acquire(self, weight: int) -> None:
+        """Block the calling thread until `weight` can be spent."""
+        delay = self.reserve(weight)
+        if delay > 0:
+            self._sleep(delay)
+
+    async def acquire_async(self, weight: int) -> None:
+        """Suspend the calling coroutine until `weight` can be spent."""
+        delay = self.reserve(weight)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update_from_headers(
+        self, headers: Mapping[str, str], status_code: Optional[int] = None
+    ) -> None:
+        """Correct local state from a response's rate-limit headers."""
+        with self._lock:
+            for name, value in headers.items():
+                match = _USED_WEIGHT_RE.match(name)
+                if match:
+                    interval = match.group(1).lower()
+                    self.used_weight[interval] = int(value)
+                    if interval == self.interval_header:
+                        self._bucket.correct(int(value))
+                    continue
+                match = _ORDER_COUNT_RE.match(name)
+                if match:
+                    self.order_count[match.group(1).lower()] = int(value)
+            if status_code in (418, 429):
+                retry_after = _header(headers, "Retry-After")
+                wait = float(retry_after) if retry_after else self._bucket.interval
+                self._blocked_until = max(self._blocked_until, self._clock() + wait)
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    value = headers.get(name)
+    if value is not None:
+        return value
+    lowered = name.lower()
+    for key, value in headers.items():
+        if key.lower() == lowered:
+            return value
+    return None
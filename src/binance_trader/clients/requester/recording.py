@@ -0,0 +1,620 @@
+"""Record requests to a log and replay them without a network.
+
+`RecordingRequester` wraps any requester and appends one JSON line per
+request to a gzip-compressed log: wall-clock time, method, URL, params,
+duration and the decoded response (or the error and its HTTP status).
+Opening an existing log appends a new gzip member, which `gzip` reads back
+as one stream, so a log can grow across runs. Headers are never written
+(they carry the API key), and `timestamp`, `recvWindow` and `signature`
+are dropped from signed URLs.
+
+`ReplayRequester` loads one or more logs, indexes them by method, path and
+params, and serves the recorded responses back in recorded order. Client
+order ids (`newClientOrderId` and friends) are left out of the match, since
+a replayed session generates fresh ones. With
+`speed=None` it answers immediately; otherwise it waits so that responses
+come out at `speed` times the recorded pace (1.0 is real time). Hosts are
+ignored when matching, so a log recorded against `api.binance.com` replays
+for any `base_url`.
+
+Example:
+    recorder = RecordingRequester(RequestsRequester(), "session.jsonl.gz")
+    BinanceClient(recorder).klines("BTCUSDT", "1m")
+    recorder.close()
+
+    client = BinanceClient(ReplayRequester("session.jsonl.gz"))
+    client.klines("BTCUSDT", "1m")  # served from the log
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import os
+import threading
+import time
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .base import AsyncRequester, BatchResult, Requester, RequestSpec
+from .resilience import _retry_after, _status
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+#: Query params that change on every signed request and never identify it.
+VOLATILE_PARAMS = frozenset({"timestamp", "recvWindow", "signature"})
+#: Params recorded but not matched on replay: generated afresh each session.
+CLIENT_ID_PARAMS = frozenset(
+    {
+        "newClientOrderId",
+        "origClientOrderId",
+        "cancelNewClientOrderId",
+        "cancelOrigClientOrderId",
+    }
+)
+
+
+def _strip_url(url: str) -> str:
+    """`url` without volatile query params."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k not in VOLATILE_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def replay_key(
+    method: str,
+    url: str,
+    params: Optional[Mapping[str, Any]] = None,
+    ignore: AbstractSet[str] = VOLATILE_PARAMS | CLIENT_ID_PARAMS,
+) -> Tuple[Hashable, ...]:
+    """Identity of a request for replay: method, path and params not in `ignore`.
+
+    Params given in the URL query and in `params` are treated alike.
+    """
+    parts = urlsplit(url)
+    merged = dict(parse_qsl(parts.query))
+    merged.update((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+    norm = tuple(sorted((k, v) for k, v in merged.items() if k not in ignore))
+    return method, parts.path, norm
+
+
+class ReplayMissError(LookupError):
+    """The replayed log has no response for a request."""
+
+
+class _ReplayedResponse:
+    """Stand-in for the HTTP response of a replayed error."""
+
+    __slots__ = ("status_code", "headers", "text")
+
+    def __init__(
+        self, status_code: Optional[int], headers: Dict[str, str], text: str
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+
+
+class ReplayedError(RuntimeError):
+    """A recorded request failure, raised again on replay.
+
+    `response.status_code` is the recorded HTTP status (None for transport
+    errors), so retry and failover logic treats it like the original.
+    """
+
+    def __init__(self, record: Mapping[str, Any]) -> None:
+        error = record["e"]
+        super().__init__(f"{error['type']}: {error['message']}")
+        self.error_type: str = error["type"]
+        headers = {}
+        if error.get("retry_after") is not None:
+            headers["Retry-After"] = str(error["retry_after"])
+        self.response = _ReplayedResponse(
+            error.get("status"), headers, error["message"]
+        )
+
+
+class RecordingRequester(Requester, AsyncRequester):
+    """Requester wrapper appending every request and its outcome to a log.
+
+    Args:
+        inner: The requester that actually performs requests.
+        path: Log file; `.gz` is conventional but not required (the log
+            is always gzip-compressed).
+        flush_interval: Seconds between flushes of the compressed stream;
+            0 flushes after every record (safer, compresses worse).
+        clock: Wall clock stored with each record, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        inner: Requester,
+        path: PathLike,
+        flush_interval: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.inner = inner
+        self.path = os.fspath(path)
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._file: Optional[gzip.GzipFile] = gzip.open(self.path, "ab")
+        self._flushed_at = time.monotonic()
+        self.records = 0
+
+    @property
+    def rate_limiter(self):  # type: ignore[override]
+        return self.inner.rate_limiter
+
+    @property
+    def decoder(self):  # type: ignore[override]
+        return self.inner.decoder
+
+    @property
+    def hooks(self):  # type: ignore[override]
+        return self.inner.hooks
+
+    @hooks.setter
+    def hooks(self, value) -> None:
+        self.inner.hooks = value
+
+    def _write(
+        self,
+        started: float,
+        elapsed: float,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        value: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        record: Dict[str, Any] = {
+            "t": started,
+            "d": round(elapsed, 6),
+            "m": method,
+            "u": _strip_url(url),
+        }
+        if params:
+            record["p"] = {
+                k: v
+                for k, v in params.items()
+                if v is not None and k not in VOLATILE_PARAMS
+            }
+        if error is None:
+            record["r"] = value
+        else:
+            record["e"] = {
+                "type": type(error).__name__,
+                "message": str(error),
+                "status": _status(error),
+                "retry_after": _retry_after(error),
+            }
+        line = json.dumps(record, separators=(",", ":"), default=str).encode() + b"\n"
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self.records += 1
+            now = time.monotonic()
+            if now - self._flushed_at >= self.flush_interval:
+                self._file.flush()
+                self._flushed_at = now
+
+    def _record(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        send: Callable[[], Any],
+    ) -> Any:
+        started, t0 = self._clock(), time.perf_counter()
+        try:
+            value = send()
+        except Exception as exc:
+            self._write(
+                started, time.perf_counter() - t0, method, url, params, error=exc
+            )
+            raise
+        self._write(started, time.perf_counter() - t0, method, url, params, value)
+        return value
+
+    async def _arecord(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        send: Callable[[], Any],
+    ) -> Any:
+        started, t0 = self._clock(), time.perf_counter()
+        try:
+            value = await send()
+        except Exception as exc:
+            self._write(
+                started, time.perf_counter() - t0, method, url, params, error=exc
+            )
+            raise
+        self._write(started, time.perf_counter() - t0, method, url, params, value)
+        return value
+
+    def _async_inner(self) -> AsyncRequester:
+        inner = self.inner
+        if not isinstance(inner, AsyncRequester):
+            raise TypeError(f"{type(inner).__name__} does not support async requests")
+        return inner
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Blocking GET; returns a coroutine inside an event loop when `inner`
+        is async-capable, mirroring `HttpxRequester.get`."""
+        if isinstance(self.inner, AsyncRequester):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                return self.aget(url, params=params, headers=headers, timeout=timeout)
+        return self._record(
+            "GET",
+            url,
+            params,
+            lambda: self.inner.get(
+                url, params=params, headers=headers, timeout=timeout
+            ),
+        )
+
+    async def aget(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        inner = self._async_inner()
+        return await self._arecord(
+            "GET",
+            url,
+            params,
+            lambda: inner.aget(url, params=params, headers=headers, timeout=timeout),
+        )
+
+    def post(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return self._record(
+            "POST",
+            url,
+            None,
+            lambda: self.inner.post(
+                url, data=data, json=json, headers=headers, timeout=timeout
+            ),
+        )
+
+    async def apost(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        inner = self._async_inner()
+        return await self._arecord(
+            "POST",
+            url,
+            None,
+            lambda: inner.apost(
+                url, data=data, json=json, headers=headers, timeout=timeout
+            ),
+        )
+
+    def delete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return self._record(
+            "DELETE",
+            url,
+            params,
+            lambda: self.inner.delete(
+                url, params=params, headers=headers, timeout=timeout
+            ),
+        )
+
+    async def adelete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        inner = self._async_inner()
+        return await self._arecord(
+            "DELETE",
+            url,
+            params,
+            lambda: inner.adelete(url, params=params, headers=headers, timeout=timeout),
+        )
+
+    def request_many(
+        self, specs: Iterable[RequestSpec], max_concurrency: int = 10
+    ) -> Iterator[BatchResult]:
+        """Run the batch through `inner`, recording each result."""
+        for result in self.inner.request_many(specs, max_concurrency=max_concurrency):
+            spec = result.request
+            # Batch results carry no start time; record completion time.
+            self._write(
+                self._clock(),
+                0.0,
+                spec.method,
+                spec.url,
+                spec.params,
+                result.value,
+                result.error,
+            )
+            yield result
+
+    def warmup(self, url: str, connections: int = 1) -> int:
+        return self.inner.warmup(url, connections)
+
+    async def awarmup(self, url: str, connections: int = 1) -> int:
+        inner = self.inner
+        if not isinstance(inner, AsyncRequester):
+            raise TypeError(f"{type(inner).__name__} does not support async requests")
+        return await inner.awarmup(url, connections)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                self._flushed_at = time.monotonic()
+
+    def close(self) -> None:
+        """Finish the log and close `inner`."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        close = getattr(self.inner, "close", None)
+        if close is not None:
+            close()
+
+    async def aclose(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        aclose = getattr(self.inner, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def read_log(path: PathLike) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a log, tolerating a truncated last line."""
+    with gzip.open(os.fspath(path), "rb") as f:
+        try:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    return  # partial record from an interrupted writer
+        except EOFError:
+            return  # stream cut mid-member: keep what was readable
+
+
+class ReplayRequester(Requester, AsyncRequester):
+    """Requester answering from recorded logs.
+
+    Args:
+        paths: One log path or several (e.g. one per day); records are
+            merged in time order.
+        speed: Replay pace relative to the recording (2.0 is twice as
+            fast); None answers without waiting.
+        strict: When a request's recorded responses are used up, raise
+            `ReplayMissError` instead of repeating the last response.
+        sleep: Blocking sleep, injectable for tests.
+        ignore_params: Params left out when matching requests to records,
+            on top of `VOLATILE_PARAMS`; defaults to `CLIENT_ID_PARAMS`.
+
+    Requests without any recorded response raise `ReplayMissError`.
+    `recorded_time` is the wall time at which the last served response
+    was originally recorded, the natural "now" of a backtest.
+    """
+
+    def __init__(
+        self,
+        paths: Union[PathLike, Sequence[PathLike]],
+        speed: Optional[float] = None,
+        strict: bool = False,
+        sleep: Callable[[float], None] = time.sleep,
+        ignore_params: Iterable[str] = CLIENT_ID_PARAMS,
+    ) -> None:
+        if isinstance(paths, (str, os.PathLike)):
+            paths = [paths]
+        records: List[Dict[str, Any]] = []
+        for path in paths:
+            records.extend(read_log(path))
+        records.sort(key=lambda r: r["t"])
+        self.records = records
+        self.speed = speed
+        self.strict = strict
+        self._sleep = sleep
+        self.ignore_params = VOLATILE_PARAMS | frozenset(ignore_params)
+        self._lock = threading.Lock()
+        self._index: Dict[Tuple[Hashable, ...], List[Dict[str, Any]]] = {}
+        for record in records:
+            key = replay_key(
+                record["m"], record["u"], record.get("p"), self.ignore_params
+            )
+            self._index.setdefault(key, []).append(record)
+        self._cursors: Dict[Tuple[Hashable, ...], int] = {}
+        self._origin = records[0]["t"] if records else 0.0
+        self._started: Optional[float] = None
+        self.recorded_time: Optional[float] = None
+        self.served = 0
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def reset(self) -> None:
+        """Start the replay over."""
+        with self._lock:
+            self._cursors.clear()
+            self._started = None
+            self.recorded_time = None
+            self.served = 0
+
+    def warmup(self, url: str, connections: int = 1) -> int:
+        """No connections to open; does not consume recorded responses."""
+        return 0
+
+    async def awarmup(self, url: str, connections: int = 1) -> int:
+        return 0
+
+    def _next(
+        self, method: str, url: str, params: Optional[Mapping[str, Any]]
+    ) -> Tuple[Dict[str, Any], float]:
+        """The record to serve and the seconds to wait before serving it."""
+        key = replay_key(method, url, params, self.ignore_params)
+        with self._lock:
+            entries = self._index.get(key)
+            if not entries:
+                raise ReplayMissError(f"No recorded response for {method} {url}")
+            cursor = self._cursors.get(key, 0)
+            if cursor >= len(entries):
+                if self.strict:
+                    raise ReplayMissError(
+                        f"Recorded responses for {method} {url} are used up"
+                    )
+                cursor = len(entries) - 1
+            self._cursors[key] = cursor + 1
+            record = entries[cursor]
+            self.recorded_time = record["t"]
+            self.served += 1
+            if not self.speed:
+                return record, 0.0
+            now = time.monotonic()
+            if self._started is None:
+                self._started = now
+            due = self._started + (
+                record["t"] + record.get("d", 0.0) - self._origin
+            ) / (self.speed)
+            return record, max(0.0, due - now)
+
+    @staticmethod
+    def _result(record: Mapping[str, Any]) -> Any:
+        if "e" in record:
+            raise ReplayedError(record)
+        return record.get("r")
+
+    def _serve(self, method: str, url: str, params: Optional[Mapping[str, Any]]) -> Any:
+        record, wait = self._next(method, url, params)
+        if wait > 0:
+            self._sleep(wait)
+        return self._result(record)
+
+    async def _aserve(
+        self, method: str, url: str, params: Optional[Mapping[str, Any]]
+    ) -> Any:
+        record, wait = self._next(method, url, params)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return self._result(record)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return self._serve("GET", url, params)
+
+    async def aget(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return await self._aserve("GET", url, params)
+
+    def post(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return self._serve("POST", url, None)
+
+    async def apost(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return await self._aserve("POST", url, None)
+
+    def delete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return self._serve("DELETE", url, params)
+
+    async def adelete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return await self._aserve("DELETE", url, params)
+
+
+def recorded_routes(paths: Union[PathLike, Sequence[PathLike]]) -> Dict[str, bytes]:
+    """Last successful response per path, encoded for `MockBinanceServer`.
+
+    Lets benchmarks serve payloads captured from the real API.
+    """
+    replay = ReplayRequester(paths)
+    routes: Dict[str, bytes] = {}
+    for record in replay.records:
+        if "e" not in record:
+            routes[urlsplit(record["u"]).path] = json.dumps(record.get("r")).encode()
+    return routes
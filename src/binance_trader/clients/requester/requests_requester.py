@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from .base import Requester
+from .base import BatchResult, Requester, RequestSpec
+from .decoders import DecoderSpec, decode_response, resolve_decoder
+from .instrumentation import RequestHook, finish_event, mark_sent, start_event
+from .rate_limit import RateLimiter, request_weight
+from .transport import TransportConfig
+
+_STREAM_CHUNK = 1 << 16
 
 
 class RequestsRequester(Requester):
@@ -14,18 +23,69 @@ class RequestsRequester(Requester):
 
     - Raises `requests.HTTPError` on non-2xx responses via `response.raise_for_status()`.
     - Returns parsed JSON when possible, otherwise returns response text.
+      `decoder` swaps `response.json()` for a faster parser (see `decoders`).
+    - With a `RateLimiter`, waits for request weight before sending and
+      feeds the `X-MBX-*` usage headers back into it.
+    - `hooks` observe every request (timing, status, bytes, weight).
+    - `request_many` overlaps requests on a bounded thread pool sharing the
+      pooled session.
+    - `transport` sizes the session's connection pools (see
+      `transport.TransportConfig`) and supplies the `(connect, read)`
+      timeout for calls without one. The default urllib3 pool keeps only
+      10 connections per host, fewer than a busy `request_many` uses.
     """
 
-    def __init__(self, session: Optional[requests.Session] = None) -> None:
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        decoder: DecoderSpec = None,
+        hooks: Sequence[RequestHook] = (),
+        transport: Optional[TransportConfig] = None,
+    ) -> None:
+        self.transport = transport or TransportConfig()
         self.session = session or requests.Session()
+        if session is None or transport is not None:
+            adapter = self.adapter(self.transport)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self.session.verify = self.transport.verify
+        self._default_timeout = self.transport.timeout_tuple()
+        self.rate_limiter = rate_limiter
+        self.decoder = resolve_decoder(decoder)
+        self.hooks = tuple(hooks)
+
+    @staticmethod
+    def adapter(transport: TransportConfig) -> HTTPAdapter:
+        """An `HTTPAdapter` keeping `max_connections` connections per host.
+
+        With `pool_block` that is also the cap on open connections;
+        otherwise extra connections are opened and dropped after use.
+        """
+        return HTTPAdapter(
+            pool_maxsize=transport.max_connections, pool_block=transport.pool_block
+        )
 
     def _request(self, method: str, url: str, **kwargs) -> Any:
-        resp = self.session.request(method, url, **kwargs)
-        resp.raise_for_status()
+        limiter = self.rate_limiter
+        event = start_event(self.hooks, method, url, kwargs.get("params"))
+        resp = None
         try:
-            return resp.json()
-        except ValueError:
-            return resp.text
+            if limiter is not None:
+                limiter.acquire(request_weight(url, kwargs.get("params")))
+            if kwargs.get("timeout") is None and self._default_timeout is not None:
+                kwargs["timeout"] = self._default_timeout
+            mark_sent(event)
+            resp = self.session.request(method, url, **kwargs)
+            if limiter is not None:
+                limiter.update_from_headers(resp.headers, resp.status_code)
+            resp.raise_for_status()
+            result = decode_response(resp, self.decoder)
+        except BaseException as exc:
+            finish_event(self.hooks, event, resp, exc)
+            raise
+        finish_event(self.hooks, event, resp)
+        return result
 
     def get(
         self,
@@ -49,3 +109,99 @@ class RequestsRequester(Requester):
         return self._request(
             "POST", url, data=data, json=json, headers=headers, timeout=timeout
         )
+
+    def delete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return self._request(
+            "DELETE", url, params=params, headers=headers, timeout=timeout
+        )
+
+    @contextmanager
+    def stream(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Iterator[bytes]]:
+        """GET `url` and yield the body chunks as they arrive from the socket.
+
+        The status is checked before anything is yielded. The request is
+        reported to `hooks` when the block exits.
+        """
+        limiter = self.rate_limiter
+        event = start_event(self.hooks, "GET", url, params)
+        resp = None
+        received = 0
+
+        def chunks() -> Iterator[bytes]:
+            nonlocal received
+            assert resp is not None
+            for chunk in resp.iter_content(_STREAM_CHUNK):
+                received += len(chunk)
+                yield chunk
+
+        try:
+            if limiter is not None:
+                limiter.acquire(request_weight(url, params))
+            timeouts = self._default_timeout if timeout is None else timeout
+            mark_sent(event)
+            resp = self.session.get(
+                url, params=params, headers=headers, timeout=timeouts, stream=True
+            )
+            if limiter is not None:
+                limiter.update_from_headers(resp.headers, resp.status_code)
+            resp.raise_for_status()
+            yield chunks()
+        except BaseException as exc:
+            finish_event(self.hooks, event, resp, exc, received)
+            raise
+        else:
+            finish_event(self.hooks, event, resp, bytes_received=received)
+        finally:
+            if resp is not None:
+                resp.close()
+
+    def warmup(self, url: str, connections: int = 1) -> int:
+        """Open pooled connections to `url`'s host; see `Requester.warmup`.
+
+        Responses are discarded and connection errors only lower the
+        returned count.
+        """
+
+        def open_one(_: int) -> bool:
+            try:
+                resp = self.session.get(url, timeout=self._default_timeout)
+            except requests.ConnectionError:
+                return False
+            if self.rate_limiter is not None:
+                self.rate_limiter.update_from_headers(resp.headers, resp.status_code)
+            return True
+
+        if connections <= 1:
+            return int(open_one(0))
+        with ThreadPoolExecutor(
+            connections, thread_name_prefix="requests-warmup"
+        ) as pool:
+            return sum(pool.map(open_one, range(connections)))
+
+    def request_many(
+        self, specs: Iterable[RequestSpec], max_concurrency: int = 10
+    ) -> Iterator[BatchResult]:
+        executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="requests-batch"
+        )
+        try:
+            futures = [
+                executor.submit(self._call_captured, index, spec)
+                for index, spec in enumerate(specs)
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,561 @@
+"""Retries, circuit breaking and hedged requests around any requester.
+
+`ResilientRequester` wraps another requester:
+
+- Idempotent GETs that fail with a transport error or a retryable status
+  (429, 418, 5xx) are retried with full-jitter exponential backoff
+  (`RetryPolicy`). A `Retry-After` header is honoured as a minimum wait.
+- A `CircuitBreaker` per host fails fast with `CircuitOpenError` after
+  repeated failures, then lets a single trial request through once
+  `reset_timeout` has passed.
+- With `hedge=True`, a GET still pending after the endpoint's observed p95
+  latency is sent a second time and the first response wins. This trims
+  tail latency for market data at the cost of extra request weight, so it
+  is off by default.
+
+Other methods (POST) go through the circuit breaker but are never retried
+or hedged. Retries are reported to the wrapped requester's hooks through
+`RequestHook.on_retry`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .base import AsyncRequester, BatchResult, Requester, RequestSpec
+from .instrumentation import LatencyHistogram
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {host}; retry in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before retrying a failed GET.
+
+    `max_attempts` counts the first try. The n-th retry waits a uniform
+    random time in `[0, min(max_delay, base_delay * 2**n))`, or longer if
+    the server sent `Retry-After`.
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 0.2
+    max_delay: float = 10.0
+    retry_statuses: Tuple[int, ...] = (418, 429, 500, 502, 503, 504)
+
+    def backoff(self, retry: int, rng: random.Random) -> float:
+        return rng.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+
+def _status(exc: BaseException) -> Optional[int]:
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _is_transport_error(exc: BaseException) -> bool:
+    # requests' exceptions derive from OSError; httpx's from TransportError.
+    if isinstance(exc, (OSError, TimeoutError)):
+        return True
+    return any(cls.__name__ == "TransportError" for cls in type(exc).__mro__)
+
+
+def is_host_failure(exc: BaseException) -> bool:
+    """True for errors that suggest the host is unhealthy: 5xx or transport."""
+    status = _status(exc)
+    if status is not None:
+        return status >= 500
+    return _is_transport_error(exc)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one host.
+
+    Closed: requests flow. After `failure_threshold` consecutive failures it
+    opens and rejects requests for `reset_timeout` seconds, then half-opens:
+    one trial request is let through and its outcome closes or re-opens it.
+    A trial that ends without an outcome (cancelled) is `release`d, and one
+    outstanding for over `reset_timeout` no longer blocks the next.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._clock() - self._opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def before(self) -> Optional[float]:
+        """Admit a request (None) or return seconds until the next trial."""
+        with self._lock:
+            if self._opened_at is None:
+                return None
+            now = self._clock()
+            remaining = self._opened_at + self.reset_timeout - now
+            if remaining > 0:
+                return remaining
+            if self._trial_at is not None:
+                trial_left = self._trial_at + self.reset_timeout - now
+                if trial_left > 0:
+                    return trial_left
+            self._trial_at = now
+            return None
+
+    def success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial_at = None
+
+    def failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial_at is not None or self.failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_at = None
+
+    def release(self) -> None:
+        """End a request that has no outcome (e.g. cancelled), freeing the trial."""
+        with self._lock:
+            self._trial_at = None
+
+
+class ResilientRequester(Requester, AsyncRequester):
+    """Requester wrapper adding retries, per-host circuit breakers and hedging.
+
+    Args:
+        inner: Requester performing the requests. Async calls need it to
+            implement `AsyncRequester`.
+        retry: Retry policy for GETs; `RetryPolicy(max_attempts=1)` disables
+            retries.
+        failure_threshold, reset_timeout: Circuit breaker settings, applied
+            per host.
+        hedge: Send a duplicate GET when the first is slower than the
+            endpoint's `hedge_quantile` latency.
+        hedge_quantile: Latency quantile used as the hedge delay.
+        hedge_min_samples: Latencies observed on an endpoint before hedging
+            starts (until then `hedge_delay`, if given, is used).
+        hedge_delay: Fixed hedge delay in seconds, used when there are not
+            enough samples yet.
+        sleep, clock, rng: Injectable for tests.
+    """
+
+    def __init__(
+        self,
+        inner: Requester,
+        retry: RetryPolicy = RetryPolicy(),
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        hedge: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_min_samples: int = 20,
+        hedge_delay: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.inner = inner
+        self.retry = retry
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_delay = hedge_delay
+        self._sleep = sleep
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._latency: Dict[str, LatencyHistogram] = {}
+        self._hedge_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self.retries = 0
+        self.hedges = 0
+
+    @property
+    def rate_limiter(self):  # type: ignore[override]
+        return self.inner.rate_limiter
+
+    @property
+    def decoder(self):  # type: ignore[override]
+        return self.inner.decoder
+
+    @property
+    def hooks(self):  # type: ignore[override]
+        return self.inner.hooks
+
+    @hooks.setter
+    def hooks(self, value) -> None:
+        self.inner.hooks = value
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        """The circuit breaker for `url`'s host."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(
+                    self.failure_threshold, self.reset_timeout, self._clock
+                )
+            return breaker
+
+    # -- classification -------------------------------------------------
+
+    def _retryable(self, exc: BaseException) -> bool:
+        status = _status(exc)
+        if status is not None:
+            return status in self.retry.retry_statuses
+        return _is_transport_error(exc)
+
+    def _admit(self, url: str) -> CircuitBreaker:
+        breaker = self.breaker(url)
+        wait = breaker.before()
+        if wait is not None:
+            raise CircuitOpenError(urlsplit(url).netloc, wait)
+        return breaker
+
+    def _record(self, breaker: CircuitBreaker, exc: Optional[BaseException]) -> None:
+        if exc is None:
+            breaker.success()
+        elif is_host_failure(exc):
+            # Rate limiting (429/418) is our fault, not the host's.
+            breaker.failure()
+        else:
+            # The host answered (e.g. 4xx): it is healthy.
+            breaker.success()
+
+    def _retry_delay(self, retry: int, exc: BaseException) -> float:
+        delay = self.retry.backoff(retry, self._rng)
+        retry_after = _retry_after(exc)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _notify_retry(
+        self, url: str, attempt: int, exc: BaseException, delay: float
+    ) -> None:
+        with self._lock:
+            self.retries += 1
+        for hook in self.inner.hooks:
+            hook.on_retry("GET", url, attempt, exc, delay)
+
+    # -- hedging ----------------------------------------------------------
+
+    def _observe(self, url: str, seconds: float) -> None:
+        endpoint = urlsplit(url).path
+        with self._lock:
+            hist = self._latency.get(endpoint)
+            if hist is None:
+                hist = self._latency[endpoint] = LatencyHistogram()
+            hist.record(seconds)
+
+    def _hedge_after(self, url: str) -> Optional[float]:
+        if not self.hedge:
+            return None
+        with self._lock:
+            hist = self._latency.get(urlsplit(url).path)
+            if hist is not None and hist.count >= self.hedge_min_samples:
+                return hist.percentile(self.hedge_quantile)
+        return self.hedge_delay
+
+    def _hedged_get(self, url: str, kwargs: Dict[str, Any]) -> Any:
+        delay = self._hedge_after(url)
+        if delay is None:
+            return self.inner.get(url, **kwargs)
+        with self._lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix="hedge"
+                )
+            pool = self._hedge_pool
+        pending = {pool.submit(self.inner.get, url, **kwargs)}
+        done, _ = concurrent.futures.wait(pending, timeout=delay)
+        if not done:
+            with self._lock:
+                self.hedges += 1
+            pending.add(pool.submit(self.inner.get, url, **kwargs))
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None:
+                    # The slower duplicate finishes in the background.
+                    return future.result()
+                error = future.exception()
+        assert error is not None
+        raise error
+
+    async def _ahedged_get(self, inner: AsyncRequester, url: str, kwargs: Dict) -> Any:
+        delay = self._hedge_after(url)
+        if delay is None:
+            return await inner.aget(url, **kwargs)
+        tasks = {asyncio.ensure_future(inner.aget(url, **kwargs))}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                with self._lock:
+                    self.hedges += 1
+                tasks.add(asyncio.ensure_future(inner.aget(url, **kwargs)))
+            error: Optional[BaseException] = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    # -- request paths ----------------------------------------------------
+
+    def _sync_get(self, url: str, **kwargs: Any) -> Any:
+        retry = 0
+        while True:
+            breaker = self._admit(url)
+            start = time.perf_counter()
+            try:
+                value = self._hedged_get(url, kwargs)
+            except Exception as exc:
+                self._record(breaker, exc)
+                if not self._retryable(exc) or retry + 1 >= self.retry.max_attempts:
+                    raise
+                delay = self._retry_delay(retry, exc)
+                retry += 1
+                self._notify_retry(url, retry, exc, delay)
+                self._sleep(delay)
+                continue
+            except BaseException:
+                breaker.release()
+                raise
+            self._record(breaker, None)
+            self._observe(url, time.perf_counter() - start)
+            return value
+
+    async def aget(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        inner = self.inner
+        if not isinstance(inner, AsyncRequester):
+            raise TypeError(f"{type(inner).__name__} does not support async requests")
+        kwargs = {"params": params, "headers": headers, "timeout": timeout}
+        retry = 0
+        while True:
+            breaker = self._admit(url)
+            start = time.perf_counter()
+            try:
+                value = await self._ahedged_get(inner, url, kwargs)
+            except Exception as exc:
+                self._record(breaker, exc)
+                if not self._retryable(exc) or retry + 1 >= self.retry.max_attempts:
+                    raise
+                delay = self._retry_delay(retry, exc)
+                retry += 1
+                self._notify_retry(url, retry, exc, delay)
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                breaker.release()
+                raise
+            self._record(breaker, None)
+            self._observe(url, time.perf_counter() - start)
+            return value
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Blocking GET; returns a coroutine inside an event loop when `inner`
+        is async-capable, mirroring `HttpxRequester.get`."""
+        if isinstance(self.inner, AsyncRequester):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                return self.aget(url, params=params, headers=headers, timeout=timeout)
+        return self._sync_get(url, params=params, headers=headers, timeout=timeout)
+
+    def post(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        breaker = self._admit(url)
+        try:
+            value = self.inner.post(
+                url, data=data, json=json, headers=headers, timeout=timeout
+            )
+        except Exception as exc:
+            self._record(breaker, exc)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        self._record(breaker, None)
+        return value
+
+    async def apost(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        inner = self.inner
+        if not isinstance(inner, AsyncRequester):
+            raise TypeError(f"{type(inner).__name__} does not support async requests")
+        breaker = self._admit(url)
+        try:
+            value = await inner.apost(
+                url, data=data, json=json, headers=headers, timeout=timeout
+            )
+        except Exception as exc:
+            self._record(breaker, exc)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        self._record(breaker, None)
+        return value
+
+    def delete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        breaker = self._admit(url)
+        try:
+            value = self.inner.delete(
+                url, params=params, headers=headers, timeout=timeout
+            )
+        except Exception as exc:
+            self._record(breaker, exc)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        self._record(breaker, None)
+        return value
+
+    async def adelete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        inner = self.inner
+        if not isinstance(inner, AsyncRequester):
+            raise TypeError(f"{type(inner).__name__} does not support async requests")
+        breaker = self._admit(url)
+        try:
+            value = await inner.adelete(
+                url, params=params, headers=headers, timeout=timeout
+            )
+        except Exception as exc:
+            self._record(breaker, exc)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        self._record(breaker, None)
+        return value
+
+    def request_many(
+        self, specs: Iterable[RequestSpec], max_concurrency: int = 10
+    ) -> Iterator[BatchResult]:
+        """Run the batch on a thread pool so each request gets retries."""
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="resilient-batch"
+        )
+        try:
+            futures = [
+                executor.submit(self._call_captured, index, spec)
+                for index, spec in enumerate(specs)
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def warmup(self, url: str, connections: int = 1) -> int:
+        return self.inner.warmup(url, connections)
+
+    async def awarmup(self, url: str, connections: int = 1) -> int:
+        inner = self.inner
+        if not isinstance(inner, AsyncRequester):
+            raise TypeError(f"{type(inner).__name__} does not support async requests")
+        return await inner.awarmup(url, connections)
+
+    def close(self) -> None:
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+        close = getattr(self.inner, "close", None)
+        if close is not None:
+            close()
+
+    async def aclose(self) -> None:
+        aclose = getattr(self.inner, "aclose", None)
+        if aclose is not None:
+            await aclose()
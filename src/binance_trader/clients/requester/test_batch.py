@@ -0,0 +1,97 @@
+"""Tests for the batch API (`request_many` / `get_many`) of both backends."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from binance_trader.clients.requester import (
+    HttpxRequester,
+    RequestSpec,
+    RequestsRequester,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        delay = float(query.get("delay", ["0"])[0])
+        time.sleep(delay)
+        if urlsplit(self.path).path == "/fail":
+            self.send_response(500)
+            self.end_headers()
+            return
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture(params=["requests", "httpx"])
+def requester(request):
+    if request.param == "httpx":
+        req = HttpxRequester()
+        yield req
+        req.close()
+    else:
+        yield RequestsRequester()
+
+
+def test_results_stream_in_completion_order(requester, server_url):
+    specs = [
+        RequestSpec(f"{server_url}/slow", params={"delay": "0.3"}),
+        RequestSpec(f"{server_url}/fast"),
+    ]
+    results = list(requester.request_many(specs))
+
+    assert [r.index for r in results] == [1, 0]
+    assert results[0].value == {"path": "/fast"}
+
+
+def test_batch_overlaps_round_trips(requester, server_url):
+    urls = [f"{server_url}/item/{i}" for i in range(20)]
+    start = time.perf_counter()
+    results = list(
+        requester.get_many(urls, params={"delay": "0.1"}, max_concurrency=20)
+    )
+    elapsed = time.perf_counter() - start
+
+    assert sorted(r.index for r in results) == list(range(20))
+    assert all(r.ok for r in results)
+    assert elapsed < 1.0
+
+
+def test_failures_are_captured(requester, server_url):
+    results = {
+        r.index: r
+        for r in requester.get_many([f"{server_url}/fail", f"{server_url}/ok"])
+    }
+
+    assert not results[0].ok
+    with pytest.raises(Exception):
+        results[0].unwrap()
+    assert results[1].unwrap() == {"path": "/ok"}
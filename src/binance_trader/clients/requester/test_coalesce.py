@@ -0,0 +1,119 @@
+"""Tests for single-flight request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from binance_trader.clients.requester import (
+    CoalescingRequester,
+    HttpxRequester,
+    RequestSpec,
+    RequestsRequester,
+)
+from binance_trader.clients.requester.coalesce import request_key
+from binance_trader.testing import FakeClock, MockBinanceServer
+
+
+@pytest.fixture
+def server():
+    calls = {"n": 0}
+
+    def ticker(params):
+        calls["n"] += 1
+        return {"symbol": params.get("symbol"), "price": "1.0"}
+
+    def fail(params):
+        return 500, {"code": -1000, "msg": "boom"}
+
+    with MockBinanceServer(
+        {"/api/v3/ticker/price": ticker, "/api/v3/time": fail}, delay=0.2
+    ) as srv:
+        srv.calls = calls
+        yield srv
+
+
+def test_request_key_normalizes_param_order():
+    assert request_key("u", {"a": 1, "b": "x"}) == request_key(
+        "u", {"b": "x", "a": "1"}
+    )
+    assert request_key("u", {"a": 1}) != request_key("u", {"a": 2})
+    assert request_key("u", None, {"X-K": "1"}) != request_key("u")
+
+
+def test_threads_share_one_inflight_request(server):
+    req = CoalescingRequester(RequestsRequester())
+    url = server.url + "/api/v3/ticker/price"
+    barrier = threading.Barrier(8)
+
+    def call(_):
+        barrier.wait()
+        return req.get(url, params={"symbol": "BTCUSDT"})
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(call, range(8)))
+    assert all(r == {"symbol": "BTCUSDT", "price": "1.0"} for r in results)
+    assert server.calls["n"] == 1
+    assert req.coalesced == 7
+    # Without a cache the next call goes to the server again.
+    req.get(url, params={"symbol": "BTCUSDT"})
+    assert server.calls["n"] == 2
+
+
+def test_errors_propagate_to_all_waiters(server):
+    req = CoalescingRequester(RequestsRequester())
+    url = server.url + "/api/v3/time"
+    barrier = threading.Barrier(4)
+
+    def call(_):
+        barrier.wait()
+        try:
+            req.get(url)
+        except Exception as exc:
+            return type(exc).__name__
+        return "ok"
+
+    with ThreadPoolExecutor(4) as pool:
+        assert set(pool.map(call, range(4))) == {"HTTPError"}
+    assert len([r for r in server.requests if r[1] == "/api/v3/time"]) == 1
+
+
+def test_micro_cache_expires(server):
+    clock = FakeClock()
+    req = CoalescingRequester(RequestsRequester(), cache_ttl=0.5, clock=clock)
+    url = server.url + "/api/v3/ticker/price"
+    req.get(url)
+    req.get(url)
+    assert server.calls["n"] == 1 and req.cache_hits == 1
+    clock.now = 1.0
+    req.get(url)
+    assert server.calls["n"] == 2
+
+
+def test_async_callers_share_request_and_survive_cancellation(server):
+    req = CoalescingRequester(HttpxRequester())
+    url = server.url + "/api/v3/ticker/price"
+
+    async def run():
+        tasks = [asyncio.create_task(req.aget(url)) for _ in range(10)]
+        await asyncio.sleep(0.05)
+        tasks[0].cancel()
+        results = await asyncio.gather(*tasks[1:])
+        await req.aclose()
+        return results
+
+    results = asyncio.run(run())
+    assert len(results) == 9 and all(r["price"] == "1.0" for r in results)
+    assert server.calls["n"] == 1
+
+
+def test_request_many_sends_distinct_gets_once(server):
+    req = CoalescingRequester(RequestsRequester())
+    url = server.url + "/api/v3/ticker/price"
+    specs = [RequestSpec(url, params={"symbol": s}) for s in ["A", "B", "A", "A"]]
+    results = sorted(req.request_many(specs), key=lambda r: r.index)
+    assert [r.value["symbol"] for r in results] == ["A", "B", "A", "A"]
+    assert server.calls["n"] == 2
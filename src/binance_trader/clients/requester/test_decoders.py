@@ -0,0 +1,96 @@
+"""Unit tests for pluggable response decoders."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from binance_trader.clients.requester import (
+    HttpxRequester,
+    RequestsRequester,
+    StatsCollector,
+)
+from binance_trader.clients.requester.decoders import get_decoder, iter_json_array
+from binance_trader.testing import MockBinanceServer, payloads
+
+
+def test_get_decoder_by_name():
+    assert get_decoder("json") is json.loads
+    assert get_decoder("auto")(b'{"a": 1}') == {"a": 1}
+    with pytest.raises(ValueError):
+        get_decoder("yaml")
+
+
+def test_orjson_decoder_when_installed():
+    orjson = pytest.importorskip("orjson")
+    assert get_decoder("orjson") is orjson.loads
+
+
+@pytest.mark.parametrize("backend", ["requests", "httpx"])
+def test_requester_decodes_raw_content(backend):
+    decoder = MagicMock(return_value={"price": "1.0"})
+    if backend == "requests":
+        requester = RequestsRequester(decoder=decoder)
+        target = requester.session
+    else:
+        requester = HttpxRequester(decoder=decoder)
+        target = requester._client
+    mock_response = MagicMock()
+    mock_response.content = b'{"price": "1.0"}'
+
+    with patch.object(target, "request", return_value=mock_response):
+        result = requester.get("https://example.com/api")
+
+    assert result == {"price": "1.0"}
+    decoder.assert_called_once_with(b'{"price": "1.0"}')
+    mock_response.json.assert_not_called()
+
+
+def test_decoder_falls_back_to_text():
+    requester = RequestsRequester(decoder="json")
+    mock_response = MagicMock()
+    mock_response.content = b"<html>"
+    mock_response.text = "<html>"
+
+    with patch.object(requester.session, "request", return_value=mock_response):
+        assert requester.get("https://example.com") == "<html>"
+
+
+def _chunked(raw: bytes, size: int):
+    return [raw[i : i + size] for i in range(0, len(raw), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 1 << 16])
+def test_iter_json_array_across_chunk_boundaries(size):
+    doc = payloads.exchange_info(20)
+    raw = json.dumps(doc).encode()
+    assert list(iter_json_array(_chunked(raw, size), ("symbols",))) == doc["symbols"]
+    values = [1234567, 2.5e10, -3e-5, "\u00e9\u00e9", None, True, {"a": [1, 2]}, []]
+    raw = json.dumps(values, ensure_ascii=False).encode()
+    assert list(iter_json_array(_chunked(raw, size))) == values
+    assert list(iter_json_array([b" [ ", b"] "])) == []
+
+
+def test_iter_json_array_errors():
+    with pytest.raises(KeyError):
+        list(iter_json_array([b'{"a": 1}'], ("symbols",)))
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"a": 1}, {"b"']))
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"a": 1}']))
+
+
+@pytest.mark.parametrize("backend", ["requests", "httpx"])
+def test_stream_yields_body_chunks(backend):
+    doc = payloads.exchange_info(50)
+    stats = StatsCollector()
+    cls = RequestsRequester if backend == "requests" else HttpxRequester
+    requester = cls(hooks=[stats])
+    with MockBinanceServer({"/api/v3/exchangeInfo": doc}) as srv:
+        with requester.stream(f"{srv.url}/api/v3/exchangeInfo") as chunks:
+            symbols = list(iter_json_array(chunks, ("symbols",)))
+    assert symbols == doc["symbols"]
+    (endpoint,) = stats.endpoints().values()
+    assert endpoint.bytes_received == len(json.dumps(doc).encode())
@@ -0,0 +1,146 @@
+"""Tests for request hooks and the stats collector."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+import requests
+
+from binance_trader.clients.requester import (
+    HttpxRequester,
+    RequestHook,
+    RequestsRequester,
+    StatsCollector,
+)
+from binance_trader.clients.requester.instrumentation import (
+    LatencyHistogram,
+    finish_event,
+    start_event,
+)
+from binance_trader.testing import MockBinanceServer
+
+
+@pytest.fixture
+def server():
+    routes = {
+        "/api/v3/ping": {},
+        "/api/v3/depth": (
+            lambda params: (200, {"lastUpdateId": 1, "bids": [], "asks": []})
+        ),
+        "/api/v3/time": lambda params: (500, {"code": -1000, "msg": "boom"}),
+    }
+    with MockBinanceServer(routes, headers={"X-MBX-USED-WEIGHT-1M": "42"}) as srv:
+        yield srv
+
+
+def test_histogram_percentiles_within_precision():
+    hist = LatencyHistogram()
+    for ms in range(1, 1001):
+        hist.record(ms / 1000)
+    assert hist.count == 1000
+    assert hist.percentile(0.5) == pytest.approx(0.5, rel=0.02)
+    assert hist.percentile(0.99) == pytest.approx(0.99, rel=0.02)
+    assert hist.percentile(1.0) == pytest.approx(1.0, rel=0.02)
+    assert hist.min == 0.001 and hist.max == 1.0
+
+    other = LatencyHistogram()
+    other.record(2.0)
+    hist.merge(other)
+    assert hist.count == 1001 and hist.max == 2.0
+
+
+def test_hooks_see_request_and_response(server):
+    seen = []
+
+    class Recorder(RequestHook):
+        def on_request(self, event):
+            seen.append(("request", event.endpoint, event.status_code))
+
+        def on_response(self, event):
+            seen.append(("response", event.endpoint, event.status_code))
+
+    req = RequestsRequester(hooks=[Recorder()])
+    req.get(server.url + "/api/v3/ping")
+    assert seen == [
+        ("request", "/api/v3/ping", None),
+        ("response", "/api/v3/ping", 200),
+    ]
+
+
+def test_collector_counts_errors_bytes_and_weight(server):
+    stats = StatsCollector()
+    req = RequestsRequester(hooks=[stats])
+    req.get(server.url + "/api/v3/ping")
+    req.get(server.url + "/api/v3/depth", params={"symbol": "X", "limit": 5000})
+    with pytest.raises(requests.HTTPError):
+        req.get(server.url + "/api/v3/time")
+
+    by_endpoint = {row["endpoint"]: row for row in stats.snapshot()["endpoints"]}
+    depth = by_endpoint["/api/v3/depth"]
+    assert depth["requests"] == 1
+    assert depth["weight"] == 250
+    assert depth["used_weight"] == 42
+    assert depth["bytes_received"] > 0
+    assert by_endpoint["/api/v3/time"]["errors"] == 1
+    assert by_endpoint["/api/v3/time"]["statuses"] == {"500": 1}
+    json.dumps(stats.snapshot())
+
+    text = stats.to_prometheus()
+    assert "# TYPE binance_requester_request_duration_seconds summary" in text
+    assert (
+        'binance_requester_weight_total{method="GET",endpoint="/api/v3/depth"} 250'
+        in text
+    )
+    assert (
+        'binance_requester_responses_total{method="GET",endpoint="/api/v3/time",'
+        'status="500"} 1' in text
+    )
+    assert "/api/v3/ping" in stats.format_table()
+
+
+class _Response:
+    status_code = 200
+
+    def __init__(self, headers, body=b"{}"):
+        self.headers = requests.structures.CaseInsensitiveDict(headers)
+        self._body = body
+
+    @property
+    def content(self):
+        if self._body is None:
+            raise AssertionError("body read despite Content-Length")
+        return self._body
+
+
+def test_bytes_received_prefers_content_length():
+    stats = StatsCollector()
+    for response in (
+        _Response({"Content-Length": "1234"}, body=None),
+        _Response({"Content-Length": "bogus"}, body=b"[1,2]"),
+        _Response({}, body=b"[]"),
+    ):
+        event = start_event([stats], "GET", "https://x/api/v3/ping")
+        finish_event([stats], event, response)
+    (row,) = stats.snapshot()["endpoints"]
+    assert row["bytes_received"] == 1234 + 5 + 2
+
+
+def test_httpx_sync_async_and_batch_are_instrumented(server):
+    stats = StatsCollector()
+    req = HttpxRequester()
+    req.add_hook(stats)
+    url = server.url + "/api/v3/ping"
+    req.get(url)
+
+    async def run():
+        await req.aget(url)
+        await req.aclose()
+
+    asyncio.run(run())
+    list(req.get_many([url, url]))
+    req.close()
+    (only,) = stats.endpoints().values()
+    assert only.requests == 4
+    assert only.statuses == {200: 4}
@@ -0,0 +1,94 @@
+"""Unit tests for the weight-aware rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from binance_trader.clients.requester import RequestsRequester
+from binance_trader.clients.requester.rate_limit import (
+    RateLimiter,
+    TokenBucket,
+    request_weight,
+)
+from binance_trader.testing import FakeClock
+
+
+def test_request_weight_table():
+    assert request_weight("https://api.binance.com/api/v3/ping") == 1
+    assert request_weight("https://api.binance.com/api/v3/exchangeInfo") == 20
+    assert request_weight("https://x/api/v3/depth", {"limit": 5000}) == 250
+    assert request_weight("https://x/api/v3/ticker/24hr") == 80
+    assert request_weight("https://x/api/v3/ticker/24hr", {"symbol": "BTCUSDT"}) == 2
+    assert request_weight("https://x/api/v3/ticker/24hr", {"symbols": '["A","B"]'}) == 2
+    assert request_weight("https://x/api/v3/unknown") == 1
+
+
+def test_token_bucket_refills_and_queues():
+    clock = FakeClock()
+    bucket = TokenBucket(10, 10.0, clock=clock)
+    assert bucket.take(10) == 0.0
+    assert bucket.take(5) == 5.0
+    clock.now += 5
+    assert bucket.tokens == 0.0
+
+
+def test_limiter_delays_when_budget_exhausted():
+    clock = FakeClock()
+    limiter = RateLimiter(
+        weight_limit=60, interval=60.0, clock=clock, sleep=clock.sleep
+    )
+    limiter.acquire(60)
+    assert clock.now == 0.0
+    limiter.acquire(30)
+    assert clock.now == 30.0
+
+
+def test_limiter_corrected_from_headers():
+    clock = FakeClock()
+    limiter = RateLimiter(weight_limit=6000, clock=clock, sleep=clock.sleep)
+    limiter.update_from_headers(
+        {"x-mbx-used-weight-1m": "5990", "X-MBX-ORDER-COUNT-10S": "3"}
+    )
+    assert limiter.remaining == 10
+    assert limiter.used_weight == {"1m": 5990}
+    assert limiter.order_count == {"10s": 3}
+
+
+def test_limiter_honours_retry_after_on_429():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    limiter.update_from_headers({"Retry-After": "7"}, status_code=429)
+    assert limiter.remaining == 0
+    limiter.acquire(1)
+    assert clock.now == 7.0
+
+
+def test_acquire_async_waits_for_budget():
+    limiter = RateLimiter(weight_limit=1000, interval=1.0)
+    limiter.reserve(1000)
+
+    async def runner():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await limiter.acquire_async(10)
+        return loop.time() - start
+
+    assert asyncio.run(runner()) >= 0.005
+
+
+def test_requests_requester_uses_limiter():
+    limiter = MagicMock()
+    requester = RequestsRequester(rate_limiter=limiter)
+    mock_response = MagicMock()
+    mock_response.json.return_value = {}
+    mock_response.headers = {"X-MBX-USED-WEIGHT-1M": "20"}
+    mock_response.status_code = 200
+
+    with patch.object(requester.session, "request", return_value=mock_response):
+        requester.get("https://api.binance.com/api/v3/exchangeInfo")
+
+    limiter.acquire.assert_called_once_with(20)
+    limiter.update_from_headers.assert_called_once_with(
+        {"X-MBX-USED-WEIGHT-1M": "20"}, 200
+    )
@@ -0,0 +1,179 @@
+"""Tests for recording requests and replaying them."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+
+import pytest
+
+from binance_trader.clients.binance import BinanceClient, HmacSigner, Orders
+from binance_trader.clients.requester import (
+    HttpxRequester,
+    RecordingRequester,
+    ReplayMissError,
+    ReplayRequester,
+    RequestsRequester,
+)
+from binance_trader.clients.requester.recording import (
+    ReplayedError,
+    read_log,
+    recorded_routes,
+    replay_key,
+)
+from binance_trader.clients.requester.resilience import is_host_failure
+from binance_trader.testing import MockBinanceServer
+
+
+@pytest.fixture
+def server():
+    prices = iter(range(1, 100))
+
+    def ticker(params):
+        return {"symbol": params["symbol"], "price": str(next(prices))}
+
+    routes = {
+        "/api/v3/ticker/price": ticker,
+        "/api/v3/time": {"serverTime": 1_700_000_000_000},
+        "/api/v3/openOrders": [],
+        "/api/v3/depth": (503, {"code": -1, "msg": "busy"}),
+    }
+    with MockBinanceServer(routes) as srv:
+        yield srv
+
+
+def test_replay_key_ignores_host_and_signature_params():
+    assert replay_key("GET", "https://a/x?b=2&timestamp=1&signature=s", {"a": 1}) == (
+        replay_key("GET", "http://b/x", {"b": "2", "a": "1", "recvWindow": 5})
+    )
+    assert replay_key("POST", "/x?newClientOrderId=a") == replay_key("POST", "/x")
+
+
+def test_record_then_replay_in_order(server, tmp_path):
+    log = tmp_path / "session.jsonl.gz"
+    recorder = RecordingRequester(RequestsRequester(), log)
+    url = f"{server.url}/api/v3/ticker/price"
+    assert recorder.get(url, params={"symbol": "BTCUSDT"})["price"] == "1"
+    assert recorder.get(url, params={"symbol": "BTCUSDT"})["price"] == "2"
+    with pytest.raises(Exception):
+        recorder.get(f"{server.url}/api/v3/depth", params={"symbol": "BTCUSDT"})
+    recorder.close()
+    # A second session appends to the same log.
+    recorder = RecordingRequester(RequestsRequester(), log)
+    recorder.get(url, params={"symbol": "ETHUSDT"})
+    recorder.close()
+    assert len(list(read_log(log))) == 4
+
+    replay = ReplayRequester(log)
+    other = "https://elsewhere/api/v3/ticker/price"
+    assert replay.get(other, params={"symbol": "BTCUSDT"})["price"] == "1"
+    assert replay.get(other, params={"symbol": "BTCUSDT"})["price"] == "2"
+    assert replay.get(other, params={"symbol": "BTCUSDT"})["price"] == "2"  # repeats
+    assert replay.get(other, params={"symbol": "ETHUSDT"})["price"] == "3"
+    with pytest.raises(ReplayedError) as info:
+        replay.get("/api/v3/depth", params={"symbol": "BTCUSDT"})
+    assert info.value.response.status_code == 503 and is_host_failure(info.value)
+    with pytest.raises(ReplayMissError):
+        replay.get(other, params={"symbol": "XRPUSDT"})
+    strict = ReplayRequester(log, strict=True)
+    strict.get(other, params={"symbol": "ETHUSDT"})
+    with pytest.raises(ReplayMissError):
+        strict.get(other, params={"symbol": "ETHUSDT"})
+
+
+def test_signed_requests_are_recorded_without_credentials(server, tmp_path):
+    log = tmp_path / "signed.jsonl.gz"
+    recorder = RecordingRequester(RequestsRequester(), log)
+    client = BinanceClient(
+        recorder, base_url=server.url, api_key="KEY", signer=HmacSigner("s")
+    )
+    client.open_orders("BTCUSDT")
+    recorder.close()
+    raw = gzip.decompress(log.read_bytes())
+    assert b"signature" not in raw and b"KEY" not in raw
+
+    replayed = BinanceClient(
+        ReplayRequester(log), api_key="KEY", signer=HmacSigner("other")
+    )
+    assert replayed.open_orders("BTCUSDT") == []
+
+
+def test_orders_replay_with_fresh_client_order_ids(tmp_path):
+    log = tmp_path / "orders.jsonl.gz"
+    orders = iter(range(1, 100))
+    routes = {
+        "/api/v3/time": {"serverTime": 1_700_000_000_000},
+        "/api/v3/order": lambda params: {"orderId": next(orders), **params},
+    }
+
+    def session(requester):
+        client = BinanceClient(
+            requester, base_url=url, api_key="KEY", signer=HmacSigner("s")
+        )
+        client_orders = Orders(client, validate=False)
+        placed = client_orders.place("BTCUSDT", "BUY", quantity=1, price=10)
+        status = client_orders.query(
+            "BTCUSDT", client_order_id=placed["newClientOrderId"]
+        )
+        cancelled = client_orders.cancel(
+            "BTCUSDT", client_order_id=placed["newClientOrderId"]
+        )
+        return [placed["orderId"], status["orderId"], cancelled["orderId"]]
+
+    with MockBinanceServer(routes) as srv:
+        url = srv.url
+        recorder = RecordingRequester(RequestsRequester(), log)
+        recorded = session(recorder)
+        recorder.close()
+
+    assert recorded == [1, 2, 3]
+    # A new session generates new client order ids but replays the same.
+    assert session(ReplayRequester(log)) == recorded
+    with pytest.raises(ReplayMissError):
+        session(ReplayRequester(log, ignore_params=()))
+
+
+def test_replay_paces_by_recorded_time(tmp_path):
+    log = tmp_path / "paced.jsonl.gz"
+    clock = iter([100.0, 110.0, 130.0])
+    recorder = RecordingRequester(_Static({"ok": True}), log, clock=lambda: next(clock))
+    for _ in range(3):
+        recorder.get("https://x/api/v3/ping")
+    recorder.close()
+
+    waits = []
+    replay = ReplayRequester(log, speed=10.0, sleep=waits.append)
+    for _ in range(3):
+        replay.get("https://x/api/v3/ping")
+    # 0s, 10s, 30s after the first record at 10x speed.
+    assert [round(w) for w in waits[-2:]] == [1, 3]
+    assert replay.recorded_time == 130.0
+    assert len(replay) == 3
+
+
+def test_async_record_and_replay(server, tmp_path):
+    log = tmp_path / "async.jsonl.gz"
+    url = f"{server.url}/api/v3/ticker/price"
+
+    async def record():
+        recorder = RecordingRequester(HttpxRequester(), log)
+        value = await recorder.aget(url, params={"symbol": "BTCUSDT"})
+        await recorder.aclose()
+        return value
+
+    async def replay():
+        return await ReplayRequester(log).aget(url, params={"symbol": "BTCUSDT"})
+
+    assert asyncio.run(record()) == asyncio.run(replay())
+    assert "/api/v3/ticker/price" in recorded_routes(log)
+
+
+class _Static(RequestsRequester):
+    """Requester returning a fixed value without network access."""
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        return self.value
@@ -0,0 +1,202 @@
+"""Tests for retries, circuit breaking and hedged requests."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+import pytest
+import requests
+
+from binance_trader.clients.requester import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HttpxRequester,
+    RequestsRequester,
+    ResilientRequester,
+    RetryPolicy,
+    StatsCollector,
+)
+from binance_trader.testing import FakeClock, MockBinanceServer
+
+
+def flaky(statuses, headers=None):
+    """Route answering with `statuses` in turn, then 200."""
+    remaining = list(statuses)
+
+    def route(params):
+        if remaining:
+            return remaining.pop(0), {"code": -1}, headers or {}
+        return {"ok": True}
+
+    return route
+
+
+def make(inner, clock, **kwargs):
+    return ResilientRequester(
+        inner, sleep=clock.sleep, clock=clock, rng=random.Random(0), **kwargs
+    )
+
+
+def test_retries_5xx_with_backoff():
+    clock = FakeClock()
+    stats = StatsCollector()
+    with MockBinanceServer({"/api/v3/time": flaky([503, 502])}) as srv:
+        req = make(RequestsRequester(hooks=[stats]), clock)
+        assert req.get(srv.url + "/api/v3/time") == {"ok": True}
+    assert req.retries == 2
+    assert len(clock.sleeps) == 2
+    assert clock.sleeps[0] < 0.2 and clock.sleeps[1] < 0.4
+    (endpoint,) = stats.endpoints().values()
+    assert endpoint.retries == 2 and endpoint.requests == 3
+
+
+def test_retry_after_is_respected_and_4xx_not_retried():
+    clock = FakeClock()
+    routes = {
+        "/api/v3/ping": flaky([429], {"Retry-After": "3"}),
+        "/api/v3/depth": flaky([400]),
+    }
+    with MockBinanceServer(routes) as srv:
+        req = make(RequestsRequester(), clock)
+        assert req.get(srv.url + "/api/v3/ping") == {"ok": True}
+        assert clock.sleeps == [3.0]
+        with pytest.raises(requests.HTTPError):
+            req.get(srv.url + "/api/v3/depth")
+    assert req.retries == 1
+
+
+def test_gives_up_after_max_attempts():
+    clock = FakeClock()
+    with MockBinanceServer({"/api/v3/time": flaky([500] * 10)}) as srv:
+        req = make(RequestsRequester(), clock, retry=RetryPolicy(max_attempts=3))
+        with pytest.raises(requests.HTTPError):
+            req.get(srv.url + "/api/v3/time")
+    assert len([r for r in srv.requests if r[1] == "/api/v3/time"]) == 3
+
+
+def test_circuit_breaker_states():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    breaker.failure()
+    assert breaker.state == "closed" and breaker.before() is None
+    breaker.failure()
+    assert breaker.state == "open" and breaker.before() == 10
+    clock.now = 10
+    assert breaker.state == "half-open"
+    assert breaker.before() is None  # the trial request
+    assert breaker.before() is not None  # everyone else waits for it
+    breaker.failure()
+    assert breaker.state == "open"
+    clock.now = 20
+    breaker.before()
+    breaker.success()
+    assert breaker.state == "closed"
+
+
+def test_stale_trial_does_not_block_forever():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.failure()
+    clock.now = 10
+    assert breaker.before() is None  # a trial that never reports back
+    clock.now = 15
+    assert breaker.before() == 5
+    clock.now = 20
+    assert breaker.before() is None
+
+
+def test_cancelled_trial_request_releases_the_breaker():
+    def slow(params):
+        time.sleep(0.5)
+        return {"ok": True}
+
+    clock = FakeClock()
+    with MockBinanceServer({"/api/v3/depth": slow, "/api/v3/time": {}}) as srv:
+        req = make(HttpxRequester(), clock, failure_threshold=1, reset_timeout=10)
+        breaker = req.breaker(srv.url)
+        breaker.failure()
+        clock.now = 10
+
+        async def run():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(req.aget(srv.url + "/api/v3/depth"), 0.05)
+            # No outcome for the cancelled trial: the next request is the trial.
+            result = await req.aget(srv.url + "/api/v3/time")
+            await req.aclose()
+            return result
+
+        assert asyncio.run(run()) == {}
+    assert breaker.state == "closed"
+
+
+def test_open_circuit_fails_fast():
+    clock = FakeClock()
+    with MockBinanceServer({"/api/v3/time": flaky([500] * 10)}) as srv:
+        req = make(
+            RequestsRequester(),
+            clock,
+            retry=RetryPolicy(max_attempts=1),
+            failure_threshold=2,
+        )
+        url = srv.url + "/api/v3/time"
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                req.get(url)
+        with pytest.raises(CircuitOpenError):
+            req.get(url)
+    assert len(srv.requests) == 2
+
+
+def test_transport_errors_are_retried():
+    clock = FakeClock()
+    req = make(RequestsRequester(), clock, retry=RetryPolicy(max_attempts=2))
+    with pytest.raises(requests.ConnectionError):
+        req.get("http://127.0.0.1:9/api/v3/ping", timeout=1)
+    assert req.retries == 1
+
+
+def slow_first(delay):
+    calls = {"n": 0}
+
+    def route(params):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            time.sleep(delay)
+        return {"n": calls["n"]}
+
+    return route
+
+
+def test_hedged_request_beats_slow_first_attempt():
+    with MockBinanceServer({"/api/v3/depth": slow_first(1.0)}) as srv:
+        req = ResilientRequester(RequestsRequester(), hedge=True, hedge_delay=0.05)
+        start = time.perf_counter()
+        assert req.get(srv.url + "/api/v3/depth") == {"n": 2}
+        assert time.perf_counter() - start < 0.8
+        assert req.hedges == 1
+        req.close()
+
+
+def test_async_hedge_and_retry():
+    routes = {
+        "/api/v3/depth": slow_first(1.0),
+        "/api/v3/time": flaky([503]),
+    }
+    with MockBinanceServer(routes) as srv:
+        req = ResilientRequester(
+            HttpxRequester(),
+            hedge=True,
+            hedge_delay=0.05,
+            retry=RetryPolicy(base_delay=0.01),
+        )
+
+        async def run():
+            depth = await req.aget(srv.url + "/api/v3/depth")
+            server_time = await req.aget(srv.url + "/api/v3/time")
+            await req.aclose()
+            return depth, server_time
+
+        assert asyncio.run(run()) == ({"n": 2}, {"ok": True})
+    assert req.hedges >= 1 and req.retries == 1
@@ -0,0 +1,95 @@
+"""Tests for transport tuning, lazy clients and connection warmup."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from binance_trader.clients.binance import AsyncBinanceClient, BinanceClient
+from binance_trader.clients.requester import (
+    CoalescingRequester,
+    HttpxRequester,
+    ReplayRequester,
+    RequestsRequester,
+    TransportConfig,
+)
+from binance_trader.testing import MockBinanceServer
+
+TUNED = TransportConfig(
+    http2=True,
+    max_connections=7,
+    max_keepalive_connections=3,
+    keepalive_expiry=60.0,
+    connect_timeout=1.5,
+    read_timeout=9.0,
+)
+
+
+def test_httpx_clients_are_created_lazily_from_the_config():
+    requester = HttpxRequester(transport=TUNED)
+    assert requester._lazy_client is None and requester._lazy_async_client is None
+    pool = requester._client._transport._pool
+    assert requester._lazy_async_client is None
+    assert (pool._max_connections, pool._max_keepalive_connections) == (7, 3)
+    assert pool._keepalive_expiry == 60.0 and pool._http2
+    # Sync and async clients share one TLS context.
+    async_pool = requester._async_client._transport._pool
+    assert async_pool._ssl_context is pool._ssl_context is TUNED.ssl_context
+    requester.close()
+
+
+def test_httpx_configured_timeouts_apply_when_call_has_none():
+    requester = HttpxRequester(transport=TransportConfig(connect_timeout=1.5))
+    response = MagicMock()
+    response.json.return_value = {}
+    with patch.object(requester._client, "request", return_value=response) as send:
+        requester.get("https://example.com/a")
+        requester.get("https://example.com/a", timeout=2.0)
+    first, second = (call.kwargs["timeout"] for call in send.call_args_list)
+    assert first.connect == 1.5 and first.read == 5.0
+    assert second == 2.0
+
+
+def test_requests_adapter_and_timeouts():
+    requester = RequestsRequester(transport=TransportConfig(max_connections=32))
+    adapter = requester.session.get_adapter("https://api.binance.com")
+    assert adapter._pool_maxsize == 32
+    requester = RequestsRequester(transport=TUNED)
+    response = MagicMock(status_code=200, headers={})
+    response.json.return_value = {}
+    with patch.object(requester.session, "request", return_value=response) as send:
+        requester.get("https://example.com/a")
+    assert send.call_args.kwargs["timeout"] == (1.5, 9.0)
+
+
+def test_warmup_opens_connections_before_the_first_call():
+    with MockBinanceServer({"/api/v3/ping": {}}) as srv:
+        client = BinanceClient(RequestsRequester(), base_url=srv.url)
+        assert client.warmup(connections=3) == 3
+        requester = HttpxRequester()
+        assert requester.warmup(f"{srv.url}/api/v3/ping", connections=2) == 2
+        assert len(requester._client._transport._pool.connections) == 2
+        requester.close()
+        # Wrappers warm their inner requester without coalescing the pings.
+        coalescing = CoalescingRequester(RequestsRequester())
+        assert coalescing.warmup(f"{srv.url}/api/v3/ping", connections=2) == 2
+        assert len(srv.requests) == 7
+
+        async def warm_async():
+            async with AsyncBinanceClient(HttpxRequester(), base_url=srv.url) as c:
+                return await c.warmup(connections=2)
+
+        assert asyncio.run(warm_async()) == 2
+    assert HttpxRequester().warmup("http://127.0.0.1:9/api/v3/ping") == 0
+    assert ReplayRequester([]).warmup("https://x/api/v3/ping") == 0
+
+
+def test_http2_warmup_uses_one_connection():
+    requester = HttpxRequester(transport=TransportConfig(http2=True))
+    with patch.object(
+        requester._client, "get", return_value=httpx.Response(200)
+    ) as get:
+        assert requester.warmup("https://example.com/api/v3/ping", 4) == 1
+    assert get.call_count == 1
@@ -0,0 +1,87 @@
+"""Connection pool and timeout settings shared by the HTTP backends.
+
+`TransportConfig` describes how a requester talks to the network: pool
+sizes, keepalive, HTTP/2, and separate connect/read timeouts. Each backend
+translates it to its own objects (`httpx.Limits`/`httpx.Timeout`, or a
+sized `requests.adapters.HTTPAdapter` and a `(connect, read)` timeout
+tuple), so switching backends keeps the same tuning.
+
+DNS lookups and TLS handshakes are paid once per pooled connection; the
+settings that keep connections alive and reused (keepalive pool size and
+expiry, HTTP/2 multiplexing, `warmup`) are what amortize them. The TLS
+context, with its loaded CA bundle, is built once per config and shared
+by every client a requester creates.
+"""
+
+from __future__ import annotations
+
+import ssl
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """Transport tuning for `HttpxRequester` and `RequestsRequester`.
+
+    Attributes:
+        http2: Multiplex requests over one HTTP/2 connection per host
+            (httpx only; needs the `h2` package: install the `http2`
+            extra, `binance-trader[http2]`).
+        max_connections: Cap on open connections (httpx, over all hosts).
+            For requests, the connections kept per host, and a cap only
+            with `pool_block`.
+        max_keepalive_connections: Idle connections kept for reuse (httpx
+            only).
+        keepalive_expiry: Seconds an idle connection is kept (httpx only;
+            urllib3 keeps idle connections until the server closes them).
+        connect_timeout: Seconds to establish a connection (TCP + TLS).
+        read_timeout: Seconds to wait for response data.
+        pool_timeout: Seconds to wait for a free pooled connection (httpx
+            only; requests blocks only with `pool_block`).
+        pool_block: With requests, wait for a free connection instead of
+            opening one beyond `max_connections`.
+        verify: Verify TLS certificates.
+
+    Timeouts left at None keep the backend's defaults (5s for httpx, none
+    for requests). A per-call `timeout` overrides them all.
+    """
+
+    http2: bool = False
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    connect_timeout: Optional[float] = None
+    read_timeout: Optional[float] = None
+    pool_timeout: Optional[float] = None
+    pool_block: bool = False
+    verify: bool = True
+
+    @property
+    def has_timeouts(self) -> bool:
+        return (
+            self.connect_timeout is not None
+            or self.read_timeout is not None
+            or self.pool_timeout is not None
+        )
+
+    def timeout_tuple(self) -> Optional[Tuple[Optional[float], Optional[float]]]:
+        """`(connect, read)` timeout for requests, or None if unset."""
+        if self.connect_timeout is None and self.read_timeout is None:
+            return None
+        return self.connect_timeout, self.read_timeout
+
+    @cached_property
+    def ssl_context(self) -> ssl.SSLContext:
+        """The TLS context shared by all clients built from this config."""
+        if not self.verify:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            return context
+        try:
+            import certifi
+        except ImportError:  # pragma: no cover - certifi ships with httpx
+            return ssl.create_default_context()
+        return ssl.create_default_context(cafile=certifi.where())
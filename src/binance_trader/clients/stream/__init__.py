@@ -0,0 +1,5 @@
+"""WebSocket market-data streaming subpackage."""
+
+from .client import StreamClient, StreamMessage
+
+__all__ = ["StreamClient", "StreamMessage"]
@@ -0,0 +1,263 @@
+"""Binance market-data WebSocket client with sharded combined streams.
+
+`StreamClient` subscribes to any number of streams (e.g. `btcusdt@trade`,
+`ethusdt@depth@100ms`) over as few `/stream` connections as the
+per-connection limit allows. Each connection:
+
+- subscribes with `SUBSCRIBE` requests, in batches;
+- reconnects with jittered exponential backoff when the socket drops, and
+  resubscribes to everything its shard owns;
+- reconnects on handshake and protocol errors too, and logs and skips
+  frames it cannot decode;
+- decodes each frame once and puts a `StreamMessage` on a bounded
+  `asyncio.Queue`. A consumer that falls behind loses its oldest messages
+  rather than stalling every other stream on the shard; drops are counted
+  in `StreamClient.dropped`.
+
+Example:
+    async with StreamClient() as streams:
+        await streams.subscribe(["btcusdt@bookTicker", "ethusdt@bookTicker"])
+        async for msg in streams.messages():
+            print(msg.stream, msg.data)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import random
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set
+
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import WebSocketException
+
+logger = logging.getLogger(__name__)
+
+#: Binance allows up to 1024 streams on a single connection.
+MAX_STREAMS_PER_CONNECTION = 1024
+#: Streams per SUBSCRIBE request, keeping frames small.
+SUBSCRIBE_BATCH = 200
+
+
+@dataclass(frozen=True, slots=True)
+class StreamMessage:
+    """One decoded combined-stream payload."""
+
+    stream: str
+    data: Any
+
+
+class _Connection:
+    """One WebSocket connection owning a shard of streams."""
+
+    def __init__(self, client: StreamClient, index: int) -> None:
+        self.client = client
+        self.index = index
+        self.streams: Set[str] = set()
+        self.ws: Optional[ClientConnection] = None
+        self.connected = asyncio.Event()
+        self.connects = 0
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._run(), name=f"binance-stream-{self.index}"
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.ws is not None:
+            await self.ws.close()
+            self.ws = None
+
+    async def send_subscription(self, method: str, streams: List[str]) -> None:
+        ws = self.ws
+        if ws is None or not streams:
+            return  # applied on (re)connect
+        for i in range(0, len(streams), SUBSCRIBE_BATCH):
+            request = {
+                "method": method,
+                "params": streams[i : i + SUBSCRIBE_BATCH],
+                "id": next(self.client._ids),
+            }
+            await ws.send(json.dumps(request))
+
+    async def _run(self) -> None:
+        client = self.client
+        delay = client.reconnect_delay
+        while True:
+            try:
+                async with connect(
+                    f"{client.base_url}/stream", max_queue=client.socket_queue_size
+                ) as ws:
+                    self.ws = ws
+                    self.connects += 1
+                    await self.send_subscription("SUBSCRIBE", sorted(self.streams))
+                    self.connected.set()
+                    delay = client.reconnect_delay
+                    async for frame in ws:
+                        client._dispatch(frame)
+            except asyncio.CancelledError:
+                raise
+            except (WebSocketException, OSError) as exc:
+                logger.warning("Stream connection %d lost: %s", self.index, exc)
+            finally:
+                self.ws = None
+                self.connected.clear()
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            delay = min(delay * 2, client.max_reconnect_delay)
+
+
+class StreamClient:
+    """Sharded, self-healing Binance combined-stream client.
+
+    Args:
+        base_url: WebSocket base URL (no trailing path).
+        max_streams_per_connection: Shard size; Binance's limit is 1024.
+        queue_size: Capacity of the shared queue; when a queue is full its
+            oldest message is dropped.
+        reconnect_delay: Initial backoff after a dropped connection.
+        max_reconnect_delay: Backoff cap.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "wss://stream.binance.com:9443",
+        max_streams_per_connection: int = MAX_STREAMS_PER_CONNECTION,
+        queue_size: int = 10_000,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        socket_queue_size: int = 64,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.max_streams_per_connection = max_streams_per_connection
+        self.queue_size = queue_size
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.socket_queue_size = socket_queue_size
+        self.queue: asyncio.Queue[StreamMessage] = asyncio.Queue(queue_size)
+        self._routes: Dict[str, asyncio.Queue[StreamMessage]] = {}
+        self._connections: List[_Connection] = []
+        self._owner: Dict[str, _Connection] = {}
+        self._ids = itertools.count(1)
+        self._running = False
+        #: Messages dropped from full queues, by stream.
+        self.dropped: Dict[str, int] = {}
+
+    async def __aenter__(self) -> StreamClient:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    @property
+    def connections(self) -> List[_Connection]:
+        return list(self._connections)
+
+    @property
+    def streams(self) -> Set[str]:
+        return set(self._owner)
+
+    async def start(self) -> None:
+        self._running = True
+        for conn in self._connections:
+            conn.start()
+
+    async def stop(self) -> None:
+        self._running = False
+        await asyncio.gather(*(conn.stop() for conn in self._connections))
+
+    async def wait_connected(self, timeout: Optional[float] = None) -> None:
+        """Wait until every shard has an open, subscribed connection."""
+        await asyncio.wait_for(
+            asyncio.gather(*(c.connected.wait() for c in self._connections)), timeout
+        )
+
+    async def subscribe(
+        self,
+        streams: Iterable[str],
+        queue: Optional[asyncio.Queue[StreamMessage]] = None,
+    ) -> asyncio.Queue[StreamMessage]:
+        """Subscribe to `streams`; their messages go to `queue` (or `self.queue`).
+
+        Streams are packed into existing connections before new ones are
+        opened. Returns the queue the streams are routed to.
+        """
+        target = queue if queue is not None else self.queue
+        added: Dict[_Connection, List[str]] = {}
+        for stream in streams:
+            self._routes[stream] = target
+            if stream in self._owner:
+                continue
+            conn = self._shard_with_room()
+            conn.streams.add(stream)
+            self._owner[stream] = conn
+            added.setdefault(conn, []).append(stream)
+        for conn, new in added.items():
+            if self._running:
+                conn.start()
+            await conn.send_subscription("SUBSCRIBE", new)
+        return target
+
+    async def unsubscribe(self, streams: Iterable[str]) -> None:
+        removed: Dict[_Connection, List[str]] = {}
+        for stream in streams:
+            conn = self._owner.pop(stream, None)
+            self._routes.pop(stream, None)
+            if conn is not None:
+                conn.streams.discard(stream)
+                removed.setdefault(conn, []).append(stream)
+        for conn, gone in removed.items():
+            await conn.send_subscription("UNSUBSCRIBE", gone)
+
+    async def messages(
+        self, queue: Optional[asyncio.Queue[StreamMessage]] = None
+    ) -> AsyncIterator[StreamMessage]:
+        """Iterate over messages from `queue` (default: the shared queue)."""
+        q = queue if queue is not None else self.queue
+        while True:
+            msg = await q.get()
+            q.task_done()
+            yield msg
+
+    def _shard_with_room(self) -> _Connection:
+        for conn in self._connections:
+            if len(conn.streams) < self.max_streams_per_connection:
+                return conn
+        conn = _Connection(self, len(self._connections))
+        self._connections.append(conn)
+        return conn
+
+    def _dispatch(self, frame: str | bytes) -> None:
+        try:
+            payload = json.loads(frame)
+        except ValueError as exc:
+            logger.warning("Skipping undecodable stream frame: %s", exc)
+            return
+        if not isinstance(payload, dict):
+            logger.warning("Skipping unexpected stream frame: %.200r", frame)
+            return
+        stream = payload.get("stream")
+        if stream is None:
+            if payload.get("error"):
+                logger.error("Stream request failed: %s", payload["error"])
+            return  # subscription acknowledgement
+        queue = self._routes.get(stream)
+        if queue is None:
+            return
+        if queue.full():
+            oldest = queue.get_nowait()
+            queue.task_done()
+            self.dropped[oldest.stream] = self.dropped.get(oldest.stream, 0) + 1
+        queue.put_nowait(StreamMessage(stream, payload.get("data")))
@@ -0,0 +1,104 @@
+"""Tests for StreamClient against the local WebSocket stand-in."""
+
+from __future__ import annotations
+
+import asyncio
+
+from binance_trader.clients.stream import StreamClient
+from binance_trader.testing import MockStreamServer
+
+
+async def _eventually(predicate, timeout: float = 5.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+def test_shards_streams_and_delivers_messages():
+    async def runner():
+        async with MockStreamServer() as server:
+            async with StreamClient(
+                base_url=server.url, max_streams_per_connection=3
+            ) as client:
+                streams = [f"sym{i}@trade" for i in range(7)]
+                await client.subscribe(streams)
+                await client.wait_connected(5)
+                await _eventually(lambda: server.subscribed() == set(streams))
+
+                assert len(client.connections) == 3
+                assert sorted(len(s) for s in server.subscriptions.values()) == [
+                    1,
+                    3,
+                    3,
+                ]
+                await server.publish("sym5@trade", {"p": "1.5"})
+                msg = await asyncio.wait_for(client.queue.get(), 5)
+                assert (msg.stream, msg.data) == ("sym5@trade", {"p": "1.5"})
+
+    asyncio.run(runner())
+
+
+def test_reconnects_and_resubscribes():
+    async def runner():
+        async with MockStreamServer() as server:
+            async with StreamClient(
+                base_url=server.url, reconnect_delay=0.01
+            ) as client:
+                await client.subscribe(["btcusdt@bookTicker"])
+                await _eventually(lambda: server.subscribed() == {"btcusdt@bookTicker"})
+
+                await server.drop_connections()
+                await _eventually(lambda: server.total_connections == 2)
+                await _eventually(lambda: server.subscribed() == {"btcusdt@bookTicker"})
+
+                await server.publish("btcusdt@bookTicker", {"b": "1"})
+                msg = await asyncio.wait_for(client.queue.get(), 5)
+                assert msg.data == {"b": "1"}
+
+    asyncio.run(runner())
+
+
+def test_full_queue_drops_oldest_without_stalling_the_shard():
+    async def runner():
+        async with MockStreamServer() as server:
+            async with StreamClient(base_url=server.url, queue_size=2) as client:
+                slow = asyncio.Queue(maxsize=2)
+                await client.subscribe(["a@trade"], queue=slow)
+                await client.subscribe(["b@trade"])
+                await _eventually(lambda: server.subscribed() == {"a@trade", "b@trade"})
+                assert len(client.connections) == 1
+
+                for i in range(5):
+                    await server.publish("a@trade", i)
+                await server.publish("b@trade", "fresh")
+                msg = await asyncio.wait_for(client.queue.get(), 5)
+                assert msg.data == "fresh"
+
+                assert [slow.get_nowait().data for _ in range(2)] == [3, 4]
+                assert client.dropped == {"a@trade": 3}
+
+    asyncio.run(runner())
+
+
+def test_survives_bad_frames_and_refused_handshakes():
+    async def runner():
+        async with MockStreamServer() as server:
+            server.reject_handshakes = 2
+            async with StreamClient(
+                base_url=server.url, reconnect_delay=0.01
+            ) as client:
+                await client.subscribe(["x@trade"])
+                await client.wait_connected(5)
+                assert server.total_connections == 1
+
+                await server.send_raw("x@trade", "{not json")
+                await server.send_raw("x@trade", "[1, 2]")
+                await server.publish("x@trade", 1)
+                msg = await asyncio.wait_for(client.queue.get(), 5)
+                assert msg.data == 1
+                assert client.connections[0].connects == 1
+
+    asyncio.run(runner())
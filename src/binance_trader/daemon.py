@@ -0,0 +1,223 @@
+"""Warm CLI daemon and the thin client that forwards invocations to it.
+
+`binance-trader daemon` runs the CLI in a long-lived process listening on a
+Unix domain socket. Requesters (with their pooled keep-alive connections)
+and `BinanceClient`s, including the exchange-info cache, are kept between
+invocations, so repeated commands skip interpreter start-up, imports and
+TCP/TLS handshakes.
+
+The `binance-trader` entry point is `main` below. It imports nothing but
+the standard library: when a daemon is listening it sends the arguments and
+working directory over the socket and relays the output as it is written;
+otherwise it falls back to running the CLI in-process. Once a command has
+been sent it is never run a second time locally, even if the daemon dies.
+
+Protocol: the client sends one JSON line `{"argv": [...], "cwd": "..."}`
+and reads JSON lines `{"stdout": "..."}` / `{"stderr": "..."}` as output is
+produced, ending with `{"code": 0}`. Closing the connection (e.g. Ctrl-C in
+the client) aborts the command at its next write.
+
+Invocations are executed one at a time, so `LOCAL_COMMANDS` (the daemon
+itself and long-running commands) always run in the calling process.
+
+Set `BINANCE_TRADER_SOCKET` to change the socket path and
+`BINANCE_TRADER_NO_DAEMON=1` to never forward.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    import socketserver
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+#: Commands never forwarded to a daemon.
+LOCAL_COMMANDS = frozenset({"daemon", "download-klines", "watch", "archive-trades"})
+
+# Global options (see `cli._main`) that take a value.
+_OPTIONS_WITH_VALUE = frozenset({"--stats-format"})
+
+
+def default_socket_path() -> str:
+    path = os.environ.get("BINANCE_TRADER_SOCKET")
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "binance-trader.sock")
+    tmp = os.environ.get("TMPDIR", "/tmp")
+    return os.path.join(tmp, f"binance-trader-{os.getuid()}.sock")
+
+
+def command_name(argv: List[str]) -> Optional[str]:
+    """The subcommand in `argv`, after any global options."""
+    args = iter(argv)
+    for arg in args:
+        if arg in _OPTIONS_WITH_VALUE:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def forward(argv: List[str], path: Optional[PathLike] = None) -> Optional[int]:
+    """Run `argv` on a listening daemon, relaying its output as it arrives.
+
+    Returns the exit code, or None when no daemon is reachable (or
+    forwarding does not apply) and the caller should run the CLI itself.
+    """
+    if not hasattr(socket, "AF_UNIX") or os.environ.get("BINANCE_TRADER_NO_DAEMON"):
+        return None
+    if command_name(argv) in LOCAL_COMMANDS:
+        return None
+    path = os.fspath(path or default_socket_path())
+    if not os.path.exists(path):
+        return None
+    streams = {"stdout": sys.stdout, "stderr": sys.stderr}
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        request = {"argv": argv, "cwd": os.getcwd()}
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+    except OSError:
+        sock.close()
+        return None
+    with sock:
+        try:
+            return _relay(sock, streams)
+        except KeyboardInterrupt:
+            return 130
+
+
+def _relay(sock: socket.socket, streams: Dict[str, Any]) -> int:
+    try:
+        for line in sock.makefile("rb"):
+            frame = json.loads(line)
+            if "code" in frame:
+                return int(frame["code"])
+            for name, text in frame.items():
+                streams[name].write(text)
+                streams[name].flush()
+    except OSError:
+        pass
+    # The command was sent: running it again locally could repeat its effects.
+    streams["stderr"].write(
+        "binance-trader: daemon closed the connection mid-command\n"
+    )
+    return 1
+
+
+def serve(
+    path: PathLike,
+    run: Callable[[List[str]], int],
+    ready: Optional[Callable[["socketserver.BaseServer"], None]] = None,
+) -> None:
+    """Listen on `path` and execute each forwarded invocation with `run`.
+
+    `run` receives the arguments and writes to `sys.stdout`/`sys.stderr`,
+    which are streamed to the client for the duration of the call. Blocks until
+    interrupted, or until another thread calls `shutdown()` on the server
+    passed to `ready`.
+    """
+    import contextlib
+    import io
+    import signal
+    import socketserver
+    import threading
+    import traceback
+
+    path = os.fspath(path)
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)  # stale socket from a dead daemon
+        else:
+            raise RuntimeError(f"A daemon is already listening on {path}")
+        finally:
+            probe.close()
+
+    class Frames(io.TextIOBase):
+        """Text stream sending each write to the client as one frame."""
+
+        def __init__(self, wfile: Any, name: str, state: Dict[str, bool]) -> None:
+            self._wfile = wfile
+            self._name = name
+            self._state = state
+
+        def writable(self) -> bool:
+            return True
+
+        def write(self, text: str) -> int:
+            if text:
+                send(self._wfile, {self._name: text}, self._state)
+            return len(text)
+
+    def send(wfile: Any, frame: Dict[str, Any], state: Dict[str, bool]) -> None:
+        if state["gone"]:
+            return
+        try:
+            wfile.write(json.dumps(frame).encode() + b"\n")
+            wfile.flush()
+        except OSError:
+            # Client gone (e.g. Ctrl-C): fail this write to abort the command.
+            state["gone"] = True
+            raise
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            request = json.loads(self.rfile.readline())
+            state = {"gone": False}
+            out = Frames(self.wfile, "stdout", state)
+            err = Frames(self.wfile, "stderr", state)
+            cwd = os.getcwd()
+            try:
+                os.chdir(request.get("cwd") or cwd)
+                with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                    try:
+                        code = run(list(request["argv"]))
+                    except Exception:
+                        traceback.print_exc()
+                        code = 1
+            finally:
+                os.chdir(cwd)
+            with contextlib.suppress(OSError):
+                send(self.wfile, {"code": code}, state)
+
+    old_umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(path, Handler)
+    finally:
+        os.umask(old_umask)
+    if threading.current_thread() is threading.main_thread():
+        # Turn `kill` into a clean exit so the socket file is removed.
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        if ready is not None:
+            ready(server)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:  # pragma: no cover - CLI
+    """`binance-trader` entry point: forward to the daemon or run locally."""
+    args = sys.argv[1:] if argv is None else argv
+    code = forward(args)
+    if code is not None:
+        return code
+    from .cli import main as cli_main
+
+    return cli_main(args)
@@ -0,0 +1,6 @@
+"""Technical indicators: batch NumPy functions and O(1) streaming state."""
+
+from . import batch
+from .streaming import ATR, EMA, RSI, VWAP, BollingerBands
+
+__all__ = ["batch", "EMA", "RSI", "ATR", "BollingerBands", "VWAP"]
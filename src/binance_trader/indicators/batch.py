@@ -0,0 +1,160 @@
+"""Batch indicators over whole histories.
+
+Every function takes columns shaped `(bars,)` or `(bars, symbols)` and
+returns arrays of the same shape, NaN while an indicator is warming up.
+
+The recursive indicators (EMA, and the Wilder averages inside RSI and
+ATR) use exactly the arithmetic of their `streaming` counterparts: a
+sequential seed sum, then `y + alpha * (x - y)` per bar, evaluated in
+plain float arithmetic per series (or bar by bar across many series at
+once). Batch and streaming values are therefore bit-for-bit identical.
+Bollinger bands and rolling VWAP agree to floating-point
+rounding (streaming keeps running sums, batch recomputes each window).
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Series count from which stepping through bars beats a float loop per
+# series; both evaluate the same float operations.
+_WIDE = 16
+
+
+def _ewm_series(x: np.ndarray, seed: float, alpha: float) -> List[float]:
+    # A loop over Python floats runs a few times faster than numpy scalar
+    # or object-array steps, with identical IEEE double results.
+    y = seed
+    ys = [y]
+    for v in x.tolist():
+        y = y + alpha * (v - y)
+        ys.append(y)
+    return ys
+
+
+def _columns(values: np.ndarray) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def _check_period(period: int) -> None:
+    if period < 1:
+        raise ValueError(f"period must be >= 1, got {period}")
+
+
+def seeded_ewm(values: np.ndarray, alpha: float, period: int) -> np.ndarray:
+    """Exponential average seeded with the mean of the first `period` values.
+
+    NaN before bar `period - 1`.
+    """
+    _check_period(period)
+    x = _columns(values)
+    out = np.full(x.shape, np.nan)
+    if len(x) < period:
+        return out
+    seed = np.cumsum(x[:period], axis=0)[-1] / period
+    if x.ndim > 1 and x[0].size >= _WIDE:
+        # Many series: step through bars, each step vectorized over series.
+        y = out[period - 1] = seed
+        for t in range(period, len(x)):
+            y = out[t] = y + alpha * (x[t] - y)
+        return out
+    if x.ndim == 1:
+        out[period - 1 :] = _ewm_series(x[period:], float(seed), alpha)
+        return out
+    for j in range(x.shape[1]):
+        out[period - 1 :, j] = _ewm_series(x[period:, j], float(seed[j]), alpha)
+    return out
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average, `alpha = 2 / (period + 1)`, SMA-seeded."""
+    return seeded_ewm(values, 2.0 / (period + 1), period)
+
+
+def _gains_losses(close: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    change = np.diff(_columns(close), axis=0)
+    return np.maximum(change, 0.0), np.maximum(-change, 0.0)
+
+
+def rsi_from_averages(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    """RSI from Wilder average gain and loss; 50 when both are zero."""
+    total = avg_gain + avg_loss
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(total > 0, 100.0 * avg_gain / total, 50.0)
+
+
+def rsi_averages(close: np.ndarray, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Wilder-smoothed average gain and loss per bar (NaN until `period`)."""
+    gains, losses = _gains_losses(close)
+    pad = np.full((1, *gains.shape[1:]), np.nan)
+    avg_gain = seeded_ewm(gains, 1.0 / period, period)
+    avg_loss = seeded_ewm(losses, 1.0 / period, period)
+    return np.concatenate([pad, avg_gain]), np.concatenate([pad, avg_loss])
+
+
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder's relative strength index, 0..100; NaN before bar `period`."""
+    avg_gain, avg_loss = rsi_averages(close, period)
+    out = rsi_from_averages(avg_gain, avg_loss)
+    out[np.isnan(avg_gain)] = np.nan
+    return out
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Bar range extended to the previous close; the first bar is high - low."""
+    high, low, close = _columns(high), _columns(low), _columns(close)
+    tr = high - low
+    prev = close[:-1]
+    tr[1:] = np.maximum(
+        np.maximum(tr[1:], np.abs(high[1:] - prev)), np.abs(low[1:] - prev)
+    )
+    return tr
+
+
+def atr(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14
+) -> np.ndarray:
+    """Wilder's average true range; NaN before bar `period - 1`."""
+    return seeded_ewm(true_range(high, low, close), 1.0 / period, period)
+
+
+def bollinger(
+    close: np.ndarray, period: int = 20, k: float = 2.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(middle, upper, lower) bands: SMA +/- `k` population std deviations."""
+    _check_period(period)
+    x = _columns(close)
+    middle = np.full(x.shape, np.nan)
+    std = np.full(x.shape, np.nan)
+    if len(x) >= period:
+        windows = sliding_window_view(x, period, axis=0)
+        middle[period - 1 :] = windows.mean(axis=-1)
+        std[period - 1 :] = windows.std(axis=-1)
+    return middle, middle + k * std, middle - k * std
+
+
+def typical_price(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    return (_columns(high) + _columns(low) + _columns(close)) / 3.0
+
+
+def vwap(
+    price: np.ndarray, volume: np.ndarray, period: Optional[int] = None
+) -> np.ndarray:
+    """Volume-weighted average `price` (e.g. `typical_price` or trade prices).
+
+    Cumulative from the first bar, or over the last `period` bars. NaN
+    where no volume has traded.
+    """
+    price, volume = _columns(price), _columns(volume)
+    pv = np.cumsum(price * volume, axis=0)
+    vol = np.cumsum(volume, axis=0)
+    if period is not None:
+        _check_period(period)
+        pv[period:] = pv[period:] - pv[:-period]
+        vol[period:] = vol[period:] - vol[:-period]
+        pv[: period - 1] = np.nan
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(vol > 0, pv / vol, np.nan)
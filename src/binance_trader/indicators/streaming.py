@@ -0,0 +1,300 @@
+"""Streaming indicators with O(1) state per symbol.
+
+Each indicator tracks `size` independent series (e.g. one per symbol) in
+flat NumPy arrays, so a new bar for thousands of symbols is a handful of
+vectorized operations instead of a Python loop. `update` takes one value
+per series, or values for the series selected by `index` (an int or an
+array of ints) when only some of them ticked, and returns the new values
+of those series; NaN while warming up.
+
+`warm` initializes a fresh indicator from history with the `batch`
+functions, shaped `(bars,)` for `size=1` or `(bars, size)`, and the
+indicator then continues exactly where the batch computation ended.
+
+Example:
+    ema = EMA(20, size=len(symbols))
+    ema.warm(history_closes)          # (bars, symbols)
+    ema.update(latest_closes)         # one close per symbol
+    ema.update(price, index=i)        # a tick for symbol i only
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from . import batch
+
+Index = Union[int, Sequence[int], np.ndarray, None]
+
+
+class _Indicator:
+    """Bookkeeping shared by the streaming indicators."""
+
+    def __init__(self, period: int, size: int = 1) -> None:
+        if period < 1:
+            raise ValueError(f"period must be >= 1, got {period}")
+        self.period = period
+        self.size = size
+        self.count = np.zeros(size, dtype=np.int64)
+
+    def _cols(self, index: Index) -> np.ndarray:
+        if index is None:
+            return np.arange(self.size)
+        return np.atleast_1d(np.asarray(index, dtype=np.int64))
+
+    def _values(self, cols: np.ndarray, value: object) -> np.ndarray:
+        return np.broadcast_to(np.asarray(value, dtype=np.float64), cols.shape)
+
+    @property
+    def ready(self) -> np.ndarray:
+        """Per series: whether the warm-up period is over."""
+        return self.count >= self.period
+
+    def _history(self, values: np.ndarray) -> np.ndarray:
+        if self.count.any():
+            raise RuntimeError("warm() needs a fresh indicator")
+        x = np.asarray(values, dtype=np.float64)
+        if x.ndim == 1:
+            x = x[:, None]
+        if x.shape[1] != self.size:
+            raise ValueError(f"history has {x.shape[1]} series, expected {self.size}")
+        return x
+
+
+class _SeededEWM(_Indicator):
+    """Exponential average seeded with the mean of the first `period` values."""
+
+    alpha: float
+
+    def __init__(self, period: int, size: int = 1) -> None:
+        super().__init__(period, size)
+        self.value = np.full(size, np.nan)
+        self._seed = np.zeros(size)
+
+    def _step(self, cols: np.ndarray, x: np.ndarray) -> np.ndarray:
+        n = self.count[cols] + 1
+        seed = self._seed[cols] + x
+        y = self.value[cols]
+        out = np.where(
+            n > self.period,
+            y + self.alpha * (x - y),
+            np.where(n == self.period, seed / self.period, np.nan),
+        )
+        self._seed[cols] = seed
+        self.value[cols] = out
+        self.count[cols] = n
+        return out
+
+    def _warm(self, x: np.ndarray) -> None:
+        self.value[:] = batch.seeded_ewm(x, self.alpha, self.period)[-1]
+        self._seed[:] = np.cumsum(x[: self.period], axis=0)[-1]
+        self.count[:] = len(x)
+
+
+class EMA(_SeededEWM):
+    """Exponential moving average; see `batch.ema`."""
+
+    def __init__(self, period: int, size: int = 1) -> None:
+        super().__init__(period, size)
+        self.alpha = 2.0 / (period + 1)
+
+    def update(self, value: object, index: Index = None) -> np.ndarray:
+        cols = self._cols(index)
+        return self._step(cols, self._values(cols, value))
+
+    def warm(self, values: np.ndarray) -> np.ndarray:
+        x = self._history(values)
+        if len(x):
+            self._warm(x)
+        return self.value.copy()
+
+
+class RSI(_Indicator):
+    """Wilder's relative strength index; see `batch.rsi`."""
+
+    def __init__(self, period: int = 14, size: int = 1) -> None:
+        super().__init__(period, size)
+        self._gain = _SeededEWM(period, size)
+        self._loss = _SeededEWM(period, size)
+        self._gain.alpha = self._loss.alpha = 1.0 / period
+        self.prev_close = np.full(size, np.nan)
+        self.value = np.full(size, np.nan)
+
+    @property
+    def ready(self) -> np.ndarray:
+        return self.count > self.period
+
+    def update(self, close: object, index: Index = None) -> np.ndarray:
+        cols = self._cols(index)
+        x = self._values(cols, close)
+        first = self.count[cols] == 0
+        change = np.where(first, 0.0, x - self.prev_close[cols])
+        self.prev_close[cols] = x
+        self.count[cols] += 1
+        out = np.full(cols.shape, np.nan)
+        moved = cols[~first]
+        if len(moved):
+            change = change[~first]
+            gain = self._gain._step(moved, np.maximum(change, 0.0))
+            loss = self._loss._step(moved, np.maximum(-change, 0.0))
+            rsi = batch.rsi_from_averages(gain, loss)
+            rsi[np.isnan(gain)] = np.nan
+            out[~first] = rsi
+        self.value[cols] = out
+        return out
+
+    def warm(self, close: np.ndarray) -> np.ndarray:
+        x = self._history(close)
+        if not len(x):
+            return self.value.copy()
+        gains = np.maximum(np.diff(x, axis=0), 0.0)
+        losses = np.maximum(-np.diff(x, axis=0), 0.0)
+        if len(gains):
+            self._gain._warm(gains)
+            self._loss._warm(losses)
+        self.prev_close[:] = x[-1]
+        self.count[:] = len(x)
+        self.value[:] = batch.rsi(x, self.period)[-1]
+        return self.value.copy()
+
+
+class ATR(_SeededEWM):
+    """Wilder's average true range; see `batch.atr`."""
+
+    def __init__(self, period: int = 14, size: int = 1) -> None:
+        super().__init__(period, size)
+        self.alpha = 1.0 / period
+        self.prev_close = np.full(size, np.nan)
+
+    def update(
+        self, high: object, low: object, close: object, index: Index = None
+    ) -> np.ndarray:
+        cols = self._cols(index)
+        h, lo, c = (self._values(cols, v) for v in (high, low, close))
+        prev = self.prev_close[cols]
+        tr = h - lo
+        tr = np.where(
+            np.isnan(prev),
+            tr,
+            np.maximum(np.maximum(tr, np.abs(h - prev)), np.abs(lo - prev)),
+        )
+        self.prev_close[cols] = c
+        return self._step(cols, tr)
+
+    def warm(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        h, lo, c = self._history(high), self._history(low), self._history(close)
+        if len(c):
+            self._warm(batch.true_range(h, lo, c))
+            self.prev_close[:] = c[-1]
+        return self.value.copy()
+
+
+class BollingerBands(_Indicator):
+    """SMA +/- `k` standard deviations over `period` values; see `batch.bollinger`.
+
+    Keeps the last `period` values per series in a ring buffer and updates
+    the window mean and sum of squared deviations in O(1) (Welford).
+    """
+
+    def __init__(self, period: int = 20, k: float = 2.0, size: int = 1) -> None:
+        super().__init__(period, size)
+        self.k = k
+        self._window = np.zeros((period, size))
+        self._mean = np.zeros(size)
+        self._m2 = np.zeros(size)
+
+    def _bands(
+        self, mean: np.ndarray, m2: np.ndarray, ready: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        std = np.sqrt(np.maximum(m2 / self.period, 0.0))
+        middle = np.where(ready, mean, np.nan)
+        return middle, middle + self.k * std, middle - self.k * std
+
+    def update(
+        self, value: object, index: Index = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Add a value; returns (middle, upper, lower) for the series."""
+        cols = self._cols(index)
+        x = self._values(cols, value)
+        n = self.count[cols]
+        slot = n % self.period
+        old = self._window[slot, cols]
+        mean, m2 = self._mean[cols], self._m2[cols]
+        full = n >= self.period
+        # Growing window: add x. Full window: replace the oldest value.
+        new_mean = np.where(
+            full, mean + (x - old) / self.period, mean + (x - mean) / (n + 1)
+        )
+        m2 = np.where(
+            full,
+            m2 + (x - old) * (x - new_mean + old - mean),
+            m2 + (x - mean) * (x - new_mean),
+        )
+        self._window[slot, cols] = x
+        self._mean[cols] = new_mean
+        self._m2[cols] = m2
+        self.count[cols] = n + 1
+        return self._bands(new_mean, m2, n + 1 >= self.period)
+
+    def warm(self, close: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        x = self._history(close)
+        recent = x[-self.period :]
+        # Lay the values out as if they had been added one by one.
+        slots = np.arange(len(x) - len(recent), len(x)) % self.period
+        self._window[slots] = recent
+        self._mean[:] = recent.mean(axis=0) if len(recent) else 0.0
+        self._m2[:] = ((recent - self._mean) ** 2).sum(axis=0)
+        self.count[:] = len(x)
+        return self._bands(self._mean, self._m2, self.ready)
+
+
+class VWAP(_Indicator):
+    """Volume-weighted average price; see `batch.vwap`.
+
+    Cumulative with `period=None`, otherwise over the last `period`
+    updates (ring buffers of price*volume and volume).
+    """
+
+    def __init__(self, period: Optional[int] = None, size: int = 1) -> None:
+        super().__init__(period or 1, size)
+        self.rolling = period is not None
+        self._pv = np.zeros(size)
+        self._vol = np.zeros(size)
+        if self.rolling:
+            self._pv_window = np.zeros((self.period, size))
+            self._vol_window = np.zeros((self.period, size))
+
+    def _value(self, pv: np.ndarray, vol: np.ndarray, ready: np.ndarray) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(ready & (vol > 0), pv / vol, np.nan)
+
+    def update(self, price: object, volume: object, index: Index = None) -> np.ndarray:
+        cols = self._cols(index)
+        p, v = self._values(cols, price), self._values(cols, volume)
+        pv_new = p * v
+        n = self.count[cols]
+        pv, vol = self._pv[cols] + pv_new, self._vol[cols] + v
+        if self.rolling:
+            slot = n % self.period
+            pv = pv - self._pv_window[slot, cols]
+            vol = vol - self._vol_window[slot, cols]
+            self._pv_window[slot, cols] = pv_new
+            self._vol_window[slot, cols] = v
+        self._pv[cols], self._vol[cols] = pv, vol
+        self.count[cols] = n + 1
+        return self._value(pv, vol, n + 1 >= self.period)
+
+    def warm(self, price: np.ndarray, volume: np.ndarray) -> np.ndarray:
+        p, v = self._history(price), self._history(volume)
+        pv = p * v
+        if self.rolling:
+            pv, v = pv[-self.period :], v[-self.period :]
+            slots = np.arange(len(p) - len(pv), len(p)) % self.period
+            self._pv_window[slots] = pv
+            self._vol_window[slots] = v
+        self._pv[:] = np.cumsum(pv, axis=0)[-1] if len(pv) else 0.0
+        self._vol[:] = np.cumsum(v, axis=0)[-1] if len(v) else 0.0
+        self.count[:] = len(p)
+        return self._value(self._pv, self._vol, self.ready)
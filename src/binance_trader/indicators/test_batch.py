@@ -0,0 +1,54 @@
+"""Tests for the batch indicator functions."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from binance_trader.indicators import batch
+
+
+def test_ema_is_sma_seeded():
+    out = batch.ema([1.0, 2.0, 3.0, 4.0], 3)
+    assert np.isnan(out[:2]).all()
+    assert out[2] == 2.0
+    assert out[3] == pytest.approx(2.0 + 0.5 * (4.0 - 2.0))
+
+
+def test_rsi_extremes_and_flat():
+    assert batch.rsi(np.arange(20.0), 14)[-1] == 100.0
+    assert batch.rsi(np.arange(20.0)[::-1], 14)[-1] == 0.0
+    flat = batch.rsi(np.ones(20), 14)
+    assert np.isnan(flat[:14]).all() and flat[14] == 50.0
+
+
+def test_atr_includes_gaps():
+    high = np.array([10.0, 12.0, 11.0])
+    low = np.array([9.0, 11.0, 10.0])
+    close = np.array([9.5, 11.5, 10.5])
+    np.testing.assert_allclose(batch.true_range(high, low, close), [1.0, 2.5, 1.5])
+    np.testing.assert_allclose(batch.atr(high, low, close, 2), [np.nan, 1.75, 1.625])
+
+
+def test_bollinger_and_vwap_match_definitions():
+    x = np.array([1.0, 2.0, 3.0, 4.0])
+    middle, upper, lower = batch.bollinger(x, 2, k=2.0)
+    np.testing.assert_allclose(middle, [np.nan, 1.5, 2.5, 3.5])
+    np.testing.assert_allclose(upper - middle, [np.nan, 1.0, 1.0, 1.0])
+    volume = np.array([1.0, 3.0, 0.0, 1.0])
+    np.testing.assert_allclose(batch.vwap(x, volume), [1.0, 1.75, 1.75, 2.2])
+    np.testing.assert_allclose(batch.vwap(x, volume, 2), [np.nan, 1.75, 2.0, 4.0])
+
+
+def test_two_dimensional_input_is_per_column():
+    x = np.random.default_rng(0).normal(100, 1, (50, 3))
+    out = batch.ema(x, 10)
+    for j in range(3):
+        np.testing.assert_array_equal(out[:, j], batch.ema(x[:, j], 10))
+
+
+def test_wide_input_matches_per_series_accumulate():
+    x = np.random.default_rng(1).normal(100, 1, (40, 20))
+    out = batch.ema(x, 5)
+    for j in range(20):
+        np.testing.assert_array_equal(out[:, j], batch.ema(x[:, j], 5))
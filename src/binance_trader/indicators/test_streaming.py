@@ -0,0 +1,95 @@
+"""Streaming indicators must reproduce the batch functions."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from binance_trader.indicators import ATR, EMA, RSI, VWAP, BollingerBands, batch
+
+BARS, SYMBOLS = 300, 4
+
+
+@pytest.fixture
+def ohlcv():
+    rng = np.random.default_rng(7)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (BARS, SYMBOLS)), axis=0))
+    high = close * (1 + rng.uniform(0, 0.01, close.shape))
+    low = close * (1 - rng.uniform(0, 0.01, close.shape))
+    volume = rng.uniform(0, 10, close.shape)
+    return high, low, close, volume
+
+
+def _stream(update, *columns):
+    return np.array([update(*(c[t] for c in columns)) for t in range(BARS)])
+
+
+def test_recursive_indicators_are_bit_identical(ohlcv):
+    high, low, close, _ = ohlcv
+    np.testing.assert_array_equal(
+        _stream(EMA(20, SYMBOLS).update, close), batch.ema(close, 20)
+    )
+    np.testing.assert_array_equal(
+        _stream(RSI(14, SYMBOLS).update, close), batch.rsi(close, 14)
+    )
+    np.testing.assert_array_equal(
+        _stream(ATR(14, SYMBOLS).update, high, low, close),
+        batch.atr(high, low, close, 14),
+    )
+
+
+def test_window_indicators_match_to_rounding(ohlcv):
+    high, low, close, volume = ohlcv
+    bands = BollingerBands(20, 2.0, SYMBOLS)
+    streamed = np.array([bands.update(close[t]) for t in range(BARS)])
+    for got, want in zip(streamed.transpose(1, 0, 2), batch.bollinger(close, 20)):
+        np.testing.assert_allclose(got, want, rtol=1e-9)
+    price = batch.typical_price(high, low, close)
+    for period in (None, 30):
+        np.testing.assert_allclose(
+            _stream(VWAP(period, SYMBOLS).update, price, volume),
+            batch.vwap(price, volume, period),
+            rtol=1e-9,
+        )
+
+
+def test_warm_then_stream_continues_batch(ohlcv):
+    high, low, close, volume = ohlcv
+    split = 200
+    ema, rsi, atr = EMA(20, SYMBOLS), RSI(14, SYMBOLS), ATR(14, SYMBOLS)
+    bands, vwap = BollingerBands(20, 2.0, SYMBOLS), VWAP(30, SYMBOLS)
+    ema.warm(close[:split])
+    rsi.warm(close[:split])
+    atr.warm(high[:split], low[:split], close[:split])
+    bands.warm(close[:split])
+    vwap.warm(close[:split], volume[:split])
+    for t in range(split, BARS):
+        e, r, a = (
+            ema.update(close[t]),
+            rsi.update(close[t]),
+            atr.update(high[t], low[t], close[t]),
+        )
+        b = bands.update(close[t])
+        v = vwap.update(close[t], volume[t])
+    np.testing.assert_array_equal(e, batch.ema(close, 20)[-1])
+    np.testing.assert_array_equal(r, batch.rsi(close, 14)[-1])
+    np.testing.assert_array_equal(a, batch.atr(high, low, close, 14)[-1])
+    np.testing.assert_allclose(b[1], batch.bollinger(close, 20)[1][-1], rtol=1e-9)
+    np.testing.assert_allclose(v, batch.vwap(close, volume, 30)[-1], rtol=1e-9)
+
+
+def test_index_updates_single_series(ohlcv):
+    close = ohlcv[2]
+    ema = EMA(5, SYMBOLS)
+    for t in range(50):
+        ema.update(close[t, 2], index=2)
+    assert np.isnan(ema.value[[0, 1, 3]]).all()
+    assert ema.value[2] == batch.ema(close[:50, 2], 5)[-1]
+    assert ema.ready.tolist() == [False, False, True, False]
+
+
+def test_warm_requires_fresh_state():
+    ema = EMA(3)
+    ema.update(1.0)
+    with pytest.raises(RuntimeError):
+        ema.warm([1.0, 2.0])
@@ -0,0 +1,6 @@
+"""Local market data structures built on top of the clients."""
+
+from .order_book import OrderBook, OrderBookSynchronizer
+from .tickers import SnapshotDiff, TickerSnapshot
+
+__all__ = ["OrderBook", "OrderBookSynchronizer", "TickerSnapshot", "SnapshotDiff"]
@@ -0,0 +1,236 @@
+"""Local order book maintained from a depth snapshot plus diff-depth events.
+
+`OrderBook` keeps each side as a sorted list of prices with a parallel
+list of quantities. Updates locate the level with a binary search
+(O(log n)); adding or removing a level shifts the rest of the list (O(n),
+a memmove that stays cheap at book depths of a few thousand levels). The
+best bid and ask are the ends of those lists (O(1)).
+Depth queries (cumulative size, VWAP to fill a size) run over NumPy views
+of the top levels.
+
+`OrderBookSynchronizer` implements Binance's procedure for keeping a local
+book in sync with the `<symbol>@depth` stream: buffer events, fetch a REST
+snapshot, drop events the snapshot already covers, then apply events whose
+`U`/`u` update IDs chain without gaps. A new snapshot is fetched only when
+the buffered events show the current one is too old. A gap triggers an
+automatic resync.
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Level = Sequence[Any]  # [price, quantity], as strings or numbers
+
+
+class _BookSide:
+    """Prices sorted ascending with a parallel quantity list.
+
+    Lookups are O(log n); inserting or deleting a level is O(n).
+    """
+
+    __slots__ = ("prices", "qtys")
+
+    def __init__(self) -> None:
+        self.prices: List[float] = []
+        self.qtys: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def clear(self) -> None:
+        self.prices.clear()
+        self.qtys.clear()
+
+    def set(self, price: float, qty: float) -> None:
+        prices = self.prices
+        i = bisect_left(prices, price)
+        if i < len(prices) and prices[i] == price:
+            if qty == 0.0:
+                del prices[i]
+                del self.qtys[i]
+            else:
+                self.qtys[i] = qty
+        elif qty != 0.0:
+            prices.insert(i, price)
+            self.qtys.insert(i, qty)
+
+
+class OrderBook:
+    """In-memory limit order book for one symbol."""
+
+    def __init__(self, symbol: str = "") -> None:
+        self.symbol = symbol
+        self.last_update_id = 0
+        self._bids = _BookSide()
+        self._asks = _BookSide()
+
+    def __repr__(self) -> str:
+        return (
+            f"OrderBook({self.symbol!r}, bid={self.best_bid()}, ask={self.best_ask()},"
+            f" last_update_id={self.last_update_id})"
+        )
+
+    def clear(self) -> None:
+        self._bids.clear()
+        self._asks.clear()
+        self.last_update_id = 0
+
+    def load_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """Replace the book with a `/api/v3/depth` response."""
+        self.clear()
+        self.apply(snapshot["bids"], snapshot["asks"])
+        self.last_update_id = int(snapshot["lastUpdateId"])
+
+    def apply(self, bids: Iterable[Level], asks: Iterable[Level]) -> None:
+        """Apply absolute level quantities; a quantity of 0 removes the level."""
+        for price, qty in bids:
+            self._bids.set(float(price), float(qty))
+        for price, qty in asks:
+            self._asks.set(float(price), float(qty))
+
+    def best_bid(self) -> Optional[Tuple[float, float]]:
+        if not self._bids:
+            return None
+        return self._bids.prices[-1], self._bids.qtys[-1]
+
+    def best_ask(self) -> Optional[Tuple[float, float]]:
+        if not self._asks:
+            return None
+        return self._asks.prices[0], self._asks.qtys[0]
+
+    def mid_price(self) -> Optional[float]:
+        bid, ask = self.best_bid(), self.best_ask()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2.0
+
+    def spread(self) -> Optional[float]:
+        bid, ask = self.best_bid(), self.best_ask()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+
+    def levels(
+        self, side: str, depth: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Prices and quantities of `side` ("bids"/"asks"), best level first."""
+        if side == "bids":
+            book, n = self._bids, len(self._bids)
+            lo = 0 if depth is None else max(0, n - depth)
+            prices = np.array(book.prices[lo:], dtype=np.float64)[::-1]
+            qtys = np.array(book.qtys[lo:], dtype=np.float64)[::-1]
+        elif side == "asks":
+            book = self._asks
+            prices = np.array(book.prices[:depth], dtype=np.float64)
+            qtys = np.array(book.qtys[:depth], dtype=np.float64)
+        else:
+            raise ValueError(f"side must be 'bids' or 'asks', got {side!r}")
+        return prices, qtys
+
+    def cumulative_depth(
+        self, side: str, depth: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Prices and running total base quantity from the best level outward."""
+        prices, qtys = self.levels(side, depth)
+        return prices, np.cumsum(qtys)
+
+    def vwap(self, side: str, size: float) -> float:
+        """Average price to fill `size` (base asset) against `side`.
+
+        Buying consumes "asks", selling consumes "bids". Raises ValueError if
+        the book is not deep enough.
+        """
+        prices, qtys = self.levels(side)
+        cum = np.cumsum(qtys)
+        if not len(cum) or cum[-1] < size:
+            raise ValueError(f"Not enough {side} liquidity to fill {size}")
+        i = int(np.searchsorted(cum, size))
+        filled = qtys[:i]
+        notional = float(np.dot(prices[:i], filled))
+        remainder = size - (float(cum[i - 1]) if i else 0.0)
+        return (notional + remainder * float(prices[i])) / size
+
+
+class OrderBookSynchronizer:
+    """Keep an `OrderBook` in sync with diff-depth events.
+
+    Args:
+        fetch_snapshot: Returns a fresh `/api/v3/depth` response, e.g.
+            `lambda: client.depth("BTCUSDT", limit=1000)`.
+        book: The book to maintain (a new one is created if omitted).
+    """
+
+    def __init__(
+        self,
+        fetch_snapshot: Callable[[], Dict[str, Any]],
+        book: Optional[OrderBook] = None,
+    ) -> None:
+        self._fetch_snapshot = fetch_snapshot
+        self.book = book if book is not None else OrderBook()
+        self.synced = False
+        self.resyncs = 0
+        self.snapshots_fetched = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._snapshot: Optional[Dict[str, Any]] = None
+
+    def process(self, event: Dict[str, Any]) -> bool:
+        """Feed one `depthUpdate` event. Returns True if the book is in sync."""
+        if not self.synced:
+            self._buffer.append(event)
+            self._try_sync()
+            return self.synced
+
+        first, last = int(event["U"]), int(event["u"])
+        if last <= self.book.last_update_id:
+            return True  # already applied
+        if first > self.book.last_update_id + 1:
+            logger.warning(
+                "Depth gap for %s: expected %d, got %d; resyncing",
+                self.book.symbol,
+                self.book.last_update_id + 1,
+                first,
+            )
+            self.resyncs += 1
+            self.synced = False
+            self._buffer = [event]
+            self._snapshot = None
+            self._try_sync()
+            return self.synced
+        self._apply(event)
+        return True
+
+    def _apply(self, event: Dict[str, Any]) -> None:
+        self.book.apply(event["b"], event["a"])
+        self.book.last_update_id = int(event["u"])
+
+    def _try_sync(self) -> None:
+        if self._snapshot is None:
+            self._snapshot = self._fetch_snapshot()
+            self.snapshots_fetched += 1
+        snapshot_id = int(self._snapshot["lastUpdateId"])
+        if snapshot_id < int(self._buffer[0]["U"]) - 1:
+            # Snapshot predates the buffered events; fetch a newer one next time.
+            self._snapshot = None
+            return
+        pending = [e for e in self._buffer if int(e["u"]) > snapshot_id]
+        expected = snapshot_id + 1
+        for i, event in enumerate(pending):
+            if int(event["U"]) > expected:
+                # Events were lost after the snapshot: restart from the gap.
+                self._buffer = pending[i:]
+                self._snapshot = None
+                return
+            expected = int(event["u"]) + 1
+        self.book.load_snapshot(self._snapshot)
+        for event in pending:
+            self._apply(event)
+        self._buffer = []
+        self._snapshot = None
+        self.synced = True
@@ -0,0 +1,135 @@
+"""Unit tests for OrderBook and OrderBookSynchronizer."""
+
+from __future__ import annotations
+
+import random
+from typing import List
+
+import pytest
+
+from binance_trader.clients.binance import BinanceClient
+from binance_trader.clients.requester import RequestsRequester
+from binance_trader.market import OrderBook, OrderBookSynchronizer
+from binance_trader.testing import MockBinanceServer
+
+
+def record_depth_events(seed: int = 7, count: int = 300):
+    """Simulate an exchange book; return (snapshots by update id, events)."""
+    rng = random.Random(seed)
+    bids = {100.0 - i: 1.0 for i in range(1, 20)}
+    asks = {100.0 + i: 1.0 for i in range(1, 20)}
+    snapshots = {}
+    events = []
+    update_id = 1000
+    for _ in range(count):
+        first = update_id + 1
+        b: List[List[str]] = []
+        a: List[List[str]] = []
+        for _ in range(rng.randint(1, 4)):
+            side, book = rng.choice([(b, bids), (a, asks)])
+            offset = rng.randint(1, 25)
+            price = 100.0 - offset if book is bids else 100.0 + offset
+            qty = 0.0 if rng.random() < 0.3 else round(rng.uniform(0.1, 5), 3)
+            if qty:
+                book[price] = qty
+            else:
+                book.pop(price, None)
+            side.append([str(price), str(qty)])
+            update_id += 1
+        events.append({"e": "depthUpdate", "U": first, "u": update_id, "b": b, "a": a})
+        snapshots[update_id] = {
+            "lastUpdateId": update_id,
+            "bids": [[str(p), str(q)] for p, q in sorted(bids.items(), reverse=True)],
+            "asks": [[str(p), str(q)] for p, q in sorted(asks.items())],
+        }
+    return snapshots, events
+
+
+def test_book_updates_and_queries():
+    book = OrderBook("BTCUSDT")
+    book.load_snapshot(
+        {
+            "lastUpdateId": 1,
+            "bids": [["99", "1"], ["98", "2"]],
+            "asks": [["101", "1"], ["102", "3"]],
+        }
+    )
+    book.apply([["99.5", "4"], ["98", "0"]], [["101", "0"]])
+
+    assert book.best_bid() == (99.5, 4.0)
+    assert book.best_ask() == (102.0, 3.0)
+    assert book.spread() == 2.5
+    prices, cum = book.cumulative_depth("bids")
+    assert prices.tolist() == [99.5, 99.0]
+    assert cum.tolist() == [4.0, 5.0]
+    assert book.vwap("bids", 5.0) == pytest.approx((99.5 * 4 + 99.0) / 5)
+    with pytest.raises(ValueError):
+        book.vwap("asks", 10.0)
+
+
+def test_synchronizer_tracks_replayed_stream_from_rest_stand_in():
+    snapshots, events = record_depth_events()
+    # The REST snapshot is taken after the 5th event was published.
+    snapshot_id = events[4]["u"]
+
+    with MockBinanceServer({"/api/v3/depth": snapshots[snapshot_id]}) as server:
+        client = BinanceClient(RequestsRequester(), base_url=server.url)
+        sync = OrderBookSynchronizer(lambda: client.depth("BTCUSDT", limit=1000))
+        for event in events:
+            sync.process(event)
+
+    expected = snapshots[events[-1]["u"]]
+    book = sync.book
+    assert sync.synced and sync.resyncs == 0 and sync.snapshots_fetched == 1
+    assert book.last_update_id == events[-1]["u"]
+    prices, qtys = book.levels("asks")
+    assert prices.tolist() == [float(p) for p, _ in expected["asks"]]
+    assert qtys.tolist() == [float(q) for _, q in expected["asks"]]
+    assert book.best_bid()[0] == float(expected["bids"][0][0])
+
+
+def test_synchronizer_resyncs_after_gap():
+    snapshots, events = record_depth_events()
+    served = []
+
+    def fetch():
+        # Serve the freshest snapshot the "exchange" had when asked.
+        latest = served[-1] if served else events[0]["u"]
+        return snapshots[latest]
+
+    sync = OrderBookSynchronizer(fetch)
+    for i, event in enumerate(events):
+        served.append(event["u"])
+        if i == 150:
+            continue  # dropped message
+        sync.process(event)
+
+    assert sync.resyncs == 1 and sync.snapshots_fetched == 2
+    assert sync.synced
+    assert sync.book.best_ask()[0] == float(snapshots[events[-1]["u"]]["asks"][0][0])
+
+
+def test_synchronizer_refetches_only_snapshots_that_are_too_old():
+    snapshots, events = record_depth_events()
+    stale = {"lastUpdateId": 900, "bids": [], "asks": []}
+    served = [stale, stale]
+
+    def fetch():
+        return served.pop(0) if served else snapshots[events[3]["u"]]
+
+    sync = OrderBookSynchronizer(fetch)
+    for i, event in enumerate(events):
+        if i == 1:
+            continue  # lost before the good snapshot: it must not be applied
+        sync.process(event)
+        if i == 0:
+            assert not sync.synced and sync.snapshots_fetched == 1
+
+    assert sync.synced and sync.resyncs == 0
+    # Two stale snapshots, then one that bridges the gap in the buffer.
+    assert sync.snapshots_fetched == 3
+    expected = snapshots[events[-1]["u"]]
+    assert sync.book.best_bid()[0] == float(expected["bids"][0][0])
+    assert sync.book.levels("asks")[0].tolist() == [
+        float(p) for p, _ in expected["asks"]
+    ]
@@ -0,0 +1,131 @@
+"""Tests for batched ticker requests and columnar snapshots."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+
+from binance_trader import cli
+from binance_trader.clients.binance import AsyncBinanceClient, BinanceClient
+from binance_trader.clients.requester import HttpxRequester, RequestsRequester
+from binance_trader.market import TickerSnapshot
+from binance_trader.testing import MockBinanceServer, payloads
+
+MARKET = payloads.book_tickers(250)
+
+
+def _book(params):
+    if "symbol" in params:
+        return next(r for r in MARKET if r["symbol"] == params["symbol"])
+    if "symbols" in params:
+        wanted = json.loads(params["symbols"])
+        return [r for r in MARKET if r["symbol"] in wanted]
+    return MARKET
+
+
+def _stats(params):
+    rows = _book(params)
+    return [{**r, "volume": "1.5", "count": 7} for r in rows]
+
+
+@pytest.fixture
+def server():
+    routes = {"/api/v3/ticker/bookTicker": _book, "/api/v3/ticker/24hr": _stats}
+    with MockBinanceServer(routes) as srv:
+        yield srv
+
+
+def _symbols(n):
+    return [r["symbol"] for r in MARKET[:n]]
+
+
+def test_symbol_lists_are_split_into_batches(server):
+    client = BinanceClient(RequestsRequester(), base_url=server.url)
+    client.ticker_batch_size = 20
+    rows = client.ticker_24hr(_symbols(30))
+    assert [r["symbol"] for r in rows] == _symbols(30)
+    sent = [json.loads(p["symbols"]) for _, _, p in server.requests]
+    assert [len(s) for s in sent] == [20, 10]
+    assert client.book_ticker(MARKET[3]["symbol"]) == MARKET[3]
+
+
+def test_whole_market_request_when_batches_weigh_more(server):
+    client = BinanceClient(RequestsRequester(), base_url=server.url)
+    # Three bookTicker batches weigh 12; the whole market weighs 4.
+    rows = client.book_ticker(_symbols(250)[::-1][:210])
+    assert len(rows) == 210
+    assert server.requests[-1][2] == {}
+    client.ticker_24hr(type="MINI")
+    assert server.requests[-1][2] == {"type": "MINI"}
+
+
+def test_async_batches_are_gathered(server):
+    async def main():
+        async with AsyncBinanceClient(HttpxRequester(), base_url=server.url) as c:
+            c.ticker_batch_size = 10
+            return await c.ticker_24hr(_symbols(25))
+
+    rows = asyncio.run(main())
+    assert sorted(r["symbol"] for r in rows) == sorted(_symbols(25))
+    assert len(server.requests) == 3
+
+
+def test_snapshot_columns_sorted_by_symbol():
+    snap = TickerSnapshot.from_rows(
+        [
+            {"symbol": "ETHUSDT", "bidPrice": "2000.5", "count": 3},
+            {"symbol": "BTCUSDT", "bidPrice": "30000", "count": None},
+        ],
+        time=1.0,
+    )
+    assert snap.symbols.tolist() == ["BTCUSDT", "ETHUSDT"]
+    assert snap["bid_price"].tolist() == [30000.0, 2000.5]
+    assert np.isnan(snap["count"][0])
+    assert snap.row("ETHUSDT") == {"bid_price": 2000.5, "count": 3.0}
+    assert snap.positions(["ETHUSDT", "XRPUSDT"]).tolist() == [1, -1]
+    assert snap.select(["ETHUSDT"]).records() == [
+        {"symbol": "ETHUSDT", "bid_price": 2000.5, "count": 3.0}
+    ]
+    one = TickerSnapshot.from_rows({"symbol": "BTCUSDT", "price": "1"})
+    assert len(one) == 1 and "BTCUSDT" in one
+
+
+def test_diff_same_symbols_and_changed_universe():
+    prev = TickerSnapshot.from_rows(MARKET, fields=["bidPrice", "askPrice"])
+    rows = [dict(r) for r in MARKET]
+    rows[5]["bidPrice"] = "1.0"
+    rows[9]["askPrice"] = "2.0"
+    same = TickerSnapshot.from_rows(rows, fields=["bidPrice", "askPrice"])
+    diff = same.diff(prev)
+    assert sorted(diff.symbols.tolist()) == sorted(
+        [rows[5]["symbol"], rows[9]["symbol"]]
+    )
+    i = diff.symbols.tolist().index(rows[5]["symbol"])
+    assert diff.after["bid_price"][i] == 1.0
+    assert diff.delta("bid_price")[i] == 1.0 - float(MARKET[5]["bidPrice"])
+    assert not same.diff(same)
+    assert diff.records()[0]["symbol"] in diff.symbols
+
+    moved = TickerSnapshot.from_rows(
+        rows[1:] + [{"symbol": "NEWUSDT", "bidPrice": "1", "askPrice": "2"}],
+        fields=["bidPrice", "askPrice"],
+    )
+    diff = moved.diff(prev, fields=["bid_price"])
+    assert diff.added.tolist() == ["NEWUSDT"]
+    assert diff.removed.tolist() == [MARKET[0]["symbol"]]
+    assert diff.symbols.tolist() == [rows[5]["symbol"]]
+
+
+def test_tickers_command(server):
+    result = CliRunner().invoke(
+        cli.app,
+        ["tickers", *_symbols(2), "--fields", "bidPrice", "--base-url", server.url],
+    )
+    assert result.exit_code == 0, result.output
+    records = json.loads(result.output)
+    assert [r["symbol"] for r in records] == sorted(_symbols(2))
+    assert set(records[0]) == {"symbol", "bid_price"}
@@ -0,0 +1,206 @@
+"""Columnar whole-market ticker snapshots.
+
+`TickerSnapshot` turns the rows of `/api/v3/ticker/price`,
+`/ticker/bookTicker` or `/ticker/24hr` into a sorted symbol array plus one
+float64 array per numeric field, so a market of thousands of symbols is a
+handful of arrays instead of thousands of dicts. Field names are the
+snake_case form of the API keys (`bidPrice` -> `bid_price`).
+
+`diff` compares two snapshots with vectorized operations: symbols are
+aligned by sorted lookup (or taken as-is when both snapshots list the same
+symbols), and every field is compared at once.
+
+Example:
+    prev = TickerSnapshot.from_rows(client.book_ticker(symbols))
+    ...
+    snap = TickerSnapshot.from_rows(client.book_ticker(symbols))
+    changes = snap.diff(prev, fields=["bid_price", "ask_price"])
+    for symbol, delta in zip(changes.symbols, changes.delta("bid_price")):
+        ...
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from time import time as _now
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+_CAMEL = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def field_name(key: str) -> str:
+    """snake_case column name for an API key (`priceChangePercent` -> ...)."""
+    return _CAMEL.sub("_", key).lower()
+
+
+def _column(rows: Sequence[Mapping[str, Any]], key: str) -> np.ndarray:
+    # NumPy parses decimal strings itself and maps None (or absent) to NaN.
+    return np.array([row.get(key) for row in rows], dtype=np.float64)
+
+
+def _changed(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Elementwise a != b, treating NaN as equal to NaN."""
+    return (a != b) & ~(np.isnan(a) & np.isnan(b))
+
+
+@dataclass(frozen=True)
+class SnapshotDiff:
+    """Differences from a previous snapshot to the current one.
+
+    `symbols` changed in at least one compared field; `before` and `after`
+    hold those fields for exactly these symbols, in the same order.
+    """
+
+    symbols: np.ndarray
+    before: Dict[str, np.ndarray]
+    after: Dict[str, np.ndarray]
+    added: np.ndarray
+    removed: np.ndarray
+
+    def __bool__(self) -> bool:
+        return bool(len(self.symbols) or len(self.added) or len(self.removed))
+
+    def delta(self, field: str) -> np.ndarray:
+        return self.after[field] - self.before[field]
+
+    def records(self) -> List[Dict[str, Any]]:
+        """One dict per changed symbol with `{field: [before, after]}`."""
+        fields = list(self.after)
+        before = [self.before[f].tolist() for f in fields]
+        after = [self.after[f].tolist() for f in fields]
+        return [
+            {
+                "symbol": symbol,
+                **{f: [b[i], a[i]] for f, b, a in zip(fields, before, after)},
+            }
+            for i, symbol in enumerate(self.symbols.tolist())
+        ]
+
+
+class TickerSnapshot:
+    """Ticker fields of many symbols as columns, ordered by symbol.
+
+    Attributes:
+        symbols: Sorted symbol names (a NumPy unicode array).
+        columns: Field name -> float64 array aligned with `symbols`.
+        time: When the snapshot was taken (`time.time()` by default).
+    """
+
+    __slots__ = ("symbols", "columns", "time", "_index")
+
+    def __init__(
+        self,
+        symbols: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        time: Optional[float] = None,
+    ) -> None:
+        self.symbols = symbols
+        self.columns = columns
+        self.time = time
+        self._index: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Mapping[str, Any]] | Mapping[str, Any],
+        fields: Optional[Sequence[str]] = None,
+        time: Optional[float] = None,
+    ) -> TickerSnapshot:
+        """Build a snapshot from ticker rows (a list, or one row).
+
+        `fields` selects API keys (e.g. `["bidPrice", "askPrice"]`); by
+        default every key of the first row except `symbol`. Missing or
+        null values become NaN.
+        """
+        rows = [rows] if isinstance(rows, Mapping) else list(rows)
+        if fields is None:
+            fields = [k for k in (rows[0] if rows else {}) if k != "symbol"]
+        names = np.asarray([row["symbol"] for row in rows], dtype=np.str_)
+        order = np.argsort(names, kind="stable")
+        columns = {field_name(key): _column(rows, key)[order] for key in fields}
+        return cls(names[order], columns, _now() if time is None else time)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self.index
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.columns[field]
+
+    def __repr__(self) -> str:
+        return f"TickerSnapshot({len(self)} symbols, fields={list(self.columns)})"
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self.columns)
+
+    @property
+    def index(self) -> Dict[str, int]:
+        """Symbol -> row position, built on first use."""
+        if self._index is None:
+            self._index = {s: i for i, s in enumerate(self.symbols.tolist())}
+        return self._index
+
+    def row(self, symbol: str) -> Dict[str, float]:
+        i = self.index[symbol]
+        return {name: float(column[i]) for name, column in self.columns.items()}
+
+    def positions(self, symbols: Sequence[str]) -> np.ndarray:
+        """Row position of each of `symbols`, -1 where absent."""
+        wanted = np.asarray(symbols, dtype=np.str_)
+        pos = np.searchsorted(self.symbols, wanted)
+        pos[pos == len(self.symbols)] = 0
+        found = len(self.symbols) > 0 and self.symbols[pos] == wanted
+        return np.where(found, pos, -1)
+
+    def select(self, symbols: Sequence[str]) -> TickerSnapshot:
+        """Snapshot restricted to `symbols` (unknown ones are skipped)."""
+        pos = self.positions(symbols)
+        pos = np.unique(pos[pos >= 0])
+        columns = {name: column[pos] for name, column in self.columns.items()}
+        return TickerSnapshot(self.symbols[pos], columns, self.time)
+
+    def records(self) -> List[Dict[str, Any]]:
+        """One `{"symbol": ..., field: value}` dict per symbol."""
+        names = list(self.columns)
+        values = [self.columns[name].tolist() for name in names]
+        return [
+            {"symbol": symbol, **dict(zip(names, row))}
+            for symbol, *row in zip(self.symbols.tolist(), *values)
+        ]
+
+    def diff(
+        self, previous: TickerSnapshot, fields: Optional[Sequence[str]] = None
+    ) -> SnapshotDiff:
+        """Changes since `previous` in `fields` (default: the shared fields)."""
+        if fields is None:
+            fields = [f for f in self.columns if f in previous.columns]
+        cur: Union[slice, np.ndarray]
+        prev: Union[slice, np.ndarray]
+        if np.array_equal(self.symbols, previous.symbols):
+            cur = prev = slice(None)
+            common = self.symbols
+            added = removed = np.empty(0, dtype=self.symbols.dtype)
+        else:
+            common, cur, prev = np.intersect1d(
+                self.symbols, previous.symbols, assume_unique=True, return_indices=True
+            )
+            added = np.setdiff1d(self.symbols, previous.symbols, assume_unique=True)
+            removed = np.setdiff1d(previous.symbols, self.symbols, assume_unique=True)
+        after = {f: self.columns[f][cur] for f in fields}
+        before = {f: previous.columns[f][prev] for f in fields}
+        mask = np.zeros(len(common), dtype=bool)
+        for f in fields:
+            mask |= _changed(after[f], before[f])
+        return SnapshotDiff(
+            common[mask],
+            {f: v[mask] for f, v in before.items()},
+            {f: v[mask] for f, v in after.items()},
+            added,
+            removed,
+        )
@@ -0,0 +1,144 @@
+"""Rendering of CLI results: JSON, NDJSON or a text table.
+
+Results are either a single document or *records*, the elements of a list
+response such as the symbols of `exchange-info`. Records are written one at
+a time as they are produced, so a streamed response (see
+`decoders.iter_json_array`) reaches stdout without ever being held whole:
+
+- `json` pretty-prints like `json.dumps(..., indent=2)`; a record stream
+  is written as the same array, element by element.
+- `ndjson` writes one compact JSON value per line, for `jq`, `grep` and
+  friends.
+- `table` aligns the records in columns (it needs all rows to size them).
+
+`fields` projects each record onto a few keys; dotted names reach into
+nested objects (`a.b`), list indexes are not supported.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, TextIO
+
+FORMATS = ("json", "ndjson", "table")
+
+
+def parse_fields(spec: Optional[str]) -> Optional[List[str]]:
+    """Split a comma-separated `--fields` value; None when empty."""
+    if not spec:
+        return None
+    fields = [f.strip() for f in spec.split(",") if f.strip()]
+    return fields or None
+
+
+def check_format(fmt: str) -> str:
+    if fmt not in FORMATS:
+        raise ValueError(
+            f"Unknown format {fmt!r}, expected one of {', '.join(FORMATS)}"
+        )
+    return fmt
+
+
+def project(record: Any, fields: Optional[Sequence[str]]) -> Any:
+    """`record` reduced to `fields` (missing ones are None)."""
+    if not fields or not isinstance(record, Mapping):
+        return record
+    out = {}
+    for name in fields:
+        value: Any = record
+        for part in name.split("."):
+            value = value.get(part) if isinstance(value, Mapping) else None
+        out[name] = value
+    return out
+
+
+def _compact(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return _compact(value)
+
+
+def format_table(rows: Sequence[Any], fields: Optional[Sequence[str]] = None) -> str:
+    """Left-aligned columns with a header row; nested values as JSON."""
+    if not rows:
+        return ""
+    columns = list(fields or ())
+    if not columns:
+        for row in rows:
+            if isinstance(row, Mapping):
+                columns.extend(k for k in row if k not in columns)
+    if not columns:
+        return "\n".join(_cell(row) for row in rows)
+    cells = [
+        [_cell(row.get(c) if isinstance(row, Mapping) else row) for c in columns]
+        for row in rows
+    ]
+    widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(columns)]
+    lines = [columns, *cells]
+    return "\n".join(
+        "  ".join(v.ljust(w) for v, w in zip(line, widths)).rstrip() for line in lines
+    )
+
+
+def write_records(
+    records: Iterable[Any],
+    fmt: str = "json",
+    fields: Optional[Sequence[str]] = None,
+    out: Optional[TextIO] = None,
+) -> None:
+    """Write `records` (any iterable, consumed lazily) in `fmt`."""
+    out = out or sys.stdout
+    rows = (project(r, fields) for r in records)
+    if check_format(fmt) == "ndjson":
+        for row in rows:
+            out.write(_compact(row) + "\n")
+    elif fmt == "table":
+        text = format_table(list(rows), fields)
+        if text:
+            out.write(text + "\n")
+    else:
+        # Same text as json.dumps(list(rows), indent=2), one element at a time.
+        separator = "[\n  "
+        for row in rows:
+            out.write(separator)
+            out.write(
+                json.dumps(row, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+            )
+            separator = ",\n  "
+        out.write("[]\n" if separator == "[\n  " else "\n]\n")
+
+
+def write_result(
+    value: Any,
+    fmt: str = "json",
+    fields: Optional[Sequence[str]] = None,
+    records_key: Optional[str] = None,
+    out: Optional[TextIO] = None,
+) -> None:
+    """Write a whole response.
+
+    Plain `json` output prints the document as-is. Otherwise lists, or the
+    list under `records_key` of an object response, are written as
+    records; any other value is a single record.
+    """
+    out = out or sys.stdout
+    check_format(fmt)
+    if fmt == "json" and not fields:
+        out.write(json.dumps(value, indent=2, ensure_ascii=False) + "\n")
+        return
+    if records_key is not None and isinstance(value, Mapping) and records_key in value:
+        value = value[records_key]
+    if isinstance(value, list):
+        write_records(value, fmt, fields, out)
+    elif fmt == "json":
+        out.write(json.dumps(project(value, fields), indent=2, ensure_ascii=False))
+        out.write("\n")
+    else:
+        write_records([value], fmt, fields, out)
@@ -0,0 +1,5 @@
+"""Scheduling of recurring REST polls under a request weight budget."""
+
+from .polling import Job, JobStatus, PollingScheduler, plan_intervals
+
+__all__ = ["Job", "JobStatus", "PollingScheduler", "plan_intervals"]
@@ -0,0 +1,381 @@
+"""Polling many REST endpoints from one event loop under a weight budget.
+
+Instead of independent loops that each call the API at a fixed interval
+(and collide, overspend weight and drift), every poll is a `Job` declaring
+an endpoint, how fresh its data should be and a priority. One
+`PollingScheduler` runs them all:
+
+- `plan_intervals` fits the jobs into the weight budget. Jobs run at their
+  `freshness` interval while the budget allows; otherwise the lowest
+  priorities are stretched first, up to `max_stretch` times.
+- The dispatcher sends the highest-priority due job first and paces sends
+  with a token bucket, so jobs that come due together do not burst.
+- With a `RateLimiter` on the client, weight other processes use on the
+  same IP (seen in `X-MBX-USED-WEIGHT-1m`) shrinks the budget and the plan
+  is redone.
+- Results go to subscribers; `status` reports per-job staleness and
+  `budget` the weight in use.
+
+Example:
+    scheduler = PollingScheduler(client, budget=1200)
+    scheduler.add(Job("book", "/api/v3/ticker/bookTicker", freshness=2, priority=10))
+    scheduler.add(Job("24hr", "/api/v3/ticker/24hr", freshness=60))
+    scheduler.subscribe(lambda job, data: print(job.name, len(data)))
+    await scheduler.run()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from ..clients.binance.async_client import AsyncBinanceClient
+from ..clients.requester.rate_limit import TokenBucket, request_weight
+
+logger = logging.getLogger(__name__)
+
+#: `callback(job, data)`; may be a coroutine function.
+Subscriber = Callable[["Job", Any], Any]
+
+_MINUTE = 60.0
+
+
+@dataclass(frozen=True)
+class Job:
+    """One endpoint to poll.
+
+    Attributes:
+        name: Unique job name, passed to subscribers.
+        path: REST path, e.g. "/api/v3/ticker/bookTicker".
+        params: Query parameters.
+        freshness: Desired maximum age of the data in seconds; the polling
+            interval when the budget allows.
+        priority: Higher priorities keep their interval under pressure.
+        max_stretch: Longest allowed interval, as a multiple of `freshness`.
+        weight: Request weight; looked up in `ENDPOINT_WEIGHTS` by default.
+    """
+
+    name: str
+    path: str
+    params: Optional[Dict[str, Any]] = None
+    freshness: float = 10.0
+    priority: int = 0
+    max_stretch: float = 10.0
+    weight: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.freshness <= 0:
+            raise ValueError(f"freshness must be > 0, got {self.freshness}")
+        if self.max_stretch < 1:
+            raise ValueError(f"max_stretch must be >= 1, got {self.max_stretch}")
+
+    @property
+    def cost(self) -> int:
+        if self.weight is not None:
+            return self.weight
+        return request_weight(self.path, self.params)
+
+
+def plan_intervals(jobs: Iterable[Job], budget: float) -> Dict[str, float]:
+    """Polling interval per job name that fits `budget` weight per minute.
+
+    Priorities are served from the highest down. A tier that fits keeps
+    its `freshness` intervals; the first tier that does not is stretched
+    evenly to use up the rest of the budget, and every lower tier is
+    stretched to its `max_stretch`. Stretches are capped by `max_stretch`,
+    so a plan can exceed a budget too small for the jobs at all.
+    """
+    tiers: Dict[int, List[Job]] = {}
+    for job in jobs:
+        tiers.setdefault(job.priority, []).append(job)
+    remaining = float(budget)
+    plan: Dict[str, float] = {}
+    for priority in sorted(tiers, reverse=True):
+        tier = tiers[priority]
+        demand = sum(job.cost * _MINUTE / job.freshness for job in tier)
+        stretch = 1.0 if demand <= remaining else demand / max(remaining, 1e-9)
+        for job in tier:
+            plan[job.name] = job.freshness * min(stretch, job.max_stretch)
+        remaining -= sum(job.cost * _MINUTE / plan[job.name] for job in tier)
+        remaining = max(remaining, 0.0)
+    return plan
+
+
+@dataclass
+class JobStatus:
+    """Runtime state of a job, as reported by `PollingScheduler.status`."""
+
+    job: Job
+    interval: float
+    next_due: float = 0.0
+    last_dispatch: Optional[float] = None
+    last_success: Optional[float] = None
+    last_error: Optional[BaseException] = None
+    runs: int = 0
+    errors: int = 0
+    in_flight: bool = False
+    data: Any = field(default=None, repr=False)
+
+    def staleness(self, now: float) -> Optional[float]:
+        """Seconds since the last successful poll, None before the first."""
+        return None if self.last_success is None else now - self.last_success
+
+    def report(self, now: float) -> Dict[str, Any]:
+        age = self.staleness(now)
+        return {
+            "job": self.job.name,
+            "priority": self.job.priority,
+            "freshness": self.job.freshness,
+            "interval": round(self.interval, 3),
+            "staleness": None if age is None else round(age, 3),
+            "stale": age is None or age > self.job.freshness,
+            "runs": self.runs,
+            "errors": self.errors,
+            "last_error": None if self.last_error is None else str(self.last_error),
+        }
+
+
+class PollingScheduler:
+    """Runs `Job`s on an `AsyncBinanceClient` within a weight budget.
+
+    Args:
+        client: Client the jobs are sent through.
+        budget: Request weight per minute the jobs may use.
+        replan_interval: Seconds between budget re-checks.
+        clock: Monotonic clock.
+    """
+
+    def __init__(
+        self,
+        client: AsyncBinanceClient,
+        budget: float = 1200.0,
+        replan_interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.client = client
+        self.budget = float(budget)
+        self.replan_interval = replan_interval
+        self._clock = clock
+        self._jobs: Dict[str, JobStatus] = {}
+        self._subscribers: List[Tuple[Subscriber, Optional[Set[str]]]] = []
+        self._spent: Deque[Tuple[float, int]] = deque()
+        self._bucket: Optional[TokenBucket] = None
+        self._available = self.budget
+        self._planned_at = -float("inf")
+        self._tasks: Set[asyncio.Task] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopped: Optional[asyncio.Event] = None
+
+    # -- configuration --------------------------------------------------
+
+    def add(self, job: Job) -> None:
+        if job.name in self._jobs:
+            raise ValueError(f"Duplicate job name: {job.name!r}")
+        self._jobs[job.name] = JobStatus(job, job.freshness, next_due=self._clock())
+        self._replan()
+
+    def remove(self, name: str) -> None:
+        del self._jobs[name]
+        self._replan()
+
+    def subscribe(
+        self, callback: Subscriber, jobs: Optional[Sequence[str]] = None
+    ) -> Callable[[], None]:
+        """Call `callback(job, data)` after each successful poll.
+
+        Limited to the named `jobs` if given. Returns an unsubscribe function.
+        """
+        entry = (callback, set(jobs) if jobs is not None else None)
+        self._subscribers.append(entry)
+        return lambda: self._subscribers.remove(entry)
+
+    # -- reporting ------------------------------------------------------
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Per-job interval, staleness, run and error counts."""
+        now = self._clock()
+        return [state.report(now) for state in self._jobs.values()]
+
+    def latest(self, name: str) -> Any:
+        """The most recent data of job `name` (None before its first poll)."""
+        return self._jobs[name].data
+
+    def budget_report(self) -> Dict[str, float]:
+        """Configured and available budget, planned and actual weight/minute."""
+        return {
+            "budget": self.budget,
+            "available": round(self._available, 1),
+            "planned": round(self._planned_rate(), 1),
+            "spent_last_minute": self._spent_last_minute(self._clock()),
+        }
+
+    # -- planning -------------------------------------------------------
+
+    def _spent_last_minute(self, now: float) -> int:
+        spent = self._spent
+        while spent and spent[0][0] <= now - _MINUTE:
+            spent.popleft()
+        return sum(weight for _, weight in spent)
+
+    def _available_budget(self, now: float) -> float:
+        """`budget`, less weight spent on this IP by others, if known."""
+        limiter = self.client.rate_limiter
+        if limiter is None:
+            return self.budget
+        used = limiter.used_weight.get(limiter.interval_header)
+        if used is None:
+            return self.budget
+        external = max(0, used - self._spent_last_minute(now))
+        return max(0.0, min(self.budget, limiter.weight_limit - external))
+
+    def _replan(self) -> None:
+        now = self._clock()
+        self._planned_at = now
+        self._available = self._available_budget(now)
+        plan = plan_intervals((s.job for s in self._jobs.values()), self._available)
+        for name, interval in plan.items():
+            state = self._jobs[name]
+            state.interval = interval
+            if state.last_dispatch is not None:
+                state.next_due = state.last_dispatch + interval
+        # Pace sends at the planned rate, which exceeds the budget only when
+        # every job is already at its `max_stretch`.
+        rate = max(self._available, self._planned_rate(), 1.0)
+        largest = max((s.job.cost for s in self._jobs.values()), default=1)
+        # Bursts of up to ten seconds' worth, and at least the largest request.
+        capacity = max(float(largest), rate / 6)
+        bucket = self._bucket
+        if (
+            bucket is None
+            or bucket.capacity != capacity
+            or not math.isclose(bucket.rate, rate / _MINUTE)
+        ):
+            self._bucket = TokenBucket(
+                capacity, capacity * _MINUTE / rate, clock=self._clock
+            )
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _planned_rate(self) -> float:
+        return sum(
+            state.job.cost * _MINUTE / state.interval for state in self._jobs.values()
+        )
+
+    # -- running --------------------------------------------------------
+
+    def _next_job(self, now: float) -> Optional[JobStatus]:
+        due = [s for s in self._jobs.values() if s.next_due <= now and not s.in_flight]
+        if not due:
+            return None
+        return max(due, key=lambda s: (s.job.priority, -s.next_due))
+
+    def _sleep_time(self, now: float) -> float:
+        waiting = [s.next_due for s in self._jobs.values() if not s.in_flight]
+        until_replan = self._planned_at + self.replan_interval - now
+        return max(0.0, min([until_replan, *(due - now for due in waiting)]))
+
+    async def run(self, duration: Optional[float] = None) -> None:
+        """Poll until `stop` is called (or for `duration` seconds)."""
+        self._wakeup = asyncio.Event()
+        self._stopped = asyncio.Event()
+        deadline = None if duration is None else self._clock() + duration
+        try:
+            while not self._stopped.is_set():
+                now = self._clock()
+                if deadline is not None and now >= deadline:
+                    break
+                if now - self._planned_at >= self.replan_interval:
+                    self._replan()
+                state = self._next_job(now)
+                if state is None:
+                    timeout = self._sleep_time(now)
+                    if deadline is not None:
+                        timeout = min(timeout, deadline - now)
+                    self._wakeup.clear()
+                    await _wait(self._wakeup, timeout)
+                    continue
+                assert self._bucket is not None
+                delay = self._bucket.take(state.job.cost)
+                if delay > 0 and await _wait(self._stopped, delay):
+                    break
+                self._dispatch(state)
+        finally:
+            for task in list(self._tasks):
+                task.cancel()
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._wakeup = self._stopped = None
+
+    def stop(self) -> None:
+        if self._stopped is not None:
+            self._stopped.set()
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _dispatch(self, state: JobStatus) -> None:
+        now = self._clock()
+        state.in_flight = True
+        state.last_dispatch = now
+        state.next_due = now + state.interval
+        self._spent.append((now, state.job.cost))
+        task = asyncio.ensure_future(self._poll(state))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _poll(self, state: JobStatus) -> None:
+        job = state.job
+        try:
+            data = await self.client.get(job.path, job.params)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            state.errors += 1
+            state.last_error = exc
+            logger.warning("Job %s failed: %s", job.name, exc)
+            return
+        finally:
+            state.in_flight = False
+            if self._wakeup is not None:
+                self._wakeup.set()
+        state.runs += 1
+        state.last_success = self._clock()
+        state.last_error = None
+        state.data = data
+        await self._deliver(job, data)
+
+    async def _deliver(self, job: Job, data: Any) -> None:
+        for callback, names in list(self._subscribers):
+            if names is not None and job.name not in names:
+                continue
+            try:
+                result = callback(job, data)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("Subscriber failed for job %s", job.name)
+
+
+async def _wait(event: asyncio.Event, timeout: float) -> bool:
+    """Wait up to `timeout` seconds for `event`; True if it was set."""
+    try:
+        await asyncio.wait_for(event.wait(), timeout)
+    except asyncio.TimeoutError:
+        return False
+    return True
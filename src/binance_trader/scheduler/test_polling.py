@@ -0,0 +1,179 @@
+"""Tests for budget planning and the polling scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from binance_trader import cli
+from binance_trader.clients.binance import AsyncBinanceClient
+from binance_trader.clients.requester import HttpxRequester, RateLimiter
+from binance_trader.scheduler import Job, PollingScheduler, plan_intervals
+from binance_trader.testing import MockBinanceServer
+
+
+def test_plan_keeps_freshness_within_budget():
+    jobs = [
+        Job("a", "/api/v3/ping", freshness=1),
+        Job("b", "/api/v3/time", freshness=2),
+    ]
+    # 60 + 30 weight per minute.
+    assert plan_intervals(jobs, 100) == {"a": 1, "b": 2}
+
+
+def test_plan_stretches_low_priorities_first():
+    jobs = [
+        Job("hi", "/api/v3/ping", freshness=1, priority=10),
+        Job("lo1", "/api/v3/ping", freshness=1),
+        Job("lo2", "/api/v3/ping", freshness=1, max_stretch=2),
+    ]
+    plan = plan_intervals(jobs, 100)
+    assert plan["hi"] == 1
+    # 40 left for 120 demanded: x3, except where capped by max_stretch.
+    assert plan["lo1"] == pytest.approx(3)
+    assert plan["lo2"] == 2
+    # Nothing left: everything below the top tier runs at its max stretch.
+    plan = plan_intervals(jobs, 60)
+    assert plan["hi"] == 1 and plan["lo1"] == 10 and plan["lo2"] == 2
+
+
+def test_job_cost_and_validation():
+    assert Job("d", "/api/v3/depth", params={"limit": 5000}).cost == 250
+    assert Job("w", "/api/v3/ping", weight=7).cost == 7
+    with pytest.raises(ValueError):
+        Job("x", "/api/v3/ping", freshness=0)
+
+
+def _run(srv, jobs, duration, budget=1200.0, subscriber=None, names=None):
+    async def main():
+        requester = HttpxRequester(rate_limiter=RateLimiter())
+        async with AsyncBinanceClient(requester, base_url=srv.url) as client:
+            scheduler = PollingScheduler(client, budget=budget)
+            for job in jobs:
+                scheduler.add(job)
+            if subscriber is not None:
+                scheduler.subscribe(subscriber, names)
+            await scheduler.run(duration)
+            return scheduler
+
+    return asyncio.run(main())
+
+
+def test_scheduler_polls_jobs_and_delivers_results():
+    seen = []
+
+    async def collect(job, data):
+        seen.append((job.name, data))
+
+    routes = {"/api/v3/ping": {}, "/api/v3/time": {"serverTime": 1}}
+    with MockBinanceServer(routes) as srv:
+        scheduler = _run(
+            srv,
+            [
+                Job("ping", "/api/v3/ping", freshness=0.1),
+                Job("time", "/api/v3/time", freshness=0.2),
+            ],
+            duration=0.55,
+            subscriber=collect,
+            names=["time"],
+        )
+    pings = sum(1 for _, path, _ in srv.requests if path == "/api/v3/ping")
+    assert 4 <= pings <= 7
+    assert seen and all(item == ("time", {"serverTime": 1}) for item in seen)
+    assert scheduler.latest("time") == {"serverTime": 1}
+    report = {r["job"]: r for r in scheduler.status()}
+    assert report["ping"]["runs"] == pings and report["ping"]["errors"] == 0
+    assert report["ping"]["staleness"] < 0.2
+    budget = scheduler.budget_report()
+    assert budget["planned"] == pytest.approx(60 / 0.1 + 60 / 0.2)
+    assert budget["spent_last_minute"] == len(srv.requests)
+
+
+def test_scheduler_stretches_low_priority_under_a_small_budget():
+    routes = {"/api/v3/ping": {}, "/api/v3/time": {}}
+    with MockBinanceServer(routes) as srv:
+        scheduler = _run(
+            srv,
+            [
+                Job("hi", "/api/v3/ping", freshness=0.1, priority=1),
+                Job("lo", "/api/v3/time", freshness=0.1),
+            ],
+            duration=0.65,
+            budget=600,  # All of it for "hi"; "lo" is stretched 10x.
+        )
+    count = {p: sum(1 for _, path, _ in srv.requests if path == p) for p in routes}
+    assert count["/api/v3/ping"] >= 4
+    assert count["/api/v3/time"] == 1
+    lo = {r["job"]: r for r in scheduler.status()}["lo"]
+    # Stale against its requested freshness, though on its stretched schedule.
+    assert lo["interval"] == 1.0 and lo["stale"]
+
+
+def test_errors_are_counted_and_external_usage_shrinks_the_budget():
+    routes = {
+        "/api/v3/ping": (200, {}, {"X-MBX-USED-WEIGHT-1m": "5900"}),
+        "/api/v3/time": (500, {"code": -1000, "msg": "boom"}),
+    }
+    with MockBinanceServer(routes) as srv:
+
+        async def main():
+            requester = HttpxRequester(rate_limiter=RateLimiter(weight_limit=6000))
+            async with AsyncBinanceClient(requester, base_url=srv.url) as client:
+                scheduler = PollingScheduler(client, budget=1200, replan_interval=0.1)
+                scheduler.add(Job("ping", "/api/v3/ping", freshness=0.5))
+                scheduler.add(Job("time", "/api/v3/time", freshness=0.5))
+                await scheduler.run(0.3)
+                return scheduler
+
+        scheduler = asyncio.run(main())
+    report = {r["job"]: r for r in scheduler.status()}
+    assert report["time"]["errors"] >= 1 and report["time"]["stale"]
+    assert "500" in report["time"]["last_error"]
+    # 5900 used on the IP, at most 2 of it by us: about 100 left.
+    assert scheduler.budget_report()["available"] <= 102
+
+
+def test_stop_ends_run():
+    with MockBinanceServer({"/api/v3/ping": {}}) as srv:
+
+        async def main():
+            async with AsyncBinanceClient(HttpxRequester(), base_url=srv.url) as c:
+                scheduler = PollingScheduler(c)
+                scheduler.add(Job("ping", "/api/v3/ping", freshness=0.05))
+                scheduler.subscribe(lambda job, data: scheduler.stop())
+                await asyncio.wait_for(scheduler.run(), 2)
+
+        asyncio.run(main())
+    assert len(srv.requests) == 1
+
+
+def test_watch_command_prints_ndjson():
+    routes = {"/api/v3/ticker/price": {"symbol": "BTCUSDT", "price": "1.0"}}
+    with MockBinanceServer(routes) as srv:
+        result = CliRunner().invoke(
+            cli.app,
+            [
+                "watch",
+                "--job",
+                "ticker/price?symbol=BTCUSDT@0.1!5",
+                "--duration",
+                "0.35",
+                "--fields",
+                "price",
+                "--base-url",
+                srv.url,
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        lines = [json.loads(line) for line in result.output.splitlines()]
+        assert len(lines) >= 2
+        assert lines[0]["job"] == "ticker/price?symbol=BTCUSDT@0.1!5"
+        assert lines[0]["data"] == {"price": "1.0"}
+        assert srv.requests[0][2] == {"symbol": "BTCUSDT"}
+        result = CliRunner().invoke(
+            cli.app, ["watch", "--job", "ticker/price", "--base-url", srv.url]
+        )
+        assert result.exit_code == 2
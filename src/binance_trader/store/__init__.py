@@ -0,0 +1,5 @@
+"""Local storage for market data fetched through the clients."""
+
+from .candles import CandleFile, Candles, CandleStore, klines_to_columns
+
+__all__ = ["CandleStore", "CandleFile", "Candles", "klines_to_columns"]
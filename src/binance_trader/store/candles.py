@@ -0,0 +1,238 @@
+"""Memory-mapped columnar candle store.
+
+Each symbol/interval lives in a single binary file laid out as a fixed
+header followed by one fixed-width column per field, each `capacity` slots
+long::
+
+    header | open_time int64[cap] | open f64[cap] | high f64[cap] | ...
+
+The file is opened with `numpy.memmap`, so reading a range is a binary
+search on `open_time` plus slicing: no parsing and no copies. Appends write
+into the spare capacity and bump the row count in the header last, so a
+crash mid-append never exposes half-written rows. When the file is full it
+is rewritten with double the capacity.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from ..clients.binance.klines import KlinesSource
+
+MAGIC = b"BTCNDL01"
+_HEADER = struct.Struct("<8sQQ")  # magic, rows, capacity
+HEADER_SIZE = 64
+
+#: Stored columns, in file order, and their dtypes.
+COLUMNS: Dict[str, np.dtype] = {
+    "open_time": np.dtype("<i8"),
+    "open": np.dtype("<f8"),
+    "high": np.dtype("<f8"),
+    "low": np.dtype("<f8"),
+    "close": np.dtype("<f8"),
+    "volume": np.dtype("<f8"),
+}
+
+DEFAULT_CAPACITY = 1 << 16
+
+
+@dataclass(frozen=True)
+class Candles:
+    """Column views over a contiguous range of stored candles."""
+
+    open_time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.open_time)
+
+
+def klines_to_columns(rows: Sequence[Sequence[Any]]) -> Dict[str, np.ndarray]:
+    """Convert raw `/api/v3/klines` rows into column arrays."""
+    if not rows:
+        return {name: np.empty(0, dtype) for name, dtype in COLUMNS.items()}
+    table = np.asarray([row[:6] for row in rows], dtype=object)
+    return {
+        name: table[:, i].astype(dtype)
+        for i, (name, dtype) in enumerate(COLUMNS.items())
+    }
+
+
+class CandleFile:
+    """One memory-mapped candle file. Use `CandleStore.open` to get one."""
+
+    def __init__(self, path: Path, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.path = path
+        if not path.exists():
+            self._create(path, capacity)
+        self._map()
+
+    @staticmethod
+    def _create(path: Path, capacity: int) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        size = HEADER_SIZE + capacity * sum(d.itemsize for d in COLUMNS.values())
+        with path.open("wb") as f:
+            f.write(_HEADER.pack(MAGIC, 0, capacity).ljust(HEADER_SIZE, b"\0"))
+            f.truncate(size)
+
+    def _map(self) -> None:
+        self._mm = np.memmap(self.path, dtype=np.uint8, mode="r+")
+        magic, rows, capacity = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a candle file")
+        self._rows = rows
+        self.capacity = capacity
+        self._columns: Dict[str, np.ndarray] = {}
+        offset = HEADER_SIZE
+        for name, dtype in COLUMNS.items():
+            self._columns[name] = np.ndarray(
+                (capacity,), dtype=dtype, buffer=self._mm, offset=offset
+            )
+            offset += capacity * dtype.itemsize
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __enter__(self) -> CandleFile:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mm.flush()
+        self._columns = {}
+        del self._mm
+
+    def column(self, name: str) -> np.ndarray:
+        """Zero-copy view of the stored rows of column `name`."""
+        return self._columns[name][: self._rows]
+
+    @property
+    def last_open_time(self) -> Optional[int]:
+        if not self._rows:
+            return None
+        return int(self._columns["open_time"][self._rows - 1])
+
+    def range(
+        self, start_time: Optional[int] = None, end_time: Optional[int] = None
+    ) -> Candles:
+        """Candles with `start_time <= open_time < end_time` (epoch ms)."""
+        open_time = self.column("open_time")
+        lo = 0 if start_time is None else int(np.searchsorted(open_time, start_time))
+        hi = (
+            self._rows
+            if end_time is None
+            else int(np.searchsorted(open_time, end_time))
+        )
+        return Candles(**{name: self.column(name)[lo:hi] for name in COLUMNS})
+
+    def all(self) -> Candles:
+        return self.range()
+
+    def append(self, columns: Dict[str, np.ndarray]) -> int:
+        """Append rows newer than the last stored bar; returns rows written.
+
+        A row whose open time equals the last stored one replaces it, so a
+        candle that was still open at the previous sync gets its final values.
+        """
+        open_time = columns["open_time"]
+        if not len(open_time):
+            return 0
+        last = self.last_open_time
+        start = 0
+        if last is not None:
+            start = int(np.searchsorted(open_time, last))
+            if start < len(open_time) and open_time[start] == last:
+                for name in COLUMNS:
+                    self._columns[name][self._rows - 1] = columns[name][start]
+                start += 1
+        count = len(open_time) - start
+        if count <= 0:
+            return 0
+        if self._rows + count > self.capacity:
+            self._grow(max(self.capacity * 2, self._rows + count))
+        lo, hi = self._rows, self._rows + count
+        for name in COLUMNS:
+            self._columns[name][lo:hi] = columns[name][start:]
+        self._mm.flush()
+        self._rows = hi
+        _HEADER.pack_into(self._mm, 0, MAGIC, hi, self.capacity)
+        self._mm.flush()
+        return count
+
+    def _grow(self, capacity: int) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        if tmp.exists():
+            tmp.unlink()
+        self._create(tmp, capacity)
+        new = np.memmap(tmp, dtype=np.uint8, mode="r+")
+        offset = HEADER_SIZE
+        for name, dtype in COLUMNS.items():
+            dst = np.ndarray((capacity,), dtype=dtype, buffer=new, offset=offset)
+            dst[: self._rows] = self.column(name)
+            offset += capacity * dtype.itemsize
+        _HEADER.pack_into(new, 0, MAGIC, self._rows, capacity)
+        new.flush()
+        del new
+        self.close()
+        os.replace(tmp, self.path)
+        self._map()
+
+
+class CandleStore:
+    """Directory of `CandleFile`s, one per `<SYMBOL>-<interval>.candles`."""
+
+    def __init__(self, root: str | os.PathLike[str]) -> None:
+        self.root = Path(root)
+
+    def path(self, symbol: str, interval: str) -> Path:
+        return self.root / f"{symbol.upper()}-{interval}.candles"
+
+    def open(self, symbol: str, interval: str) -> CandleFile:
+        return CandleFile(self.path(symbol, interval))
+
+    def series(self) -> List[str]:
+        """Stored `<SYMBOL>-<interval>` series names."""
+        return sorted(p.stem for p in self.root.glob("*.candles"))
+
+    def write(self, symbol: str, interval: str, rows: Iterable[Sequence[Any]]) -> int:
+        """Append raw kline rows (e.g. from `iter_klines`) to the store."""
+        with self.open(symbol, interval) as f:
+            return f.append(klines_to_columns(list(rows)))
+
+    def sync(
+        self,
+        client: KlinesSource,
+        symbol: str,
+        interval: str,
+        start_time: int = 0,
+        limit: int = 1000,
+    ) -> int:
+        """Fetch and append candles newer than the last stored bar.
+
+        Uses `client.klines` (e.g. a `BinanceClient`). Starts at
+        `start_time` for an empty file. Returns the number of new rows.
+        """
+        added = 0
+        with self.open(symbol, interval) as f:
+            last = f.last_open_time
+            next_start = start_time if last is None else last
+            while True:
+                rows = client.klines(
+                    symbol, interval, start_time=next_start, limit=limit
+                )
+                added += f.append(klines_to_columns(rows))
+                if len(rows) < limit:
+                    return added
+                next_start = int(rows[-1][6]) + 1
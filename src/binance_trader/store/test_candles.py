@@ -0,0 +1,74 @@
+"""Unit tests for the memory-mapped candle store."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from binance_trader.store import CandleStore, klines_to_columns
+from binance_trader.store.candles import CandleFile
+
+MINUTE = 60_000
+
+
+def make_rows(start: int, count: int) -> list[list]:
+    return [
+        [t, str(i), str(i + 1), str(i - 1), str(i + 0.5), "10", t + MINUTE - 1]
+        for i, t in enumerate(range(start, start + count * MINUTE, MINUTE))
+    ]
+
+
+class FakeClient:
+    def __init__(self, rows: list[list]) -> None:
+        self.rows = rows
+        self.calls: list[int | None] = []
+
+    def klines(self, symbol, interval, start_time=None, end_time=None, limit=None):
+        self.calls.append(start_time)
+        return [r for r in self.rows if r[0] >= start_time][:limit]
+
+
+def test_write_and_range_query(tmp_path):
+    store = CandleStore(tmp_path)
+    assert store.write("btcusdt", "1m", make_rows(0, 100)) == 100
+
+    with store.open("BTCUSDT", "1m") as f:
+        assert len(f) == 100
+        candles = f.range(10 * MINUTE, 20 * MINUTE)
+        assert len(candles) == 10
+        assert candles.open_time[0] == 10 * MINUTE
+        np.testing.assert_array_equal(candles.open, np.arange(10, 20, dtype=float))
+        # Views share memory with the mapping: no copy was made.
+        assert not candles.close.flags.owndata
+    assert store.series() == ["BTCUSDT-1m"]
+
+
+def test_append_grows_file_and_survives_reopen(tmp_path):
+    store = CandleStore(tmp_path)
+    path = store.path("ETHUSDT", "1m")
+
+    with CandleFile(path, capacity=8) as f:
+        assert f.append(klines_to_columns(make_rows(0, 30))) == 30
+        assert f.capacity >= 30
+
+    with store.open("ETHUSDT", "1m") as f:
+        assert f.last_open_time == 29 * MINUTE
+        assert f.all().high[-1] == 30.0
+
+
+def test_sync_appends_only_new_bars_and_updates_last(tmp_path):
+    store = CandleStore(tmp_path)
+    client = FakeClient(make_rows(0, 2500))
+    assert store.sync(client, "BTCUSDT", "1m") == 2500
+    assert client.calls == [0, 1000 * MINUTE, 2000 * MINUTE]
+
+    # The last bar changed (it was still open) and two new bars arrived.
+    rows = make_rows(0, 2502)
+    rows[2499][4] = "999"
+    client = FakeClient(rows)
+    assert store.sync(client, "BTCUSDT", "1m") == 2
+    assert client.calls == [2499 * MINUTE]
+
+    with store.open("BTCUSDT", "1m") as f:
+        assert len(f) == 2502
+        assert f.column("close")[2499] == 999.0
+        assert np.all(np.diff(f.column("open_time")) == MINUTE)
@@ -0,0 +1,210 @@
+"""Tests for the warm CLI daemon and lazy backend imports."""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from binance_trader import cli, daemon
+from binance_trader.testing import MockBinanceServer
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(daemon.socket, "AF_UNIX"), reason="needs Unix domain sockets"
+)
+
+
+def _serve(path, run):
+    """Start `daemon.serve` in a thread; returns a function stopping it."""
+    started = threading.Event()
+    servers = []
+
+    def ready(server):
+        servers.append(server)
+        started.set()
+
+    thread = threading.Thread(target=daemon.serve, args=(path, run, ready), daemon=True)
+    thread.start()
+    assert started.wait(5)
+
+    def stop():
+        servers[0].shutdown()
+        thread.join(5)
+        assert not os.path.exists(path)
+
+    return stop
+
+
+@pytest.fixture
+def running_daemon(tmp_path, monkeypatch):
+    path = str(tmp_path / "d.sock")
+    monkeypatch.setattr(cli, "_warm", {})
+    stop = _serve(path, cli._run_in_daemon)
+    yield path
+    stop()
+
+
+def test_forward_runs_commands_on_warm_clients(running_daemon, capsys):
+    with MockBinanceServer(
+        {"/api/v3/ping": {}, "/api/v3/time": {"serverTime": 5}}
+    ) as srv:
+        args = ["--base-url", srv.url]
+        assert daemon.forward(["ping", *args], running_daemon) == 0
+        assert daemon.forward(["time", *args], running_daemon) == 0
+        assert daemon.forward(["ping", *args], running_daemon) == 0
+    out = capsys.readouterr().out
+    assert '"serverTime": 5' in out
+    # One requester and one client per configuration, reused across calls.
+    assert len([k for k in cli._warm if k[0] == "requester"]) == 1
+    assert len([k for k in cli._warm if k[0] == "client"]) == 1
+
+
+def test_forward_reports_errors_and_exit_codes(running_daemon, capsys):
+    assert daemon.forward(["no-such-command"], running_daemon) == 2
+    assert "No such command" in capsys.readouterr().err
+
+
+def test_forward_falls_back_without_daemon(tmp_path):
+    assert daemon.forward(["ping"], tmp_path / "missing.sock") is None
+    stale = tmp_path / "stale.sock"
+    stale.write_text("")
+    assert daemon.forward(["ping"], stale) is None
+    assert daemon.forward(["daemon"], stale) is None
+
+
+def test_output_is_streamed_while_the_command_runs(tmp_path, monkeypatch):
+    release = threading.Event()
+
+    def run(argv):
+        print("first", flush=True)
+        assert release.wait(5)
+        print("second")
+        return 3
+
+    class Stdout:
+        def __init__(self):
+            self.text = ""
+
+        def write(self, text):
+            self.text += text
+            if "first" in text:
+                # Arrives while the command is still running.
+                release.set()
+
+        def flush(self):
+            pass
+
+    out = Stdout()
+    monkeypatch.setattr(sys, "stdout", out)
+    path = str(tmp_path / "d.sock")
+    stop = _serve(path, run)
+    try:
+        assert daemon.forward(["ping"], path) == 3
+    finally:
+        stop()
+    assert out.text == "first\nsecond\n"
+
+
+def test_client_disconnect_aborts_the_command(tmp_path):
+    writes = []
+    failed = threading.Event()
+
+    def run(argv):
+        try:
+            while len(writes) < 1000:
+                print("tick", flush=True)
+                writes.append(1)
+                time.sleep(0.01)
+        except OSError:
+            failed.set()
+            raise
+        return 0
+
+    path = str(tmp_path / "d.sock")
+    stop = _serve(path, run)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(path)
+            sock.sendall(json.dumps({"argv": ["watch"]}).encode() + b"\n")
+            assert json.loads(sock.makefile("rb").readline()) == {"stdout": "tick"}
+        assert failed.wait(5)
+    finally:
+        stop()
+    assert len(writes) < 1000
+
+
+def test_daemon_dying_mid_command_is_an_error_not_a_rerun(tmp_path, capsys):
+    path = str(tmp_path / "d.sock")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen(1)
+
+    def die_after_first_frame():
+        conn, _ = listener.accept()
+        with conn:
+            conn.makefile("rb").readline()
+            conn.sendall(json.dumps({"stdout": "partial\n"}).encode() + b"\n")
+
+    thread = threading.Thread(target=die_after_first_frame)
+    thread.start()
+    try:
+        assert daemon.forward(["ping"], path) == 1
+    finally:
+        thread.join(5)
+        listener.close()
+    captured = capsys.readouterr()
+    assert captured.out == "partial\n"
+    assert "closed the connection" in captured.err
+
+
+def test_only_the_subcommand_decides_forwarding(tmp_path):
+    assert daemon.command_name(["--stats", "tickers", "daemon"]) == "tickers"
+    assert daemon.command_name(["--stats-format", "json", "daemon"]) == "daemon"
+    assert daemon.command_name(["--stats"]) is None
+    stale = tmp_path / "stale.sock"
+    stale.write_text("")
+    # A `daemon` symbol is not the daemon command: forwarding is attempted.
+    assert daemon.forward(["tickers", "daemon"], stale) is None
+    for command in daemon.LOCAL_COMMANDS:
+        assert daemon.forward(["--stats", command], stale) is None
+
+
+def test_watch_runs_locally_while_a_daemon_listens(tmp_path, monkeypatch, capsys):
+    forwarded = []
+
+    def run(argv):
+        forwarded.append(argv)
+        return 0
+
+    path = str(tmp_path / "d.sock")
+    monkeypatch.setenv("BINANCE_TRADER_SOCKET", path)
+    stop = _serve(path, run)
+    routes = {"/api/v3/ping": {}}
+    try:
+        with MockBinanceServer(routes) as srv:
+            args = ["watch", "--job", "ping@0.1", "--duration", "0.25"]
+            with pytest.raises(SystemExit) as exit_info:
+                daemon.main([*args, "--base-url", srv.url])
+    finally:
+        stop()
+    assert exit_info.value.code == 0 and forwarded == []
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(lines) >= 2 and lines[0]["job"] == "ping@0.1"
+
+
+def test_cli_import_does_not_load_http_backends():
+    code = "import sys, binance_trader.cli; print('httpx' in sys.modules, 'requests' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    ).stdout
+    assert out.split() == ["False", "False"]
@@ -0,0 +1,89 @@
+"""Tests for CLI output formats and streamed exchange info."""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from binance_trader import cli
+from binance_trader.output import (
+    format_table,
+    parse_fields,
+    project,
+    write_records,
+    write_result,
+)
+from binance_trader.testing import MockBinanceServer, payloads
+
+ROWS = [
+    {"symbol": "BTCUSDT", "status": "TRADING", "meta": {"tick": "0.01"}},
+    {"symbol": "ETHBTC", "status": "BREAK", "meta": None},
+]
+
+
+def _render(write, *args, **kwargs):
+    out = io.StringIO()
+    write(*args, out=out, **kwargs)
+    return out.getvalue()
+
+
+def test_projection_and_fields():
+    assert parse_fields(" symbol, meta.tick ,") == ["symbol", "meta.tick"]
+    assert parse_fields("") is None
+    assert project(ROWS[0], ["symbol", "meta.tick", "nope"]) == {
+        "symbol": "BTCUSDT",
+        "meta.tick": "0.01",
+        "nope": None,
+    }
+
+
+def test_streamed_json_matches_json_dumps():
+    assert _render(write_records, iter(ROWS)) == json.dumps(ROWS, indent=2) + "\n"
+    assert _render(write_records, iter([])) == "[]\n"
+    lines = _render(write_records, ROWS, "ndjson", ["symbol"]).splitlines()
+    assert lines == ['{"symbol":"BTCUSDT"}', '{"symbol":"ETHBTC"}']
+
+
+def test_table_and_single_documents():
+    assert format_table(ROWS, ["symbol", "meta"]).splitlines() == [
+        "symbol   meta",
+        'BTCUSDT  {"tick":"0.01"}',
+        "ETHBTC",
+    ]
+    doc = {"serverTime": 5, "extra": 1}
+    assert _render(write_result, doc) == json.dumps(doc, indent=2) + "\n"
+    assert json.loads(_render(write_result, doc, "json", ["serverTime"])) == {
+        "serverTime": 5
+    }
+    assert _render(write_result, doc, "ndjson") == '{"serverTime":5,"extra":1}\n'
+    with pytest.raises(ValueError):
+        _render(write_result, doc, "xml")
+
+
+def test_exchange_info_command_streams_symbol_records():
+    doc = payloads.exchange_info(30)
+    with MockBinanceServer({"/api/v3/exchangeInfo": doc}) as srv:
+        result = CliRunner().invoke(
+            cli.app,
+            [
+                "exchange-info",
+                "--base-url",
+                srv.url,
+                "--format",
+                "ndjson",
+                "--fields",
+                "symbol,status",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert records == [
+            {"symbol": s["symbol"], "status": s["status"]} for s in doc["symbols"]
+        ]
+        result = CliRunner().invoke(
+            cli.app, ["time", "--base-url", srv.url, "--format", "yaml"]
+        )
+        assert result.exit_code == 2
@@ -0,0 +1,8 @@
+"""Local stand-ins for Binance services, used by tests and benchmarks."""
+
+from . import payloads
+from .clock import FakeClock
+from .mock_server import MockBinanceServer
+from .mock_stream import MockStreamServer
+
+__all__ = ["FakeClock", "MockBinanceServer", "MockStreamServer", "payloads"]
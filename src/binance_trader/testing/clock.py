@@ -0,0 +1,24 @@
+"""Manually advanced clock for code that takes injectable `clock`/`sleep`."""
+
+from __future__ import annotations
+
+from typing import List
+
+
+class FakeClock:
+    """Callable clock returning `now`; `sleep` advances it and is recorded.
+
+    Args:
+        now: Starting time.
+    """
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
@@ -0,0 +1,108 @@
+"""Local stand-in for the Binance combined-stream WebSocket endpoint.
+
+`MockStreamServer` accepts connections on `/stream`, answers
+`SUBSCRIBE`/`UNSUBSCRIBE` requests like Binance does, and lets tests push
+events to whichever connections are subscribed to a stream::
+
+    async with MockStreamServer() as server:
+        client = StreamClient(base_url=server.url)
+        ...
+        await server.publish("btcusdt@trade", {"p": "1.0"})
+"""
+
+from __future__ import annotations
+
+import json
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Set
+
+from websockets.asyncio.server import Server, ServerConnection, serve
+from websockets.exceptions import ConnectionClosed
+from websockets.http11 import Request, Response
+
+
+class MockStreamServer:
+    """In-process WebSocket server speaking the combined-stream protocol."""
+
+    def __init__(self) -> None:
+        self.subscriptions: Dict[ServerConnection, Set[str]] = {}
+        self.requests: List[Dict[str, Any]] = []
+        self.total_connections = 0
+        #: Handshakes still to be refused with 503 before accepting any.
+        self.reject_handshakes = 0
+        self._server: Optional[Server] = None
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None, "server not started"
+        host, port = next(iter(self._server.sockets)).getsockname()[:2]
+        return f"ws://{host}:{port}"
+
+    async def start(self) -> MockStreamServer:
+        self._server = await serve(
+            self._handle, "127.0.0.1", 0, process_request=self._process_request
+        )
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> MockStreamServer:
+        return await self.start()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    def _process_request(
+        self, ws: ServerConnection, request: Request
+    ) -> Optional[Response]:
+        if self.reject_handshakes > 0:
+            self.reject_handshakes -= 1
+            return ws.respond(HTTPStatus.SERVICE_UNAVAILABLE, "try again\n")
+        return None
+
+    async def _handle(self, ws: ServerConnection) -> None:
+        self.total_connections += 1
+        streams: Set[str] = set()
+        self.subscriptions[ws] = streams
+        try:
+            async for frame in ws:
+                request = json.loads(frame)
+                self.requests.append(request)
+                if request.get("method") == "SUBSCRIBE":
+                    streams.update(request["params"])
+                elif request.get("method") == "UNSUBSCRIBE":
+                    streams.difference_update(request["params"])
+                await ws.send(json.dumps({"result": None, "id": request.get("id")}))
+        except ConnectionClosed:
+            pass
+        finally:
+            self.subscriptions.pop(ws, None)
+
+    def subscribed(self) -> Set[str]:
+        """Union of streams subscribed across live connections."""
+        return set().union(*self.subscriptions.values())
+
+    async def publish(self, stream: str, data: Any) -> int:
+        """Send `data` to every connection subscribed to `stream`."""
+        return await self.send_raw(stream, json.dumps({"stream": stream, "data": data}))
+
+    async def send_raw(self, stream: str, frame: str) -> int:
+        """Send `frame` verbatim to every connection subscribed to `stream`."""
+        sent = 0
+        for ws, streams in list(self.subscriptions.items()):
+            if stream in streams:
+                try:
+                    await ws.send(frame)
+                    sent += 1
+                except ConnectionClosed:
+                    pass
+        return sent
+
+    async def drop_connections(self) -> None:
+        """Abruptly close every client connection (to exercise reconnects)."""
+        for ws in list(self.subscriptions):
+            await ws.close(code=1011)
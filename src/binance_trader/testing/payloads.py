@@ -0,0 +1,198 @@
+"""Deterministic Binance-shaped payloads for tests and benchmarks.
+
+The generators produce documents with the same structure and roughly the
+same size as the real responses (a full `exchangeInfo` is a few MB), so
+parsing and transfer costs are representative without network access.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List
+
+MINUTE_MS = 60_000
+
+_QUOTES = ("USDT", "BTC", "ETH", "BNB", "FDUSD", "TRY", "EUR")
+
+
+def symbol_names(count: int) -> List[str]:
+    """`count` distinct, stable symbol names such as `AAAUSDT`."""
+    names = []
+    for i in range(count):
+        base = "".join(chr(65 + (i // 26**k) % 26) for k in range(3))
+        names.append(base + _QUOTES[i % len(_QUOTES)])
+    return names
+
+
+def exchange_info(symbols: int = 2000, seed: int = 0) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    entries = []
+    for i, name in enumerate(symbol_names(symbols)):
+        quote = _QUOTES[i % len(_QUOTES)]
+        tick = rng.choice(["0.01000000", "0.00010000", "0.00000100"])
+        step = rng.choice(["0.00001000", "0.00100000", "1.00000000"])
+        entries.append(
+            {
+                "symbol": name,
+                "status": "TRADING",
+                "baseAsset": name[: -len(quote)],
+                "baseAssetPrecision": 8,
+                "quoteAsset": quote,
+                "quotePrecision": 8,
+                "quoteAssetPrecision": 8,
+                "orderTypes": [
+                    "LIMIT",
+                    "LIMIT_MAKER",
+                    "MARKET",
+                    "STOP_LOSS_LIMIT",
+                    "TAKE_PROFIT_LIMIT",
+                ],
+                "icebergAllowed": True,
+                "ocoAllowed": True,
+                "isSpotTradingAllowed": True,
+                "isMarginTradingAllowed": False,
+                "filters": [
+                    {
+                        "filterType": "PRICE_FILTER",
+                        "minPrice": tick,
+                        "maxPrice": "1000000.00000000",
+                        "tickSize": tick,
+                    },
+                    {
+                        "filterType": "LOT_SIZE",
+                        "minQty": step,
+                        "maxQty": "9000000.00000000",
+                        "stepSize": step,
+                    },
+                    {
+                        "filterType": "NOTIONAL",
+                        "minNotional": "5.00000000",
+                        "applyMinToMarket": True,
+                        "maxNotional": "9000000.00000000",
+                        "applyMaxToMarket": False,
+                        "avgPriceMins": 5,
+                    },
+                    {"filterType": "MAX_NUM_ORDERS", "maxNumOrders": 200},
+                ],
+                "permissions": [],
+                "permissionSets": [["SPOT", "MARGIN"]],
+                "defaultSelfTradePreventionMode": "EXPIRE_MAKER",
+                "allowedSelfTradePreventionModes": ["EXPIRE_TAKER", "EXPIRE_MAKER"],
+            }
+        )
+    return {
+        "timezone": "UTC",
+        "serverTime": 1_700_000_000_000,
+        "rateLimits": [
+            {
+                "rateLimitType": "REQUEST_WEIGHT",
+                "interval": "MINUTE",
+                "intervalNum": 1,
+                "limit": 6000,
+            },
+        ],
+        "exchangeFilters": [],
+        "symbols": entries,
+    }
+
+
+def klines(
+    count: int = 1000, start_time: int = 0, interval_ms: int = MINUTE_MS, seed: int = 0
+) -> List[List[Any]]:
+    rng = random.Random(seed)
+    price = 30_000.0
+    rows = []
+    for i in range(count):
+        t = start_time + i * interval_ms
+        o = price
+        c = max(0.01, o * (1 + rng.gauss(0, 0.001)))
+        h = max(o, c) * (1 + abs(rng.gauss(0, 0.0005)))
+        lo = min(o, c) * (1 - abs(rng.gauss(0, 0.0005)))
+        v = abs(rng.gauss(10, 3))
+        rows.append(
+            [
+                t,
+                f"{o:.2f}",
+                f"{h:.2f}",
+                f"{lo:.2f}",
+                f"{c:.2f}",
+                f"{v:.5f}",
+                t + interval_ms - 1,
+                f"{v * c:.5f}",
+                rng.randint(50, 500),
+                f"{v / 2:.5f}",
+                f"{v * c / 2:.5f}",
+                "0",
+            ]
+        )
+        price = c
+    return rows
+
+
+def agg_trades(
+    count: int = 1000,
+    start_time: int = 0,
+    first_id: int = 1,
+    spacing_ms: int = 100,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """`/api/v3/aggTrades` rows with consecutive IDs, `spacing_ms` apart."""
+    rng = random.Random(seed)
+    price = 30_000.0
+    rows = []
+    trade_id = first_id * 3
+    for i in range(count):
+        price = max(0.01, price * (1 + rng.gauss(0, 0.0002)))
+        fills = rng.randint(1, 3)
+        rows.append(
+            {
+                "a": first_id + i,
+                "p": f"{price:.2f}",
+                "q": f"{rng.uniform(0.0001, 2):.5f}",
+                "f": trade_id,
+                "l": trade_id + fills - 1,
+                "T": start_time + i * spacing_ms,
+                "m": rng.random() < 0.5,
+                "M": True,
+            }
+        )
+        trade_id += fills
+    return rows
+
+
+def depth(levels: int = 5000, mid: float = 30_000.0, seed: int = 0) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    bids = [
+        [f"{mid - 0.01 * (i + 1):.2f}", f"{rng.uniform(0.001, 3):.5f}"]
+        for i in range(levels)
+    ]
+    asks = [
+        [f"{mid + 0.01 * (i + 1):.2f}", f"{rng.uniform(0.001, 3):.5f}"]
+        for i in range(levels)
+    ]
+    return {"lastUpdateId": 1_000_000, "bids": bids, "asks": asks}
+
+
+def ticker_prices(symbols: int = 2000, seed: int = 0) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    return [
+        {"symbol": s, "price": f"{rng.uniform(0.0001, 50_000):.8f}"}
+        for s in symbol_names(symbols)
+    ]
+
+
+def book_tickers(symbols: int = 2000, seed: int = 0) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    rows = []
+    for s in symbol_names(symbols):
+        bid = rng.uniform(0.0001, 50_000)
+        rows.append(
+            {
+                "symbol": s,
+                "bidPrice": f"{bid:.8f}",
+                "bidQty": f"{rng.uniform(0, 100):.8f}",
+                "askPrice": f"{bid * 1.0005:.8f}",
+                "askQty": f"{rng.uniform(0, 100):.8f}",
+            }
+        )
+    return rows